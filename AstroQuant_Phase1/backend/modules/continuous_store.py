@@ -0,0 +1,234 @@
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from backend.services.bar_aggregator import bar_epoch
+from backend.services.market_data_service import safe_float
+
+
+COLUMNS = ("open", "high", "low", "close", "volume")
+PRICE_COLUMNS = ("open", "high", "low", "close")
+
+
+def _iso(epoch):
+    return datetime.fromtimestamp(int(epoch), tz=timezone.utc).isoformat()
+
+
+class ContinuousSeries:
+    """Back-adjusted 1m history of one root as parallel numpy columns plus JSON metadata."""
+
+    def __init__(self, root):
+        self.root = root
+        self.time = np.empty(0, dtype=np.int64)
+        self.columns = {name: np.empty(0, dtype=np.float64) for name in COLUMNS}
+        self.meta = {
+            "active_contract": None,
+            "rollovers": [],
+            "coverage_start": None,
+            "synced_at": None,
+            "daily_stats": {},
+            "stats_refreshed_at": {},
+        }
+        self.mtime = None
+
+    def __len__(self):
+        return int(self.time.size)
+
+    @property
+    def first_epoch(self):
+        return int(self.time[0]) if self.time.size else None
+
+    @property
+    def last_epoch(self):
+        return int(self.time[-1]) if self.time.size else None
+
+    @staticmethod
+    def _arrays(bars):
+        rows = {}
+        for bar in bars or []:
+            epoch = bar_epoch(bar)
+            if epoch is not None:
+                rows[epoch] = tuple(safe_float(bar.get(name, 0)) for name in COLUMNS)
+        ordered = sorted(rows)
+        times = np.asarray(ordered, dtype=np.int64)
+        values = np.asarray([rows[epoch] for epoch in ordered], dtype=np.float64).reshape(len(ordered), len(COLUMNS))
+        return times, values
+
+    def _concat(self, times, values, head):
+        pieces = [(times, values), (self.time, np.column_stack([self.columns[name] for name in COLUMNS]) if self.time.size else np.empty((0, len(COLUMNS))))]
+        if not head:
+            pieces.reverse()
+        self.time = np.concatenate([pieces[0][0], pieces[1][0]])
+        stacked = np.concatenate([pieces[0][1], pieces[1][1]])
+        for index, name in enumerate(COLUMNS):
+            self.columns[name] = np.ascontiguousarray(stacked[:, index])
+
+    def append(self, bars, shift=0.0):
+        """Add bars at or after the last stored minute; the overlap replaces stored rows (forming bar revisions)."""
+        times, values = self._arrays(bars)
+        if not times.size:
+            return 0
+        last = self.last_epoch
+        if last is not None:
+            keep = times >= last
+            times, values = times[keep], values[keep]
+            if not times.size:
+                return 0
+            self.truncate_from(int(times[0]))
+        values[:, :4] += shift
+        self._concat(times, values, head=False)
+        return int(times.size)
+
+    def prepend(self, bars, shift=0.0):
+        """Add bars strictly older than the first stored minute."""
+        times, values = self._arrays(bars)
+        first = self.first_epoch
+        if first is not None:
+            keep = times < first
+            times, values = times[keep], values[keep]
+        if not times.size:
+            return 0
+        values[:, :4] += shift
+        self._concat(times, values, head=True)
+        return int(times.size)
+
+    def truncate_from(self, epoch):
+        cut = int(np.searchsorted(self.time, epoch, side="left"))
+        self.time = self.time[:cut]
+        for name in COLUMNS:
+            self.columns[name] = self.columns[name][:cut]
+
+    def trim_before(self, epoch):
+        cut = int(np.searchsorted(self.time, epoch, side="left"))
+        if cut:
+            self.time = self.time[cut:]
+            for name in COLUMNS:
+                self.columns[name] = self.columns[name][cut:]
+            if self.meta["coverage_start"] is not None:
+                self.meta["coverage_start"] = max(self.meta["coverage_start"], int(epoch))
+
+    def apply_roll(self, old_contract, new_contract, rollover_date, adjustment):
+        """Record a roll and back-adjust all history once; bars from the roll day on are re-pulled from the new contract."""
+        roll_epoch = int(datetime.fromisoformat(f"{rollover_date}T00:00:00+00:00").timestamp())
+        self.truncate_from(roll_epoch)
+        for name in PRICE_COLUMNS:
+            self.columns[name] = self.columns[name] + float(adjustment)
+        self.meta["rollovers"].append(
+            {
+                "old_contract": old_contract,
+                "new_contract": new_contract,
+                "rollover_date": rollover_date,
+                "epoch": roll_epoch,
+                "adjustment_value": float(adjustment),
+            }
+        )
+        self.meta["active_contract"] = new_contract
+        self.meta["synced_at"] = None
+
+    def window(self, minutes):
+        """Stored bars of the last ``minutes`` ending at the newest bar, as normalized bar dicts."""
+        if not self.time.size:
+            return []
+        start = int(np.searchsorted(self.time, self.last_epoch - int(minutes) * 60, side="left"))
+        columns = [self.columns[name][start:].tolist() for name in COLUMNS]
+        return [
+            {"time": _iso(epoch), "open": o, "high": h, "low": l, "close": c, "volume": v}
+            for epoch, o, h, l, c, v in zip(self.time[start:].tolist(), *columns)
+        ]
+
+
+class ContinuousContractStore:
+    """
+    On-disk continuous-contract history per root under data/continuous.
+
+    Each root is a compressed ``.npz`` of int64 minute epochs and float64
+    OHLCV columns plus a JSON sidecar with the active contract, applied
+    rolls, coverage and cached daily stats. Files are replaced atomically
+    and reloaded when another process has written a newer copy.
+    """
+
+    def __init__(self, directory=None, max_days=None):
+        if max_days is None:
+            try:
+                max_days = int(os.getenv("CONTINUOUS_STORE_MAX_DAYS", "14"))
+            except Exception:
+                max_days = 14
+        self.max_days = max(1, int(max_days))
+        self.directory = Path(directory) if directory else Path(__file__).resolve().parents[2] / "data" / "continuous"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._series = {}
+        self.lock = threading.RLock()
+
+    def _paths(self, root):
+        return self.directory / f"{root}.npz", self.directory / f"{root}.json"
+
+    def _load(self, root):
+        series = ContinuousSeries(root)
+        data_path, meta_path = self._paths(root)
+        try:
+            with np.load(data_path) as data:
+                series.time = data["time"].astype(np.int64)
+                for name in COLUMNS:
+                    series.columns[name] = data[name].astype(np.float64)
+            series.meta.update(json.loads(meta_path.read_text()))
+            series.mtime = meta_path.stat().st_mtime
+        except FileNotFoundError:
+            pass
+        except Exception as error:
+            print(f"Continuous store: discarding unreadable {root} history ({error}).")
+            series = ContinuousSeries(root)
+        return series
+
+    def series(self, root):
+        with self.lock:
+            series = self._series.get(root)
+            _, meta_path = self._paths(root)
+            try:
+                disk_mtime = meta_path.stat().st_mtime
+            except OSError:
+                disk_mtime = None
+            if series is None or (disk_mtime is not None and (series.mtime is None or disk_mtime > series.mtime)):
+                series = self._load(root)
+                self._series[root] = series
+            return series
+
+    def save(self, series):
+        with self.lock:
+            if series.last_epoch is not None:
+                series.trim_before(series.last_epoch - self.max_days * 86400)
+            data_path, meta_path = self._paths(series.root)
+            tmp_data = data_path.with_name(f"{data_path.stem}.tmp.npz")
+            tmp_meta = meta_path.with_suffix(".json.tmp")
+            np.savez_compressed(tmp_data, time=series.time, **series.columns)
+            tmp_meta.write_text(json.dumps(series.meta))
+            os.replace(tmp_data, data_path)
+            os.replace(tmp_meta, meta_path)
+            series.mtime = meta_path.stat().st_mtime
+
+    def status(self, root):
+        with self.lock:
+            series = self.series(root)
+            return {
+                "bars": len(series),
+                "first_bar": _iso(series.first_epoch) if series.first_epoch is not None else None,
+                "last_bar": _iso(series.last_epoch) if series.last_epoch is not None else None,
+                "active_contract": series.meta.get("active_contract"),
+                "rollovers": len(series.meta.get("rollovers", [])),
+            }
+
+
+_shared_stores = {}
+_shared_stores_lock = threading.Lock()
+
+
+def get_continuous_store(directory=None):
+    key = str(directory or "")
+    with _shared_stores_lock:
+        store = _shared_stores.get(key)
+        if store is None:
+            store = _shared_stores[key] = ContinuousContractStore(directory)
+        return store
@@ -3,6 +3,8 @@ import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from backend.modules.continuous_store import get_continuous_store
+from backend.services.bar_aggregator import bar_epoch
 from backend.services.market_data_service import normalize_bars
 
 
@@ -17,15 +19,28 @@ class RolloverManager:
         "6B": ["6B.FUT", "6BZ6", "6BH7", "6BM7"],
     }
 
-    def __init__(self, data_engine, confirm_days=2):
+    STATS_DAYS = 5
+    SYNC_OVERLAP_MINUTES = 3
+
+    def __init__(self, data_engine, confirm_days=2, store=None):
         self.data_engine = data_engine
         self.confirm_days = max(1, int(confirm_days))
         self.storage_path = Path(__file__).resolve().parents[2] / "data" / "rollover_events.json"
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         self._cache = {}
         self._continuous_cache = {}
+        self.store = store or get_continuous_store()
         self.contract_chains = dict(self.DEFAULT_CONTRACTS)
 
+        try:
+            self.stats_refresh_seconds = max(300.0, float(os.getenv("ROLLOVER_STATS_REFRESH_SECONDS", "21600")))
+        except Exception:
+            self.stats_refresh_seconds = 21600.0
+        try:
+            self.sync_interval_seconds = max(5.0, float(os.getenv("CONTINUOUS_SYNC_SECONDS", "20")))
+        except Exception:
+            self.sync_interval_seconds = 20.0
+
         env_chains = self._parse_contract_chain_env(os.getenv("ROLLOVER_CONTRACT_CHAINS", ""))
         if env_chains:
             self.contract_chains.update(env_chains)
@@ -100,6 +115,55 @@ class RolloverManager:
         raw = self.data_engine.get_ohlcv(contract, minutes=minutes)
         return normalize_bars(raw) if raw else []
 
+    def _contract_daily_stats(self, root, contract):
+        """Daily volume/open interest/close for ``contract``, refreshed at most every stats_refresh_seconds."""
+        now_epoch = self._utc_now().timestamp()
+        with self.store.lock:
+            series = self.store.series(root)
+            refreshed_at = series.meta["stats_refreshed_at"].get(contract)
+            cached = series.meta["daily_stats"].get(contract)
+            if cached is not None and refreshed_at and (now_epoch - refreshed_at) < self.stats_refresh_seconds:
+                return cached
+
+        daily = {}
+        fetch_statistics = getattr(self.data_engine, "get_daily_statistics", None)
+        if fetch_statistics is not None:
+            daily = fetch_statistics(contract, days=self.STATS_DAYS) or {}
+        if not any(item.get("volume") for item in daily.values()):
+            # No statistics feed: fall back to summing 1m bars, without open interest.
+            daily = {
+                day: {"volume": item["volume"], "open_interest": None, "close": item["close"]}
+                for day, item in self._daily_stats(self._get_contract_bars(contract, minutes=self.STATS_DAYS * 24 * 60)).items()
+            }
+
+        with self.store.lock:
+            series = self.store.series(root)
+            if daily or cached is None:
+                series.meta["daily_stats"][contract] = daily
+                cached = daily
+            series.meta["stats_refreshed_at"][contract] = now_epoch
+            self.store.save(series)
+        return cached
+
+    @staticmethod
+    def _comparable(front_day, next_day):
+        """Both contracts reported volume and a non-zero settlement (close) for the day."""
+        for stats in (front_day, next_day):
+            if stats.get("volume") is None or not stats.get("close"):
+                return False
+        return True
+
+    @staticmethod
+    def _crossed(front_day, next_day):
+        """Next contract leads on volume and, where both are reported, on open interest."""
+        if float(next_day["volume"]) <= float(front_day["volume"]):
+            return False
+        front_oi = front_day.get("open_interest")
+        next_oi = next_day.get("open_interest")
+        if front_oi is None or next_oi is None:
+            return True
+        return float(next_oi) > float(front_oi)
+
     def detect_rollover(self, symbol):
         root = self._normalize_root(symbol)
         cache_key = f"detect:{root}"
@@ -113,13 +177,15 @@ class RolloverManager:
         front_contract = contracts[0]
         next_contract = contracts[1] if len(contracts) > 1 else contracts[0]
 
-        front_bars = self._get_contract_bars(front_contract, minutes=5 * 24 * 60)
-        next_bars = self._get_contract_bars(next_contract, minutes=5 * 24 * 60)
-
-        front_daily = self._daily_stats(front_bars)
-        next_daily = self._daily_stats(next_bars)
+        front_daily = self._contract_daily_stats(root, front_contract)
+        next_daily = self._contract_daily_stats(root, next_contract)
 
-        common_days = sorted(set(front_daily.keys()) & set(next_daily.keys()))
+        # A day missing either contract's volume or settlement cannot confirm
+        # a roll, and its zero close would become the back-adjustment.
+        common_days = sorted(
+            day for day in set(front_daily.keys()) & set(next_daily.keys())
+            if self._comparable(front_daily[day], next_daily[day])
+        )
         recent_days = common_days[-self.confirm_days:]
         latest_compare_day = common_days[-1] if common_days else None
 
@@ -128,24 +194,32 @@ class RolloverManager:
         adjustment_value = 0.0
 
         for day in recent_days:
-            if next_daily[day]["volume"] > front_daily[day]["volume"]:
+            if self._crossed(front_daily[day], next_daily[day]):
                 consecutive += 1
                 rollover_date = day
-                adjustment_value = float(next_daily[day]["close"] - front_daily[day]["close"])
+                adjustment_value = float(next_daily[day]["close"]) - float(front_daily[day]["close"])
 
         rollover_detected = consecutive >= self.confirm_days
         active_contract = next_contract if rollover_detected else front_contract
 
         latest_front_volume = 0.0
         latest_next_volume = 0.0
+        latest_front_oi = None
+        latest_next_oi = None
         if latest_compare_day:
             latest_front_volume = float(front_daily.get(latest_compare_day, {}).get("volume", 0) or 0)
             latest_next_volume = float(next_daily.get(latest_compare_day, {}).get("volume", 0) or 0)
+            latest_front_oi = front_daily.get(latest_compare_day, {}).get("open_interest")
+            latest_next_oi = next_daily.get(latest_compare_day, {}).get("open_interest")
 
         volume_ratio = 0.0
         if latest_front_volume > 0:
             volume_ratio = latest_next_volume / latest_front_volume
 
+        open_interest_ratio = None
+        if latest_front_oi and latest_next_oi is not None:
+            open_interest_ratio = float(latest_next_oi) / float(latest_front_oi)
+
         events = self._load_events()
         if rollover_detected and rollover_date:
             exists = any(
@@ -181,12 +255,113 @@ class RolloverManager:
             "latest_front_volume": latest_front_volume,
             "latest_next_volume": latest_next_volume,
             "volume_ratio": volume_ratio,
+            "open_interest_ratio": open_interest_ratio,
             "events": events,
         }
 
         self._cache[cache_key] = {"time": now, "payload": payload}
         return payload
 
+    def _fetch_stitched(self, active_contract, rollovers, minutes):
+        """Pull ``minutes`` of history across the recorded rolls, each segment shifted by the later adjustments."""
+        start_epoch = int(self._utc_now().timestamp()) - int(minutes) * 60
+        contract = active_contract
+        shift = 0.0
+        upper = None
+        segments = []
+        for roll in reversed(rollovers):
+            bars = [
+                bar for bar in self._get_contract_bars(contract, minutes)
+                if (bar_epoch(bar) or 0) >= roll["epoch"] and (upper is None or (bar_epoch(bar) or 0) < upper)
+            ]
+            segments.append((bars, shift))
+            shift += float(roll["adjustment_value"])
+            upper = roll["epoch"]
+            contract = roll["old_contract"]
+            if roll["epoch"] <= start_epoch:
+                return segments
+        bars = [bar for bar in self._get_contract_bars(contract, minutes) if upper is None or (bar_epoch(bar) or 0) < upper]
+        segments.append((bars, shift))
+        return segments
+
+    def _plan_sync(self, root, detection, minutes, now_epoch):
+        """Under the store lock: apply any new roll and decide what to fetch."""
+        series = self.store.series(root)
+        rolled = False
+        if series.meta["active_contract"] is None:
+            series.meta["active_contract"] = detection["front_contract"]
+            if detection["rollover_detected"] and detection["front_contract"] != detection["next_contract"]:
+                series.apply_roll(detection["front_contract"], detection["next_contract"], detection["rollover_date"], detection["adjustment_value"])
+            rolled = True
+        elif (
+            detection["rollover_detected"]
+            and detection["active_contract"] != series.meta["active_contract"]
+            and detection["front_contract"] == series.meta["active_contract"]
+        ):
+            # Rolls only move forward: history is back-adjusted once here and
+            # bars from the roll day on are re-pulled from the new contract.
+            series.apply_roll(detection["front_contract"], detection["next_contract"], detection["rollover_date"], detection["adjustment_value"])
+            rolled = True
+        if rolled:
+            self.store.save(series)
+
+        coverage_start = series.meta["coverage_start"]
+        wanted_start = now_epoch - int(minutes) * 60
+        backfill = coverage_start is None or wanted_start < coverage_start - 60
+
+        # A backfill re-pulls the active contract up to now, which covers the tail.
+        tail_minutes = None
+        synced_at = series.meta["synced_at"]
+        if not backfill and (synced_at is None or (now_epoch - synced_at) >= self.sync_interval_seconds):
+            last = series.last_epoch
+            if last is None:
+                tail_minutes = int(minutes)
+            else:
+                tail_minutes = (now_epoch - last) // 60 + self.SYNC_OVERLAP_MINUTES
+            tail_minutes = max(self.SYNC_OVERLAP_MINUTES, min(tail_minutes, self.store.max_days * 24 * 60))
+
+        return {
+            "active_contract": series.meta["active_contract"],
+            "rollovers": [dict(roll) for roll in series.meta["rollovers"]],
+            "backfill": backfill,
+            "wanted_start": wanted_start,
+            "tail_minutes": tail_minutes,
+        }
+
+    def _sync_store(self, root, detection, minutes):
+        """Bring the root's stored series up to date; returns it. Only new bars are pulled once history exists.
+
+        The store lock is held only to plan and to merge: Databento fetches
+        run without it so readers of other roots and the window of this one
+        are not blocked behind the network.
+        """
+        now_epoch = int(self._utc_now().timestamp())
+        with self.store.lock:
+            plan = self._plan_sync(root, detection, minutes, now_epoch)
+        if not plan["backfill"] and plan["tail_minutes"] is None:
+            return self.store.series(root)
+
+        segments = self._fetch_stitched(plan["active_contract"], plan["rollovers"], minutes) if plan["backfill"] else []
+        tail = self._get_contract_bars(plan["active_contract"], plan["tail_minutes"]) if plan["tail_minutes"] is not None else []
+
+        with self.store.lock:
+            series = self.store.series(root)
+            if series.meta["active_contract"] != plan["active_contract"] or len(series.meta["rollovers"]) != len(plan["rollovers"]):
+                # Another writer rolled the series while we fetched; these
+                # bars carry the old adjustment, so leave it to the next sync.
+                return series
+            if plan["backfill"]:
+                for bars, shift in segments:
+                    series.prepend(bars, shift)
+                    series.append(bars, shift)
+                coverage_start = series.meta["coverage_start"]
+                series.meta["coverage_start"] = plan["wanted_start"] if coverage_start is None else min(coverage_start, plan["wanted_start"])
+            if plan["tail_minutes"] is not None:
+                series.append(tail)
+            series.meta["synced_at"] = now_epoch
+            self.store.save(series)
+            return series
+
     def get_continuous_ohlcv(self, symbol, minutes=240):
         root = self._normalize_root(symbol)
         cache_key = f"continuous:{root}:{minutes}"
@@ -197,74 +372,34 @@ class RolloverManager:
             return cached["payload"]
 
         detection = self.detect_rollover(root)
-        front_contract = detection["front_contract"]
-        next_contract = detection["next_contract"]
-
-        front_bars = self._get_contract_bars(front_contract, minutes=minutes)
-        if not front_bars:
-            payload = {"bars": [], "meta": detection}
-            self._continuous_cache[cache_key] = {"time": now, "payload": payload}
-            return payload
-
-        if not detection["rollover_detected"] or front_contract == next_contract:
-            payload = {
-                "bars": front_bars,
-                "meta": {
-                    **detection,
-                    "continuous": True,
-                    "rollover_week": False,
-                },
-            }
-            self._continuous_cache[cache_key] = {"time": now, "payload": payload}
-            return payload
-
-        next_bars = self._get_contract_bars(next_contract, minutes=minutes)
-        if not next_bars:
-            payload = {
-                "bars": front_bars,
-                "meta": {
-                    **detection,
-                    "continuous": True,
-                    "rollover_week": False,
-                },
+        self._sync_store(root, detection, minutes)
+        with self.store.lock:
+            series = self.store.series(root)
+            bars = series.window(minutes)
+            last_roll = series.meta["rollovers"][-1] if series.meta["rollovers"] else None
+            store_status = {
+                "bars": len(series),
+                "first_bar": bars[0]["time"] if bars else None,
+                "rollovers_applied": len(series.meta["rollovers"]),
             }
-            self._continuous_cache[cache_key] = {"time": now, "payload": payload}
-            return payload
-
-        adjustment = float(detection.get("adjustment_value", 0) or 0)
-        rollover_day = detection.get("rollover_date")
-
-        combined = []
-        for bar in front_bars:
-            ts = str(bar.get("time", ""))
-            if rollover_day and ts[:10] >= rollover_day:
-                continue
-            combined.append(bar)
-
-        for bar in next_bars:
-            adjusted_bar = dict(bar)
-            adjusted_bar["open"] = float(adjusted_bar.get("open", 0) or 0) - adjustment
-            adjusted_bar["high"] = float(adjusted_bar.get("high", 0) or 0) - adjustment
-            adjusted_bar["low"] = float(adjusted_bar.get("low", 0) or 0) - adjustment
-            adjusted_bar["close"] = float(adjusted_bar.get("close", 0) or 0) - adjustment
-            combined.append(adjusted_bar)
-
-        combined.sort(key=lambda item: item.get("time", ""))
+            active_contract = series.meta["active_contract"]
 
         rollover_week = False
-        if rollover_day:
-            try:
-                rollover_dt = datetime.fromisoformat(f"{rollover_day}T00:00:00+00:00")
-                rollover_week = abs((now - rollover_dt).days) <= 8
-            except Exception:
-                rollover_week = False
+        if last_roll:
+            rollover_week = abs(now.timestamp() - last_roll["epoch"]) <= 8 * 86400
 
         payload = {
-            "bars": combined,
+            "bars": bars,
             "meta": {
                 **detection,
+                # The stored series only rolls forward, so its contract and
+                # last applied roll identify the adjustment behind ``bars``.
+                "active_contract": active_contract,
+                "rollover_date": last_roll["rollover_date"] if last_roll else detection.get("rollover_date"),
+                "adjustment_value": last_roll["adjustment_value"] if last_roll else 0.0,
                 "continuous": True,
                 "rollover_week": rollover_week,
+                "store": store_status,
             },
         }
 
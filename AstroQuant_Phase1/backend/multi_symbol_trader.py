@@ -1,20 +1,14 @@
 import time
 from datetime import datetime, timezone
 from engine.data_engine import DataEngine
-from engine.orderflow_engine import OrderFlowEngine
-from engine.iceberg_engine import IcebergEngine
-from engine.fusion_engine import FusionEngine
-from engine.ict_engine import ICTEngine
-from engine.gann_engine import GannEngine
-from engine.astro_engine import AstroEngine
-from engine.regime_engine import RegimeEngine
 from engine.execution_pipeline import ExecutionPipeline
 from backend.modules.rollover_manager import RolloverManager
 from backend.services.spread_mapper_service import SpreadMapperService
+from backend.services.bar_aggregator import rollover_signature, shared_aggregator
+from backend.services.analysis_snapshot_service import get_analysis_snapshot_service
 from execution.execution_manager import get_execution_manager
 from execution.symbol_mapper import is_execution_supported, to_execution_symbol
 from execution.config import PRIORITY_RULES, TRADE_UNIVERSE, SYMBOL_SPREAD_LIMITS
-from backend.engines.news_engine import NewsEngine
 from backend.services.data_freshness_service import staleness_limit_for
 from execution.position_monitor import PositionMonitor
 
@@ -30,17 +24,10 @@ MODEL_MAX_TRADES_PER_SESSION = {
 class MultiSymbolTrader:
     def __init__(self):
         self.data_engine = DataEngine()
-        self.orderflow = OrderFlowEngine()
-        self.iceberg_engine = IcebergEngine()
-        self.fusion = FusionEngine()
-        self.ict_engine = ICTEngine()
-        self.gann_engine = GannEngine()
-        self.astro_engine = AstroEngine()
-        self.regime_engine = RegimeEngine()
-        self.news_engine = NewsEngine()
         self.execution_pipeline = ExecutionPipeline()
         self.rollover_manager = RolloverManager(self.data_engine)
         self.spread_mapper = SpreadMapperService()
+        self.analysis_snapshots = get_analysis_snapshot_service()
         self.execution_manager = get_execution_manager()
         self.trade_universe = TRADE_UNIVERSE
         self.session_trade_counter = {}
@@ -112,6 +99,8 @@ class MultiSymbolTrader:
             continuous = self.rollover_manager.get_continuous_ohlcv(symbol, minutes=360)
             bars = continuous.get("bars") or []
             if bars:
+                # Keep the shared rollups warm so /analyze serves this symbol from memory.
+                shared_aggregator().ingest(symbol, bars, signature=rollover_signature(continuous.get("meta")))
                 return bars
 
         return self.data_engine.get_ohlcv(data_symbol) or []
@@ -247,14 +236,15 @@ class MultiSymbolTrader:
             print(f"Stale data for {data_symbol}. Auto-trade blocked.")
             return None
 
-        of = self.orderflow.analyze(bars)
-        ice = self.iceberg_engine.detect(of, bars[-1])
-        ict = self.ict_engine.analyze(bars)
-        gann = self.gann_engine.analyze(bars)
-        astro = self.astro_engine.analyze()
-        regime = self.regime_engine.detect(bars)
-        news = self.news_engine.analyze(data_symbol, bars)
-        fu = self.fusion.combine(of, ice, ict, gann, astro, regime)
+        snapshot = self.analysis_snapshots.get(data_symbol, "1m", bars)
+        of = snapshot["orderflow"]
+        ice = snapshot["iceberg"]
+        ict = snapshot["ict"]
+        gann = snapshot["gann"]
+        astro = snapshot["astro"]
+        regime = snapshot["regime"]
+        news = snapshot["news"]
+        fu = snapshot["fusion"]
 
         model_payload = self._build_model_payload(
             bars,
@@ -417,6 +407,7 @@ class MultiSymbolTrader:
                             data_symbol,
                             broker_symbol,
                             lookback_minutes=180,
+                            rollover_status=rollover_status,
                         )
                         spread_adjusted = self.spread_mapper.apply_basis(
                             updated_signal.get("side"),
@@ -430,6 +421,7 @@ class MultiSymbolTrader:
                         candidate["execution_payload"]["entry"] = spread_adjusted.get("entry")
                         candidate["execution_payload"]["stop"] = spread_adjusted.get("stop")
                         candidate["execution_payload"]["basis_applied"] = spread_adjusted.get("basis")
+                        candidate["execution_payload"]["basis_status"] = self.spread_mapper.basis_status(data_symbol, broker_symbol, lookback_minutes=180)
                         candidate["execution_payload"]["rollover_risk_modifier"] = updated_signal.get("rollover_risk_modifier", 1.0)
                         candidate["execution_payload"]["rollover_status"] = rollover_status or {}
 
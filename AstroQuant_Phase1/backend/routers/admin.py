@@ -114,8 +114,10 @@ def set_phase(phase: str, _auth: None = Depends(require_admin_key)):
     return {"success": success, "active_phase": prop_lock.phase}
 
 @router.get("/stress-test")
-def stress_test(_auth: None = Depends(require_admin_key)):
+def stress_test(paths: int = Query(1, ge=1, le=200000), _auth: None = Depends(require_admin_key)):
     engine = StressEngine()
+    if paths > 1:
+        return engine.run_paths(paths=paths)
     result = engine.run()
     return result
 
@@ -2,22 +2,18 @@ from fastapi import APIRouter, Depends, Query
 from concurrent.futures import ThreadPoolExecutor, wait
 import csv
 import os
+import time
+from collections import deque
 from datetime import datetime, timezone
 
 from backend.security import require_admin_key
 from engine.data_engine import DataEngine
 from engine.orderflow_engine import OrderFlowEngine
-from engine.iceberg_engine import IcebergEngine
-from engine.fusion_engine import FusionEngine
-from ai.mentor import AIMentor
-from engine.ict_engine import ICTEngine
-from engine.gann_engine import GannEngine
-from engine.astro_engine import AstroEngine
-from engine.regime_engine import RegimeEngine
 from engine.prop_phase_engine import PropPhaseEngine
 from engine.capital_engine import CapitalEngine
 from engine.risk_engine import RiskEngine
 from execution.execution_manager import get_execution_manager
+from execution.execution_queue import get_execution_queue
 from execution.symbol_mapper import to_execution_symbol
 from execution.config import SYMBOL_SPREAD_LIMITS, TRADE_UNIVERSE
 from backend.engines.news_engine import NewsEngine
@@ -26,6 +22,8 @@ from backend.engines.liquidity_engine import LiquidityEngine
 from backend.modules.rollover_manager import RolloverManager
 from backend.services.data_freshness_service import staleness_limit_for
 from backend.services.market_data_service import safe_float, normalize_bars, generate_fallback_bars, aggregate_bars
+from backend.services.bar_aggregator import bar_epoch, rollover_signature, shared_aggregator
+from backend.services.analysis_snapshot_service import get_analysis_snapshot_service
 
 
 router = APIRouter()
@@ -45,21 +43,17 @@ def emergency_start(_auth: None = Depends(require_admin_key)):
 
 data_engine = DataEngine()
 orderflow = OrderFlowEngine()
-iceberg_engine = IcebergEngine()
-fusion = FusionEngine()
-mentor = AIMentor()
-ict_engine = ICTEngine()
-gann_engine = GannEngine()
-astro_engine = AstroEngine()
-regime_engine = RegimeEngine()
 phase_engine = PropPhaseEngine()
 capital_engine = CapitalEngine()
 risk_engine = RiskEngine()
 execution_manager = get_execution_manager()
+execution_queue = get_execution_queue()
+analyze_read_ms = deque(maxlen=200)
 news_guard_engine = NewsEngine()
 cycle_overlay_engine = CycleEngine()
 liquidity_overlay_engine = LiquidityEngine()
 rollover_manager = RolloverManager(data_engine)
+analysis_snapshots = get_analysis_snapshot_service()
 try:
     MARKET_FETCH_TIMEOUT_SECONDS = float(os.getenv("MARKET_FETCH_TIMEOUT_SECONDS", "8"))
 except Exception:
@@ -531,10 +525,28 @@ def liquidity_status(symbol: str):
     return output
 
 
+@router.get("/analysis/snapshots")
+def analysis_snapshot_status():
+    return analysis_snapshots.status()
+
+
+@router.get("/execution/queue")
+def execution_queue_status():
+    reads = sorted(analyze_read_ms)
+    status = execution_queue.status()
+    status["analyze_read_ms"] = {
+        "samples": len(reads),
+        "p50": round(reads[len(reads) // 2], 2) if reads else None,
+        "p95": round(reads[min(len(reads) - 1, int(len(reads) * 0.95))], 2) if reads else None,
+    }
+    return status
+
+
 @router.get("/analyze/{symbol}")
 
 
 def analyze(symbol: str, tf: str = Query("5m")):
+    read_started = time.perf_counter()
     base_bars, rollover_meta, has_live_data = _load_bars_with_rollover(symbol, minutes=360, fallback_count=120)
     raw_bars = base_bars if has_live_data else []
     data_age_seconds = _bar_age_seconds(base_bars)
@@ -545,27 +557,38 @@ def analyze(symbol: str, tf: str = Query("5m")):
         and data_age_seconds <= max_staleness_seconds
     )
 
-    bars = aggregate_bars(base_bars, tf)
-
-    of = orderflow.analyze(bars)
-    ice = iceberg_engine.detect(of, bars[-1])
-    ict = ict_engine.analyze(bars)
-    gann = gann_engine.analyze(bars)
-    astro = astro_engine.analyze()
-    regime = regime_engine.detect(bars)
-
-    fu = fusion.combine(of, ice, ict, gann, astro, regime)
-
-    mentor_struct = mentor.structured(fu, ice, ict, gann, astro)
-
-    news_guard = news_guard_engine.analyze(symbol, bars)
-    cycle_data = cycle_overlay_engine.analyze(bars)
-    liquidity_data = liquidity_overlay_engine.analyze(bars)
-
-    # --- Institutional position sync ---
-    execution_manager.sync_position_state()
+    bars = []
+    if has_live_data:
+        # Live 1m bars roll into every timeframe incrementally; only bars newer
+        # than the last ingest are parsed and the requested timeframe is read
+        # from memory for the fetched window.
+        bar_store = shared_aggregator()
+        bar_store.ingest(symbol, base_bars, signature=rollover_signature(rollover_meta))
+        first_epoch = bar_epoch(base_bars[0])
+        bars = bar_store.bars(symbol, tf, since=first_epoch) if first_epoch is not None else []
+    if not bars:
+        bars = aggregate_bars(base_bars, tf)
+
+    # One engine run per (symbol, timeframe, bar update), shared with the
+    # trader; the response below copies what it annotates.
+    snapshot = analysis_snapshots.get(symbol, tf, bars)
+    ice = snapshot["iceberg"]
+    gann = snapshot["gann"]
+    astro = snapshot["astro"]
+    ict = snapshot["ict"]
+    fu = dict(snapshot["fusion"])
+    mentor_struct = snapshot["mentor"]
+    news_guard = snapshot["news"]
+    cycle_data = snapshot["cycle"]
+    liquidity_data = snapshot["liquidity"]
+
+    # This GET never touches the broker: position sync and trade execution
+    # go to the execution queue worker, which dedupes per bar so repeated
+    # polling cannot execute twice.
+    execution_queue.request_sync()
 
     auto_executed = False
+    execution_dispatch = None
     trade_halted = bool(news_guard.get("trade_halt", False))
     halt_reason = news_guard.get("high_impact", "News risk event") if trade_halted else None
 
@@ -574,7 +597,8 @@ def analyze(symbol: str, tf: str = Query("5m")):
         halt_reason = "Stale market data"
 
     if fu["confidence"] >= 75 and raw_bars and not trade_halted:
-        auto_executed = execution_manager.execute_trade(fu, symbol=symbol)
+        execution_dispatch = execution_queue.submit_trade(fu, symbol, bar_time=base_bars[-1].get("time"))
+        auto_executed = execution_dispatch["queued"]
 
     fu["prices"] = bars
     fu["signals"] = []
@@ -611,6 +635,14 @@ def analyze(symbol: str, tf: str = Query("5m")):
             "level_50": gann.get("level_50"),
             "level_100": gann.get("level_100")
         },
+        "ict": {
+            "enabled": True,
+            "times": [start_time, end_time] if bars else [],
+            "fvgs": ict.get("open_fvgs", []),
+            "fvg_above": ict.get("fvg_above"),
+            "fvg_below": ict.get("fvg_below"),
+            "structure": ict.get("structure"),
+        },
         "astro": {
             "enabled": True,
             "times": [bars[-1]["time"]] if bars else [],
@@ -648,11 +680,12 @@ def analyze(symbol: str, tf: str = Query("5m")):
     }
 
 
-    return {
+    response = {
         "symbol": symbol,
         "execution_symbol": to_execution_symbol(symbol),
         "fusion": fu,
         "auto_executed": auto_executed,
+        "execution_dispatch": execution_dispatch,
         "trade_halted": trade_halted,
         "halt_reason": halt_reason,
         "news": news_guard,
@@ -668,6 +701,8 @@ def analyze(symbol: str, tf: str = Query("5m")):
             "rollover": rollover_meta,
         }
     }
+    analyze_read_ms.append((time.perf_counter() - read_started) * 1000.0)
+    return response
 
 
 # --- PHASE 3: PROP STATUS ROUTE ---
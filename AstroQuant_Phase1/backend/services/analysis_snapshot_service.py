@@ -0,0 +1,149 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+from engine.orderflow_engine import OrderFlowEngine
+from engine.iceberg_engine import IcebergEngine
+from engine.fusion_engine import FusionEngine
+from engine.ict_engine import ICTEngine
+from engine.gann_engine import GannEngine
+from engine.astro_engine import AstroEngine
+from engine.regime_engine import RegimeEngine
+from ai.mentor import AIMentor
+from backend.engines.news_engine import NewsEngine
+from backend.engines.cycle_engine import CycleEngine
+from backend.engines.liquidity_engine import LiquidityEngine
+
+
+class AnalysisSnapshotService:
+    """
+    Full engine bundle per (symbol, timeframe, last bar), computed once.
+
+    /analyze and MultiSymbolTrader both read from here, so dashboard polling
+    and the trading loop share one engine run per bar update. Concurrent
+    requests for the same key wait on the in-flight build instead of
+    starting their own.
+    """
+
+    def __init__(self, max_entries=64):
+        self.orderflow = OrderFlowEngine()
+        self.iceberg_engine = IcebergEngine()
+        self.fusion = FusionEngine()
+        self.ict_engine = ICTEngine()
+        self.gann_engine = GannEngine()
+        self.astro_engine = AstroEngine()
+        self.regime_engine = RegimeEngine()
+        self.mentor = AIMentor()
+        self.news_engine = NewsEngine()
+        self.cycle_engine = CycleEngine()
+        self.liquidity_engine = LiquidityEngine()
+        self.max_entries = max(1, int(max_entries))
+        self._snapshots = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "builds": 0, "coalesced": 0, "build_ms_total": 0.0}
+
+    @staticmethod
+    def _bar_key(bars):
+        if not bars:
+            return None
+        last = bars[-1]
+        # The astro engine reads the UTC hour, so the key rolls with it too.
+        return (
+            len(bars),
+            bars[0].get("time"),
+            last.get("time"),
+            last.get("high"),
+            last.get("low"),
+            last.get("close"),
+            last.get("volume"),
+            datetime.now(timezone.utc).hour,
+        )
+
+    def _build(self, symbol, timeframe, bars):
+        of = self.orderflow.analyze(bars)
+        ice = self.iceberg_engine.detect(of, bars[-1])
+        ict = self.ict_engine.analyze(bars, stream=(str(symbol or "").upper(), str(timeframe or "")))
+        gann = self.gann_engine.analyze(bars)
+        astro = self.astro_engine.analyze()
+        regime = self.regime_engine.detect(bars)
+        fu = self.fusion.combine(of, ice, ict, gann, astro, regime)
+        return {
+            "orderflow": of,
+            "iceberg": ice,
+            "ict": ict,
+            "gann": gann,
+            "astro": astro,
+            "regime": regime,
+            "fusion": fu,
+            "mentor": self.mentor.structured(fu, ice, ict, gann, astro),
+            "news": self.news_engine.analyze(symbol, bars),
+            "cycle": self.cycle_engine.analyze(bars),
+            "liquidity": self.liquidity_engine.analyze(bars),
+        }
+
+    def get(self, symbol, timeframe, bars):
+        """Engine bundle for ``bars``; treat the returned dicts as read-only and copy before mutating."""
+        if not bars:
+            return None
+        key = (str(symbol or "").upper(), str(timeframe or ""))
+        bar_key = self._bar_key(bars)
+
+        while True:
+            with self._lock:
+                cached = self._snapshots.get(key)
+                if cached is not None and cached["bar_key"] == bar_key:
+                    self.stats["hits"] += 1
+                    return cached["bundle"]
+                inflight = self._inflight.get(key)
+                if inflight is None or inflight[0] != bar_key:
+                    event = threading.Event()
+                    self._inflight[key] = (bar_key, event)
+                    break
+                self.stats["coalesced"] += 1
+            inflight[1].wait()
+            with self._lock:
+                cached = self._snapshots.get(key)
+                if cached is not None and cached["bar_key"] == bar_key:
+                    return cached["bundle"]
+            # The build we waited on failed; loop and build it here.
+
+        started = time.perf_counter()
+        try:
+            bundle = self._build(symbol, timeframe, bars)
+            bundle["computed_at"] = datetime.now(timezone.utc).isoformat()
+            with self._lock:
+                self.stats["builds"] += 1
+                self.stats["build_ms_total"] += (time.perf_counter() - started) * 1000.0
+                self._snapshots[key] = {"bar_key": bar_key, "bundle": bundle}
+                if len(self._snapshots) > self.max_entries:
+                    self._snapshots.pop(next(iter(self._snapshots)))
+            return bundle
+        finally:
+            with self._lock:
+                if self._inflight.get(key, (None, None))[1] is event:
+                    self._inflight.pop(key, None)
+            event.set()
+
+    def status(self):
+        with self._lock:
+            builds = self.stats["builds"]
+            return {
+                "entries": len(self._snapshots),
+                "hits": self.stats["hits"],
+                "builds": builds,
+                "coalesced": self.stats["coalesced"],
+                "avg_build_ms": round(self.stats["build_ms_total"] / builds, 3) if builds else None,
+            }
+
+
+_shared_snapshot_service = None
+_shared_snapshot_lock = threading.Lock()
+
+
+def get_analysis_snapshot_service():
+    global _shared_snapshot_service
+    with _shared_snapshot_lock:
+        if _shared_snapshot_service is None:
+            _shared_snapshot_service = AnalysisSnapshotService()
+    return _shared_snapshot_service
@@ -0,0 +1,191 @@
+import threading
+from collections import deque
+from datetime import datetime, timezone
+
+from backend.services.market_data_service import parse_time_value, safe_float
+
+
+TIMEFRAME_MINUTES = {
+    "1m": 1,
+    "5m": 5,
+    "15m": 15,
+    "1h": 60,
+    "4h": 240,
+}
+
+# Roughly five days of history per timeframe.
+DEFAULT_CAPACITY = {
+    "1m": 7200,
+    "5m": 1440,
+    "15m": 480,
+    "1h": 120,
+    "4h": 30,
+}
+
+
+def bar_epoch(bar):
+    """Whole-minute UTC epoch seconds of a bar, or None when its time cannot be parsed."""
+    dt = parse_time_value(bar.get("time"))
+    if dt is None:
+        return None
+    return int(dt.timestamp()) // 60 * 60
+
+
+def rollover_signature(meta):
+    """Identity of a continuous series' back-adjustment; changes when the contract rolls."""
+    if not meta:
+        return None
+    return (meta.get("active_contract"), meta.get("rollover_date"), meta.get("adjustment_value"))
+
+
+def _iso(epoch):
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat()
+
+
+def _bar_values(bar):
+    return (
+        safe_float(bar.get("open", 0)),
+        safe_float(bar.get("high", 0)),
+        safe_float(bar.get("low", 0)),
+        safe_float(bar.get("close", 0)),
+        max(0.0, safe_float(bar.get("volume", 0))),
+    )
+
+
+def _merge(base, values):
+    """OHLCV of ``base`` (or None) followed by one more minute."""
+    open_, high, low, close, volume = values
+    if base is None:
+        return (open_, high, low, close, volume)
+    return (base[0], max(base[1], high), min(base[2], low), close, base[4] + volume)
+
+
+class _Rollup:
+    """One timeframe of one symbol: closed buckets plus the forming bucket."""
+
+    def __init__(self, minutes, capacity):
+        self.seconds = minutes * 60
+        self.bars = deque(maxlen=max(1, int(capacity)))
+        self.bucket = None
+        self.base = None
+        self.current = None
+
+    def apply(self, epoch, values, revision):
+        bucket = epoch - (epoch % self.seconds)
+        if bucket != self.bucket:
+            self.bucket = bucket
+            self.base = None
+            self.bars.append({"time": _iso(bucket)})
+        elif not revision:
+            # A new minute in the same bucket: the previous minute is final.
+            self.base = self.current
+        self.current = _merge(self.base, values)
+        row = self.bars[-1]
+        row["open"], row["high"], row["low"], row["close"], row["volume"] = self.current
+
+
+class BarAggregator:
+    """
+    Per-symbol 1m bars rolled up into every timeframe as they arrive.
+
+    Each bucket keeps the aggregate of its finished minutes plus the latest
+    minute, so a new minute or a revision of the forming one is O(1) per
+    timeframe. Bars are keyed by integer epoch; only bars at or after the
+    last ingested time are parsed, so repeat ingests of an overlapping
+    window cost a string comparison per old bar.
+    """
+
+    def __init__(self, capacity=None):
+        self.capacity = dict(DEFAULT_CAPACITY)
+        self.capacity.update(capacity or {})
+        self._symbols = {}
+        self._lock = threading.Lock()
+
+    def _state(self, symbol):
+        state = self._symbols.get(symbol)
+        if state is None:
+            state = {
+                "rollups": {tf: _Rollup(minutes, self.capacity.get(tf, 500)) for tf, minutes in TIMEFRAME_MINUTES.items()},
+                "last_epoch": None,
+                "last_time": None,
+                "signature": None,
+            }
+            self._symbols[symbol] = state
+        return state
+
+    def _apply(self, state, epoch, values):
+        last = state["last_epoch"]
+        revision = last is not None and epoch == last
+        for rollup in state["rollups"].values():
+            rollup.apply(epoch, values, revision)
+        state["last_epoch"] = epoch
+
+    def ingest(self, symbol, bars, signature=None):
+        """Feed normalized 1m bars (ascending); returns how many were applied."""
+        if not bars:
+            return 0
+        key = str(symbol or "").upper()
+        with self._lock:
+            state = self._state(key)
+            if signature != state["signature"]:
+                # Back-adjusted continuous series shift every price on a
+                # roll, so a new signature restarts the symbol from scratch.
+                del self._symbols[key]
+                state = self._state(key)
+                state["signature"] = signature
+
+            start = len(bars)
+            last_time = state["last_time"]
+            while start > 0 and (last_time is None or str(bars[start - 1].get("time", "")) >= last_time):
+                start -= 1
+
+            applied = 0
+            for bar in bars[start:]:
+                epoch = bar_epoch(bar)
+                if epoch is None:
+                    continue
+                if state["last_epoch"] is not None and epoch < state["last_epoch"]:
+                    continue
+                self._apply(state, epoch, _bar_values(bar))
+                state["last_time"] = str(bar.get("time", ""))
+                applied += 1
+            return applied
+
+    def bars(self, symbol, timeframe="1m", since=None):
+        """Bars for ``timeframe`` from memory, optionally only buckets containing ``since`` or later."""
+        minutes = TIMEFRAME_MINUTES.get(str(timeframe or "").lower(), 1)
+        tf = next(name for name, value in TIMEFRAME_MINUTES.items() if value == minutes)
+        with self._lock:
+            state = self._symbols.get(str(symbol or "").upper())
+            if state is None:
+                return []
+            rows = state["rollups"][tf].bars
+            if since is None:
+                return [dict(row) for row in rows]
+            floor = _iso(since - (since % (minutes * 60)))
+            return [dict(row) for row in rows if row["time"] >= floor]
+
+    def reset(self, symbol=None):
+        with self._lock:
+            if symbol is None:
+                self._symbols.clear()
+            else:
+                self._symbols.pop(str(symbol or "").upper(), None)
+
+    def status(self, symbol):
+        with self._lock:
+            state = self._symbols.get(str(symbol or "").upper())
+            if state is None:
+                return {"symbol": symbol, "last_bar": None, "counts": {}}
+            return {
+                "symbol": symbol,
+                "last_bar": state["last_time"],
+                "counts": {tf: len(rollup.bars) for tf, rollup in state["rollups"].items()},
+            }
+
+
+_shared = BarAggregator()
+
+
+def shared_aggregator():
+    return _shared
@@ -37,7 +37,7 @@ def generate_fallback_bars(count=120):
     return bars
 
 
-def _parse_time_value(value):
+def parse_time_value(value):
     if value is None:
         return None
 
@@ -75,7 +75,7 @@ def normalize_bars(raw_bars):
             or datetime.now(timezone.utc).isoformat()
         )
 
-        parsed_time = _parse_time_value(raw_time)
+        parsed_time = parse_time_value(raw_time)
         if parsed_time is None:
             continue
 
@@ -105,21 +105,23 @@ def aggregate_bars(bars, timeframe="1m"):
         "4h": 240,
     }
     minutes = tf_map.get(str(timeframe or "").lower(), 1)
+    bucket_seconds = minutes * 60
 
+    # Buckets are keyed by integer epoch so 1h/4h floor on whole hours since
+    # the epoch; live symbols are served incrementally by bar_aggregator.
     buckets = {}
     for bar in bars:
-        dt = _parse_time_value(bar.get("time"))
+        dt = parse_time_value(bar.get("time"))
         if dt is None:
             continue
 
-        minute_bucket = (dt.minute // minutes) * minutes
-        bucket_time = dt.replace(minute=minute_bucket, second=0, microsecond=0)
-        key = bucket_time.isoformat()
+        epoch = int(dt.timestamp())
+        key = epoch - (epoch % bucket_seconds)
 
         existing = buckets.get(key)
         if existing is None:
             buckets[key] = {
-                "time": key,
+                "time": datetime.fromtimestamp(key, tz=timezone.utc).isoformat(),
                 "open": safe_float(bar.get("open", 0)),
                 "high": safe_float(bar.get("high", 0)),
                 "low": safe_float(bar.get("low", 0)),
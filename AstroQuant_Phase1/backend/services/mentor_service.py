@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor
 import os
+import threading
 
 from backend.engines.iceberg_engine import IcebergEngine
 from backend.engines.gann_engine import GannEngine
@@ -32,6 +33,41 @@ class MentorService:
         except Exception:
             configured_timeout = 8.0
         self.fetch_timeout_seconds = max(2.0, min(configured_timeout, 30.0))
+        self._stage_cache = {}
+        self._build_cache = {}
+        self._cache_lock = threading.Lock()
+        self.cache_stats = {"hits": 0, "misses": 0, "stage_hits": 0, "stage_misses": 0}
+
+    @staticmethod
+    def _bars_key(bars):
+        if not bars:
+            return (0,)
+        last = bars[-1]
+        return (
+            len(bars),
+            bars[0].get("time"),
+            last.get("time"),
+            last.get("open"),
+            last.get("high"),
+            last.get("low"),
+            last.get("close"),
+            last.get("volume"),
+        )
+
+    def _stage(self, symbol, stage, key, compute):
+        # Each engine result is kept with the key of the inputs it was computed
+        # from; only stages whose key moved are recomputed.
+        cache_key = (symbol, stage)
+        with self._cache_lock:
+            cached = self._stage_cache.get(cache_key)
+            if cached is not None and cached["key"] == key:
+                self.cache_stats["stage_hits"] += 1
+                return cached["payload"]
+            self.cache_stats["stage_misses"] += 1
+        payload = compute()
+        with self._cache_lock:
+            self._stage_cache[cache_key] = {"key": key, "payload": payload}
+        return payload
 
     def _timed_get_ohlcv(self, symbol):
         if self.data_engine is None:
@@ -147,14 +183,26 @@ class MentorService:
     def build(self, symbol):
         raw_bars = self._timed_get_ohlcv(symbol)
         price_data = normalize_bars(raw_bars) if raw_bars else generate_fallback_bars(120)
-        orderflow = self._build_orderflow_snapshot(price_data)
-
-        iceberg_data = self.iceberg.analyze(symbol, orderflow)
-        gann_data = self.gann.analyze(symbol, price_data)
-        astro_data = self.astro.analyze(symbol)
-        cycle_data = self.cycle.analyze(price_data)
-        liquidity_data = self.liquidity.analyze(price_data)
-        news_data = self.news.analyze(symbol, price_data)
+
+        # The dashboard polls every second, but the inputs only change when a
+        # bar updates or the UTC hour (astro window / kill zone) rolls over.
+        bars_key = self._bars_key(price_data)
+        hour = datetime.now(timezone.utc).hour
+        fingerprint = (bars_key, hour)
+        with self._cache_lock:
+            cached = self._build_cache.get(symbol)
+            if cached is not None and cached["key"] == fingerprint:
+                self.cache_stats["hits"] += 1
+                return cached["payload"]
+            self.cache_stats["misses"] += 1
+
+        orderflow = self._stage(symbol, "orderflow", bars_key, lambda: self._build_orderflow_snapshot(price_data))
+        iceberg_data = self._stage(symbol, "iceberg", bars_key, lambda: self.iceberg.analyze(symbol, orderflow))
+        gann_data = self._stage(symbol, "gann", bars_key, lambda: self.gann.analyze(symbol, price_data))
+        astro_data = self._stage(symbol, "astro", hour, lambda: self.astro.analyze(symbol))
+        cycle_data = self._stage(symbol, "cycle", bars_key, lambda: self.cycle.analyze(price_data))
+        liquidity_data = self._stage(symbol, "liquidity", bars_key, lambda: self.liquidity.analyze(price_data))
+        news_data = self._stage(symbol, "news", bars_key, lambda: self.news.analyze(symbol, price_data))
         governance = self._build_governance(news_data, orderflow)
         context = self._build_context(price_data, orderflow, liquidity_data, cycle_data)
 
@@ -170,7 +218,7 @@ class MentorService:
             f"News state: {news_data['high_impact']}"
         )
 
-        return {
+        payload = {
             "symbol": symbol,
             "active_model": "Fusion Model 3",
             "confidence": confidence,
@@ -187,3 +235,6 @@ class MentorService:
             "news": news_data,
             "governance": governance,
         }
+        with self._cache_lock:
+            self._build_cache[symbol] = {"key": fingerprint, "payload": payload}
+        return payload
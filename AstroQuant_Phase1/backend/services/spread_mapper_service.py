@@ -1,12 +1,81 @@
-from statistics import median
+import os
+import threading
+import time
+from bisect import bisect_left, insort
 
-from backend.services.market_data_service import normalize_bars
+from backend.services.market_data_service import normalize_bars, parse_time_value
+
+
+class _BasisSeries:
+    """Rolling source/execution closes joined on bar minute, with a sorted diff list for the median."""
+
+    def __init__(self, lookback_minutes, max_pairs):
+        self.lookback_seconds = max(60, int(lookback_minutes) * 60)
+        self.max_pairs = max(1, int(max_pairs))
+        self.source = {}
+        self.execution = {}
+        self.diffs = {}
+        self.sorted_diffs = []
+        self.aligned_times = []
+        self.refreshed_at = None
+        self.contract = None
+
+    def latest_time(self, side):
+        bars = self.source if side == "source" else self.execution
+        return max(bars) if bars else None
+
+    def _drop_diff(self, minute):
+        old = self.diffs.pop(minute, None)
+        if old is None:
+            return
+        del self.sorted_diffs[bisect_left(self.sorted_diffs, old)]
+        del self.aligned_times[bisect_left(self.aligned_times, minute)]
+
+    def add(self, side, minute, close):
+        own, other = (self.source, self.execution) if side == "source" else (self.execution, self.source)
+        own[minute] = close
+        if minute not in other:
+            return
+        # A re-fetched (still forming) bar replaces its earlier diff.
+        self._drop_diff(minute)
+        diff = self.source[minute] - self.execution[minute]
+        self.diffs[minute] = diff
+        insort(self.sorted_diffs, diff)
+        insort(self.aligned_times, minute)
+
+    def trim(self):
+        newest = max(self.latest_time("source") or 0, self.latest_time("execution") or 0)
+        cutoff = newest - self.lookback_seconds
+        for bars in (self.source, self.execution):
+            for minute in [minute for minute in bars if minute <= cutoff]:
+                del bars[minute]
+        while self.aligned_times and (self.aligned_times[0] <= cutoff or len(self.aligned_times) > self.max_pairs):
+            self._drop_diff(self.aligned_times[0])
+
+    def median(self):
+        values = self.sorted_diffs
+        count = len(values)
+        if count == 0:
+            return 0.0
+        middle = count // 2
+        if count % 2:
+            return float(values[middle])
+        return float((values[middle - 1] + values[middle]) / 2.0)
 
 
 class SpreadMapperService:
 
-    def __init__(self):
+    def __init__(self, ttl_seconds=None, max_pairs=50, refresh_overlap_minutes=3):
+        if ttl_seconds is None:
+            try:
+                ttl_seconds = float(os.getenv("SPREAD_BASIS_TTL_SECONDS", "60"))
+            except Exception:
+                ttl_seconds = 60.0
+        self.ttl_seconds = max(1.0, float(ttl_seconds))
+        self.max_pairs = max(1, int(max_pairs))
+        self.refresh_overlap_minutes = max(1, int(refresh_overlap_minutes))
         self._basis_cache = {}
+        self._lock = threading.Lock()
 
     @staticmethod
     def _safe_float(value, default=0.0):
@@ -15,37 +84,100 @@ class SpreadMapperService:
         except Exception:
             return float(default)
 
-    def estimate_basis(self, data_engine, source_symbol, execution_symbol, lookback_minutes=180):
-        cache_key = f"{source_symbol}->{execution_symbol}:{lookback_minutes}"
-        if cache_key in self._basis_cache:
-            return self._basis_cache[cache_key]
-
-        source_raw = data_engine.get_ohlcv(source_symbol, minutes=lookback_minutes)
-        execution_raw = data_engine.get_ohlcv(execution_symbol, minutes=lookback_minutes)
-
-        source_bars = normalize_bars(source_raw) if source_raw else []
-        execution_bars = normalize_bars(execution_raw) if execution_raw else []
-
-        if not source_bars or not execution_bars:
-            basis = 0.0
-            self._basis_cache[cache_key] = basis
-            return basis
-
-        aligned_count = min(len(source_bars), len(execution_bars), 50)
-        if aligned_count <= 0:
-            basis = 0.0
-            self._basis_cache[cache_key] = basis
-            return basis
-
-        diffs = []
-        for index in range(1, aligned_count + 1):
-            source_close = self._safe_float(source_bars[-index].get("close", 0), 0)
-            execution_close = self._safe_float(execution_bars[-index].get("close", 0), 0)
-            diffs.append(source_close - execution_close)
-
-        basis = float(median(diffs)) if diffs else 0.0
-        self._basis_cache[cache_key] = basis
-        return basis
+    @staticmethod
+    def _cache_key(source_symbol, execution_symbol, lookback_minutes):
+        return f"{source_symbol}->{execution_symbol}:{lookback_minutes}"
+
+    @staticmethod
+    def _bar_minute(bar):
+        parsed = parse_time_value(bar.get("time"))
+        if parsed is None:
+            return None
+        return int(parsed.timestamp()) // 60 * 60
+
+    def _fetch_minutes(self, series, side, lookback_minutes):
+        latest = series.latest_time(side)
+        if latest is None:
+            return int(lookback_minutes)
+        # Pull only what arrived since the last buffered bar, re-reading a
+        # few minutes so the forming bar is replaced with its final close.
+        gap_minutes = int(max(0.0, time.time() - latest) // 60) + self.refresh_overlap_minutes
+        return max(self.refresh_overlap_minutes, min(int(lookback_minutes), gap_minutes))
+
+    @staticmethod
+    def _fetch_bars(data_engine, symbol, minutes):
+        raw = data_engine.get_ohlcv(symbol, minutes=minutes)
+        return normalize_bars(raw) if raw else []
+
+    def _merge(self, series, side, bars):
+        for bar in bars:
+            minute = self._bar_minute(bar)
+            if minute is not None:
+                series.add(side, minute, self._safe_float(bar.get("close", 0), 0))
+
+    @staticmethod
+    def _contract_signature(rollover_status):
+        if not rollover_status:
+            return None
+        return (rollover_status.get("active_contract"), rollover_status.get("current_front"))
+
+    def estimate_basis(self, data_engine, source_symbol, execution_symbol, lookback_minutes=180, rollover_status=None):
+        cache_key = self._cache_key(source_symbol, execution_symbol, lookback_minutes)
+        contract = self._contract_signature(rollover_status)
+        with self._lock:
+            series = self._basis_cache.get(cache_key)
+            if series is None or (contract is not None and series.contract is not None and series.contract != contract):
+                # Fresh series on first use and when the front contract rolls,
+                # since pre-roll closes belong to a different contract.
+                series = _BasisSeries(lookback_minutes, self.max_pairs)
+                self._basis_cache[cache_key] = series
+            if contract is not None:
+                series.contract = contract
+
+            if series.refreshed_at is not None and (time.monotonic() - series.refreshed_at) < self.ttl_seconds:
+                return series.median()
+            source_minutes = self._fetch_minutes(series, "source", lookback_minutes)
+            execution_minutes = self._fetch_minutes(series, "execution", lookback_minutes)
+
+        # Databento pulls run without the lock so other pairs, status reads
+        # and invalidation are not queued behind the network.
+        source_bars = self._fetch_bars(data_engine, source_symbol, source_minutes)
+        execution_bars = self._fetch_bars(data_engine, execution_symbol, execution_minutes)
+
+        with self._lock:
+            # If the series was invalidated or rolled meanwhile it is no longer
+            # cached; merging still answers this call without reviving it.
+            self._merge(series, "source", source_bars)
+            self._merge(series, "execution", execution_bars)
+            series.trim()
+            series.refreshed_at = time.monotonic()
+            return series.median()
+
+    def invalidate(self, source_symbol=None):
+        with self._lock:
+            if source_symbol is None:
+                self._basis_cache.clear()
+                return
+            prefix = f"{source_symbol}->"
+            for key in [key for key in self._basis_cache if key.startswith(prefix)]:
+                del self._basis_cache[key]
+
+    def basis_status(self, source_symbol, execution_symbol, lookback_minutes=180):
+        with self._lock:
+            series = self._basis_cache.get(self._cache_key(source_symbol, execution_symbol, lookback_minutes))
+            if series is None:
+                return {"basis": None, "pairs": 0, "age_seconds": None, "last_aligned_bar": None, "bar_lag_seconds": None, "stale": True, "contract": None}
+            age = None if series.refreshed_at is None else round(time.monotonic() - series.refreshed_at, 3)
+            last_aligned = series.aligned_times[-1] if series.aligned_times else None
+            return {
+                "basis": series.median(),
+                "pairs": len(series.sorted_diffs),
+                "age_seconds": age,
+                "last_aligned_bar": last_aligned,
+                "bar_lag_seconds": None if last_aligned is None else round(time.time() - last_aligned, 3),
+                "stale": age is None or age >= self.ttl_seconds,
+                "contract": series.contract[0] if series.contract else None,
+            }
 
     def apply_basis(self, side, entry, stop, basis):
         entry_val = self._safe_float(entry, 0)
@@ -1,6 +1,8 @@
 import random
 import math
 
+import numpy as np
+
 class StressEngine:
 
     def __init__(self,
@@ -81,3 +83,60 @@ class StressEngine:
             "max_loss_streak": self.max_loss_streak,
             "violated": violated
         }
+
+    def run_paths(self, paths=100000, seed=None):
+        """Vectorised ``run`` over many independent paths at once.
+
+        Applies the same spread/news shocks and 3% daily / 8% total limits as
+        ``run``; a path stops trading at its first violation.
+        """
+        paths = max(1, int(paths))
+        per_day = max(1, int(self.trades_per_day))
+        total = max(1, int(self.days)) * per_day
+        rng = np.random.default_rng(seed)
+
+        win = rng.random((paths, total)) < self.winrate
+        news = rng.random((paths, total)) < 0.05
+        spread = rng.random((paths, total)) < 0.05
+        risk_mult = np.where(spread, 1.2, 1.0)
+        r = np.where(news, -1.5, np.where(win, self.rr, -1.0)) * risk_mult
+
+        balance = np.empty((paths, total + 1))
+        balance[:, 0] = self.start_balance
+        np.cumprod(1.0 + r * self.risk_per_trade, axis=1, out=balance[:, 1:])
+        balance[:, 1:] *= self.start_balance
+        after = balance[:, 1:]
+
+        # Daily loss only accumulates losing trades, matching ``run``.
+        losses = np.minimum(after - balance[:, :-1], 0.0).reshape(paths, -1, per_day)
+        daily_loss = np.cumsum(losses, axis=2).reshape(paths, total)
+        breach = (daily_loss < -self.start_balance * 0.03) | (after < self.start_balance * 0.92)
+        violated = breach.any(axis=1)
+        stop = np.where(violated, breach.argmax(axis=1), total - 1)
+        live = np.arange(total) <= stop[:, None]
+
+        final = after[np.arange(paths), stop]
+        drawdown = np.where(live, np.maximum.accumulate(balance, axis=1)[:, 1:] - after, 0.0).max(axis=1)
+
+        losing = (r < 0) & live
+        streak = np.zeros(paths, dtype=int)
+        max_streak = np.zeros(paths, dtype=int)
+        for column in range(total):
+            streak = np.where(losing[:, column], streak + 1, 0)
+            np.maximum(max_streak, streak, out=max_streak)
+
+        def pct(values, q):
+            return round(float(np.percentile(values, q)), 2)
+
+        return {
+            "paths": paths,
+            "violation_rate": round(float(violated.mean()), 4),
+            "mean_profit": round(float(final.mean() - self.start_balance), 2),
+            "profit_p5": pct(final - self.start_balance, 5),
+            "profit_p50": pct(final - self.start_balance, 50),
+            "max_drawdown_p50": pct(drawdown, 50),
+            "max_drawdown_p95": pct(drawdown, 95),
+            "max_drawdown_p99": pct(drawdown, 99),
+            "max_loss_streak_p95": int(np.percentile(max_streak, 95)),
+            "max_loss_streak_max": int(max_streak.max()),
+        }
@@ -3,6 +3,7 @@ import os
 import re
 import databento as db
 from backend.config import DATABENTO_API_KEY
+from engine import databento_cache
 
 class DataEngine:
 
@@ -30,6 +31,7 @@ class DataEngine:
         env_chains = self._parse_symbol_chain_env(os.getenv("DATABENTO_RAW_SYMBOL_CANDIDATES", ""))
         if env_chains:
             self.raw_symbol_candidates.update(env_chains)
+        databento_cache.configure_from_env()
 
         if not DATABENTO_API_KEY:
             print("DataEngine: DATABENTO_API_KEY missing, live feed disabled.")
@@ -73,7 +75,8 @@ class DataEngine:
             return None
 
     def _request_ohlcv(self, dataset, raw_symbol, start, end):
-        data = self.client.timeseries.get_range(
+        data = databento_cache.get_range(
+            self.client,
             dataset=dataset,
             schema="ohlcv-1m",
             symbols=[raw_symbol],
@@ -86,6 +89,65 @@ class DataEngine:
             return []
         return df.reset_index().to_dict(orient="records")
 
+    # Databento statistics stat_type codes used for roll detection.
+    STAT_SETTLEMENT_PRICE = 3
+    STAT_CLEARED_VOLUME = 6
+    STAT_OPEN_INTEREST = 9
+
+    def get_daily_statistics(self, symbol: str, days=5):
+        """Per-day cleared volume, open interest and settlement for one contract, keyed by YYYY-MM-DD."""
+        if self.client is None:
+            return {}
+
+        end = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=self.default_end_lag_minutes)
+        if self._available_end_cache:
+            end = min(end, self._available_end_cache - datetime.timedelta(minutes=1))
+        start = end - datetime.timedelta(days=max(1, int(days)))
+
+        for raw_symbol in self._symbol_candidates(symbol):
+            try:
+                data = databento_cache.get_range(
+                    self.client,
+                    dataset="GLBX.MDP3",
+                    schema="statistics",
+                    symbols=[raw_symbol],
+                    start=start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    end=end.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    stype_in="raw_symbol",
+                )
+                df = data.to_df()
+            except Exception as e:
+                if "symbology_invalid_request" in str(e):
+                    continue
+                print(f"Statistics error (symbol={raw_symbol}):", e)
+                return {}
+            if df.empty:
+                continue
+
+            daily = {}
+            for row in df.reset_index().to_dict(orient="records"):
+                stat_type = int(row.get("stat_type", 0) or 0)
+                day = None
+                # Settlement and open interest refer to a trading date via ts_ref.
+                for field in ("ts_ref", "ts_event"):
+                    try:
+                        day = row.get(field).strftime("%Y-%m-%d")
+                        break
+                    except Exception:
+                        continue
+                if not day:
+                    continue
+                state = daily.setdefault(day, {"volume": None, "open_interest": None, "close": None})
+                if stat_type == self.STAT_CLEARED_VOLUME:
+                    state["volume"] = float(row.get("quantity", 0) or 0)
+                elif stat_type == self.STAT_OPEN_INTEREST:
+                    state["open_interest"] = float(row.get("quantity", 0) or 0)
+                elif stat_type == self.STAT_SETTLEMENT_PRICE:
+                    state["close"] = float(row.get("price", 0) or 0)
+            return daily
+
+        return {}
+
     def _symbol_candidates(self, symbol: str):
         normalized = str(symbol or "").strip().upper()
         if not normalized:
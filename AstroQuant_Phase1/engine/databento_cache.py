@@ -0,0 +1,454 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple
+
+# databento, numpy and pandas are imported where they are used, so importing
+# this module (every market route does) stays cheap until a range is fetched.
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts fall back to the in-process lock
+    fcntl = None
+
+
+def _to_ns(value):
+    """UTC nanoseconds for a get_range bound, or None for relative/unparseable values."""
+    import numpy as np
+    import pandas as pd
+
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    try:
+        stamp = pd.Timestamp(value)
+        if pd.isna(stamp) or stamp.year < 1970:
+            return None
+        if stamp.tzinfo is None:
+            stamp = stamp.tz_localize("UTC")
+        return int(stamp.tz_convert("UTC").value)
+    except Exception:
+        return None
+
+
+class _SymbolMapping(NamedTuple):
+    # Metadata() takes mappings as objects with these attributes, while
+    # DBNStore.metadata.mappings hands them back as a dict of plain dicts.
+    raw_symbol: str
+    intervals: list
+
+
+def _symbol_mappings(metadatas):
+    """Union of the stores' ``{raw_symbol: [interval dicts]}`` mappings, in Metadata() form."""
+    from databento.common.symbology import MappingInterval
+
+    merged = {}
+    for metadata in metadatas:
+        for raw_symbol, intervals in (metadata.mappings or {}).items():
+            bucket = merged.setdefault(str(raw_symbol), set())
+            for interval in intervals:
+                bucket.add(MappingInterval(interval["start_date"], interval["end_date"], str(interval["symbol"])))
+    return [_SymbolMapping(raw_symbol, sorted(intervals)) for raw_symbol, intervals in sorted(merged.items())]
+
+
+def _record_ns(record):
+    # get_range filters on ts_recv when the schema has it, else ts_event.
+    value = getattr(record, "ts_recv", None)
+    if value is None:
+        value = record.ts_event
+    return int(value)
+
+
+class CachedRange:
+    """
+    DBNStore-shaped view over cached segments and freshly fetched stores.
+
+    Each part is (store, lo, hi): only records with lo <= ts < hi are
+    yielded, parts are in time order and never overlap, and ``limit`` caps
+    the total the way the API does (first N records of the range).
+    """
+
+    def __init__(self, parts, limit=None):
+        self.parts = parts
+        self.limit = limit
+
+    def __iter__(self):
+        emitted = 0
+        for store, lo, hi in self.parts:
+            for record in store:
+                ts = _record_ns(record)
+                if ts < lo or ts >= hi:
+                    continue
+                yield record
+                emitted += 1
+                if self.limit and emitted >= self.limit:
+                    return
+
+    def to_df(self, **kwargs):
+        import numpy as np
+        import pandas as pd
+
+        frames = []
+        for store, lo, hi in self.parts:
+            df = store.to_df(**kwargs)
+            if df.empty:
+                continue
+            index = df.index
+            stamps = index.asi8 if isinstance(index, pd.DatetimeIndex) else np.asarray(index, dtype=np.int64)
+            frames.append(df[(stamps >= lo) & (stamps < hi)])
+        if not frames:
+            return self.parts[0][0].to_df(**kwargs).iloc[0:0] if self.parts else pd.DataFrame()
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        return df.head(self.limit) if self.limit else df
+
+    @property
+    def metadata(self):
+        return self.parts[0][0].metadata if self.parts else None
+
+
+class DatabentoCache:
+    """
+    Read-through cache for ``timeseries.get_range`` shared by every process on the host.
+
+    Responses are stored as uncompressed DBN segments under one directory,
+    keyed by (dataset, schema, symbols, stype_in, stype_out) with the
+    nanosecond range each segment covers. A request is served from the
+    segments that cover it and only the missing sub-ranges go to Databento;
+    the part of a range newer than ``settle_seconds`` is always fetched and
+    never stored, since recent bars may still be revised. Runs of touching
+    segments are merged into one file, the JSON index is guarded by an
+    flock so concurrent processes see one consistent view, and least
+    recently used segments are evicted past ``max_bytes``.
+    """
+
+    COMPACT_RUN = 8
+
+    def __init__(self, directory, max_bytes, settle_seconds=900):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(1, int(max_bytes))
+        self.settle_ns = int(max(0.0, float(settle_seconds)) * 1e9)
+        self._index_path = self.directory / "index.json"
+        self._lock_path = self.directory / "index.lock"
+        self._thread_lock = threading.Lock()
+        self.stats = {"hits": 0, "partial": 0, "misses": 0, "bypassed": 0, "fetches": 0, "evicted": 0}
+
+    @contextmanager
+    def _locked(self):
+        with self._thread_lock:
+            with open(self._lock_path, "a+") as handle:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _read_index(self):
+        try:
+            return json.loads(self._index_path.read_text())
+        except Exception:
+            return {"segments": {}}
+
+    def _write_index(self, index):
+        tmp_path = self._index_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(index))
+        os.replace(tmp_path, self._index_path)
+
+    @staticmethod
+    def _key(dataset, schema, symbols, stype_in, stype_out):
+        if isinstance(symbols, (str, int)):
+            symbols = [symbols]
+        parts = [str(dataset), str(schema), ",".join(sorted(str(item) for item in symbols or [])), str(stype_in), str(stype_out)]
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:20]
+
+    @staticmethod
+    def _cover(segments, start, end):
+        """Greedy non-overlapping cover of [start, end): (covered pieces, gaps)."""
+        covered, gaps = [], []
+        cursor = start
+        ordered = sorted(segments, key=lambda item: item[1]["start"])
+        while cursor < end:
+            best = None
+            for seg_id, seg in ordered:
+                if seg["start"] <= cursor < seg["end"] and (best is None or seg["end"] > best[1]["end"]):
+                    best = (seg_id, seg)
+            if best is not None:
+                hi = min(best[1]["end"], end)
+                covered.append((best[0], cursor, hi))
+                cursor = hi
+                continue
+            upcoming = [seg["start"] for _, seg in ordered if cursor < seg["start"] < end]
+            hi = min(upcoming) if upcoming else end
+            gaps.append((cursor, hi))
+            cursor = hi
+        return covered, gaps
+
+    def _fetch(self, client, request, lo, hi, limit):
+        import pandas as pd
+
+        self.stats["fetches"] += 1
+        return client.timeseries.get_range(
+            **request,
+            start=pd.Timestamp(lo, unit="ns", tz="UTC"),
+            end=pd.Timestamp(hi, unit="ns", tz="UTC"),
+            limit=limit,
+        )
+
+    def _store(self, key, store, lo, hi):
+        """Persist ``store`` as a segment covering [lo, hi); returns its id or None."""
+        if hi <= lo:
+            return None
+        seg_id = uuid.uuid4().hex
+        path = self.directory / f"{seg_id}.dbn"
+        store.to_file(path, compression="none")
+        with self._locked():
+            index = self._read_index()
+            existing = [(other_id, seg) for other_id, seg in index["segments"].items() if seg["key"] == key]
+            if not self._cover(existing, lo, hi)[1]:
+                # Another thread or process stored this range while we fetched it.
+                path.unlink()
+                return None
+            index["segments"][seg_id] = {
+                "key": key,
+                "start": int(lo),
+                "end": int(hi),
+                "file": path.name,
+                "bytes": path.stat().st_size,
+                "last_access": time.time(),
+            }
+            self._compact(index, key)
+            self._evict(index)
+            self._write_index(index)
+        return seg_id
+
+    def _compact(self, index, key):
+        """Merge runs of touching segments of ``key`` into one file once a run reaches COMPACT_RUN."""
+        import databento as db
+        import databento_dbn
+
+        segments = sorted(((seg_id, seg) for seg_id, seg in index["segments"].items() if seg["key"] == key), key=lambda item: item[1]["start"])
+        runs, run = [], []
+        for item in segments:
+            if run and item[1]["start"] > max(seg["end"] for _, seg in run):
+                runs.append(run)
+                run = []
+            run.append(item)
+        runs.append(run)
+        for run in runs:
+            if len(run) < self.COMPACT_RUN:
+                continue
+            chunks, cursor, metadatas = [], None, []
+            for seg_id, seg in run:
+                store = db.DBNStore.from_bytes((self.directory / seg["file"]).read_bytes())
+                metadatas.append(store.metadata)
+                for record in store:
+                    ts = _record_ns(record)
+                    if seg["start"] <= ts < seg["end"] and (cursor is None or ts >= cursor):
+                        chunks.append(bytes(record))
+                cursor = seg["end"] if cursor is None else max(cursor, seg["end"])
+            lo = run[0][1]["start"]
+            metadata = metadatas[0]
+            symbols = []
+            for item in metadatas:
+                symbols.extend(symbol for symbol in item.symbols or [] if symbol not in symbols)
+            try:
+                header = databento_dbn.Metadata(
+                    dataset=metadata.dataset,
+                    start=lo,
+                    stype_in=metadata.stype_in,
+                    stype_out=metadata.stype_out,
+                    schema=metadata.schema,
+                    symbols=symbols,
+                    end=cursor,
+                    mappings=_symbol_mappings(metadatas),
+                ).encode()
+            except Exception:
+                # A merged file without its symbology would lose instrument
+                # mappings; keep the run as separate segments instead.
+                continue
+            merged_id = uuid.uuid4().hex
+            path = self.directory / f"{merged_id}.dbn"
+            path.write_bytes(bytes(header) + b"".join(chunks))
+            for seg_id, seg in run:
+                del index["segments"][seg_id]
+                try:
+                    (self.directory / seg["file"]).unlink()
+                except FileNotFoundError:
+                    pass
+            index["segments"][merged_id] = {
+                "key": key,
+                "start": lo,
+                "end": cursor,
+                "file": path.name,
+                "bytes": path.stat().st_size,
+                "last_access": time.time(),
+            }
+
+    def _evict(self, index):
+        segments = index["segments"]
+        total = sum(seg["bytes"] for seg in segments.values())
+        for seg_id, seg in sorted(segments.items(), key=lambda item: item[1]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            try:
+                (self.directory / seg["file"]).unlink()
+            except FileNotFoundError:
+                pass
+            total -= seg["bytes"]
+            del segments[seg_id]
+            self.stats["evicted"] += 1
+
+    def get_range(self, client, dataset, schema="trades", symbols=None, start=None, end=None, stype_in="raw_symbol", stype_out="instrument_id", limit=None, **kwargs):
+        request = {"dataset": dataset, "schema": schema, "symbols": symbols, "stype_in": stype_in, "stype_out": stype_out, **kwargs}
+        start_ns, end_ns = _to_ns(start), _to_ns(end)
+        cutoff = time.time_ns() - self.settle_ns
+        if kwargs.get("path") or start_ns is None or end_ns is None or start_ns >= min(end_ns, cutoff):
+            # Relative or open-ended windows and entirely unsettled ranges go straight through.
+            self.stats["bypassed"] += 1
+            return client.timeseries.get_range(**request, start=start, end=end, limit=limit)
+
+        import databento as db
+
+        key = self._key(dataset, schema, symbols, stype_in, stype_out)
+        settled_end = min(end_ns, cutoff)
+        with self._locked():
+            index = self._read_index()
+            segments = [(seg_id, seg) for seg_id, seg in index["segments"].items() if seg["key"] == key]
+            covered, gaps = self._cover(segments, start_ns, settled_end)
+            loaded = {}
+            missing = False
+            for seg_id, _, _ in covered:
+                if seg_id in loaded:
+                    continue
+                seg = index["segments"][seg_id]
+                seg["last_access"] = time.time()
+                try:
+                    loaded[seg_id] = db.DBNStore.from_bytes((self.directory / seg["file"]).read_bytes())
+                except OSError:
+                    # Segment removed behind the index's back: forget it and refetch.
+                    del index["segments"][seg_id]
+                    missing = True
+            if covered:
+                self._write_index(index)
+        if missing:
+            return self.get_range(client, dataset, schema, symbols=symbols, start=start, end=end, stype_in=stype_in, stype_out=stype_out, limit=limit, **kwargs)
+        if settled_end < end_ns:
+            # The unsettled tail is fetched with the last gap when they touch.
+            if gaps and gaps[-1][1] == settled_end:
+                gaps[-1] = (gaps[-1][0], end_ns)
+            else:
+                gaps.append((settled_end, end_ns))
+
+        if not gaps:
+            self.stats["hits"] += 1
+        elif covered:
+            self.stats["partial"] += 1
+        else:
+            self.stats["misses"] += 1
+
+        pieces = [(lo, (loaded[seg_id], lo, hi)) for seg_id, lo, hi in covered]
+        truncated_at = None
+        for lo, hi in gaps:
+            fetched = self._fetch(client, request, lo, hi, limit)
+            serve_hi, store_hi = hi, min(hi, settled_end)
+            if limit:
+                stamps = [_record_ns(record) for record in fetched]
+                if len(stamps) >= limit:
+                    # A capped response is only complete strictly before its last timestamp.
+                    serve_hi, store_hi = stamps[-1] + 1, min(stamps[-1], settled_end)
+                    truncated_at = lo if truncated_at is None else min(truncated_at, lo)
+            pieces.append((lo, (fetched, lo, serve_hi)))
+            try:
+                self._store(key, fetched, lo, store_hi)
+            except OSError as error:
+                print(f"Databento cache: could not store segment ({error}).")
+
+        pieces.sort(key=lambda item: item[0])
+        parts = []
+        for lo, part in pieces:
+            parts.append(part)
+            if truncated_at is not None and lo >= truncated_at:
+                break
+        return CachedRange(parts, limit=limit)
+
+    def status(self):
+        with self._locked():
+            segments = self._read_index()["segments"]
+        return {
+            "directory": str(self.directory),
+            "segments": len(segments),
+            "bytes": sum(seg["bytes"] for seg in segments.values()),
+            "max_bytes": self.max_bytes,
+            **self.stats,
+        }
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+_settings = None
+
+
+def configure(enabled=True, directory=None, max_mb=2048, settle_seconds=900):
+    """Set the shared cache's settings; ``directory`` defaults to <repo>/data/databento_cache."""
+    global _settings, _shared_cache
+    config = {
+        "enabled": bool(enabled),
+        "directory": str(directory or Path(__file__).resolve().parents[2] / "data" / "databento_cache"),
+        "max_mb": int(max_mb),
+        "settle_seconds": int(settle_seconds),
+    }
+    with _shared_cache_lock:
+        if config != _settings:
+            _settings = config
+            _shared_cache = None
+
+
+def configure_from_env():
+    """Apply the DATABENTO_CACHE_* environment settings; called when DataEngine starts."""
+    try:
+        max_mb = int(os.getenv("DATABENTO_CACHE_MAX_MB", "2048"))
+    except Exception:
+        max_mb = 2048
+    try:
+        settle_seconds = int(os.getenv("DATABENTO_CACHE_SETTLE_SECONDS", "900"))
+    except Exception:
+        settle_seconds = 900
+    configure(
+        enabled=os.getenv("DATABENTO_CACHE_ENABLED", "true").strip().lower() in {"1", "true", "yes", "on"},
+        directory=os.getenv("DATABENTO_CACHE_DIR", "").strip() or None,
+        max_mb=max_mb,
+        settle_seconds=settle_seconds,
+    )
+
+
+def settings():
+    if _settings is None:
+        configure_from_env()
+    return _settings
+
+
+def shared_cache():
+    global _shared_cache
+    config = settings()
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = DatabentoCache(
+                config["directory"],
+                max_bytes=config["max_mb"] * 1024 * 1024,
+                settle_seconds=config["settle_seconds"],
+            )
+    return _shared_cache
+
+
+def get_range(client, **kwargs):
+    """Drop-in for ``client.timeseries.get_range`` that reads through the shared on-disk cache."""
+    if not settings()["enabled"]:
+        return client.timeseries.get_range(**kwargs)
+    return shared_cache().get_range(client, **kwargs)
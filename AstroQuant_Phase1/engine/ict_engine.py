@@ -1,3 +1,6 @@
+from engine.ict_structure import ICTStructureTracker, tracker_for
+
+
 class ICTEngine:
 
     def detect_fvg(self, bars):
@@ -23,15 +26,38 @@ class ICTEngine:
 
         return signals
 
-    def analyze(self, bars):
+    @staticmethod
+    def _forming_fvg(bars):
+        # The last bar is still forming, so it is checked here rather than
+        # committed to the tracker.
+        if len(bars) < 3:
+            return None
+        prev, curr = bars[-3], bars[-1]
+        if curr["low"] > prev["high"]:
+            return {"type": "BULLISH_FVG", "price": curr["low"]}
+        if curr["high"] < prev["low"]:
+            return {"type": "BEARISH_FVG", "price": curr["high"]}
+        return None
+
+    def analyze(self, bars, stream=None):
+        """ICT read of ``bars``; with a ``stream`` key, structure is kept incrementally across calls."""
+        tracker = tracker_for(stream) if stream is not None else ICTStructureTracker()
+        price = bars[-1]["close"] if bars else None
+        # Concurrent snapshot builds share the stream's tracker: feed it and
+        # read it in one go so this call sees exactly the bars it passed.
+        with tracker.lock:
+            tracker.ingest(bars)
+            structure = tracker.state(price)
+            open_fvgs = tracker.open_fvgs(limit=20)
 
-        fvg = self.detect_fvg(bars)
+        last = self._forming_fvg(bars)
+        if last is None and structure["last_fvg"]:
+            last = {"type": structure["last_fvg"]["type"], "price": structure["last_fvg"]["price"]}
 
         score = 0
         direction = None
 
-        if fvg:
-            last = fvg[-1]
+        if last:
             if "BULLISH" in last["type"]:
                 score += 30
                 direction = "BUY"
@@ -42,5 +68,14 @@ class ICTEngine:
         return {
             "ict_score": score,
             "ict_direction": direction,
-            "fvg": fvg[-1] if fvg else None
+            "fvg": last,
+            "open_fvgs": open_fvgs,
+            "fvg_above": structure.get("fvg_above"),
+            "fvg_below": structure.get("fvg_below"),
+            "structure": {
+                "trend": structure["trend"],
+                "last_break": structure["last_break"],
+                "last_sweep": structure["last_sweep"],
+                "liquidity": structure["liquidity"],
+            },
         }
@@ -0,0 +1,325 @@
+import bisect
+import itertools
+import threading
+from collections import deque
+
+
+class ICTStructureTracker:
+    """Incremental ICT market structure for one bar stream.
+
+    Each closed bar is applied once:
+    - FVGs: a new fair value gap is detected from the bar two back; open gaps
+      the bar trades into shrink, and gaps it trades through are marked filled.
+    - Swings and BOS/CHOCH: confirmed fractal swings become the levels whose
+      close-through is a break of structure (with the trend) or a change of
+      character (against it).
+    - Liquidity pools: unswept swing highs/lows, with equal levels merged; a
+      wick through a pool that closes back inside is a sweep.
+
+    Open gaps sit in a list sorted by bottom, so "nearest open FVG
+    above/below" is a bisect. Pools are kept sorted and swept from the end
+    nearest price, so each gap or pool is inserted and removed once:
+    amortised O(1) per bar.
+
+    Trackers from ``tracker_for`` are shared between concurrent callers, so
+    feeding and queries take ``lock``; hold it around an ``ingest`` and the
+    reads that should see the same bars.
+    """
+
+    def __init__(self, swing_strength=2, equal_tolerance_pct=0.0005, max_open_fvgs=300, max_pools=200):
+        self.swing_strength = max(1, int(swing_strength))
+        self.equal_tolerance_pct = max(0.0, float(equal_tolerance_pct))
+        self.max_open_fvgs = max(1, int(max_open_fvgs))
+        self.max_pools = max(1, int(max_pools))
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        self.bars_seen = 0
+        self.last_time = None
+        self._last_bar = None
+        self._recent = deque(maxlen=self.swing_strength * 2 + 1)
+        self._ids = itertools.count(1)
+        # Open FVGs: sorted (bottom, id) keys plus id -> record.
+        self._fvg_keys = []
+        self._fvgs = {}
+        self._max_fvg_height = 0.0
+        self.last_fvg = None
+        self.filled_count = 0
+        # Swing structure.
+        self.trend = None
+        self.swing_high = None
+        self.swing_low = None
+        self.last_break = None
+        # Liquidity pools: buy-side (above, ascending) and sell-side (below, ascending).
+        self._buy_side = []
+        self._sell_side = []
+        self.last_sweep = None
+
+    # --- FVGs -------------------------------------------------------------
+
+    def _open_fvg(self, kind, bottom, top, index, time_value):
+        if top <= bottom:
+            return None
+        fvg_id = next(self._ids)
+        record = {
+            "id": fvg_id,
+            "type": kind,
+            "bottom": bottom,
+            "top": top,
+            "created_index": index,
+            "time": time_value,
+            "price": top if kind == "BULLISH_FVG" else bottom,
+        }
+        self._fvgs[fvg_id] = record
+        bisect.insort(self._fvg_keys, (bottom, fvg_id))
+        self._max_fvg_height = max(self._max_fvg_height, top - bottom)
+        if len(self._fvg_keys) > self.max_open_fvgs:
+            oldest = min(self._fvgs)
+            self._drop_fvg(oldest)
+        self.last_fvg = record
+        return record
+
+    def _drop_fvg(self, fvg_id):
+        record = self._fvgs.pop(fvg_id, None)
+        if record is None:
+            return None
+        index = bisect.bisect_left(self._fvg_keys, (record["bottom"], fvg_id))
+        if index < len(self._fvg_keys) and self._fvg_keys[index] == (record["bottom"], fvg_id):
+            del self._fvg_keys[index]
+        if not self._fvgs:
+            self._max_fvg_height = 0.0
+        return record
+
+    def _mitigate(self, low, high):
+        filled = []
+        # Only gaps with bottom <= high can touch this bar, and none starting
+        # below low - tallest open gap can reach it; walk that slice.
+        position = bisect.bisect_right(self._fvg_keys, (high, float("inf"))) - 1
+        floor = low - self._max_fvg_height
+        touched = []
+        while position >= 0 and self._fvg_keys[position][0] >= floor:
+            record = self._fvgs[self._fvg_keys[position][1]]
+            if record["top"] >= low:
+                touched.append(record["id"])
+            position -= 1
+        for fvg_id in touched:
+            record = self._fvgs[fvg_id]
+            # Price trading into a gap shrinks it from the side it came in;
+            # once it reaches the far edge the gap is filled.
+            if record["type"] == "BULLISH_FVG":
+                new_bottom, new_top = record["bottom"], min(record["top"], low)
+            else:
+                new_bottom, new_top = max(record["bottom"], high), record["top"]
+            if new_top <= new_bottom:
+                filled.append(self._drop_fvg(fvg_id))
+                continue
+            # Shrinking only moves the sort key when the bottom rises; the
+            # record stays open, so the tallest-gap bound stays valid as is.
+            if new_bottom != record["bottom"]:
+                index = bisect.bisect_left(self._fvg_keys, (record["bottom"], fvg_id))
+                del self._fvg_keys[index]
+                bisect.insort(self._fvg_keys, (new_bottom, fvg_id))
+            record["bottom"], record["top"] = new_bottom, new_top
+        self.filled_count += len(filled)
+        return filled
+
+    # --- Liquidity pools --------------------------------------------------
+
+    def _add_pool(self, pools, level, index):
+        tolerance = abs(level) * self.equal_tolerance_pct
+        position = bisect.bisect_left(pools, [level - tolerance])
+        if position < len(pools) and abs(pools[position][0] - level) <= tolerance:
+            pools[position][1] += 1
+            pools[position][2] = index
+            return
+        bisect.insort(pools, [level, 1, index])
+        if len(pools) > self.max_pools:
+            oldest = min(range(len(pools)), key=lambda i: pools[i][2])
+            del pools[oldest]
+
+    def _sweep_pools(self, high, low, close, index):
+        sweeps = []
+        while self._buy_side and self._buy_side[0][0] <= high:
+            level, touches, _ = self._buy_side.pop(0)
+            if close < level:
+                sweeps.append({"side": "BUY_SIDE", "level": level, "touches": touches, "index": index, "direction": "SELL"})
+        while self._sell_side and self._sell_side[-1][0] >= low:
+            level, touches, _ = self._sell_side.pop()
+            if close > level:
+                sweeps.append({"side": "SELL_SIDE", "level": level, "touches": touches, "index": index, "direction": "BUY"})
+        if sweeps:
+            self.last_sweep = sweeps[-1]
+        return sweeps
+
+    # --- Swings and structure breaks -------------------------------------
+
+    def _confirm_swing(self, index):
+        window = self._recent
+        if len(window) < window.maxlen:
+            return None
+        middle = window[self.swing_strength]
+        others = [bar for offset, bar in enumerate(window) if offset != self.swing_strength]
+        swing_index = index - self.swing_strength
+        confirmed = None
+        if all(middle[0] > bar[0] for bar in others):
+            self.swing_high = {"level": middle[0], "index": swing_index, "broken": False}
+            self._add_pool(self._buy_side, middle[0], swing_index)
+            confirmed = "HIGH"
+        if all(middle[1] < bar[1] for bar in others):
+            self.swing_low = {"level": middle[1], "index": swing_index, "broken": False}
+            self._add_pool(self._sell_side, middle[1], swing_index)
+            confirmed = "LOW" if confirmed is None else "BOTH"
+        return confirmed
+
+    def _check_break(self, close, index):
+        if self.swing_high and not self.swing_high["broken"] and close > self.swing_high["level"]:
+            self.swing_high["broken"] = True
+            kind = "BOS" if self.trend == "UP" else "CHOCH"
+            self.trend = "UP"
+            self.last_break = {"type": kind, "direction": "BUY", "level": self.swing_high["level"], "index": index}
+            return self.last_break
+        if self.swing_low and not self.swing_low["broken"] and close < self.swing_low["level"]:
+            self.swing_low["broken"] = True
+            kind = "BOS" if self.trend == "DOWN" else "CHOCH"
+            self.trend = "DOWN"
+            self.last_break = {"type": kind, "direction": "SELL", "level": self.swing_low["level"], "index": index}
+            return self.last_break
+        return None
+
+    # --- Feeding ----------------------------------------------------------
+
+    def update(self, bar):
+        """Apply one closed bar; returns the events it produced."""
+        with self.lock:
+            return self._apply(bar)
+
+    def _apply(self, bar):
+        high = float(bar.get("high", 0.0) or 0.0)
+        low = float(bar.get("low", 0.0) or 0.0)
+        close = float(bar.get("close", 0.0) or 0.0)
+        index = self.bars_seen
+        events = {"fvg": None, "filled": [], "break": None, "sweeps": []}
+
+        events["filled"] = self._mitigate(low, high)
+        events["sweeps"] = self._sweep_pools(high, low, close, index)
+        events["break"] = self._check_break(close, index)
+
+        if len(self._recent) >= 2:
+            two_back_high, two_back_low = self._recent[-2][0], self._recent[-2][1]
+            if low > two_back_high:
+                events["fvg"] = self._open_fvg("BULLISH_FVG", two_back_high, low, index, bar.get("time"))
+            elif high < two_back_low:
+                events["fvg"] = self._open_fvg("BEARISH_FVG", high, two_back_low, index, bar.get("time"))
+
+        self._recent.append((high, low))
+        self._confirm_swing(index)
+        self.bars_seen += 1
+        self.last_time = bar.get("time")
+        self._last_bar = (self.last_time, high, low, close)
+        return events
+
+    def _same_bar(self, bar):
+        try:
+            values = (bar.get("time"), float(bar.get("high", 0.0) or 0.0), float(bar.get("low", 0.0) or 0.0), float(bar.get("close", 0.0) or 0.0))
+        except (TypeError, ValueError):
+            return False
+        return values == self._last_bar
+
+    def ingest(self, bars, include_last=False):
+        """Feed the bars after the last applied one; the forming last bar is held back unless ``include_last``."""
+        with self.lock:
+            closed = list(bars or []) if include_last else list(bars or [])[:-1]
+            if not closed:
+                return 0
+            start = 0
+            if self.last_time is not None:
+                try:
+                    if closed[-1].get("time") == self.last_time and self._same_bar(closed[-1]):
+                        return 0
+                    start = len(closed)
+                    while start > 0 and closed[start - 1].get("time") > self.last_time:
+                        start -= 1
+                    # The series went backwards or its last applied bar changed
+                    # (e.g. a back-adjusted roll): rebuild from this window.
+                    if start == len(closed) or (start > 0 and not self._same_bar(closed[start - 1])):
+                        self.reset()
+                        start = 0
+                except TypeError:
+                    self.reset()
+                    start = 0
+            for bar in closed[start:]:
+                self._apply(bar)
+            return len(closed) - start
+
+    # --- Queries ----------------------------------------------------------
+
+    def nearest_fvg_above(self, price):
+        with self.lock:
+            position = bisect.bisect_right(self._fvg_keys, (float(price), float("inf")))
+            if position < len(self._fvg_keys):
+                return dict(self._fvgs[self._fvg_keys[position][1]])
+            return None
+
+    def nearest_fvg_below(self, price):
+        with self.lock:
+            price = float(price)
+            position = bisect.bisect_right(self._fvg_keys, (price, float("inf"))) - 1
+            best = None
+            # Keys are sorted by bottom, so once a bottom sits more than the
+            # tallest gap below the best top found, nothing lower can beat it.
+            while position >= 0:
+                record = self._fvgs[self._fvg_keys[position][1]]
+                if best is not None and record["bottom"] < best["top"] - self._max_fvg_height:
+                    break
+                if record["top"] <= price and (best is None or record["top"] > best["top"]):
+                    best = record
+                position -= 1
+            return dict(best) if best else None
+
+    def open_fvgs(self, limit=None):
+        with self.lock:
+            records = [self._fvgs[fvg_id] for _, fvg_id in self._fvg_keys]
+            records.sort(key=lambda record: record["created_index"], reverse=True)
+            if limit is not None:
+                records = records[: max(0, int(limit))]
+            return [dict(record) for record in records]
+
+    def liquidity(self):
+        with self.lock:
+            return {
+                "buy_side": [{"level": level, "touches": touches} for level, touches, _ in self._buy_side[:5]],
+                "sell_side": [{"level": level, "touches": touches} for level, touches, _ in reversed(self._sell_side[-5:])],
+            }
+
+    def state(self, price=None):
+        with self.lock:
+            snapshot = {
+                "bars_seen": self.bars_seen,
+                "trend": self.trend,
+                "swing_high": dict(self.swing_high) if self.swing_high else None,
+                "swing_low": dict(self.swing_low) if self.swing_low else None,
+                "last_break": dict(self.last_break) if self.last_break else None,
+                "last_fvg": dict(self.last_fvg) if self.last_fvg else None,
+                "last_sweep": dict(self.last_sweep) if self.last_sweep else None,
+                "open_fvg_count": len(self._fvg_keys),
+                "filled_fvg_count": self.filled_count,
+                "liquidity": self.liquidity(),
+            }
+            if price is not None:
+                snapshot["fvg_above"] = self.nearest_fvg_above(price)
+                snapshot["fvg_below"] = self.nearest_fvg_below(price)
+            return snapshot
+
+
+_trackers = {}
+_trackers_lock = threading.Lock()
+
+
+def tracker_for(key):
+    """Shared tracker per stream key (symbol, source, timeframe, ...)."""
+    with _trackers_lock:
+        tracker = _trackers.get(key)
+        if tracker is None:
+            tracker = _trackers[key] = ICTStructureTracker()
+        return tracker
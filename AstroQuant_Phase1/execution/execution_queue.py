@@ -0,0 +1,145 @@
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+
+from execution.execution_manager import get_execution_manager
+
+
+def _percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round((pct / 100.0) * (len(ordered) - 1))))
+    return round(ordered[index], 2)
+
+
+class ExecutionQueue:
+    """
+    Single worker thread that owns every broker side effect requested by a read path.
+
+    HTTP handlers only enqueue: trade decisions are deduplicated per
+    (symbol, bar, direction) so repeated polling of the same bar can never
+    execute twice, and position syncs coalesce into one pending job. Queue
+    wait and execution latency are tracked separately from read latency.
+    Trade jobs that waited longer than ``max_age_seconds`` are dropped
+    unexecuted: the decision was priced off a market that has since moved.
+    """
+
+    def __init__(self, execution_manager=None, maxsize=32, sync_min_interval=5.0, dedupe_size=512, max_age_seconds=None):
+        if max_age_seconds is None:
+            try:
+                max_age_seconds = float(os.getenv("EXECUTION_QUEUE_MAX_AGE_SECONDS", "15"))
+            except Exception:
+                max_age_seconds = 15.0
+        self.max_age_seconds = max(0.1, float(max_age_seconds))
+        self.execution_manager = execution_manager or get_execution_manager()
+        self._queue = queue.Queue(maxsize=max(1, int(maxsize)))
+        self._seen = OrderedDict()
+        self._dedupe_size = max(16, int(dedupe_size))
+        self._sync_pending = False
+        self._last_sync_at = 0.0
+        self.sync_min_interval = max(0.0, float(sync_min_interval))
+        self._lock = threading.Lock()
+        self._worker = None
+        self._queue_wait_ms = deque(maxlen=200)
+        self._execution_ms = deque(maxlen=200)
+        self._sync_ms = deque(maxlen=200)
+        self.counters = {"submitted": 0, "deduplicated": 0, "rejected_full": 0, "executed": 0, "declined": 0, "failed": 0, "expired": 0, "syncs": 0}
+        self.last_result = None
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="execution-queue", daemon=True)
+            self._worker.start()
+
+    def submit_trade(self, fusion_result, symbol, bar_time=None):
+        key = (str(symbol or "").upper(), str(bar_time or ""), str((fusion_result or {}).get("direction", "")).upper())
+        with self._lock:
+            if key in self._seen:
+                self.counters["deduplicated"] += 1
+                return {"queued": False, "reason": "Already dispatched for this bar", "key": list(key)}
+            try:
+                self._queue.put_nowait(("trade", dict(fusion_result or {}), symbol, key, time.perf_counter()))
+            except queue.Full:
+                self.counters["rejected_full"] += 1
+                return {"queued": False, "reason": "Execution queue full", "key": list(key)}
+            self._seen[key] = None
+            while len(self._seen) > self._dedupe_size:
+                self._seen.popitem(last=False)
+            self.counters["submitted"] += 1
+            self._ensure_worker()
+        return {"queued": True, "reason": None, "key": list(key)}
+
+    def request_sync(self):
+        with self._lock:
+            if self._sync_pending or (time.monotonic() - self._last_sync_at) < self.sync_min_interval:
+                return False
+            try:
+                self._queue.put_nowait(("sync", None, None, None, time.perf_counter()))
+            except queue.Full:
+                return False
+            self._sync_pending = True
+            self._ensure_worker()
+        return True
+
+    def _run(self):
+        while True:
+            kind, fusion_result, symbol, key, enqueued_at = self._queue.get()
+            started = time.perf_counter()
+            waited = started - enqueued_at
+            self._queue_wait_ms.append(waited * 1000.0)
+            if kind == "trade" and waited > self.max_age_seconds:
+                self.counters["expired"] += 1
+                self.last_result = {"key": list(key), "executed": False, "expired": True, "queue_wait_ms": round(waited * 1000.0, 2), "finished_at": time.time()}
+                self._queue.task_done()
+                continue
+            try:
+                if kind == "sync":
+                    self.execution_manager.sync_position_state()
+                    self.counters["syncs"] += 1
+                else:
+                    executed = bool(self.execution_manager.execute_trade(fusion_result, symbol=symbol))
+                    self.counters["executed" if executed else "declined"] += 1
+                    self.last_result = {"key": list(key), "executed": executed, "finished_at": time.time()}
+            except Exception as error:
+                self.counters["failed"] += 1
+                self.last_result = {"key": list(key) if key else None, "executed": False, "error": str(error), "finished_at": time.time()}
+                print(f"Execution queue {kind} error: {error}")
+            finally:
+                elapsed_ms = (time.perf_counter() - started) * 1000.0
+                if kind == "sync":
+                    self._sync_ms.append(elapsed_ms)
+                    with self._lock:
+                        self._sync_pending = False
+                        self._last_sync_at = time.monotonic()
+                else:
+                    self._execution_ms.append(elapsed_ms)
+                self._queue.task_done()
+
+    def status(self):
+        queue_wait = list(self._queue_wait_ms)
+        execution = list(self._execution_ms)
+        sync = list(self._sync_ms)
+        return {
+            "worker_alive": bool(self._worker and self._worker.is_alive()),
+            "depth": self._queue.qsize(),
+            "counters": dict(self.counters),
+            "queue_wait_ms": {"p50": _percentile(queue_wait, 50), "p95": _percentile(queue_wait, 95)},
+            "execution_ms": {"p50": _percentile(execution, 50), "p95": _percentile(execution, 95), "max": round(max(execution), 2) if execution else None},
+            "sync_ms": {"p50": _percentile(sync, 50), "p95": _percentile(sync, 95)},
+            "last_result": self.last_result,
+        }
+
+
+_shared_execution_queue = None
+_shared_execution_queue_lock = threading.Lock()
+
+
+def get_execution_queue():
+    global _shared_execution_queue
+    with _shared_execution_queue_lock:
+        if _shared_execution_queue is None:
+            _shared_execution_queue = ExecutionQueue()
+    return _shared_execution_queue
@@ -76,6 +76,13 @@ SYMBOLS = {
 DATABENTO_API_KEY = os.getenv("DATABENTO_API_KEY", "").strip()
 DATABENTO_DATASET = os.getenv("DATABENTO_DATASET", "GLBX.MDP3").strip() or "GLBX.MDP3"
 DATABENTO_STRICT_STARTUP = os.getenv("DATABENTO_STRICT_STARTUP", "false").strip().lower() in {"1", "true", "yes", "on"}
+DATABENTO_CACHE_ENABLED = _env_flag("DATABENTO_CACHE_ENABLED", default=True)
+DATABENTO_CACHE_DIR = _env_first(
+    "DATABENTO_CACHE_DIR",
+    default=str(Path(__file__).resolve().parents[2] / "data" / "databento_cache"),
+)
+DATABENTO_CACHE_MAX_MB = _env_int("DATABENTO_CACHE_MAX_MB", default=2048)
+DATABENTO_CACHE_SETTLE_SECONDS = _env_int("DATABENTO_CACHE_SETTLE_SECONDS", default=900)
 SPOT_FIDELITY_SYMBOLS = [
     s.strip().upper() for s in os.getenv("SPOT_FIDELITY_SYMBOLS", "XAUUSD").split(",") if s.strip()
 ]
@@ -97,8 +104,31 @@ EXECUTION_BROWSER_TIMEOUT_MS = _env_int(
     "EXECUTION_BROWSER_TIMEOUT_MS",
     default=_env_int("CDP_TIMEOUT_SEC", default=12) * 1000,
 )
+EXECUTION_ENGINE_MODE = os.getenv("EXECUTION_ENGINE_MODE", "sync").strip().lower() or "sync"
+EXECUTION_READ_POOL_ENABLED = _env_flag("EXECUTION_READ_POOL_ENABLED", default=False)
+EXECUTION_READ_SELECTOR_PROFILE_FILE = _env_first(
+    "EXECUTION_READ_SELECTOR_PROFILE_FILE",
+    default="data/broker_read_selectors.json",
+)
+EXECUTION_SYMBOL_CATALOGUE_REFRESH_SECONDS = _env_int("EXECUTION_SYMBOL_CATALOGUE_REFRESH_SECONDS", default=900)
 EXECUTION_LOGIN_USERNAME = os.getenv("EXECUTION_LOGIN_USERNAME", os.getenv("MAVEN_USERNAME", "")).strip()
 EXECUTION_LOGIN_PASSWORD = os.getenv("EXECUTION_LOGIN_PASSWORD", os.getenv("MAVEN_PASSWORD", "")).strip()
+NEWS_CALENDAR_URL = os.getenv("NEWS_CALENDAR_URL", "https://nfs.faireconomy.media/ff_calendar_thisweek.xml").strip()
+NEWS_CALENDAR_CACHE_FILE = os.getenv("NEWS_CALENDAR_CACHE_FILE", "data/news_calendar.json").strip()
+NEWS_CALENDAR_REFRESH_SECONDS = _env_int("NEWS_CALENDAR_REFRESH_SECONDS", default=600)
+NEWS_CALENDAR_TIMEOUT_SECONDS = float(os.getenv("NEWS_CALENDAR_TIMEOUT_SECONDS", "5"))
+MONTECARLO_ACCOUNT_KEY = os.getenv("MONTECARLO_ACCOUNT_KEY", "50K").strip().upper() or "50K"
+MONTECARLO_PATHS = _env_int("MONTECARLO_PATHS", default=100000)
+MONTECARLO_HORIZON_DAYS = _env_int("MONTECARLO_HORIZON_DAYS", default=30)
+MONTECARLO_TRADES_PER_DAY = _env_int("MONTECARLO_TRADES_PER_DAY", default=3)
+MONTECARLO_REFRESH_SECONDS = _env_int("MONTECARLO_REFRESH_SECONDS", default=3600)
+MONTECARLO_REDUCE_RISK_FAILURE_RATE = float(os.getenv("MONTECARLO_REDUCE_RISK_FAILURE_RATE", "0.35"))
+RUNNER_PRICE_TRIGGER_BPS = float(os.getenv("RUNNER_PRICE_TRIGGER_BPS", "5"))
+RUNNER_BAR_CLOSE_DELAY_SECONDS = float(os.getenv("RUNNER_BAR_CLOSE_DELAY_SECONDS", "2"))
+RUNNER_IDLE_SWEEP_SECONDS = _env_int("RUNNER_IDLE_SWEEP_SECONDS", default=60)
+RUNNER_MIN_EVAL_INTERVAL_SECONDS = float(os.getenv("RUNNER_MIN_EVAL_INTERVAL_SECONDS", "1"))
+RESOLVER_PROBE_WORKERS = _env_int("RESOLVER_PROBE_WORKERS", default=4)
+STARTUP_PROFILE = _env_flag("STARTUP_PROFILE", default=False)
 ADMIN_API_TOKEN = os.getenv("ADMIN_API_TOKEN", "dev-admin-token").strip() or "dev-admin-token"
 ADMIN_DEFAULT_ROLE = os.getenv("ADMIN_DEFAULT_ROLE", "ADMIN").strip().upper() or "ADMIN"
 
@@ -1,7 +1,8 @@
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from dataclasses import dataclass
 from astroquant.backend.governance.prop_storage import init_db, save_state, load_state
 from astroquant.backend.engines.volatility_engine import VolatilityEngine
+from astroquant.engine import clock, session_timeline
 
 
 @dataclass
@@ -23,7 +24,7 @@ class PropGovernance:
 
         self.daily_high = config.account_size
         self.daily_open_equity = config.account_size
-        self.daily_start = datetime.now(timezone.utc).date()
+        self.daily_start = clock.utcnow().date()
 
         self.trading_enabled = True
         self.profitable_days = 0
@@ -199,13 +200,8 @@ class PropGovernance:
         return state
 
     def get_session(self):
-        hour = datetime.now(timezone.utc).hour
-
-        if 0 <= hour < 7:
-            return "ASIA"
-        elif 7 <= hour < 13:
-            return "LONDON"
-        return "NEWYORK"
+        # Asia 0-6 UTC, London 7-12 UTC, otherwise New York.
+        return session_timeline.shared().prop_session()
 
     def get_phase_risk(self, news_spike=False):
         limits = self.phase_limits(self.phase)
@@ -255,7 +251,7 @@ class PropGovernance:
 
         if self.consecutive_losses == 2:
             self.cooldown_active = True
-            self.cooldown_end = datetime.now(timezone.utc) + timedelta(hours=4)
+            self.cooldown_end = clock.utcnow() + timedelta(hours=4)
 
         if self.consecutive_losses >= 3:
             self.trading_enabled = False
@@ -266,7 +262,7 @@ class PropGovernance:
         if not self.cooldown_active:
             return "OK"
 
-        now = datetime.now(timezone.utc)
+        now = clock.utcnow()
         if self.cooldown_end and now < self.cooldown_end:
             return "COOLDOWN_ACTIVE"
 
@@ -276,7 +272,7 @@ class PropGovernance:
         return "OK"
 
     def update_equity(self, equity: float):
-        today = datetime.now(timezone.utc).date()
+        today = clock.utcnow().date()
 
         if today != self.daily_start:
             if self.day_pnl > 0:
@@ -1,18 +1,22 @@
 from dotenv import load_dotenv
 import os
 from pathlib import Path
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
 # Load environment variables
 BASE_DIR = Path(__file__).resolve().parents[1]
 load_dotenv(BASE_DIR / ".env")
 load_dotenv(BASE_DIR.parent / ".env")
 
+# STARTUP_PROFILE=1 times every import and init phase below; see /status/startup.
+from astroquant.backend.startup_profile import profiler as startup_profiler
+startup_profiler.install()
 
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
 
-from astroquant.backend import router_market, router_status, router_admin
-from astroquant.backend.services.websocket_service import router as websocket_router
+with startup_profiler.phase("import_routers"):
+    from astroquant.backend import router_market, router_status, router_admin
+    from astroquant.backend.services.websocket_service import router as websocket_router
 from fastapi.staticfiles import StaticFiles
 
 app = FastAPI()
@@ -39,36 +43,34 @@ app.add_middleware(
 )
 
 # Ensure router_market is included for /market/orderflow_summary
-app.include_router(router_market.router)
-app.include_router(router_status.router)
-app.include_router(router_admin.router)
-app.include_router(websocket_router)
-
-# --- Mentor Endpoints (ported from legacy) ---
-import types
-import sys
-from fastapi import Request
-
-# Dynamically load legacy mentor logic
-MENTOR_LEGACY_PATH = BASE_DIR / "astroquant" / "backend" / "main.py.legacy.bak"
-if MENTOR_LEGACY_PATH.exists():
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("mentor_legacy", str(MENTOR_LEGACY_PATH))
-    mentor_legacy = importlib.util.module_from_spec(spec)
-    sys.modules["mentor_legacy"] = mentor_legacy
-    spec.loader.exec_module(mentor_legacy)
-else:
-    mentor_legacy = None
-
-
+with startup_profiler.phase("include_routers"):
+    app.include_router(router_market.router)
+    app.include_router(router_status.router)
+    app.include_router(router_admin.router)
+    app.include_router(websocket_router)
 
 # --- Mentor Endpoints (direct implementation, using APIRouter) ---
 from fastapi import APIRouter
 from astroquant.backend.ai.mentor_engine import MentorEngine
 
 # Register only the external mentor router
-from astroquant.backend import router_mentor
-app.include_router(router_mentor.router)
+with startup_profiler.phase("mentor_router"):
+    from astroquant.backend import router_mentor
+    app.include_router(router_mentor.router)
+
+
+@app.on_event("startup")
+def _startup_ready():
+    from astroquant.engine.databento import cache as databento_cache
+    databento_cache.configure_from_config()
+    startup_profiler.mark_ready()
+    if startup_profiler.enabled:
+        startup_profiler.print_report()
+
+
+@app.get("/status/startup")
+def startup_status(top: int = 25):
+    return startup_profiler.report(top=top)
 
 @app.get("/status/feed")
 def feed_status():
@@ -39,6 +39,7 @@ def get_chart_data(symbol: str = "GC.FUT", timeframe: str = "1", limit: int = 80
 			import databento as db
 			from datetime import datetime, timezone, timedelta
 			import concurrent.futures
+			from astroquant.engine.databento import cache as databento_cache
 			api_key = os.environ.get("DATABENTO_API_KEY")
 			if api_key:
 				now = datetime.now(timezone.utc)
@@ -47,7 +48,8 @@ def get_chart_data(symbol: str = "GC.FUT", timeframe: str = "1", limit: int = 80
 				client = db.Historical(api_key)
 
 				def fetch_db(start, end):
-					return client.timeseries.get_range(
+					return databento_cache.get_range(
+						client,
 						dataset=dataset,
 						schema=schema,
 						symbols=[symbol],
@@ -111,6 +113,24 @@ def get_chart_data(symbol: str = "GC.FUT", timeframe: str = "1", limit: int = 80
 			"signals": []
 		}
 
+
+@router.get("/chart/gann_levels")
+def get_gann_levels(symbol: str = "GC.FUT", low: float = 0.0, high: float = 0.0, kinds: str = "") -> Any:
+	from astroquant.engine.gann.gann_level_lattice import lattice_for
+	if low <= 0 or high <= 0:
+		return {"status": "ERROR", "message": "low and high must be positive prices"}
+	lattice = lattice_for(symbol)
+	wanted = [kind.strip() for kind in kinds.split(",") if kind.strip()] or None
+	levels = lattice.between(low, high, kinds=wanted)
+	snapshot = lattice.snapshot()
+	return {
+		"symbol": symbol,
+		"levels": levels,
+		"truncated": [kind for kind in snapshot["truncated"] if wanted is None or kind in wanted],
+		"lattice": snapshot,
+	}
+
+
 # Minimal /equity endpoint for dashboard integration
 @router.get("/equity")
 def get_equity(request: Request):
@@ -167,6 +187,18 @@ def get_orderflow_summary(symbol: str = "GC.FUT", timeframe: str = "1m"):
 		}
 	}
 
+
+@router.get("/dashboard/timeline")
+def get_session_timeline(day: str | None = None) -> Any:
+	from datetime import date
+	from astroquant.engine import session_timeline
+	try:
+		target = date.fromisoformat(day) if day else None
+	except ValueError:
+		return {"status": "ERROR", "message": "day must be YYYY-MM-DD"}
+	return session_timeline.shared().snapshot(target)
+
+
 # Placeholder endpoint for dashboard multi-symbol
 @router.get("/dashboard/multi_symbol")
 def get_multi_symbol_dashboard() -> Any:
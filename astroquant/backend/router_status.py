@@ -11,7 +11,6 @@ router = APIRouter()
 
 
 # Real status endpoint with Playwright broker health
-from astroquant.execution.playwright_engine import PlaywrightExecutionEngine
 import time
 import logging
 
@@ -22,6 +21,7 @@ async def get_status() -> Any:
 	system_health = get_system_health()
 	try:
 		logging.info("Instantiating PlaywrightExecutionEngine")
+		from astroquant.execution.playwright_engine import PlaywrightExecutionEngine
 		engine = PlaywrightExecutionEngine()
 		broker_ok = False
 		broker_status = {
@@ -34,11 +34,13 @@ class DatabentoLiveService:
             # Fallback: Simulate live candles using historical data (1s bars from a known-good window)
             import databento as db
             from datetime import datetime, timedelta, timezone
+            from astroquant.engine.databento import cache as databento_cache
             hist_client = db.Historical(self.api_key)
             # Use a fixed historical window (e.g., 2024-03-10 00:00:00 to 00:05:00 UTC)
             hist_start = datetime(2024, 3, 10, 0, 0, 0, tzinfo=timezone.utc)
             hist_end = datetime(2024, 3, 10, 0, 5, 0, tzinfo=timezone.utc)
-            bars = hist_client.timeseries.get_range(
+            bars = databento_cache.get_range(
+                hist_client,
                 dataset="GLBX.MDP3",
                 schema="ohlcv-1s",
                 symbols=[symbol],
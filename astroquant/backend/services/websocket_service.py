@@ -1,7 +1,7 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 import asyncio
-from astroquant.backend.services.databento_live_service import DatabentoLiveService
-from astroquant.backend.database import get_connection
+# DatabentoLiveService (databento + pandas) and the DB connection are imported
+# inside the handlers that use them so app startup does not pay for them.
 
 # Define router at the top so all decorators work
 router = APIRouter()
@@ -165,6 +165,35 @@ async def websocket_chart(websocket: WebSocket, symbol: str):
         await websocket.send_json({"error": str(e)})
 
 # --- WebSocket endpoint: AI mentor signals ---
+_mentor_v3 = None
+
+
+def _mentor_signals(symbol):
+    # Every client polls once a second, but the mentor inputs only move on a
+    # bar update, a session edge or a news-state flip; while the fingerprint is
+    # unchanged all sockets share the cached payload.
+    from astroquant.engine import mentor_cache, session_timeline
+    from astroquant.engine.candle.candle_reader import get_candle_series
+    from astroquant.engine.mentor_engine_v3 import AIMentorV3, market_from_candles
+
+    candles = get_candle_series(symbol, 1, limit=120)
+    segment = session_timeline.shared().at()
+    news_mode = {currency: state["mode"] for currency, state in segment["news"].items()}
+    fingerprint = mentor_cache.input_fingerprint(candles, news_mode=news_mode, session=segment["session"])
+
+    def build():
+        global _mentor_v3
+        if _mentor_v3 is None:
+            _mentor_v3 = AIMentorV3()
+        news = {}
+        if segment["news"]:
+            state = next(iter(segment["news"].values()))
+            news = {"news_event": state.get("title"), "news_impact": "High" if state["mode"] == "HALT" else "Medium"}
+        return _mentor_v3.generate(market_from_candles(symbol, candles, session=segment["session"], news=news))
+
+    return mentor_cache.shared().get_or_build(symbol, fingerprint, build)
+
+
 @router.websocket("/ws/ai_mentor/{symbol}")
 async def websocket_ai_mentor(websocket: WebSocket, symbol: str):
     await manager.connect(websocket)
@@ -172,10 +201,9 @@ async def websocket_ai_mentor(websocket: WebSocket, symbol: str):
     try:
         while True:
             await asyncio.sleep(1)
-            from astroquant.backend.main import mentor_engine
             signals = []
             try:
-                signals = mentor_engine.get_signals(symbol)
+                signals = await asyncio.to_thread(_mentor_signals, symbol)
             except Exception as e:
                 logging.error(f"Error fetching mentor signals for {symbol}: {e}")
                 signals = []
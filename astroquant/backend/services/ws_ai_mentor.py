@@ -1,7 +1,7 @@
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi import APIRouter
 import asyncio
-from astroquant.backend.main import mentor_engine, runner
+from astroquant.backend.services.websocket_service import _mentor_signals
 
 router = APIRouter()
 
@@ -28,9 +28,8 @@ async def ai_mentor_ws(websocket: WebSocket, symbol: str):
     try:
         while True:
             await asyncio.sleep(1)
-            # Fetch AI mentor signals for the selected symbol
-            candles = runner.get_futures_candles(symbol, lookback_minutes=180, record_limit=120)[1]
-            signals = mentor_engine.get_signals(symbol, candles) if hasattr(mentor_engine, 'get_signals') else {}
+            # Fingerprint-cached mentor payload shared with /ws/ai_mentor in websocket_service
+            signals = await asyncio.to_thread(_mentor_signals, symbol)
             await websocket.send_json({"symbol": symbol, "signals": signals})
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -0,0 +1,171 @@
+import contextlib
+import importlib
+import sys
+import threading
+import time
+import types
+
+from astroquant.backend.config import STARTUP_PROFILE
+
+
+class _TimedLoader:
+    """Loader proxy that times ``exec_module`` and forwards everything else."""
+
+    def __init__(self, loader, profiler, fullname):
+        self._loader = loader
+        self._profiler = profiler
+        self._fullname = fullname
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self._profiler.measure_import(self._fullname):
+            self._loader.exec_module(module)
+
+
+class _TimingFinder:
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self.profiler, fullname)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """
+    Opt-in (STARTUP_PROFILE=1) record of per-module import time and named init phases.
+    Import times are inclusive ("cumulative") and exclusive of nested imports ("self").
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = bool(enabled)
+        self.started_at = time.perf_counter()
+        self.ready_at = None
+        self.imports = {}
+        self.phases = []
+        self._stack = []
+        self._finder = None
+        self._lock = threading.RLock()
+
+    def install(self):
+        if self.enabled and self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+        return self
+
+    def uninstall(self):
+        if self._finder is not None:
+            with contextlib.suppress(ValueError):
+                sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    @contextlib.contextmanager
+    def measure_import(self, name):
+        started = time.perf_counter()
+        with self._lock:
+            self._stack.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                children = self._stack.pop()
+                if self._stack:
+                    self._stack[-1] += elapsed
+                self.imports[name] = {"cumulative_ms": elapsed * 1000.0, "self_ms": (elapsed - children) * 1000.0}
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append({"phase": name, "ms": round((time.perf_counter() - started) * 1000.0, 2)})
+
+    def record_lazy_load(self, name, seconds):
+        if self.enabled:
+            self.phases.append({"phase": f"lazy:{name}", "ms": round(seconds * 1000.0, 2)})
+
+    def mark_ready(self):
+        if self.ready_at is None:
+            self.ready_at = time.perf_counter()
+        self.uninstall()
+
+    def report(self, top=25):
+        ready_ms = None if self.ready_at is None else round((self.ready_at - self.started_at) * 1000.0, 2)
+        ranked = sorted(self.imports.items(), key=lambda item: item[1]["self_ms"], reverse=True)[: max(1, int(top))]
+        return {
+            "enabled": self.enabled,
+            "ready_ms": ready_ms,
+            "modules_timed": len(self.imports),
+            "imports": [
+                {"module": name, "self_ms": round(row["self_ms"], 2), "cumulative_ms": round(row["cumulative_ms"], 2)}
+                for name, row in ranked
+            ],
+            "phases": list(self.phases),
+            "lazy_modules_loaded": sorted(name for name, module in _lazy_modules.items() if module._module is not None),
+        }
+
+    def print_report(self, top=25):
+        report = self.report(top=top)
+        print(f"[startup] ready in {report['ready_ms']} ms, {report['modules_timed']} modules timed")
+        for row in report["phases"]:
+            print(f"[startup] phase {row['phase']:<32} {row['ms']:>10.2f} ms")
+        for row in report["imports"]:
+            print(f"[startup] import {row['module']:<48} self {row['self_ms']:>9.2f} ms  cum {row['cumulative_ms']:>9.2f} ms")
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self.__name__)
+                    profiler.record_lazy_load(self.__name__, time.perf_counter() - started)
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+_lazy_modules = {}
+
+
+def lazy_module(name):
+    """Shared deferred import for heavy optional modules (databento, playwright, numpy, ...)."""
+    module = _lazy_modules.get(name)
+    if module is None:
+        module = _lazy_modules.setdefault(name, LazyModule(name))
+    return module
+
+
+profiler = StartupProfiler(enabled=STARTUP_PROFILE)
@@ -1,6 +1,6 @@
 import time
-from collections import deque
-from statistics import median
+
+from astroquant.engine.utils.rolling_stats import RollingMedian
 
 
 class BasisEngine:
@@ -35,8 +35,9 @@ class BasisEngine:
 
     def _new_state(self):
         return {
-            "raw_basis_history": deque(maxlen=self.history_window),
-            "raw_bps_history": deque(maxlen=self.history_window),
+            "raw_bps_history": RollingMedian(self.history_window),
+            "basis_window": RollingMedian(self.smoothing_window),
+            "bps_window": RollingMedian(self.smoothing_window),
             "smooth_basis": None,
             "smooth_bps": None,
             "last_raw_basis": None,
@@ -61,11 +62,10 @@ class BasisEngine:
         if smooth_bps is not None and abs(raw_bps - smooth_bps) > self.max_jump_bps:
             return f"Basis jump too large ({abs(raw_bps - smooth_bps):.2f}bps)"
 
-        history = list(state.get("raw_bps_history", []))
+        history = state["raw_bps_history"]
         if len(history) >= max(12, self.smoothing_window):
-            med = float(median(history))
-            deviations = [abs(x - med) for x in history]
-            mad = float(median(deviations)) if deviations else 0.0
+            med = float(history.median())
+            mad = float(history.mad(med))
             robust_sigma = 1.4826 * mad
             dynamic_cap = max(self.min_sigma_abs_bps, self.max_sigma * robust_sigma)
             if abs(raw_bps - med) > dynamic_cap:
@@ -105,23 +105,20 @@ class BasisEngine:
             state["last_update"] = timestamp
             return self.snapshot(symbol)
 
-        state["raw_basis_history"].append(raw_basis)
-        state["raw_bps_history"].append(raw_bps)
+        state["raw_bps_history"].push(raw_bps)
+        state["basis_window"].push(raw_basis)
+        state["bps_window"].push(raw_bps)
 
-        basis_window = list(state["raw_basis_history"])[-self.smoothing_window:]
-        bps_window = list(state["raw_bps_history"])[-self.smoothing_window:]
-        median_basis = float(median(basis_window)) if basis_window else raw_basis
-        median_bps = float(median(bps_window)) if bps_window else raw_bps
+        median_basis = float(state["basis_window"].median())
+        median_bps = float(state["bps_window"].median())
 
         prev_basis = state.get("smooth_basis")
         prev_bps = state.get("smooth_bps")
         smooth_basis = median_basis if prev_basis is None else (self.ewma_alpha * median_basis) + ((1.0 - self.ewma_alpha) * prev_basis)
         smooth_bps = median_bps if prev_bps is None else (self.ewma_alpha * median_bps) + ((1.0 - self.ewma_alpha) * prev_bps)
 
-        full_bps = list(state["raw_bps_history"])
-        med_full = float(median(full_bps)) if full_bps else 0.0
-        deviations = [abs(x - med_full) for x in full_bps]
-        mad = float(median(deviations)) if deviations else 0.0
+        med_full = float(state["raw_bps_history"].median())
+        mad = float(state["raw_bps_history"].mad(med_full))
         robust_sigma = max(1e-9, 1.4826 * mad)
         zscore = (raw_bps - med_full) / robust_sigma
 
@@ -162,7 +159,7 @@ class BasisEngine:
             "smooth_basis": state.get("smooth_basis"),
             "smooth_bps": state.get("smooth_bps"),
             "zscore": state.get("zscore", 0.0),
-            "sample_count": len(state.get("raw_basis_history", [])),
+            "sample_count": len(state["raw_bps_history"]),
             "spot_source": state.get("spot_source"),
             "futures_source": state.get("futures_source"),
             "guard_reason": state.get("last_guard_reason"),
@@ -1,4 +1,4 @@
-import time
+from astroquant.engine import clock
 
 
 class BrokerEquityVerificationEngine:
@@ -26,7 +26,7 @@ class BrokerEquityVerificationEngine:
         return dict(self._last_snapshot)
 
     def verify(self, internal_equity, broker_equity):
-        now = int(time.time())
+        now = int(clock.now_ts())
         if (now - int(self._last_check)) < self.check_interval_seconds and self._last_snapshot.get("status") != "UNINITIALIZED":
             return dict(self._last_snapshot)
 
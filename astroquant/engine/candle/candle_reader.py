@@ -1,9 +1,12 @@
 
-import redis
 import json
 import os
 import time
 
+from astroquant.backend.startup_profile import lazy_module
+
+redis = lazy_module("redis")
+
 def get_redis_client(retries=3, delay=1):
     host = os.environ.get("REDIS_HOST", "localhost")
     port = int(os.environ.get("REDIS_PORT", 6379))
@@ -17,12 +20,20 @@ def get_redis_client(retries=3, delay=1):
             else:
                 raise e
 
-redis_client = get_redis_client()
+_redis_client = None
+
+
+def _client():
+    # Created on first read so importing the router does not import redis.
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = get_redis_client()
+    return _redis_client
 
 
 def get_latest_candle(symbol, timeframe=1):
     key = f"candle:{symbol}:{timeframe}"
-    data = redis_client.get(key)
+    data = _client().get(key)
     if not data:
         return None
     return json.loads(data)
@@ -30,7 +41,7 @@ def get_latest_candle(symbol, timeframe=1):
 # New function to fetch multiple candles
 def get_candle_series(symbol, timeframe=1, limit=80):
     pattern = f"candle:{symbol}:{timeframe}:*"
-    keys = redis_client.keys(pattern)
+    keys = _client().keys(pattern)
     # Sort keys by timestamp descending (assuming last part is timestamp)
     def extract_ts(k):
         parts = k.decode().split(":")
@@ -38,7 +49,7 @@ def get_candle_series(symbol, timeframe=1, limit=80):
     sorted_keys = sorted(keys, key=extract_ts, reverse=True)
     candles = []
     for k in sorted_keys[:limit]:
-        data = redis_client.get(k)
+        data = _client().get(k)
         if data:
             candles.append(json.loads(data))
     # Reverse to ascending order for chart
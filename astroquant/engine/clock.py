@@ -0,0 +1,70 @@
+import time
+from datetime import datetime, timezone
+
+
+class SystemClock:
+
+    def time(self):
+        return time.time()
+
+    def now(self, tz=None):
+        return datetime.now(tz)
+
+    def sleep(self, seconds):
+        time.sleep(max(0.0, float(seconds)))
+
+
+class SimulatedClock:
+    """Clock moved explicitly by the replay driver; sleeping advances it."""
+
+    def __init__(self, start=0.0):
+        self._now = float(start)
+
+    def time(self):
+        return self._now
+
+    def now(self, tz=None):
+        return datetime.fromtimestamp(self._now, tz)
+
+    def sleep(self, seconds):
+        self.advance(seconds)
+
+    def advance(self, seconds):
+        self._now += max(0.0, float(seconds))
+        return self._now
+
+    def set(self, timestamp):
+        # Time never runs backwards, so cooldowns and windows stay monotonic.
+        self._now = max(self._now, float(timestamp))
+        return self._now
+
+
+_active = SystemClock()
+
+
+def get_clock():
+    return _active
+
+
+def set_clock(clock):
+    """Install ``clock`` process-wide and return the previous one."""
+    global _active
+    previous = _active
+    _active = clock if clock is not None else SystemClock()
+    return previous
+
+
+def now_ts():
+    return _active.time()
+
+
+def utcnow():
+    return _active.now(timezone.utc)
+
+
+def now(tz=None):
+    return _active.now(tz)
+
+
+def today():
+    return _active.now().date()
@@ -1,4 +1,5 @@
 import json
+import threading
 import time
 from pathlib import Path
 
@@ -8,6 +9,7 @@ class ContractResolver:
     def __init__(self, cache_file="data/contract_resolver_cache.json"):
         self.file = Path(cache_file)
         self.cache = {}
+        self._lock = threading.RLock()
         self._load()
 
     def _load(self):
@@ -20,24 +22,27 @@ class ContractResolver:
             self._save()
 
     def _save(self):
-        self.file.parent.mkdir(parents=True, exist_ok=True)
-        self.file.write_text(json.dumps(self.cache, indent=2), encoding="utf-8")
+        # Warmup resolves symbols concurrently; serialise the dump and write.
+        with self._lock:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            self.file.write_text(json.dumps(self.cache, indent=2), encoding="utf-8")
 
     def _entry(self, canonical_symbol):
         key = str(canonical_symbol)
-        if key not in self.cache:
-            self.cache[key] = {
-                "active_symbol": None,
-                "resolved_at": None,
-                "last_probe_at": None,
-                "last_status": "UNRESOLVED",
-                "sample_count": 0,
-                "attempts": 0,
-                "consecutive_failures": 0,
-                "ttl_seconds": 6 * 3600,
-                "candidates_tried": [],
-            }
-        return self.cache[key]
+        with self._lock:
+            if key not in self.cache:
+                self.cache[key] = {
+                    "active_symbol": None,
+                    "resolved_at": None,
+                    "last_probe_at": None,
+                    "last_status": "UNRESOLVED",
+                    "sample_count": 0,
+                    "attempts": 0,
+                    "consecutive_failures": 0,
+                    "ttl_seconds": 6 * 3600,
+                    "candidates_tried": [],
+                }
+            return self.cache[key]
 
     def get_cached(self, canonical_symbol, max_age_seconds=6 * 3600):
         entry = self._entry(canonical_symbol)
@@ -1,4 +1,5 @@
 import databento as db
+from astroquant.engine.databento import cache as databento_cache
 from astroquant.engine.utils.time_guard import get_query_window
 
 def fetch_live_data(symbol="GLBX.MDP3", minutes=30):
@@ -7,7 +8,8 @@ def fetch_live_data(symbol="GLBX.MDP3", minutes=30):
         start, end = get_query_window(minutes)
         print(f"[TIME CHECK] Safe UTC Now: {end}")
         print(f"[INFO] Fetching from {start} to {end}")
-        data = client.timeseries.get_range(
+        data = databento_cache.get_range(
+            client,
             dataset=symbol,
             start=start,
             end=end,
@@ -20,7 +22,8 @@ def fetch_live_data(symbol="GLBX.MDP3", minutes=30):
         try:
             print("[RETRY] Using fallback window...")
             start, end = get_query_window(minutes + 10)
-            data = client.timeseries.get_range(
+            data = databento_cache.get_range(
+                client,
                 dataset=symbol,
                 start=start,
                 end=end,
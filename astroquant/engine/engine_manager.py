@@ -1,32 +1,70 @@
 import os
+import ast
 import importlib
 import asyncio
 
+from astroquant.backend.startup_profile import profiler as startup_profiler
+
+
+class LazyEngine:
+    """Factory for one engine class; the module is imported and the class built on first use."""
+
+    def __init__(self, module_path, class_name):
+        self.module_path = module_path
+        self.class_name = class_name
+        self._instance = None
+        self._failed = False
+
+    @property
+    def name(self):
+        return self.class_name
+
+    def resolve(self):
+        if self._instance is None and not self._failed:
+            try:
+                with startup_profiler.phase(f"engine:{self.module_path}.{self.class_name}"):
+                    module = importlib.import_module(self.module_path)
+                    self._instance = getattr(module, self.class_name)()
+            except Exception:
+                self._failed = True
+        return self._instance
+
+    def __getattr__(self, name):
+        instance = self.resolve()
+        if instance is None:
+            raise AttributeError(name)
+        return getattr(instance, name)
+
+
 class EngineManager:
     def __init__(self, engine_folder="astroquant.engine"):
         self.engine_folder = engine_folder
         self.engines = []
 
     def load_engines(self):
+        # Register classes by parsing the engine modules instead of importing
+        # them, so startup does not pay for numpy/databento/playwright imports
+        # pulled in by engines that may never run.
         folder_path = self.engine_folder.replace('.', os.sep)
-        for file in os.listdir(folder_path):
+        for file in sorted(os.listdir(folder_path)):
             if file.endswith("_engine.py"):
                 module_name = file.replace(".py", "")
                 module_path = f"{self.engine_folder}.{module_name}"
-                module = importlib.import_module(module_path)
-                for attr in dir(module):
-                    obj = getattr(module, attr)
-                    if isinstance(obj, type):
-                        try:
-                            instance = obj()
-                            self.engines.append(instance)
-                        except Exception:
-                            pass
-        print(f"{len(self.engines)} engines loaded")
+                try:
+                    with open(os.path.join(folder_path, file), encoding="utf-8") as handle:
+                        tree = ast.parse(handle.read(), filename=file)
+                except Exception:
+                    continue
+                for node in tree.body:
+                    if isinstance(node, ast.ClassDef):
+                        self.engines.append(LazyEngine(module_path, node.name))
+        print(f"{len(self.engines)} engines registered")
 
     async def run_engines(self, market_data):
         tasks = []
         for engine in self.engines:
+            if engine.resolve() is None:
+                continue
             tasks.append(engine.run(market_data))
         results = await asyncio.gather(*tasks)
         return results
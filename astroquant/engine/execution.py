@@ -1,10 +1,88 @@
+import asyncio
+import concurrent.futures
+import inspect
+
+from astroquant.backend.config import (
+	EXECUTION_BROWSER_CDP_URL,
+	EXECUTION_BROWSER_TIMEOUT_MS,
+	EXECUTION_BROWSER_URL,
+	EXECUTION_ENGINE_MODE,
+	EXECUTION_READ_POOL_ENABLED,
+	EXECUTION_READ_SELECTOR_PROFILE_FILE,
+	EXECUTION_SYMBOL_CATALOGUE_REFRESH_SECONDS,
+)
+from astroquant.execution.async_playwright_engine import AsyncPlaywrightExecutionEngine
+from astroquant.execution.broker_read_pool import BrokerReadPool
 from astroquant.execution.playwright_engine import PlaywrightExecutionEngine
 
 
 class ExecutionEngine:
 
-	def __init__(self):
-		self.playwright = PlaywrightExecutionEngine()
+	def __init__(self, mode=None):
+		self.mode = str(mode or EXECUTION_ENGINE_MODE).strip().lower()
+		self.page_owner = None
+		if self.mode == "async":
+			self.playwright = AsyncPlaywrightExecutionEngine(
+				cdp_url=EXECUTION_BROWSER_CDP_URL,
+				url=EXECUTION_BROWSER_URL,
+				timeout_ms=EXECUTION_BROWSER_TIMEOUT_MS,
+			)
+		else:
+			self.mode = "sync"
+			self.playwright = PlaywrightExecutionEngine()
+			# Sync Playwright pages are thread-affine: every page call from the
+			# runner, the routers and the catalogue refresh runs on this thread.
+			self.page_owner = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="aq-execution-page")
+			self.playwright.set_task_dispatcher(self.page_owner)
+		self.read_pool = None
+		if EXECUTION_READ_POOL_ENABLED and EXECUTION_BROWSER_CDP_URL:
+			self.read_pool = BrokerReadPool(
+				cdp_url=EXECUTION_BROWSER_CDP_URL,
+				url=EXECUTION_BROWSER_URL,
+				timeout_ms=EXECUTION_BROWSER_TIMEOUT_MS,
+				selector_profile_file=EXECUTION_READ_SELECTOR_PROFILE_FILE,
+			)
+			self.playwright.set_read_pool(self.read_pool)
+		# Discovery runs on the page owner thread (sync) or the server loop
+		# (async); until either has a page the refresh just records why not.
+		if EXECUTION_SYMBOL_CATALOGUE_REFRESH_SECONDS > 0:
+			self.playwright.start_symbol_catalogue_refresh(interval_seconds=EXECUTION_SYMBOL_CATALOGUE_REFRESH_SECONDS)
+
+	async def start(self):
+		"""Attach the async engine to the running loop; await this from the server's startup hook."""
+		if self.mode != "async":
+			return None
+		try:
+			return await self.playwright.start()
+		except Exception as exc:
+			self.playwright.last_error = f"Browser attach failed: {exc}"
+			return None
+
+	def _on_engine_loop(self):
+		try:
+			return asyncio.get_running_loop() is self.playwright.loop
+		except RuntimeError:
+			return False
+
+	def _resolve(self, result, unavailable=None, stopped=None):
+		# Async-mode calls made on the server loop hand the coroutine back for
+		# the caller to await; calls from other threads (the runner) block on
+		# the server loop until the coroutine finishes.
+		if not inspect.iscoroutine(result) or self._on_engine_loop():
+			return result
+		loop = self.playwright.loop
+		if loop is None or not loop.is_running():
+			result.close()
+			return unavailable
+		return self.playwright.run_sync(result, stopped=stopped)
+
+	def close(self):
+		if self.mode == "async":
+			return self._resolve(self.playwright.close())
+		self.playwright.close()
+		if self.page_owner is not None:
+			self.page_owner.shutdown(wait=False)
+		return None
 
 	def set_page(self, page):
 		self.playwright.set_page(page)
@@ -16,7 +94,14 @@ class ExecutionEngine:
 		self.playwright.set_reconnect_handler(handler)
 
 	def execute(self, signal, lot_size, page=None):
-		return self.playwright.execute(signal, lot_size, page=page)
+		return self._resolve(
+			self.playwright.execute(signal, lot_size, page=page),
+			unavailable={"status": "Rejected", "reason": "Execution loop unavailable"},
+			stopped={"status": "UNKNOWN", "reason": "Execution loop stopped before the order resolved"},
+		)
+
+	def close_position_fraction(self, symbol=None, fraction=0.5):
+		return self._resolve(self.playwright.close_position_fraction(self.playwright.page, symbol=symbol, fraction=fraction))
 
 	def execution_health(self):
 		return self.playwright.execution_health()
@@ -28,10 +113,23 @@ class ExecutionEngine:
 		self.playwright.emergency_halt(reason)
 
 	def broker_positions_snapshot(self):
-		return self.playwright.broker_positions_snapshot()
+		return self._resolve(self.playwright.broker_positions_snapshot())
 
 	def broker_equity_snapshot(self):
-		return self.playwright.broker_equity_snapshot()
+		return self._resolve(self.playwright.broker_equity_snapshot())
 
 	def broker_quote_snapshot(self, expected_symbols=None):
-		return self.playwright.broker_quote_snapshot(expected_symbols=expected_symbols)
+		return self._resolve(self.playwright.broker_quote_snapshot(expected_symbols=expected_symbols))
+
+	def broker_quotes_snapshot(self, symbols):
+		if self.read_pool is not None and self.read_pool.is_healthy():
+			return self.read_pool.quotes_snapshot(symbols)
+		return {str(symbol): self.broker_quote_snapshot(expected_symbols=[symbol]) for symbol in symbols or []}
+
+	def symbol_catalogue_snapshot(self):
+		return self.playwright.symbol_catalogue.snapshot()
+
+	def read_pool_health(self):
+		if self.read_pool is None:
+			return {"enabled": False}
+		return self.read_pool.health()
@@ -1,7 +1,8 @@
-import datetime
 import json
 from pathlib import Path
 
+from astroquant.engine import clock
+
 
 class FrequencyEngine:
 
@@ -11,7 +12,7 @@ class FrequencyEngine:
 
     def _default_state(self):
         return {
-            "today": str(datetime.date.today()),
+            "today": str(clock.today()),
             "daily_trades": 0,
             "symbol_trades": {},
             "session_trades": {},
@@ -30,7 +31,7 @@ class FrequencyEngine:
         self.file.write_text(json.dumps(self.data, indent=4))
 
     def reset_if_new_day(self):
-        today = str(datetime.date.today())
+        today = str(clock.today())
 
         if self.data.get("today") != today:
             self.data = self._default_state()
@@ -0,0 +1,179 @@
+import time
+
+import numpy as np
+
+from astroquant.engine.gann.gann_360_wheel_engine import Gann360WheelEngine
+from astroquant.engine.gann.gann_angle_engine import GannAngleEngine
+from astroquant.engine.gann.gann_cross_engine import GannCrossEngine
+from astroquant.engine.gann.gann_hexagon_engine import GannHexagonEngine
+from astroquant.engine.gann.gann_master_cycle_engine import GannMasterCycleEngine
+from astroquant.engine.gann.gann_planet_alignment_engine import GannPlanetAlignmentEngine
+from astroquant.engine.gann.gann_vibration_engine import GannVibrationEngine
+
+SQUARE9_OFFSETS = np.array([-0.5, -0.25, -0.125, 0.0, 0.125, 0.25, 0.5])
+FAN_LABELS = np.array(list(GannAngleEngine.FAN_RATIOS.keys()))
+FAN_RATIOS = np.array(list(GannAngleEngine.FAN_RATIOS.values()), dtype=float)
+KEY_DEGREES = np.array(Gann360WheelEngine.key_levels, dtype=float)
+CARDINAL = np.array(GannCrossEngine.cardinal, dtype=float)
+ORDINAL = np.array(GannCrossEngine.ordinal, dtype=float)
+VIBRATION = np.array(GannVibrationEngine.vibration_numbers, dtype=float)
+HEXAGON = np.array(GannHexagonEngine.numbers, dtype=float)
+MASTER_CYCLES = np.array(GannMasterCycleEngine.cycles, dtype=float)
+PLANET_CYCLES = np.array(list(GannPlanetAlignmentEngine.CYCLES.values()), dtype=np.int64)
+
+
+def _first_match(values, table, tolerance, compare_to=None):
+    """First entry of ``table`` (in table order) within ``tolerance`` of each value, else NaN."""
+    targets = table if compare_to is None else compare_to
+    hits = np.abs(values[:, None] - targets[None, :]) <= tolerance
+    found = hits.any(axis=1)
+    picked = table[np.argmax(hits, axis=1)].astype(float)
+    return np.where(found, picked, np.nan)
+
+
+def _spiral_xy(value):
+    radius = np.sqrt(np.maximum(0.0, value))
+    theta = np.mod(radius, 1.0) * (2.0 * np.pi)
+    return np.round(radius * np.cos(theta), 6), np.round(radius * np.sin(theta), 6)
+
+
+def _epoch_days(timestamps, bars):
+    if timestamps is None:
+        return np.full(bars, int(time.time() // 86400), dtype=np.int64)
+    values = np.asarray(timestamps)
+    if values.dtype.kind in "if":
+        return (values.astype(float) // 86400).astype(np.int64)
+    planet = GannPlanetAlignmentEngine()
+    return np.array([planet._epoch_day(value) for value in values], dtype=np.int64)
+
+
+class GannBatchEngine:
+    """
+    Columnar form of GannMasterEngine.analyze: bar ``i`` of every output equals
+    ``analyze(candles[: i + 1])``. Each sub-engine's scalar rule is expressed
+    as array math or a broadcast against its level table, so a whole history
+    costs a handful of NumPy operations instead of one Python call per bar.
+    """
+
+    min_bars = 8
+
+    def analyze(self, close, high=None, low=None, timestamps=None):
+        close = np.nan_to_num(np.asarray(close, dtype=float), nan=0.0)
+        n = close.size
+        if n == 0:
+            return {"bars": 0}
+        # analyze() falls back to close for missing/zero high and low values.
+        high = close if high is None else np.asarray(high, dtype=float)
+        low = close if low is None else np.asarray(low, dtype=float)
+        high = np.where(np.isnan(high) | (high == 0), close, high)
+        low = np.where(np.isnan(low) | (low == 0), close, low)
+
+        bars = np.arange(1, n + 1, dtype=float)
+        prev_close = np.concatenate(([close[0]], close[:-1]))
+        prev_close = np.where(prev_close == 0, close, prev_close)
+        price_move = np.abs(close - close[0])
+
+        positive = close > 0
+        root = np.sqrt(np.where(positive, close, 0.0))
+        degree = np.where(positive, np.mod(root, 1.0) * 360.0, np.nan)
+        wheel = np.mod(degree, 360.0)
+        key_degree = _first_match(wheel, KEY_DEGREES, 5.0, compare_to=np.mod(KEY_DEGREES, 360.0))
+        cardinal = np.isfinite(_first_match(wheel, CARDINAL, 3.0))
+        ordinal = ~cardinal & np.isfinite(_first_match(wheel, ORDINAL, 3.0))
+        cross = np.where(cardinal, "CARDINAL", np.where(ordinal, "ORDINAL", ""))
+
+        vibration = np.where(positive, _first_match(np.round(root, 2), VIBRATION, 1.0), np.nan)
+        time_vibration = np.where(np.isin(bars, VIBRATION), bars, np.nan)
+        cycle_144 = np.mod(bars, 144) == 0
+        master_cycle = np.isin(bars, MASTER_CYCLES)
+        rounded = np.rint(close)
+        square_root = np.floor(np.sqrt(np.maximum(rounded, 0.0)))
+        square_root = np.where((square_root + 1) ** 2 <= rounded, square_root + 1, square_root)
+        is_square = (rounded >= 0) & (square_root * square_root == rounded)
+        hexagon = np.isfinite(_first_match(np.nan_to_num(vibration, nan=0.0), HEXAGON, 0.5))
+
+        price_time_alignment = np.abs(price_move - bars) <= 8.0
+        price_time_aligned = np.abs(price_move / np.maximum(1.0, bars) - 1.0) <= 0.25
+
+        vector_delta = np.zeros(n)
+        if n >= self.min_bars:
+            vector_delta[self.min_bars - 1:] = close[self.min_bars - 1:] - close[: n - self.min_bars + 1]
+        vector_direction = np.where(vector_delta > 0, "UP", np.where(vector_delta < 0, "DOWN", "FLAT"))
+
+        days = _epoch_days(timestamps, n)
+        remainder = np.mod(days[:, None], PLANET_CYCLES[None, :])
+        planet_score = (np.minimum(remainder, PLANET_CYCLES[None, :] - remainder) <= 2).sum(axis=1)
+
+        px, py = _spiral_xy(close)
+        tx, ty = _spiral_xy(bars)
+        pm = np.sqrt(px * px + py * py)
+        tm = np.sqrt(tx * tx + ty * ty)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cosine = np.clip((px * tx + py * ty) / (pm * tm), -1.0, 1.0)
+        spiral_score = np.where((pm > 0) & (tm > 0), np.round((cosine + 1.0) / 2.0, 6), 0.0)
+        spiral_aligned = spiral_score >= 0.75
+
+        angle_step = np.maximum(0.01, np.abs(high - low))
+        fan = low[:, None] + (np.maximum(0.00001, angle_step)[:, None] * FAN_RATIOS[None, :]) * bars[:, None]
+        fan_distance = np.abs(close[:, None] - fan)
+        nearest_fan = np.argmin(fan_distance, axis=1)
+        angle_distance = fan_distance[np.arange(n), nearest_fan]
+        angle_aligned = angle_distance <= np.maximum(0.00001, angle_step)
+
+        square9_levels = np.round(np.maximum(0.0, np.sqrt(np.maximum(0.0, close))[:, None] + SQUARE9_OFFSETS[None, :]) ** 2, 6)
+        square9_distance_all = np.abs(close[:, None] - square9_levels)
+        nearest_square9 = np.argmin(square9_distance_all, axis=1)
+        square9_level = square9_levels[np.arange(n), nearest_square9]
+        square9_distance = np.round(square9_distance_all[np.arange(n), nearest_square9], 6)
+
+        score = (
+            np.isfinite(key_degree) * 2
+            + cardinal * 2
+            + ordinal * 1
+            + np.isfinite(vibration) * 2
+            + np.isfinite(time_vibration) * 1
+            + cycle_144 * 2
+            + master_cycle * 1
+            + is_square * 1
+            + hexagon * 1
+            + price_time_alignment * 2
+            + price_time_aligned * 2
+            + angle_aligned * 2
+            + (square9_distance <= angle_step) * 1
+            + spiral_aligned * 1
+            + planet_score
+        ).astype(int)
+
+        direction = np.where(close >= prev_close, "BUY", "SELL")
+        direction = np.where(vector_direction == "UP", "BUY", np.where(vector_direction == "DOWN", "SELL", direction))
+
+        valid = bars >= self.min_bars
+        score = np.where(valid, score, 0)
+        return {
+            "bars": n,
+            "valid": valid,
+            "score": score,
+            "confidence": np.where(valid, np.round(np.minimum(92.0, 48.0 + score * 3.2), 2), 0.0),
+            "direction": np.where(valid, direction, ""),
+            "degree": np.round(degree, 2),
+            "key_degree": key_degree,
+            "cross": cross,
+            "vibration": vibration,
+            "time_vibration": time_vibration,
+            "cycle_144": cycle_144,
+            "master_cycle": master_cycle,
+            "square_level": is_square,
+            "square_of_9_level": square9_level,
+            "square_of_9_distance": square9_distance,
+            "hexagon": hexagon,
+            "price_time_alignment": price_time_alignment,
+            "price_time_aligned": price_time_aligned,
+            "vector_direction": vector_direction,
+            "planet_score": planet_score,
+            "spiral_vector_score": spiral_score,
+            "angle": FAN_LABELS[nearest_fan],
+            "angle_distance": np.round(angle_distance, 6),
+            "angle_aligned": angle_aligned,
+            "support": np.round(close - angle_step, 5),
+            "resistance": np.round(close + angle_step, 5),
+        }
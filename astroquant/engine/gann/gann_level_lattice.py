@@ -0,0 +1,180 @@
+import bisect
+import math
+import threading
+
+from astroquant.engine.gann.gann_hexagon_engine import GannHexagonEngine
+from astroquant.engine.gann.gann_vibration_engine import GannVibrationEngine
+
+KINDS = ("square_of_9", "octave", "square", "vibration", "hexagon")
+SQUARE9_ROOT_STEP = 0.125
+MAX_LEVELS_PER_KIND = 5000
+
+
+def octave_step(price):
+    """Step of GannOctaveEngine's grid for ``price`` (one eighth of its power of ten)."""
+    magnitude = 10 ** int(math.floor(math.log10(price)))
+    return max(magnitude / 8.0, 0.00001)
+
+
+class GannLevelLattice:
+    """
+    Sorted absolute Gann price levels inside a band around the current price.
+
+    Square-of-9 rings are prices whose square root sits on a 1/8 step, octaves
+    are multiples of GannOctaveEngine's step, squares are perfect squares, and
+    vibration/hexagon levels are the squares of those engines' numbers. The
+    band is rebuilt only when a query falls outside it, and lookups are bisects
+    into the merged sorted array.
+    """
+
+    def __init__(self, band_pct=0.1):
+        self.band_pct = max(0.005, float(band_pct))
+        self.low = None
+        self.high = None
+        self.prices = []
+        self.kinds = []
+        self.by_kind = {kind: [] for kind in KINDS}
+        self.truncated = []
+        self.rebuilds = 0
+        self._lock = threading.Lock()
+
+    def _kind_levels(self, low, high):
+        levels = {}
+        truncated = set()
+
+        def capped(kind, first, last):
+            # Bands wide enough to exceed the cap keep the lowest levels and
+            # say so in the snapshot rather than silently stopping short.
+            if last - first + 1 > MAX_LEVELS_PER_KIND:
+                truncated.add(kind)
+                return first + MAX_LEVELS_PER_KIND - 1
+            return last
+
+        root_low, root_high = math.sqrt(low), math.sqrt(high)
+
+        first = math.ceil(root_low / SQUARE9_ROOT_STEP)
+        last = capped("square_of_9", first, math.floor(root_high / SQUARE9_ROOT_STEP))
+        levels["square_of_9"] = [round((k * SQUARE9_ROOT_STEP) ** 2, 6) for k in range(first, last + 1)]
+
+        # The octave step depends on the decade a price sits in, so a band
+        # crossing a power of ten gets each decade's own grid.
+        octave = []
+        decade = int(math.floor(math.log10(low)))
+        while 10 ** decade <= high:
+            floor_price, ceiling_price = 10 ** decade, 10 ** (decade + 1)
+            step = octave_step(floor_price)
+            first = math.ceil(max(low, floor_price) / step)
+            last = math.floor(min(high, ceiling_price) / step)
+            if last * step >= ceiling_price:
+                last -= 1
+            octave.extend(round(k * step, 6) for k in range(first, last + 1))
+            decade += 1
+        octave = sorted(set(octave))
+        if len(octave) > MAX_LEVELS_PER_KIND:
+            truncated.add("octave")
+            octave = octave[:MAX_LEVELS_PER_KIND]
+        levels["octave"] = octave
+
+        first = math.ceil(root_low)
+        last = capped("square", first, math.floor(root_high))
+        levels["square"] = [float(k * k) for k in range(first, last + 1)]
+
+        levels["vibration"] = sorted(float(n * n) for n in GannVibrationEngine.vibration_numbers if low <= n * n <= high)
+        levels["hexagon"] = sorted(float(n * n) for n in GannHexagonEngine.numbers if low <= n * n <= high)
+        return levels, sorted(truncated)
+
+    def rebuild(self, low, high):
+        low = max(0.00001, float(low))
+        high = max(low, float(high))
+        by_kind, truncated = self._kind_levels(low, high)
+        merged = sorted((price, kind) for kind, values in by_kind.items() for price in values)
+        with self._lock:
+            self.low, self.high = low, high
+            self.by_kind = by_kind
+            self.truncated = truncated
+            self.prices = [price for price, _ in merged]
+            self.kinds = [kind for _, kind in merged]
+            self.rebuilds += 1
+
+    def covers(self, low, high=None):
+        high = low if high is None else high
+        return self.low is not None and self.low <= low and high <= self.high
+
+    def ensure(self, price, high=None):
+        """Make sure ``price`` (or the range ``price..high``) lies inside the band."""
+        low = float(price)
+        high = low if high is None else float(high)
+        if low <= 0:
+            return False
+        if self.covers(low, high):
+            return False
+        self.rebuild(low * (1.0 - self.band_pct), high * (1.0 + self.band_pct))
+        return True
+
+    def nearest(self, price, kind=None):
+        value = float(price)
+        if value <= 0:
+            return {"level": None, "kind": None, "distance": None}
+        self.ensure(value)
+        with self._lock:
+            prices = self.by_kind.get(kind, []) if kind else self.prices
+            kinds = None if kind else self.kinds
+        if not prices:
+            return {"level": None, "kind": kind, "distance": None}
+        index = bisect.bisect_left(prices, value)
+        candidates = [i for i in (index - 1, index) if 0 <= i < len(prices)]
+        best = min(candidates, key=lambda i: abs(prices[i] - value))
+        return {
+            "level": prices[best],
+            "kind": kind or kinds[best],
+            "distance": round(abs(prices[best] - value), 6),
+        }
+
+    def neighbours(self, price, kind=None):
+        """Closest level at or below and strictly above ``price``."""
+        value = float(price)
+        self.ensure(value)
+        with self._lock:
+            prices = self.by_kind.get(kind, []) if kind else self.prices
+        index = bisect.bisect_right(prices, value)
+        return {
+            "below": prices[index - 1] if index > 0 else None,
+            "above": prices[index] if index < len(prices) else None,
+        }
+
+    def between(self, low, high, kinds=None):
+        """All levels in ``[low, high]`` for chart rendering, ascending."""
+        low, high = float(min(low, high)), float(max(low, high))
+        if high <= 0:
+            return []
+        self.ensure(max(low, 0.00001), high)
+        wanted = set(kinds) if kinds else None
+        with self._lock:
+            start = bisect.bisect_left(self.prices, low)
+            stop = bisect.bisect_right(self.prices, high)
+            rows = list(zip(self.prices[start:stop], self.kinds[start:stop]))
+        return [{"price": price, "kind": kind} for price, kind in rows if wanted is None or kind in wanted]
+
+    def snapshot(self):
+        return {
+            "low": self.low,
+            "high": self.high,
+            "levels": len(self.prices),
+            "per_kind": {kind: len(values) for kind, values in self.by_kind.items()},
+            "truncated": list(self.truncated),
+            "rebuilds": self.rebuilds,
+        }
+
+
+_lattices = {}
+_lattices_lock = threading.Lock()
+
+
+def lattice_for(symbol, band_pct=0.1):
+    """Shared lattice for ``symbol`` so the runner, models and chart reuse one band."""
+    key = str(symbol or "").upper()
+    with _lattices_lock:
+        lattice = _lattices.get(key)
+        if lattice is None:
+            lattice = _lattices[key] = GannLevelLattice(band_pct=band_pct)
+        return lattice
@@ -37,6 +37,19 @@ class GannMasterEngine:
         self.vector = GannVectorEngine()
         self.vibration = GannVibrationEngine()
 
+    def analyze_batch(self, close, high=None, low=None, timestamps=None):
+        """Per-bar arrays equal to analyze() over every prefix of the history (see GannBatchEngine)."""
+        # Imported here so NumPy is only loaded by callers that batch.
+        from astroquant.engine.gann.gann_batch_engine import GannBatchEngine
+
+        return GannBatchEngine().analyze(close, high=high, low=low, timestamps=timestamps)
+
+    def levels(self, symbol, low, high, kinds=None):
+        """Absolute Gann levels in ``[low, high]`` from the symbol's shared lattice."""
+        from astroquant.engine.gann.gann_level_lattice import lattice_for
+
+        return lattice_for(symbol).between(low, high, kinds=kinds)
+
     def _to_float(self, value, default=None):
         try:
             return float(value)
@@ -1,8 +1,8 @@
+from astroquant.engine import clock
 from astroquant.engine.news_engine import NewsEngine
 from astroquant.engine.correlation_engine import CorrelationEngine
 from astroquant.engine.model_weight_engine import ModelWeightEngine
 from astroquant.engine.frequency_engine import FrequencyEngine
-import datetime
 
 
 def allowed_models_for_phase(phase):
@@ -36,9 +36,9 @@ def fractional_kelly(win_rate, rr):
 
 class Governance:
 
-    def __init__(self, state):
+    def __init__(self, state, news=None):
         self.state = state
-        self.news = NewsEngine()
+        self.news = news if news is not None else NewsEngine()
         self.correlation = CorrelationEngine()
         self.weight_engine = ModelWeightEngine()
         self.freq_engine = FrequencyEngine()
@@ -70,7 +70,7 @@ class Governance:
 
     def validate(self, signal, spread, daily_loss, phase, symbol, session="UNKNOWN"):
         if not self.news.last_fetch or (
-            datetime.datetime.now(datetime.UTC) - self.news.last_fetch
+            clock.utcnow() - self.news.last_fetch
         ).seconds > 600:
             self.news.fetch_news()
 
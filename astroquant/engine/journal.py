@@ -1,5 +1,5 @@
-import datetime
 import json
+from astroquant.engine import clock
 from astroquant.engine.model_weight_engine import ModelWeightEngine
 from astroquant.engine.performance_memory_engine import PerformanceMemory
 from astroquant.engine.frequency_engine import FrequencyEngine
@@ -17,7 +17,7 @@ class JournalEngine:
 
 	def log_trade(self, trade):
 
-		trade["timestamp"] = str(datetime.datetime.now())
+		trade["timestamp"] = str(clock.now())
 
 		with open("logs/trade_log.json", "a") as f:
 			f.write(json.dumps(trade) + "\n")
@@ -5,6 +5,8 @@ import re
 import threading
 from collections import defaultdict
 
+from astroquant.engine.databento import cache as databento_cache
+
 try:
     import databento_dbn as dbn
 except Exception:
@@ -31,6 +33,19 @@ class MarketFeed:
         self.live_subscriptions = set()
         self.live_streams = {}
         self.live_pending = set()
+        self.price_listeners = []
+        self.symbology_cache = {}
+
+    def on_price(self, callback):
+        """Call ``callback(dataset, symbol, price)`` for every live trade/quote price."""
+        self.price_listeners.append(callback)
+
+    def _publish_price(self, dataset, symbol, price):
+        for callback in list(self.price_listeners):
+            try:
+                callback(dataset, symbol, price)
+            except Exception:
+                pass
 
     def is_configured(self):
         return bool(self.api_key)
@@ -239,6 +254,7 @@ class MarketFeed:
                         "source": "DATABENTO_LIVE",
                     }
             self.live_last_error = None
+            self._publish_price(dataset, symbol, float(price))
         except Exception as exc:
             self.live_last_error = str(exc)
 
@@ -273,6 +289,7 @@ class MarketFeed:
                             "source": "DATABENTO_LIVE",
                         }
                     self.live_last_error = None
+                    self._publish_price(source_dataset, source_symbol, float(price))
                 except Exception as callback_exc:
                     self.live_last_error = str(callback_exc)
 
@@ -369,6 +386,58 @@ class MarketFeed:
             except Exception:
                 pass
 
+    def _candidate_stypes(self, symbol, stype_in=None):
+        if stype_in:
+            return [stype_in]
+        if symbol.endswith(".FUT"):
+            return ["parent", "continuous", "raw_symbol"]
+        if ".c." in symbol:
+            return ["continuous", "parent", "raw_symbol"]
+        return ["raw_symbol", "parent"]
+
+    def resolve_symbols(self, dataset, symbols, ttl_seconds=6 * 3600):
+        """
+        Subset of ``symbols`` that Databento symbology maps to an instrument in the last few days.
+        One metadata request per stype instead of a bar pull per candidate; returns None when
+        symbology is unavailable so callers fall back to probing bars.
+        """
+        if not self.client or self.auth_failed_until > time.time():
+            return None
+        now = time.time()
+        dataset_key = str(dataset).strip().upper()
+        known = set()
+        unchecked = {}
+        for symbol in symbols:
+            cached = self.symbology_cache.get((dataset_key, symbol))
+            if cached and (now - cached[1]) < ttl_seconds:
+                if cached[0]:
+                    known.add(symbol)
+                continue
+            unchecked.setdefault(self._candidate_stypes(symbol)[0], []).append(symbol)
+
+        today = datetime.datetime.now(datetime.UTC).date()
+        for stype, batch in unchecked.items():
+            try:
+                response = self.client.symbology.resolve(
+                    dataset=dataset,
+                    symbols=batch,
+                    stype_in=stype,
+                    stype_out="instrument_id",
+                    start_date=today - datetime.timedelta(days=4),
+                    end_date=today + datetime.timedelta(days=1),
+                )
+            except Exception as error:
+                if self._is_auth_error(error):
+                    self.last_error = str(error)
+                return None
+            result = dict((response or {}).get("result") or {})
+            for symbol in batch:
+                exists = bool(result.get(symbol))
+                self.symbology_cache[(dataset_key, symbol)] = (exists, now)
+                if exists:
+                    known.add(symbol)
+        return known
+
     def get_ohlcv(self, dataset, symbol, lookback_minutes=60, stype_in=None, record_limit=None):
         if not self.client:
             self.last_error = "Missing DATABENTO_API_KEY"
@@ -386,15 +455,7 @@ class MarketFeed:
         bounded_lookback = max(10, min(int(lookback_minutes or 60), 60 * 24 * 14))
         start = end - datetime.timedelta(minutes=bounded_lookback)
 
-        candidate_stypes = []
-        if stype_in:
-            candidate_stypes = [stype_in]
-        elif symbol.endswith(".FUT"):
-            candidate_stypes = ["parent", "continuous", "raw_symbol"]
-        elif ".c." in symbol:
-            candidate_stypes = ["continuous", "parent", "raw_symbol"]
-        else:
-            candidate_stypes = ["raw_symbol", "parent"]
+        candidate_stypes = self._candidate_stypes(symbol, stype_in)
 
         bounded_record_limit = None
         if record_limit is not None:
@@ -406,7 +467,8 @@ class MarketFeed:
             current_end = end
             current_start = start
             try:
-                data = self.client.timeseries.get_range(
+                data = databento_cache.get_range(
+                    self.client,
                     dataset=dataset,
                     schema="ohlcv-1m",
                     symbols=[symbol],
@@ -455,7 +517,8 @@ class MarketFeed:
                         retry_end = available_end - datetime.timedelta(seconds=1)
                         retry_lookback = max(bounded_lookback, 180)
                         retry_start = retry_end - datetime.timedelta(minutes=retry_lookback)
-                        retry_data = self.client.timeseries.get_range(
+                        retry_data = databento_cache.get_range(
+                            self.client,
                             dataset=dataset,
                             schema="ohlcv-1m",
                             symbols=[symbol],
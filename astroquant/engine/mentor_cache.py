@@ -0,0 +1,174 @@
+import threading
+from collections import OrderedDict
+
+
+def freeze(value):
+    """Hashable, order-stable form of a mentor input (dicts/lists become tuples)."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, float) and value != value:
+        return "nan"
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _bar_time(bar):
+    return bar.get("time") or bar.get("timestamp") or bar.get("ts_event") or bar.get("ts")
+
+
+def bar_key(candles):
+    """Cheap identity of a candle window: its length, first bar time and the full last bar."""
+    if not candles:
+        return (0,)
+    first, last = candles[0], candles[-1]
+    return (
+        len(candles),
+        _bar_time(first),
+        _bar_time(last),
+        last.get("open"),
+        last.get("high"),
+        last.get("low"),
+        last.get("close"),
+        last.get("volume"),
+    )
+
+
+def positions_key(positions):
+    rows = []
+    for position in positions or []:
+        if isinstance(position, dict):
+            rows.append((position.get("symbol"), position.get("side") or position.get("direction"), position.get("size") or position.get("qty")))
+        else:
+            rows.append(freeze(position))
+    return tuple(sorted(rows, key=repr))
+
+
+def input_fingerprint(candles, news_mode=None, session=None, positions=None):
+    """Fingerprint of everything the mentor reads: last bar, news mode, session and open positions."""
+    return (bar_key(candles), freeze(news_mode), session, positions_key(positions))
+
+
+class StageMemo:
+    """
+    Last result of each mentor sub-engine per scope (usually the symbol).
+
+    A stage is recomputed only when its own input key changes, so a new bar
+    re-runs the bar-driven stages while session or news stages keep their
+    previous output, and vice versa.
+    """
+
+    def __init__(self, max_scopes=64):
+        self.max_scopes = max(1, int(max_scopes))
+        self._scopes = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, scope, stage, key, compute):
+        with self._lock:
+            stages = self._scopes.get(scope)
+            if stages is None:
+                stages = self._scopes[scope] = {}
+                while len(self._scopes) > self.max_scopes:
+                    self._scopes.popitem(last=False)
+            else:
+                self._scopes.move_to_end(scope)
+            cached = stages.get(stage)
+            if cached is not None and cached[0] == key:
+                self.stats["hits"] += 1
+                return cached[1]
+            self.stats["misses"] += 1
+        value = compute()
+        with self._lock:
+            self._scopes.setdefault(scope, {})[stage] = (key, value)
+        return value
+
+    def clear(self, scope=None):
+        with self._lock:
+            if scope is None:
+                self._scopes.clear()
+            else:
+                self._scopes.pop(scope, None)
+
+
+class MentorCache:
+    """
+    Whole-payload cache keyed by symbol and input fingerprint.
+
+    Dashboard sockets poll every second per client; while the fingerprint is
+    unchanged they all share one computed payload, and concurrent misses for
+    the same symbol wait for a single build instead of each running it.
+    """
+
+    def __init__(self, max_symbols=64):
+        self.max_symbols = max(1, int(max_symbols))
+        self._entries = OrderedDict()
+        self._building = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "waits": 0}
+
+    def get_or_build(self, symbol, fingerprint, build):
+        while True:
+            with self._lock:
+                entry = self._entries.get(symbol)
+                if entry is not None and entry[0] == fingerprint:
+                    self._entries.move_to_end(symbol)
+                    self.stats["hits"] += 1
+                    return entry[1]
+                pending = self._building.get(symbol)
+                if pending is None or pending[0] != fingerprint:
+                    event = threading.Event()
+                    self._building[symbol] = (fingerprint, event)
+                    self.stats["misses"] += 1
+                    break
+                self.stats["waits"] += 1
+            pending[1].wait()
+            with self._lock:
+                entry = self._entries.get(symbol)
+                if entry is None or entry[0] != fingerprint:
+                    # The build failed; fall through and try it ourselves.
+                    continue
+                self.stats["hits"] += 1
+                return entry[1]
+
+        try:
+            value = build()
+            with self._lock:
+                self._entries[symbol] = (fingerprint, value)
+                self._entries.move_to_end(symbol)
+                while len(self._entries) > self.max_symbols:
+                    self._entries.popitem(last=False)
+            return value
+        finally:
+            with self._lock:
+                if self._building.get(symbol, (None, None))[1] is event:
+                    self._building.pop(symbol, None)
+            event.set()
+
+    def invalidate(self, symbol=None):
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
+
+    def snapshot(self):
+        with self._lock:
+            return {"symbols": list(self._entries), "stats": dict(self.stats)}
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared():
+    """Process-wide mentor payload cache shared by every dashboard socket."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = MentorCache()
+        return _shared
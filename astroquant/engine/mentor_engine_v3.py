@@ -10,10 +10,52 @@ from .mentor_news_engine import MentorNewsEngine
 from .mentor_probability_engine import MentorProbabilityEngine
 from .mentor_story_engine import MentorStoryEngine
 from .mentor_session_engine import MentorSessionEngine
+from .mentor_cache import StageMemo, freeze
+
+# Market fields each sub-engine reads; a stage re-runs only when these change.
+STAGE_INPUTS = {
+    "context": ("symbol", "price", "prev_low", "prev_high", "htf_bias", "ltf_structure", "kill_zone", "volatility"),
+    "liquidity": ("external_high", "external_low", "prev_high", "prev_low", "sweep", "liquidity_target"),
+    "institution": ("iceberg_buy", "iceberg_sell", "delta", "poc"),
+    "ict": ("price", "prev_low", "prev_high", "fvg", "ob", "sweep"),
+    "gann": ("range", "low", "bar_count"),
+    "astro": ("astro_window_active", "astro_marker", "astro_bias"),
+    "news": ("news_event", "news_impact", "news_time"),
+    "session": ("session",),
+}
+
+
+def market_from_candles(symbol: str, candles: list, session: str | None = None, news: dict | None = None) -> dict:
+    """Mentor market dict derived from a candle window plus session/news state."""
+    news = news or {}
+    market = {"symbol": symbol, "session": session, "bar_count": len(candles or [])}
+    market.update({key: news.get(key) for key in ("news_event", "news_impact", "news_time")})
+    if not candles:
+        return market
+    last = candles[-1]
+    prior = candles[:-1] or candles
+    highs = [float(bar.get("high") or 0.0) for bar in prior]
+    lows = [float(bar.get("low") or 0.0) for bar in prior]
+    low = min(float(bar.get("low") or 0.0) for bar in candles)
+    high = max(float(bar.get("high") or 0.0) for bar in candles)
+    delta = 0.0
+    for bar in candles[-30:]:
+        volume = float(bar.get("volume") or 0.0)
+        delta += volume if float(bar.get("close") or 0.0) >= float(bar.get("open") or 0.0) else -volume
+    market.update({
+        "price": float(last.get("close") or 0.0),
+        "prev_high": max(highs),
+        "prev_low": min(lows),
+        "low": low,
+        "range": max(0.0, high - low),
+        "delta": delta,
+    })
+    return market
 
 
 class AIMentorV3:
-    def __init__(self):
+    def __init__(self, memo: StageMemo | None = None):
+        self.memo = memo if memo is not None else StageMemo()
         self.context = MentorContextEngine()
         self.liquidity = MentorLiquidityEngine()
         self.institution = MentorInstitutionEngine()
@@ -25,17 +67,27 @@ class AIMentorV3:
         self.probability = MentorProbabilityEngine()
         self.story = MentorStoryEngine()
 
+    def _stage_keys(self, market: dict) -> dict:
+        return {stage: tuple(freeze(market.get(field)) for field in fields) for stage, fields in STAGE_INPUTS.items()}
+
     def generate(self, market: dict) -> dict:
-        context = self.context.analyze(market)
-        liquidity = self.liquidity.analyze(market)
-        institution = self.institution.analyze(market)
-        ict = self.ict.detect(market)
-        gann = self.gann.calculate(market)
-        astro = self.astro.calculate(market)
-        news = self.news.check(market)
-        session = self.session.analyze(market)
-        probability = self.probability.score(context, liquidity, institution, ict, gann, astro, news)
-        story = self.story.build(context, liquidity, institution, ict, gann, astro, news, session)
+        # Every sub-engine is memoized per symbol on the fields it reads, and
+        # the derived stages on their upstream keys, so a repeat call with an
+        # unchanged market dict does no engine work at all.
+        scope = str(market.get("symbol") or "")
+        keys = self._stage_keys(market)
+        memo = self.memo.get
+        context = memo(scope, "context", keys["context"], lambda: self.context.analyze(market))
+        liquidity = memo(scope, "liquidity", keys["liquidity"], lambda: self.liquidity.analyze(market))
+        institution = memo(scope, "institution", keys["institution"], lambda: self.institution.analyze(market))
+        ict = memo(scope, "ict", keys["ict"], lambda: self.ict.detect(market))
+        gann = memo(scope, "gann", keys["gann"], lambda: self.gann.calculate(market))
+        astro = memo(scope, "astro", keys["astro"], lambda: self.astro.calculate(market))
+        news = memo(scope, "news", keys["news"], lambda: self.news.check(market))
+        session = memo(scope, "session", keys["session"], lambda: self.session.analyze(market))
+        upstream = tuple(keys[stage] for stage in ("context", "liquidity", "institution", "ict", "gann", "astro", "news"))
+        probability = memo(scope, "probability", upstream, lambda: self.probability.score(context, liquidity, institution, ict, gann, astro, news))
+        story = memo(scope, "story", upstream + (keys["session"],), lambda: self.story.build(context, liquidity, institution, ict, gann, astro, news, session))
         return {
             "context": context,
             "liquidity": liquidity,
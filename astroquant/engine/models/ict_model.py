@@ -1,7 +1,47 @@
+from astroquant.engine.ict_structure import tracker_for
+
+
 class ICTModel:
 
+	SWEEP_LOOKBACK_BARS = 20
+
+	def _structure_signal(self, data, symbol):
+		candles = data.get("candles") or []
+		if len(candles) < 6:
+			return None
+		tracker = tracker_for((symbol, data.get("pricing_source")))
+		price = float(candles[-1].get("close", 0.0) or 0.0)
+		with tracker.lock:
+			tracker.ingest(candles)
+			state = tracker.state(price)
+		structure = state["last_break"]
+		if not structure:
+			return None
+
+		direction = structure["direction"]
+		sweep = state["last_sweep"]
+		recent_sweep = bool(sweep and sweep["direction"] == direction and sweep["index"] >= state["bars_seen"] - self.SWEEP_LOOKBACK_BARS)
+		swept = bool(data.get("liquidity_sweep")) or recent_sweep
+		# Entry zone: the nearest open gap on the retracement side of price.
+		zone = state["fvg_below"] if direction == "BUY" else state["fvg_above"]
+		expected = "BULLISH_FVG" if direction == "BUY" else "BEARISH_FVG"
+		if not swept or not zone or zone["type"] != expected:
+			return None
+
+		return {
+			"model": "ICT",
+			"direction": direction,
+			"confidence": 80 if structure["type"] == "BOS" else 75,
+			"rr": 3,
+			"performance_weight": 1.0,
+			"structure": structure["type"],
+			"fvg": {"bottom": zone["bottom"], "top": zone["top"]},
+		}
+
 	def check(self, data, symbol):
-		# Example placeholder logic (replace with real ICT later)
+		if data.get("candles"):
+			return self._structure_signal(data, symbol)
+
 		if data["trend"] == "UP" and data["liquidity_sweep"]:
 			return {
 				"model": "ICT",
@@ -1,17 +1,226 @@
-import random
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from astroquant.core.prop_profiles import normalize_account_key, profile_for, profile_risk_pct
+from astroquant.backend.config import (
+    MONTECARLO_ACCOUNT_KEY,
+    MONTECARLO_HORIZON_DAYS,
+    MONTECARLO_PATHS,
+    MONTECARLO_REDUCE_RISK_FAILURE_RATE,
+    MONTECARLO_REFRESH_SECONDS,
+    MONTECARLO_TRADES_PER_DAY,
+)
+
+DB_PATH = "ai_trade_journal.db"
+MIN_JOURNAL_SAMPLES = 30
+R_MULTIPLE_BOUNDS = (-5.0, 10.0)
+CHUNK_PATHS = 20000
+
+
+def load_r_multiples(db_path=DB_PATH, limit=2000):
+    """Most recent realised R-multiples from the AI trade journal."""
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute(
+                "SELECT r_multiple FROM trades WHERE r_multiple IS NOT NULL ORDER BY id DESC LIMIT ?",
+                (int(limit),),
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return []
+    values = []
+    for (value,) in rows:
+        try:
+            numeric = float(value)
+        except (TypeError, ValueError):
+            continue
+        if np.isfinite(numeric):
+            values.append(min(R_MULTIPLE_BOUNDS[1], max(R_MULTIPLE_BOUNDS[0], numeric)))
+    return values
+
+
+def _first_true(mask, sentinel):
+    index = mask.argmax(axis=1)
+    index[~mask.any(axis=1)] = sentinel
+    return index
+
+
+def _distribution(values, scale=1.0, digits=2):
+    if values.size == 0:
+        return {"p50": None, "p90": None, "p95": None, "p99": None, "mean": None}
+    p50, p90, p95, p99 = np.percentile(values, [50, 90, 95, 99])
+    return {
+        "p50": round(float(p50) * scale, digits),
+        "p90": round(float(p90) * scale, digits),
+        "p95": round(float(p95) * scale, digits),
+        "p99": round(float(p99) * scale, digits),
+        "mean": round(float(values.mean()) * scale, digits),
+    }
 
 
 class MonteCarlo:
+    """Prop-challenge Monte Carlo over bootstrapped journal R-multiples.
+
+    Every path compounds fixed-fraction risk per trade and stops at the first
+    of: daily loss limit, total loss limit or phase target. All paths in a
+    chunk are simulated together as ``(paths, trades)`` arrays, so 100k paths
+    cost a handful of NumPy passes instead of a Python loop per trade.
+    """
+
+    def __init__(self, db_path=DB_PATH, account_key=None, mode="STANDARD"):
+        self.db_path = db_path
+        self.account_key = normalize_account_key(account_key or MONTECARLO_ACCOUNT_KEY)
+        self.mode = mode
+        self.paths = max(1000, int(MONTECARLO_PATHS))
+        self.horizon_days = max(1, int(MONTECARLO_HORIZON_DAYS))
+        self.trades_per_day = max(1, int(MONTECARLO_TRADES_PER_DAY))
+        self.refresh_seconds = max(60, int(MONTECARLO_REFRESH_SECONDS))
+        self.reduce_risk_failure_rate = float(MONTECARLO_REDUCE_RISK_FAILURE_RATE)
+        self.last_report = None
+        self.last_refresh_at = 0.0
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._refreshing = False
 
     def simulate(self, win_rate=0.55, rr=2, trades=100):
-        equity = 0
-        results = []
+        """Worst and best cumulative R over ``trades`` Bernoulli trades (one path)."""
+        rng = np.random.default_rng()
+        outcomes = np.where(rng.random(int(trades)) < float(win_rate), float(rr), -1.0)
+        equity = np.cumsum(outcomes)
+        return float(equity.min()), float(equity.max())
+
+    def simulate_paths(self, r_multiples=None, phase="PHASE1", account_key=None, mode=None,
+                       paths=None, days=None, trades_per_day=None, win_rate=0.55, rr=2.0, seed=None):
+        profile = profile_for(account_key or self.account_key, mode or self.mode)
+        phase_key = str(phase or "PHASE1").upper()
+        paths = max(1, int(paths or self.paths))
+        days = max(1, int(days or self.horizon_days))
+        per_day = max(1, int(trades_per_day or self.trades_per_day))
+        total_trades = days * per_day
+
+        samples = np.asarray(list(r_multiples or []), dtype=float)
+        if samples.size >= MIN_JOURNAL_SAMPLES:
+            source = "journal"
+            pool, weights = samples, None
+        else:
+            source = "synthetic"
+            pool = np.array([float(rr), -1.0])
+            weights = np.array([float(win_rate), 1.0 - float(win_rate)])
+
+        account_size = float(profile["account_size"])
+        risk_pct = profile_risk_pct(profile, phase_key)
+        daily_limit = float(profile["daily_max_loss"])
+        floor = account_size - float(profile["total_max_loss"])
+        target = account_size + float(profile["phase2_target" if phase_key == "PHASE2" else "phase1_target"])
+        day_start_cols = (np.arange(total_trades) // per_day) * per_day
+
+        rng = np.random.default_rng(seed)
+        max_dd, target_days = [], []
+        counts = {"passed": 0, "daily_breach": 0, "max_loss_breach": 0}
+        final_sum = 0.0
+
+        for offset in range(0, paths, CHUNK_PATHS):
+            n = min(CHUNK_PATHS, paths - offset)
+            draws = rng.choice(pool, size=(n, total_trades), p=weights)
+            equity = np.empty((n, total_trades + 1))
+            equity[:, 0] = account_size
+            np.cumprod(1.0 + draws * risk_pct, axis=1, out=equity[:, 1:])
+            equity[:, 1:] *= account_size
+            after = equity[:, 1:]
+
+            daily_idx = _first_true(after - equity[:, day_start_cols] <= -daily_limit, total_trades)
+            floor_idx = _first_true(after <= floor, total_trades)
+            target_idx = _first_true(after >= target, total_trades)
+            fail_idx = np.minimum(daily_idx, floor_idx)
+            passed = target_idx < fail_idx
+            failed = fail_idx < target_idx
+            end_idx = np.minimum(np.minimum(fail_idx, target_idx), total_trades - 1)
+
+            drawdown = np.maximum.accumulate(equity, axis=1)[:, 1:] - after
+            drawdown[np.arange(total_trades) > end_idx[:, None]] = 0.0
+            max_dd.append(drawdown.max(axis=1) / account_size)
+            target_days.append(target_idx[passed] // per_day + 1)
+
+            counts["passed"] += int(passed.sum())
+            counts["daily_breach"] += int((failed & (daily_idx <= floor_idx)).sum())
+            counts["max_loss_breach"] += int((failed & (floor_idx < daily_idx)).sum())
+            final_sum += float(after[np.arange(n), end_idx].sum())
+
+        max_dd = np.concatenate(max_dd)
+        target_days = np.concatenate(target_days)
+        failures = counts["daily_breach"] + counts["max_loss_breach"]
+        return {
+            "paths": paths,
+            "days": days,
+            "trades_per_day": per_day,
+            "phase": phase_key,
+            "account_key": profile["account_key"],
+            "mode": profile["mode"],
+            "risk_pct": round(risk_pct * 100.0, 4),
+            "source": source,
+            "samples": int(samples.size),
+            "mean_r": round(float(samples.mean()), 4) if samples.size else None,
+            "pass_rate": round(counts["passed"] / paths, 4),
+            "failure_rate": round(failures / paths, 4),
+            "daily_breach_probability": round(counts["daily_breach"] / paths, 4),
+            "max_loss_breach_probability": round(counts["max_loss_breach"] / paths, 4),
+            "unresolved_rate": round((paths - counts["passed"] - failures) / paths, 4),
+            "max_drawdown_pct": _distribution(max_dd, scale=100.0),
+            "days_to_target": _distribution(target_days.astype(float), digits=1),
+            "mean_final_balance": round(final_sum / paths, 2),
+        }
+
+    def refresh(self, phase="PHASE1", account_key=None):
+        try:
+            report = self.simulate_paths(load_r_multiples(self.db_path), phase=phase, account_key=account_key)
+            report["generated_at"] = int(time.time())
+            with self._lock:
+                self.last_report = report
+                self.last_error = None
+        except Exception as exc:
+            with self._lock:
+                self.last_error = str(exc)
+        finally:
+            with self._lock:
+                self.last_refresh_at = time.monotonic()
+                self._refreshing = False
+        return self.last_report
+
+    def refresh_async(self, phase="PHASE1", account_key=None, force=False):
+        """Start a background refresh when the cached report is stale."""
+        wanted_phase = str(phase or "PHASE1").upper()
+        wanted_account = normalize_account_key(account_key or self.account_key)
+        with self._lock:
+            report = self.last_report or {}
+            stale = (
+                force
+                or not report
+                or report.get("phase") != wanted_phase
+                or report.get("account_key") != wanted_account
+                or (time.monotonic() - self.last_refresh_at) >= self.refresh_seconds
+            )
+            if self._refreshing or not stale:
+                return False
+            self._refreshing = True
+        threading.Thread(
+            target=self.refresh,
+            kwargs={"phase": phase, "account_key": account_key},
+            daemon=True,
+            name="aq-montecarlo",
+        ).start()
+        return True
 
-        for _ in range(trades):
-            if random.random() < win_rate:
-                equity += rr
-            else:
-                equity -= 1
-            results.append(equity)
+    def report(self):
+        with self._lock:
+            return dict(self.last_report) if self.last_report else None
 
-        return min(results), max(results)
+    def should_reduce_risk(self):
+        report = self.report()
+        if not report:
+            return False
+        return float(report.get("failure_rate") or 0.0) >= self.reduce_risk_failure_rate
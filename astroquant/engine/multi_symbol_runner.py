@@ -1,11 +1,11 @@
 import time
 import json
 import sqlite3
-import datetime
 import threading
-from datetime import datetime, timezone
 from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from astroquant.engine.signal_manager import SignalManager
+from astroquant.engine import clock, session_timeline
 from astroquant.engine.ai_decision import AIDecisionEngine
 from astroquant.engine.governance import Governance
 from astroquant.engine.prop_phase import PropPhase
@@ -26,11 +26,18 @@ from astroquant.engine.montecarlo_engine import MonteCarlo
 from astroquant.engine.basis_engine import BasisEngine
 from astroquant.engine.contract_resolver import ContractResolver
 from astroquant.engine.position_reconciliation import PositionReconciliationEngine
+from astroquant.engine.runner_scheduler import RunnerScheduler
 from astroquant.engine.broker_equity_verification import BrokerEquityVerificationEngine
 from astroquant.backend.ai.model_learning import ModelLearningEngine
+from astroquant.core.prop_profiles import normalize_account_key
 from astroquant.backend.config import (
     DATABENTO_API_KEY,
     DATABENTO_DATASET,
+    RESOLVER_PROBE_WORKERS,
+    RUNNER_BAR_CLOSE_DELAY_SECONDS,
+    RUNNER_IDLE_SWEEP_SECONDS,
+    RUNNER_MIN_EVAL_INTERVAL_SECONDS,
+    RUNNER_PRICE_TRIGGER_BPS,
     SPOT_CONFIRMATION_MAX_BPS,
     SPOT_FIDELITY_STRICT,
     SPOT_FIDELITY_SYMBOLS,
@@ -86,12 +93,14 @@ class MultiSymbolRunner:
         if self.prop_engine:
             self.state.phase = self.prop_engine.phase
 
-        self.signal_manager = SignalManager(DATABENTO_API_KEY)
+        self.signal_manager = self._build_signal_manager()
         self.ai_engine = AIDecisionEngine()
-        self.governance = Governance(self.state)
+        self.governance = self._build_governance()
+        self.timeline = session_timeline.shared()
+        self.timeline.attach_news(self.governance.news)
         self.prop = PropPhase(self.state)
         self.risk = RiskEngine(self.state)
-        self.execution = ExecutionEngine()
+        self.execution = self._build_execution()
         self.journal = JournalEngine(self.state)
         self.session_bias = SessionBias()
         self.regime_engine = VolatilityRegimeEngine()
@@ -99,7 +108,7 @@ class MultiSymbolRunner:
         self.slippage_guard = SlippageGuard()
         self.telegram = TelegramEngine()
         self.clawbot = ClawbotEngine()
-        self.feed = MarketFeed(DATABENTO_API_KEY)
+        self.feed = self._build_feed()
         self.dataset = DATABENTO_DATASET
         self.spot_fidelity_symbols = set(str(s).upper() for s in SPOT_FIDELITY_SYMBOLS)
         self.spot_fidelity_strict = bool(SPOT_FIDELITY_STRICT)
@@ -135,6 +144,13 @@ class MultiSymbolRunner:
         self.symbol_cycle_seconds = 10
         self.reconciliation_interval_seconds = 3
         self.equity_verify_interval_seconds = 3
+        self.price_trigger_bps = float(RUNNER_PRICE_TRIGGER_BPS)
+        self.bar_close_delay_seconds = float(RUNNER_BAR_CLOSE_DELAY_SECONDS)
+        self.idle_sweep_seconds = int(RUNNER_IDLE_SWEEP_SECONDS)
+        self.scheduler = RunnerScheduler(min_symbol_interval=RUNNER_MIN_EVAL_INTERVAL_SECONDS)
+        self.trigger_reference_prices = {}
+        self.last_seen_prices = {}
+        self.broker_position_fingerprint = None
         self.entry_lock_seconds = 60
         self.trade_cooldown_seconds = 300
         self.max_trades_per_day_limit = 20
@@ -162,12 +178,24 @@ class MultiSymbolRunner:
         self.offset_halt_points = 3.0
         self.offset_kill_points = 5.0
         self.daily_trade_count = 0
-        self.daily_trade_date = datetime.now(timezone.utc).date()
+        self.daily_trade_date = clock.utcnow().date()
         self.prop_status_callback = None
 
         self.running = False
         self._start_broker_spot_scanner()
 
+    def _build_signal_manager(self):
+        return SignalManager(DATABENTO_API_KEY)
+
+    def _build_governance(self):
+        return Governance(self.state)
+
+    def _build_execution(self):
+        return ExecutionEngine()
+
+    def _build_feed(self):
+        return MarketFeed(DATABENTO_API_KEY)
+
     def _start_broker_spot_scanner(self):
         if not bool(self.broker_spot_scanner_enabled):
             return
@@ -209,10 +237,17 @@ class MultiSymbolRunner:
         return snapshot
 
     def reconcile_positions(self):
+        return self._reconcile_positions()[0]
+
+    def _reconcile_positions(self):
+        # Returns the broker positions it read as well, so callers that also
+        # need them do not pay for a second browser round-trip.
+        broker_positions = None
         try:
+            broker_positions = self.execution.broker_positions_snapshot()
             snapshot = self.reconciliation_engine.reconcile(
                 internal_positions=self.positions.get_positions(),
-                broker_positions=self.execution.broker_positions_snapshot(),
+                broker_positions=broker_positions,
             )
         except Exception as exc:
             snapshot = {
@@ -223,11 +258,11 @@ class MultiSymbolRunner:
         self.last_reconciliation = snapshot
         if snapshot.get("hard_halt"):
             self.execution.emergency_halt(snapshot.get("reason") or "Position reconciliation mismatch")
-        return snapshot
+        return snapshot, broker_positions
 
     def _front_month_contracts(self, root):
         cycle = self.ROOT_MONTH_CYCLES.get(root, ["H", "M", "U", "Z"])
-        now = datetime.now(timezone.utc)
+        now = clock.utcnow()
         current_month = now.month
         current_year = now.year
 
@@ -305,26 +340,61 @@ class MultiSymbolRunner:
         dataset = symbol_dataset(symbol)
         # Always probe all candidates (up to 12)
         candidates = self.candidate_feed_symbols(symbol, include_contracts=True)[:max_candidates]
-        probe_start = time.monotonic()
-        found = None
-        attempted = []
-        for candidate in candidates:
-            if (time.monotonic() - probe_start) > float(max_probe_seconds):
-                break
-            candles = self.feed.get_ohlcv(
+        resolve_symbols = getattr(self.feed, "resolve_symbols", None)
+        known = resolve_symbols(dataset, candidates) if callable(resolve_symbols) else None
+        if known is not None:
+            # Symbology is a cheap existence check; only pull bars for contracts it knows.
+            candidates = [candidate for candidate in candidates if candidate in known] or candidates[:1]
+
+        found, candles, attempted = self._probe_candidates(dataset, candidates, max_probe_seconds)
+        if found:
+            self.contract_resolver.set_active(symbol, found, sample_count=len(candles), candidates_tried=attempted, ttl_seconds=4 * 3600)
+        else:
+            self.contract_resolver.mark_unresolved(symbol, candidates_tried=attempted)
+        return found or cached or preferred
+
+    def _probe_candidates(self, dataset, candidates, max_probe_seconds):
+        """
+        Pull bars for all candidates on a small pool and return the highest-ranked hit.
+        A hit is accepted as soon as every better-ranked candidate has missed, and the
+        remaining probes are abandoned.
+        """
+        if not candidates:
+            return None, [], []
+
+        def probe(candidate):
+            return self.feed.get_ohlcv(
                 dataset=dataset,
                 symbol=candidate,
                 lookback_minutes=180,
                 record_limit=400,
             )
-            attempted.append(candidate)
-            if candles:
-                self.contract_resolver.set_active(symbol, candidate, sample_count=len(candles), candidates_tried=attempted, ttl_seconds=4 * 3600)
-                found = candidate
-                break
-        if not found:
-            self.contract_resolver.mark_unresolved(symbol, candidates_tried=attempted)
-        return found or cached or preferred
+
+        results = {}
+        deadline = time.monotonic() + float(max_probe_seconds)
+        pool = ThreadPoolExecutor(max_workers=max(1, min(int(RESOLVER_PROBE_WORKERS), len(candidates))), thread_name_prefix="aq-resolver")
+        try:
+            futures = {pool.submit(probe, candidate): index for index, candidate in enumerate(candidates)}
+            pending = set(futures)
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        results[futures[future]] = future.result() or []
+                    except Exception:
+                        results[futures[future]] = []
+                for index in range(len(candidates)):
+                    if index not in results:
+                        break
+                    if results[index]:
+                        attempted = [candidates[i] for i in sorted(results) if i <= index]
+                        return candidates[index], results[index], attempted
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return None, [], [candidates[i] for i in sorted(results)]
 
     def get_futures_candles(self, symbol, lookback_minutes=180, record_limit=1200, prefer_cached=True):
         dataset = symbol_dataset(symbol)
@@ -361,19 +431,23 @@ class MultiSymbolRunner:
         return active, []
 
     def warmup_contracts(self, force_probe=False, max_candidates=2, max_probe_seconds=2.0):
-        warmed = {}
-        for symbol in self.symbols:
+        def warm(symbol):
             active = self.resolve_active_feed_symbol(
                 symbol,
                 force_probe=force_probe,
                 max_candidates=max(1, min(int(max_candidates or 2), 6)),
                 max_probe_seconds=max(0.5, min(float(max_probe_seconds or 2.0), 6.0)),
             )
-            warmed[symbol] = {
+            return symbol, {
                 "active_symbol": active,
                 "resolver": self.contract_resolver.snapshot(symbol),
             }
-        return warmed
+
+        if not self.symbols:
+            return {}
+        # One parallel probe round per symbol, all symbols at once.
+        with ThreadPoolExecutor(max_workers=len(self.symbols), thread_name_prefix="aq-warmup") as pool:
+            return dict(pool.map(warm, self.symbols))
 
     def get_spot_price(self, symbol):
         canonical = str(symbol).upper()
@@ -420,7 +494,7 @@ class MultiSymbolRunner:
     def _record_spot_tick(self, symbol, price, source):
         key = str(symbol).upper()
         series = self.spot_tick_history.setdefault(key, deque(maxlen=600))
-        now = int(time.time())
+        now = int(clock.now_ts())
         series.append({
             "time": now,
             "price": float(price),
@@ -433,7 +507,7 @@ class MultiSymbolRunner:
         if not ticks:
             return []
 
-        cutoff = int(time.time()) - (max(60, min(int(lookback_minutes or 240), 60 * 24 * 3)) * 60)
+        cutoff = int(clock.now_ts()) - (max(60, min(int(lookback_minutes or 240), 60 * 24 * 3)) * 60)
         buckets = {}
         for tick in ticks:
             ts = int(tick.get("time", 0))
@@ -548,6 +622,8 @@ class MultiSymbolRunner:
                     if price is not None:
                         current["price"] = float(price)
                     self.broker_spot_cache[target_key] = current
+                if price is not None:
+                    self.note_price(target_key, price)
             except Exception:
                 pass
             finally:
@@ -643,7 +719,7 @@ class MultiSymbolRunner:
         expires_at = override.get("expires_at")
         if expires_at is not None:
             try:
-                if float(expires_at) <= time.time():
+                if float(expires_at) <= clock.now_ts():
                     del self.prop_behavior_overrides[key]
                     return None
             except Exception:
@@ -686,7 +762,7 @@ class MultiSymbolRunner:
         expires_minutes=None,
     ):
         key = str(symbol)
-        now = time.time()
+        now = clock.now_ts()
         override = {
             "created_at": int(now),
             "mode": str(mode).upper() if mode is not None else None,
@@ -1072,20 +1148,9 @@ class MultiSymbolRunner:
         return True
 
     def _in_trading_window(self):
-        now = datetime.now(timezone.utc)
-        hour = int(now.hour)
-        minute = int(now.minute)
-
-        london = 7 <= hour <= 12
-        ny_first_half = 13 <= hour <= 15
-        if not (london or ny_first_half):
-            return False, "Outside London/NY-first-half window"
-
-        in_rollover = (hour == 21 and minute >= 55) or (hour == 22 and minute <= 10)
-        if in_rollover:
-            return False, "Rollover window lock"
-
-        return True, "OK"
+        # London + NY first half (07:00-15:59 UTC); the 21:55-22:10 rollover
+        # lock falls outside that window and is tracked on the timeline.
+        return self.timeline.trading_window()
 
     def _phase_limits_runtime(self):
         phase = str(self.prop_engine.phase if self.prop_engine else self.state.phase).upper()
@@ -1109,7 +1174,7 @@ class MultiSymbolRunner:
         except Exception:
             return {"status": "UNAVAILABLE", "deviation": None, "baseline": None, "smooth": None}
 
-        now = datetime.now(timezone.utc)
+        now = clock.utcnow()
         if now.hour < 7:
             return {"status": "PRE_LONDON", "deviation": 0.0, "baseline": self.offset_baselines.get(key), "smooth": raw_basis}
 
@@ -1150,7 +1215,7 @@ class MultiSymbolRunner:
             pass
 
     def process_symbol(self, symbol):
-        now_date = datetime.now(timezone.utc).date()
+        now_date = clock.utcnow().date()
         if now_date != self.daily_trade_date:
             self.daily_trade_date = now_date
             self.daily_trade_count = 0
@@ -1349,7 +1414,7 @@ class MultiSymbolRunner:
         self.max_trades_per_day_limit = int(phase_limits.get("max_trades_per_day", self.max_trades_per_day_limit))
         self.min_confidence_threshold = float(phase_limits.get("confidence_threshold", self.min_confidence_threshold))
 
-        now = time.time()
+        now = clock.now_ts()
         lock_timestamp = float(self.entry_attempt_lock.get(symbol) or 0.0)
         if (now - lock_timestamp) < float(self.entry_lock_seconds):
             remaining = int(max(0.0, float(self.entry_lock_seconds) - (now - lock_timestamp)))
@@ -1636,8 +1701,23 @@ class MultiSymbolRunner:
                 "broker_quote": broker_quote,
             }
 
-        self.entry_attempt_lock[symbol] = time.time()
-        trade = self.execution.execute(execution_signal, lot_size)
+        self.entry_attempt_lock[symbol] = clock.now_ts()
+        trade = self.execution.execute(execution_signal, lot_size) or {
+            "status": "UNKNOWN",
+            "reason": "No execution result",
+        }
+        if str(trade.get("status") or "").upper() == "UNKNOWN":
+            # The order may be live at the broker; reconciliation decides
+            # whether the book still matches instead of assuming either way.
+            reconciliation = self.reconcile_positions()
+            self._audit_event("REJECTED_TRADE", "EXECUTION_UNKNOWN", {
+                "symbol": symbol,
+                "reason": trade.get("reason"),
+                "reconciliation": reconciliation,
+                "model": best.get("model"),
+                "direction": best.get("direction"),
+            })
+            return {"status": "Unknown", "symbol": symbol, "reason": trade.get("reason"), "reconciliation": reconciliation}
         if trade.get("status") != "EXECUTED":
             self._audit_event("REJECTED_TRADE", "EXECUTION_REJECTED", {
                 "symbol": symbol,
@@ -1683,49 +1763,133 @@ class MultiSymbolRunner:
 
         self.journal.log_trade(trade)
         self.positions.add_position(symbol, trade)
-        self.cooldowns[symbol] = time.time()
+        self.cooldowns[symbol] = clock.now_ts()
         self.daily_trade_count += 1
 
         print(f"Executed trade for {symbol}: {trade}")
         return trade
 
-    def start(self):
-        self.running = True
-        print("Multi-Symbol Engine Started")
+    def refresh_montecarlo(self):
+        """Apply the cached Monte Carlo verdict and queue a background refresh when stale."""
+        phase = self.prop_engine.phase if self.prop_engine else self.state.phase
+        account_key = self.montecarlo.account_key
+        if self.prop_engine is not None:
+            size = float(getattr(self.prop_engine.config, "account_size", 0.0) or 0.0)
+            if size > 0:
+                account_key = normalize_account_key(f"{int(round(size / 1000.0))}K", fallback=account_key)
+        self.montecarlo.refresh_async(phase=phase, account_key=account_key)
+        if self.montecarlo.report() is not None:
+            self.state.reduce_risk = self.montecarlo.should_reduce_risk()
+            self.montecarlo_checked = True
+        return self.montecarlo.report()
+
+    def _runner_symbol_for_feed(self, symbol):
+        token = str(symbol or "").strip().upper()
+        if token in self.symbols:
+            return token
+        for canonical in self.symbols:
+            if token in [alias.upper() for alias in self.SPOT_SYMBOL_MAP.get(canonical, [])]:
+                return canonical
+            root = self.SYMBOL_MAP.get(canonical, canonical).split(".")[0].upper()
+            # Continuous (GC.c.1) and outright (GCZ6 / GCZ26) contracts share the root.
+            if token.split(".")[0] == root or (token.startswith(root) and token[len(root):][:1] in self.MONTH_CODE_TO_MONTH and token[len(root) + 1:].isdigit()):
+                return canonical
+        return None
+
+    def note_price(self, symbol, price):
+        """Queue an evaluation when ``symbol`` has moved ``price_trigger_bps`` since it was last evaluated."""
+        canonical = self._runner_symbol_for_feed(symbol)
+        if canonical is None or not price:
+            return False
+        price = float(price)
+        self.last_seen_prices[canonical] = price
+        reference = self.trigger_reference_prices.get(canonical)
+        if reference is None:
+            self.trigger_reference_prices[canonical] = price
+            return False
+        if abs(price - reference) / abs(reference) * 10000.0 < float(self.price_trigger_bps):
+            return False
+        self.trigger_reference_prices[canonical] = price
+        self.scheduler.trigger(canonical, "PRICE_MOVE")
+        return True
 
-        self.warmup_contracts(force_probe=False)
+    def _on_feed_price(self, dataset, symbol, price):
+        self.note_price(symbol, price)
 
-        if not self.montecarlo_checked:
-            worst, _ = self.montecarlo.simulate()
-            self.state.reduce_risk = worst < -10
-            self.montecarlo_checked = True
+    def _reconcile_and_detect_fills(self):
+        snapshot, broker_positions = self._reconcile_positions()
+        if broker_positions is None:
+            # An unreadable book is not a flat book; keep the last fingerprint.
+            return snapshot
+        try:
+            fingerprint = {
+                str(row.get("symbol") or "").upper(): float(row.get("volume") or 0.0)
+                for row in broker_positions
+                if isinstance(row, dict)
+            }
+        except Exception:
+            return snapshot
+        previous = self.broker_position_fingerprint
+        self.broker_position_fingerprint = fingerprint
+        if previous is None or previous == fingerprint:
+            return snapshot
+        changed = {symbol for symbol in set(previous) | set(fingerprint) if previous.get(symbol) != fingerprint.get(symbol)}
+        targets = {self._runner_symbol_for_feed(symbol) for symbol in changed} - {None}
+        for symbol in targets or self.symbols:
+            self.scheduler.trigger(symbol, "BROKER_FILL")
+        return snapshot
 
-        now = time.monotonic()
-        next_symbol_cycle = now
-        next_reconciliation = now
-        next_equity_verify = now
+    def _housekeeping(self):
+        self.refresh_montecarlo()
+        self.governance.news.check_and_alert(self.telegram)
+
+    def _on_bar_close(self):
+        if self.strict_challenge_mode:
+            wait = self.timeline.seconds_until_tradeable()
+            if wait > 0:
+                # Nothing can trade until the window reopens; sleep through it.
+                return wait + float(self.bar_close_delay_seconds)
+        for symbol in self.symbols:
+            self.scheduler.trigger(symbol, "BAR_CLOSE")
+        return 60.0 - (clock.now_ts() % 60.0) + float(self.bar_close_delay_seconds)
 
-        while self.running:
-            tick = time.monotonic()
+    def _idle_sweep(self):
+        if self.strict_challenge_mode and self.timeline.seconds_until_tradeable() > 0:
+            return
+        for symbol in self.symbols:
+            self.scheduler.trigger(symbol, "SWEEP")
 
-            if tick >= next_equity_verify:
-                self.verify_broker_equity()
-                next_equity_verify = tick + float(self.equity_verify_interval_seconds)
+    def _evaluate_triggered(self, triggered):
+        for symbol in self.symbols:
+            if symbol not in triggered:
+                continue
+            self.process_symbol(symbol)
+            # Measure the next move from the price this evaluation saw.
+            if symbol in self.last_seen_prices:
+                self.trigger_reference_prices[symbol] = self.last_seen_prices[symbol]
+
+    def start(self):
+        self.running = True
+        print("Multi-Symbol Engine Started")
+
+        self.warmup_contracts(force_probe=False)
 
-            if tick >= next_reconciliation:
-                self.reconcile_positions()
-                next_reconciliation = tick + float(self.reconciliation_interval_seconds)
+        self.refresh_montecarlo()
 
-            if tick >= next_symbol_cycle:
-                self.governance.news.check_and_alert(self.telegram)
-                for symbol in self.symbols:
-                    self.process_symbol(symbol)
-                next_symbol_cycle = tick + float(self.symbol_cycle_seconds)
+        scheduler = self.scheduler
+        scheduler.every("equity_verify", self.equity_verify_interval_seconds, self.verify_broker_equity)
+        scheduler.every("reconciliation", self.reconciliation_interval_seconds, self._reconcile_and_detect_fills)
+        scheduler.every("housekeeping", self.symbol_cycle_seconds, self._housekeeping)
+        scheduler.every("bar_close", 60, self._on_bar_close)
+        scheduler.every("idle_sweep", max(self.symbol_cycle_seconds, self.idle_sweep_seconds), self._idle_sweep, first_delay=self.idle_sweep_seconds)
+        if hasattr(self.feed, "on_price") and self._on_feed_price not in getattr(self.feed, "price_listeners", []):
+            self.feed.on_price(self._on_feed_price)
 
-            time.sleep(1)
+        scheduler.run(self._evaluate_triggered)
 
     def stop(self):
         self.running = False
+        self.scheduler.stop()
         self.feed.stop_live()
         print("Multi-Symbol Engine Stopped")
 
@@ -0,0 +1,238 @@
+import bisect
+import datetime
+import json
+import threading
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import requests
+
+from astroquant.engine import clock
+
+
+def parse_calendar_xml(content):
+    """High-impact, timed events from a Forex Factory weekly XML payload."""
+    root = ET.fromstring(content)
+    events = []
+    for item in root.findall("event"):
+        impact_node = item.find("impact")
+        currency_node = item.find("currency")
+        date_node = item.find("date")
+        time_node = item.find("time")
+        title_node = item.find("title")
+
+        impact = (impact_node.text or "").strip() if impact_node is not None else ""
+        currency = (currency_node.text or "").strip() if currency_node is not None else ""
+        date_str = (date_node.text or "").strip() if date_node is not None else ""
+        time_str = (time_node.text or "").strip() if time_node is not None else ""
+        title = (title_node.text or "").strip() if title_node is not None else ""
+
+        if impact != "High":
+            continue
+
+        if time_str in {"All Day", "Tentative", ""}:
+            continue
+
+        try:
+            event_time = datetime.datetime.strptime(
+                date_str + " " + time_str,
+                "%m-%d-%Y %I:%M%p"
+            ).replace(tzinfo=datetime.UTC)
+        except Exception:
+            continue
+
+        events.append({
+            "title": title,
+            "currency": currency,
+            "impact": impact,
+            "time": event_time
+        })
+    return events
+
+
+class NewsCalendar:
+    """Time-sorted, per-currency indexed economic calendar.
+
+    Window queries ("any event for these currencies between t0 and t1") are a
+    pair of bisects per currency. The parsed calendar is persisted with the
+    feed's ETag/Last-Modified so restarts and unchanged weeks cost a 304, and
+    refreshes run on a background thread so callers never wait on the feed.
+    """
+
+    def __init__(self, url, cache_file=None, refresh_seconds=600, timeout_seconds=5, retry_seconds=60):
+        self.url = url
+        self.file = Path(cache_file) if cache_file else None
+        self.refresh_seconds = max(30, int(refresh_seconds))
+        self.timeout_seconds = max(1.0, float(timeout_seconds))
+        self.retry_seconds = max(5, int(retry_seconds))
+        self.events = []
+        self._index = {}
+        self.etag = None
+        self.last_modified = None
+        self.fetched_at = None
+        self.last_error = None
+        self.not_modified_count = 0
+        self._next_attempt = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._loop_thread = None
+        self._stop = threading.Event()
+        self._listeners = []
+        self._change_listeners = []
+        self._load()
+
+    def on_refresh(self, callback):
+        self._listeners.append(callback)
+
+    def on_change(self, callback):
+        """Call ``callback(calendar)`` whenever the event set is replaced."""
+        self._change_listeners.append(callback)
+
+    def set_events(self, events):
+        ordered = sorted((dict(event) for event in events or []), key=lambda event: event["time"])
+        index = {}
+        for event in ordered:
+            times, rows = index.setdefault(event.get("currency") or "", ([], []))
+            times.append(event["time"].timestamp())
+            rows.append(event)
+        with self._lock:
+            self.events = ordered
+            self._index = index
+        for callback in list(self._change_listeners):
+            try:
+                callback(self)
+            except Exception:
+                pass
+
+    def between(self, start, end, currencies=None):
+        """Events with ``start <= time <= end`` (datetimes), earliest first."""
+        lo, hi = start.timestamp(), end.timestamp()
+        with self._lock:
+            index = self._index
+        keys = index.keys() if currencies is None else [c for c in currencies if c in index]
+        found = []
+        for key in keys:
+            times, rows = index[key]
+            found.extend(rows[bisect.bisect_left(times, lo):bisect.bisect_right(times, hi)])
+        if len(found) > 1:
+            found.sort(key=lambda event: event["time"])
+        return found
+
+    def _load(self):
+        if self.file is None:
+            return
+        try:
+            payload = json.loads(self.file.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(payload, dict):
+            return
+        events = []
+        for row in payload.get("events", []) or []:
+            try:
+                events.append({**row, "time": datetime.datetime.fromisoformat(row["time"])})
+            except Exception:
+                continue
+        self.set_events(events)
+        self.etag = payload.get("etag")
+        self.last_modified = payload.get("last_modified")
+        if payload.get("fetched_at"):
+            self.fetched_at = datetime.datetime.fromisoformat(payload["fetched_at"])
+
+    def _save(self):
+        if self.file is None:
+            return
+        with self._lock:
+            payload = {
+                "url": self.url,
+                "etag": self.etag,
+                "last_modified": self.last_modified,
+                "fetched_at": self.fetched_at.isoformat() if self.fetched_at else None,
+                "events": [{**event, "time": event["time"].isoformat()} for event in self.events],
+            }
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        self.file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    def is_stale(self):
+        if self.fetched_at is None:
+            return True
+        return (clock.utcnow() - self.fetched_at).total_seconds() >= self.refresh_seconds
+
+    def refresh(self):
+        """Conditionally re-download the feed; returns True when the calendar is current."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        try:
+            response = requests.get(self.url, headers=headers, timeout=self.timeout_seconds)
+            if response.status_code == 304:
+                self.not_modified_count += 1
+            else:
+                response.raise_for_status()
+                self.set_events(parse_calendar_xml(response.content))
+                self.etag = response.headers.get("ETag")
+                self.last_modified = response.headers.get("Last-Modified")
+            self.fetched_at = clock.utcnow()
+            self.last_error = None
+            self._save()
+        except Exception as error:
+            self.last_error = str(error)
+            self._next_attempt = time.monotonic() + self.retry_seconds
+            print("News fetch error:", error)
+            return False
+        for callback in list(self._listeners):
+            try:
+                callback(self)
+            except Exception:
+                pass
+        return True
+
+    def _refresh_worker(self):
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def refresh_async(self):
+        """Start a background refresh unless one is running or the feed is backing off."""
+        with self._lock:
+            if self._refreshing or time.monotonic() < self._next_attempt:
+                return False
+            self._refreshing = True
+        threading.Thread(target=self._refresh_worker, daemon=True, name="aq-news-calendar").start()
+        return True
+
+    def start_background_refresh(self):
+        if self._loop_thread and self._loop_thread.is_alive():
+            return False
+        self._stop.clear()
+
+        def _loop():
+            while not self._stop.wait(self.refresh_seconds):
+                if self.is_stale():
+                    self.refresh_async()
+
+        self._loop_thread = threading.Thread(target=_loop, daemon=True, name="aq-news-calendar-loop")
+        self._loop_thread.start()
+        return True
+
+    def stop_background_refresh(self):
+        self._stop.set()
+
+    def status(self):
+        return {
+            "url": self.url,
+            "events": len(self.events),
+            "currencies": sorted(self._index),
+            "fetched_at": self.fetched_at.isoformat() if self.fetched_at else None,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "not_modified_count": self.not_modified_count,
+            "refreshing": self._refreshing,
+            "last_error": self.last_error,
+            "stale": self.is_stale(),
+        }
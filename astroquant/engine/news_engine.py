@@ -1,6 +1,13 @@
-import requests
 import datetime
-import xml.etree.ElementTree as ET
+
+from astroquant.engine import clock
+from astroquant.engine.news_calendar import NewsCalendar
+from astroquant.backend.config import (
+    NEWS_CALENDAR_CACHE_FILE,
+    NEWS_CALENDAR_REFRESH_SECONDS,
+    NEWS_CALENDAR_TIMEOUT_SECONDS,
+    NEWS_CALENDAR_URL,
+)
 
 
 HIGH_IMPACT_KEYWORDS = ["CPI", "NFP", "FOMC", "Rate", "Powell"]
@@ -13,61 +20,46 @@ def is_high_impact(news_title):
 
 class NewsEngine:
 
-    def __init__(self):
-        self.events = []
-        self.last_fetch = None
+    def __init__(self, cache_file=NEWS_CALENDAR_CACHE_FILE):
+        self.calendar = NewsCalendar(
+            NEWS_CALENDAR_URL,
+            cache_file=cache_file,
+            refresh_seconds=NEWS_CALENDAR_REFRESH_SECONDS,
+            timeout_seconds=NEWS_CALENDAR_TIMEOUT_SECONDS,
+        )
+        self.calendar.on_refresh(self._on_calendar_refresh)
+        self.last_fetch = self.calendar.fetched_at
         self.alerted_events = set()
         self.freeze_pre_minutes = 20
         self.freeze_post_minutes = 20
 
+    @property
+    def events(self):
+        return self.calendar.events
+
+    @events.setter
+    def events(self, rows):
+        self.calendar.set_events(rows)
+
+    def _on_calendar_refresh(self, calendar):
+        self.last_fetch = calendar.fetched_at
+
     def fetch_news(self):
-        url = "https://nfs.faireconomy.media/ff_calendar_thisweek.xml"
-
-        try:
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            root = ET.fromstring(response.content)
-
-            self.events = []
-
-            for item in root.findall("event"):
-                impact_node = item.find("impact")
-                currency_node = item.find("currency")
-                date_node = item.find("date")
-                time_node = item.find("time")
-                title_node = item.find("title")
-
-                impact = (impact_node.text or "").strip() if impact_node is not None else ""
-                currency = (currency_node.text or "").strip() if currency_node is not None else ""
-                date_str = (date_node.text or "").strip() if date_node is not None else ""
-                time_str = (time_node.text or "").strip() if time_node is not None else ""
-                title = (title_node.text or "").strip() if title_node is not None else ""
-
-                if impact != "High":
-                    continue
-
-                if time_str in {"All Day", "Tentative", ""}:
-                    continue
-
-                try:
-                    event_time = datetime.datetime.strptime(
-                        date_str + " " + time_str,
-                        "%m-%d-%Y %I:%M%p"
-                    ).replace(tzinfo=datetime.UTC)
-                except Exception:
-                    continue
-
-                self.events.append({
-                    "title": title,
-                    "currency": currency,
-                    "impact": impact,
-                    "time": event_time
-                })
-
-            self.last_fetch = datetime.datetime.now(datetime.UTC)
-
-        except Exception as error:
-            print("News fetch error:", error)
+        # Only a cold start with no cached calendar waits on the feed (bounded by
+        # the request timeout); every later refresh runs in the background.
+        if self.last_fetch is None and not self.calendar.events and not self.calendar.last_error:
+            self.calendar.refresh()
+        else:
+            self.calendar.refresh_async()
+        self.calendar.start_background_refresh()
+
+    def _window(self, symbol, before_seconds, after_seconds):
+        now = clock.utcnow()
+        return self.calendar.between(
+            now - datetime.timedelta(seconds=before_seconds),
+            now + datetime.timedelta(seconds=after_seconds),
+            currencies=self.normalize_symbol(symbol),
+        ), now
 
     def normalize_symbol(self, symbol):
         if symbol == "XAUUSD":
@@ -79,30 +71,21 @@ class NewsEngine:
         return []
 
     def is_high_impact_near(self, symbol):
-        now = datetime.datetime.now(datetime.UTC)
-        currencies = self.normalize_symbol(symbol)
         freeze_pre = int(self.freeze_pre_minutes)
         freeze_post = int(self.freeze_post_minutes)
 
-        for event in self.events:
-            delta = (event["time"] - now).total_seconds()
-
-            # freeze window: N minutes before to N minutes after
-            if -(freeze_post * 60) <= delta <= (freeze_pre * 60):
-                if event["currency"] in currencies:
-                    return True, event["title"]
+        # freeze window: N minutes before to N minutes after
+        events, _ = self._window(symbol, freeze_post * 60, freeze_pre * 60)
+        if events:
+            return True, events[0]["title"]
 
         return False, None
 
     def is_post_news_volatility(self, symbol):
-        now = datetime.datetime.now(datetime.UTC)
-        currencies = self.normalize_symbol(symbol)
-
-        for event in self.events:
+        events, now = self._window(symbol, 1800, -600)
+        for event in events:
             if event.get("impact") != "High":
                 continue
-            if event.get("currency") not in currencies:
-                continue
 
             delta = (now - event["time"]).total_seconds()
             if 600 < delta <= 1800:  # 10-30 minutes after event
@@ -111,15 +94,11 @@ class NewsEngine:
         return False, None
 
     def news_risk_mode(self, symbol):
-        now = datetime.datetime.now(datetime.UTC)
-        currencies = self.normalize_symbol(symbol)
         freeze_pre = int(self.freeze_pre_minutes)
         freeze_post = int(self.freeze_post_minutes)
 
-        for event in self.events:
-            if event.get("currency") not in currencies:
-                continue
-
+        events, now = self._window(symbol, freeze_post * 60, (freeze_pre + 10) * 60)
+        for event in events:
             delta = (event["time"] - now).total_seconds()
 
             # During freeze window ±N min
@@ -133,14 +112,11 @@ class NewsEngine:
         return "NORMAL", None
 
     def high_impact_halt(self, symbol, minutes_to_news=15):
-        now = datetime.datetime.now(datetime.UTC)
-        currencies = self.normalize_symbol(symbol)
         freeze_pre = max(int(minutes_to_news), int(self.freeze_pre_minutes))
         freeze_post = int(self.freeze_post_minutes)
 
-        for event in self.events:
-            if event.get("currency") not in currencies:
-                continue
+        events, now = self._window(symbol, freeze_post * 60, freeze_pre * 60)
+        for event in events:
             if not is_high_impact(event.get("title", "")):
                 continue
 
@@ -154,15 +130,14 @@ class NewsEngine:
         if not telegram:
             return
 
-        now = datetime.datetime.now(datetime.UTC)
+        now = clock.utcnow()
 
-        for event in self.events:
-            delta = (event["time"] - now).total_seconds()
-
-            if 540 <= delta <= 600:  # 10 min before
-                event_key = f"{event.get('title')}|{event.get('currency')}|{event.get('time')}"
-                if event_key in self.alerted_events:
-                    continue
+        # 10 min before
+        upcoming = self.calendar.between(now + datetime.timedelta(seconds=540), now + datetime.timedelta(seconds=600))
+        for event in upcoming:
+            event_key = f"{event.get('title')}|{event.get('currency')}|{event.get('time')}"
+            if event_key in self.alerted_events:
+                continue
 
-                telegram.send_news_alert(event)
-                self.alerted_events.add(event_key)
+            telegram.send_news_alert(event)
+            self.alerted_events.add(event_key)
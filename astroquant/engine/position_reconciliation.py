@@ -1,4 +1,4 @@
-import time
+from astroquant.engine import clock
 
 
 class PositionReconciliationEngine:
@@ -50,7 +50,7 @@ class PositionReconciliationEngine:
         return dict(self._last_snapshot)
 
     def reconcile(self, internal_positions, broker_positions):
-        now = int(time.time())
+        now = int(clock.now_ts())
         if (now - int(self._last_check)) < self.check_interval_seconds and self._last_snapshot.get("status") != "UNINITIALIZED":
             return dict(self._last_snapshot)
 
@@ -0,0 +1,139 @@
+from astroquant.engine import clock
+
+
+class SimulatedExecutionEngine:
+    """ExecutionEngine stand-in that fills orders against the replay feed.
+
+    Fills happen at the last closed bar's close, shifted by half the spread
+    plus a fixed slippage against the trader. The broker book mirrors the
+    runner's open positions so reconciliation and equity checks see a
+    broker that always agrees with internal state.
+    """
+
+    def __init__(self, feed, state, symbol_map=None, spread=0.3, slippage_points=0.0):
+        self.feed = feed
+        self.state = state
+        self.symbol_map = dict(symbol_map or {})
+        self.spread = max(0.0, float(spread))
+        self.slippage_points = max(0.0, float(slippage_points))
+        self.playwright = None
+        self.halted = False
+        self.last_error = None
+        self.halted_at = None
+        self.fills = []
+        self.partial_closes = []
+
+    def _feed_symbol(self, symbol):
+        return self.symbol_map.get(str(symbol or "").upper(), symbol)
+
+    def _quote(self, symbol):
+        bar = self.feed.last_bar(self._feed_symbol(symbol))
+        if bar is None:
+            return None
+        mid = float(bar["close"])
+        half = self.spread / 2.0
+        return {"bid": mid - half, "ask": mid + half, "last": mid, "mid": mid, "time": int(bar["time"]) + 60}
+
+    def set_page(self, page):
+        return None
+
+    def set_task_dispatcher(self, dispatcher):
+        return None
+
+    def set_reconnect_handler(self, handler):
+        return None
+
+    def execute(self, signal, lot_size, page=None):
+        if self.halted:
+            return {"status": "Rejected", "reason": "Execution HALTED"}
+        symbol = str((signal or {}).get("symbol") or "")
+        direction = str((signal or {}).get("direction") or "").upper()
+        if direction not in {"BUY", "SELL"}:
+            return {"status": "Rejected", "reason": "Invalid direction"}
+        quote = self._quote(symbol)
+        if quote is None:
+            return {"status": "Rejected", "reason": "Broker disconnected"}
+
+        if direction == "BUY":
+            fill = quote["ask"] + self.slippage_points
+        else:
+            fill = quote["bid"] - self.slippage_points
+        fill = round(fill, 5)
+        trade = {
+            "status": "EXECUTED",
+            "model": (signal or {}).get("model"),
+            "direction": direction,
+            "lot_size": lot_size,
+            "requested_price": (signal or {}).get("entry_price"),
+            "entry_price": fill,
+            "fill_price": fill,
+            "slippage": abs(fill - float((signal or {}).get("entry_price") or fill)),
+            "execution_source": "REPLAY",
+            "executed_at": int(clock.now_ts()),
+        }
+        self.fills.append({"symbol": symbol, **trade})
+        return trade
+
+    def close_position_fraction(self, symbol=None, fraction=0.5):
+        position = self.state.open_positions.get(symbol)
+        if not position:
+            return {"ok": False, "reason": "symbol_not_found", "symbol": symbol}
+        fraction = max(0.01, min(0.99, float(fraction or 0.5)))
+        volume = float(position.get("lot_size") or 0.0)
+        close_volume = max(0.01, round(volume * fraction, 2))
+        position["lot_size"] = round(volume - close_volume, 2)
+        self.partial_closes.append({"symbol": symbol, "volume": close_volume, "at": int(clock.now_ts())})
+        return {"ok": True, "symbol": symbol, "fraction": fraction, "requested_close_volume": close_volume, "source_volume": volume}
+
+    def execution_health(self):
+        return {
+            "execution_status": "HALTED" if self.halted else "OK",
+            "last_error": self.last_error,
+            "halted_at": self.halted_at,
+            "healthy": not self.halted,
+            "engine_mode": "replay",
+            "fills": len(self.fills),
+        }
+
+    def is_halted(self):
+        return bool(self.halted)
+
+    def emergency_halt(self, reason):
+        self.halted = True
+        self.last_error = str(reason)
+        self.halted_at = int(clock.now_ts())
+
+    def reset(self):
+        self.halted = False
+        self.last_error = None
+        self.halted_at = None
+
+    def broker_positions_snapshot(self):
+        return [
+            {"symbol": symbol, "volume": float(position.get("lot_size") or 0.0), "source": "REPLAY"}
+            for symbol, position in self.state.open_positions.items()
+        ]
+
+    def broker_equity_snapshot(self):
+        return float(self.state.balance)
+
+    def broker_quote_snapshot(self, expected_symbols=None):
+        for symbol in expected_symbols or []:
+            quote = self._quote(symbol)
+            if quote is None:
+                continue
+            return {
+                "symbol": str(symbol),
+                "bid": quote["bid"],
+                "ask": quote["ask"],
+                "last": quote["last"],
+                "mid": quote["mid"],
+                "spread": self.spread,
+                "symbol_mismatch": False,
+                "source": "REPLAY",
+                "captured_at": int(clock.now_ts()),
+            }
+        return None
+
+    def broker_quotes_snapshot(self, symbols):
+        return {str(symbol): self.broker_quote_snapshot(expected_symbols=[symbol]) for symbol in symbols or []}
@@ -0,0 +1,302 @@
+import bisect
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+from astroquant.engine import clock
+
+
+def _epoch_seconds(value):
+    if hasattr(value, "timestamp"):
+        return int(value.timestamp())
+    numeric = int(value)
+    if numeric > 10_000_000_000_000:
+        return int(numeric / 1_000_000_000)
+    if numeric > 10_000_000_000:
+        return int(numeric / 1_000_000)
+    return numeric
+
+
+BAR_FIELDS = ("time", "open", "high", "low", "close", "volume")
+BAR_DTYPE = [("time", "i8"), ("open", "f8"), ("high", "f8"), ("low", "f8"), ("close", "f8"), ("volume", "f8")]
+TRADE_DTYPE = [("time", "i8"), ("price", "f8"), ("size", "i8"), ("side", "S1")]
+
+
+def _search(times, value, side="right"):
+    if hasattr(times, "searchsorted"):
+        return int(times.searchsorted(value, side=side))
+    if side == "left":
+        return bisect.bisect_left(times, value)
+    return bisect.bisect_right(times, value)
+
+
+def _price(value):
+    numeric = float(value)
+    if abs(numeric) >= 1_000_000_000:
+        return numeric / 1_000_000_000.0
+    return numeric
+
+
+def load_frame(path):
+    """Read a recorded DBN, Parquet or CSV file into a DataFrame."""
+    import pandas as pd
+
+    name = str(path).lower()
+    if name.endswith(".parquet"):
+        frame = pd.read_parquet(path)
+    elif name.endswith(".csv"):
+        frame = pd.read_csv(path)
+    elif ".dbn" in name:
+        import databento as db
+
+        frame = db.DBNStore.from_file(path).to_df()
+    else:
+        raise ValueError(f"Unsupported replay file: {path}")
+
+    if "ts_event" not in frame.columns:
+        frame = frame.reset_index()
+    if "ts_event" not in frame.columns:
+        for column in ("ts_recv", "time", "timestamp"):
+            if column in frame.columns:
+                frame = frame.rename(columns={column: "ts_event"})
+                break
+    return frame
+
+
+def bars_from_frame(frame):
+    if {"open", "high", "low", "close"}.issubset(frame.columns):
+        volumes = frame["volume"] if "volume" in frame.columns else [0.0] * len(frame)
+        return [
+            {
+                "time": _epoch_seconds(ts),
+                "open": _price(o),
+                "high": _price(h),
+                "low": _price(lo),
+                "close": _price(c),
+                "volume": float(v or 0.0),
+            }
+            for ts, o, h, lo, c, v in zip(
+                frame["ts_event"], frame["open"], frame["high"], frame["low"], frame["close"], volumes)
+        ]
+
+    buckets = {}
+    for ts, price, size in zip(frame["ts_event"], frame["price"], frame["size"]):
+        minute = (_epoch_seconds(ts) // 60) * 60
+        px = _price(price)
+        row = buckets.get(minute)
+        if row is None:
+            buckets[minute] = {"time": minute, "open": px, "high": px, "low": px, "close": px, "volume": float(size or 0.0)}
+            continue
+        row["high"] = max(row["high"], px)
+        row["low"] = min(row["low"], px)
+        row["close"] = px
+        row["volume"] += float(size or 0.0)
+    return [buckets[key] for key in sorted(buckets)]
+
+
+def trades_from_frame(frame):
+    if not {"price", "size"}.issubset(frame.columns):
+        return []
+    sides = frame["side"] if "side" in frame.columns else ["N"] * len(frame)
+    return [
+        SimpleNamespace(time=_epoch_seconds(ts), price=_price(price), size=int(size or 0), side=str(side or "N"))
+        for ts, price, size, side in zip(frame["ts_event"], frame["price"], frame["size"], sides)
+    ]
+
+
+class ReplayMarketFeed:
+    """MarketFeed stand-in serving recorded bars up to the active clock.
+
+    Only bars whose minute has fully closed at ``clock.now_ts()`` are visible,
+    so the pipeline never sees the future. Each symbol keeps a sorted list of
+    bar open times and every query is a pair of bisects.
+    """
+
+    def __init__(self, sources=None, trade_window=500):
+        self.api_key = "replay"
+        self.last_error = None
+        self.trade_window = max(1, int(trade_window))
+        self.bar_times = {}
+        self.bars = {}
+        self.bar_arrays = {}
+        self.trade_times = {}
+        self.trades = {}
+        self.trade_arrays = {}
+        self.aliases = {}
+        for symbol, paths in (sources or {}).items():
+            self.load(symbol, paths)
+
+    def save_arrays(self, directory):
+        """Write every symbol's bars and trades as ``.npy`` files for memory-mapping."""
+        import numpy as np
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        manifest = {"bars": {}, "trades": {}}
+        for index, key in enumerate(sorted(self.bar_times)):
+            name = f"bars_{index}.npy"
+            np.save(directory / name, np.array([tuple(row[f] for f in BAR_FIELDS) for row in self._bar_rows(key)], dtype=BAR_DTYPE))
+            manifest["bars"][key] = name
+        for index, key in enumerate(sorted(self.trade_times)):
+            name = f"trades_{index}.npy"
+            rows = [(row.time, row.price, row.size, str(row.side)[:1].encode()) for row in self._trade_rows(key)]
+            np.save(directory / name, np.array(rows, dtype=TRADE_DTYPE))
+            manifest["trades"][key] = name
+        (directory / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        return directory
+
+    @classmethod
+    def from_arrays(cls, directory, trade_window=500):
+        """Feed backed by read-only memory maps written by ``save_arrays``.
+
+        Worker processes opening the same directory share the page cache
+        instead of each holding a parsed copy of the recording.
+        """
+        import numpy as np
+
+        directory = Path(directory)
+        manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+        feed = cls(trade_window=trade_window)
+        for key, name in manifest.get("bars", {}).items():
+            feed.bar_arrays[key] = np.load(directory / name, mmap_mode="r")
+            feed.bar_times[key] = feed.bar_arrays[key]["time"]
+        for key, name in manifest.get("trades", {}).items():
+            feed.trade_arrays[key] = np.load(directory / name, mmap_mode="r")
+            feed.trade_times[key] = feed.trade_arrays[key]["time"]
+        return feed
+
+    def _bar_rows(self, key, start=0, end=None):
+        if key in self.bar_arrays:
+            return [dict(zip(BAR_FIELDS, row)) for row in self.bar_arrays[key][start:end].tolist()]
+        return [dict(row) for row in self.bars.get(key, [])[start:end]]
+
+    def _trade_rows(self, key, start=0, end=None):
+        if key in self.trade_arrays:
+            return [
+                SimpleNamespace(time=ts, price=price, size=size, side=side.decode() or "N")
+                for ts, price, size, side in self.trade_arrays[key][start:end].tolist()
+            ]
+        return self.trades.get(key, [])[start:end]
+
+    def _key(self, symbol):
+        text = str(symbol or "").strip()
+        return self.aliases.get(text.upper(), text.upper())
+
+    def add_alias(self, alias, symbol):
+        self.aliases[str(alias).strip().upper()] = self._key(symbol)
+
+    def add_bars(self, symbol, rows):
+        key = self._key(symbol)
+        merged = {int(row["time"]): dict(row) for row in self.bars.get(key, [])}
+        for row in rows or []:
+            merged[int(row["time"])] = dict(row)
+        ordered = [merged[ts] for ts in sorted(merged)]
+        self.bars[key] = ordered
+        self.bar_times[key] = [row["time"] for row in ordered]
+
+    def add_trades(self, symbol, rows):
+        key = self._key(symbol)
+        ordered = sorted([*self.trades.get(key, []), *(rows or [])], key=lambda row: row.time)
+        self.trades[key] = ordered
+        self.trade_times[key] = [row.time for row in ordered]
+
+    def load(self, symbol, paths):
+        if isinstance(paths, (str, Path)):
+            paths = [paths]
+        for path in paths or []:
+            frame = load_frame(path)
+            self.add_bars(symbol, bars_from_frame(frame))
+            self.add_trades(symbol, trades_from_frame(frame))
+
+    def timeline(self, start=None, end=None):
+        """Sorted bar open times across all symbols, optionally bounded."""
+        stamps = sorted({int(ts) for times in self.bar_times.values() for ts in times})
+        lo = bisect.bisect_left(stamps, int(start)) if start is not None else 0
+        hi = bisect.bisect_right(stamps, int(end)) if end is not None else len(stamps)
+        return stamps[lo:hi]
+
+    def symbols(self):
+        return sorted(self.bar_times)
+
+    def is_configured(self):
+        return True
+
+    def health(self):
+        return {
+            "configured": True,
+            "healthy": bool(self.bar_times),
+            "reason": "OK" if self.bar_times else "No replay data loaded",
+            "last_error": self.last_error,
+            "auth_cooldown_seconds": 0,
+            "live_started": False,
+            "live_last_error": None,
+            "replay": True,
+        }
+
+    def test_connection(self, dataset, symbol):
+        candles = self.get_ohlcv(dataset, symbol)
+        return {
+            "configured": True,
+            "healthy": len(candles) > 0,
+            "candles": len(candles),
+            "last_error": self.last_error,
+            "auth_cooldown_seconds": 0,
+        }
+
+    def _closed_range(self, key, lookback_seconds):
+        times = self.bar_times.get(key)
+        if times is None or len(times) == 0:
+            return None, 0, 0
+        now = clock.now_ts()
+        end = _search(times, now - 60, side="right")
+        start = _search(times, now - lookback_seconds, side="left")
+        return times, start, end
+
+    def get_ohlcv(self, dataset, symbol, lookback_minutes=60, stype_in=None, record_limit=None):
+        key = self._key(symbol)
+        bounded_lookback = max(10, min(int(lookback_minutes or 60), 60 * 24 * 14))
+        times, start, end = self._closed_range(key, bounded_lookback * 60)
+        if times is None:
+            self.last_error = f"No replay data for {symbol}"
+            return []
+        if record_limit is not None:
+            start = max(start, end - max(100, min(int(record_limit), 10000)))
+        self.last_error = None
+        return self._bar_rows(key, start, end)
+
+    def last_bar(self, symbol):
+        key = self._key(symbol)
+        times, _, end = self._closed_range(key, 0)
+        if times is None or end <= 0:
+            return None
+        return self._bar_rows(key, end - 1, end)[0]
+
+    def get_recent_trades(self, dataset, symbol):
+        key = self._key(symbol)
+        times = self.trade_times.get(key)
+        if times is None or len(times) == 0:
+            return []
+        end = _search(times, clock.now_ts(), side="right")
+        return self._trade_rows(key, max(0, end - self.trade_window), end)
+
+    def get_live_quote(self, dataset, symbol, stype_in=None, max_age_seconds=20):
+        bar = self.last_bar(symbol)
+        if bar is None:
+            return None
+        return {
+            "price": float(bar["close"]),
+            "time": int(bar["time"]) + 60,
+            "updated_at": int(clock.now_ts()),
+            "dataset": str(dataset or "").upper(),
+            "symbol": str(symbol),
+            "source": "REPLAY",
+        }
+
+    def ensure_live_subscription(self, dataset, symbol, stype_in="raw_symbol"):
+        return True
+
+    def ensure_live_subscription_async(self, dataset, symbol, stype_in="raw_symbol"):
+        return None
+
+    def stop_live(self):
+        return None
@@ -0,0 +1,343 @@
+import argparse
+import contextlib
+import cProfile
+import json
+import os
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+from astroquant.core.prop_profiles import profile_for
+from astroquant.engine import clock
+from astroquant.engine.governance import Governance
+from astroquant.engine.multi_symbol_runner import MultiSymbolRunner
+from astroquant.engine.news_engine import NewsEngine
+from astroquant.engine.orderflow_engine import OrderflowEngine
+from astroquant.engine.replay_execution import SimulatedExecutionEngine
+from astroquant.engine.replay_feed import ReplayMarketFeed
+from astroquant.engine.signal_manager import SignalManager
+
+
+def _parse_event_time(value):
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(float(value), timezone.utc)
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class ReplayNewsEngine(NewsEngine):
+    """NewsEngine fed from a recorded calendar instead of the live XML feed."""
+
+    def __init__(self, events=None):
+        super().__init__(cache_file=None)
+        if isinstance(events, (str, Path)):
+            events = json.loads(Path(events).read_text(encoding="utf-8"))
+        self.recorded_events = []
+        for row in events or []:
+            try:
+                self.recorded_events.append({
+                    "title": str(row.get("title") or ""),
+                    "currency": str(row.get("currency") or ""),
+                    "impact": str(row.get("impact") or "High"),
+                    "time": _parse_event_time(row.get("time")),
+                })
+            except Exception:
+                continue
+        self.recorded_events.sort(key=lambda event: event["time"])
+
+    def fetch_news(self):
+        self.events = list(self.recorded_events)
+        self.last_fetch = clock.utcnow()
+
+
+class ReplayOrderflowEngine(OrderflowEngine):
+
+    def __init__(self, feed):
+        self.client = None
+        self.feed = feed
+
+    def get_recent_trades(self, dataset, symbol):
+        return self.feed.get_recent_trades(dataset, symbol)
+
+
+class _SilentTelegram:
+
+    def send(self, message):
+        return False
+
+    def send_news_alert(self, event):
+        return False
+
+    def status(self):
+        return {"configured": False, "active": False, "reason": "replay"}
+
+
+class ReplayRunner(MultiSymbolRunner):
+    """MultiSymbolRunner wired to recorded data, simulated fills and a sim clock.
+
+    ``parameter_overrides`` pins runner thresholds that ``process_symbol``
+    would otherwise reload from the phase limits on every call.
+    """
+
+    def __init__(self, symbols, feed, news_events=None, prop_engine=None,
+                 spread=0.3, slippage_points=0.0, parameter_overrides=None):
+        self.replay_feed = feed
+        self.replay_news = ReplayNewsEngine(news_events)
+        self.replay_spread = float(spread)
+        self.replay_slippage_points = float(slippage_points)
+        self.parameter_overrides = dict(parameter_overrides or {})
+        self.audit_events = []
+        super().__init__(symbols, prop_engine=prop_engine)
+        self.broker_spot_scanner_enabled = False
+        self.telegram = _SilentTelegram()
+        for symbol in self.symbols:
+            for alias in self.candidate_feed_symbols(symbol, include_contracts=True):
+                feed.add_alias(alias, symbol)
+        for key, value in self.parameter_overrides.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+
+    def _build_signal_manager(self):
+        return SignalManager(None, orderflow_engine=ReplayOrderflowEngine(self.replay_feed))
+
+    def _build_governance(self):
+        return Governance(self.state, news=self.replay_news)
+
+    def _build_execution(self):
+        return SimulatedExecutionEngine(
+            self.replay_feed,
+            self.state,
+            spread=self.replay_spread,
+            slippage_points=self.replay_slippage_points,
+        )
+
+    def _build_feed(self):
+        return self.replay_feed
+
+    def _start_broker_spot_scanner(self):
+        return None
+
+    def _schedule_broker_spot_refresh(self, canonical):
+        return None
+
+    def get_broker_spot_quote(self, symbol):
+        snapshot = self.execution.broker_quote_snapshot(expected_symbols=[symbol])
+        if not snapshot or snapshot.get("mid") is None:
+            return {"price": None, "source": None, "snapshot": snapshot, "stale": True, "from_cache": False}
+        self._record_spot_tick(symbol, float(snapshot["mid"]), "REPLAY")
+        return {
+            "price": float(snapshot["mid"]),
+            "source": f"REPLAY:{symbol}",
+            "snapshot": snapshot,
+            "cache_age_seconds": 0.0,
+            "stale": False,
+            "from_cache": False,
+        }
+
+    def get_current_spread(self, symbol):
+        return self.replay_spread
+
+    def _phase_limits_runtime(self):
+        limits = super()._phase_limits_runtime()
+        if "min_confidence_threshold" in self.parameter_overrides:
+            limits["confidence_threshold"] = float(self.parameter_overrides["min_confidence_threshold"])
+        if "max_trades_per_day_limit" in self.parameter_overrides:
+            limits["max_trades_per_day"] = int(self.parameter_overrides["max_trades_per_day_limit"])
+        return limits
+
+    def _audit_event(self, category, action, payload=None):
+        self.audit_events.append({
+            "category": str(category or "SYSTEM").upper(),
+            "action": str(action or "EVENT").upper(),
+            "payload": payload or {},
+            "created_at": int(clock.now_ts()),
+        })
+
+
+class ReplayEngine:
+    """Drive ReplayRunner over recorded bars as fast as the CPU allows.
+
+    Every relative-path store the runner touches (journal, prop state,
+    frequency stats, resolver cache) is created inside ``workdir`` so a
+    replay never mixes with live state.
+    """
+
+    def __init__(self, symbols, sources, news_events=None, workdir="data/replay/run",
+                 spread=0.3, slippage_points=0.0, step_seconds=60, parameter_overrides=None,
+                 prop_engine_factory=None, feed=None, account_key="50K"):
+        self.symbols = list(symbols)
+        self.sources = {
+            symbol: [str(Path(p).resolve()) for p in ([paths] if isinstance(paths, (str, Path)) else paths)]
+            for symbol, paths in (sources or {}).items()
+        }
+        if isinstance(news_events, (str, Path)):
+            news_events = json.loads(Path(news_events).read_text(encoding="utf-8"))
+        self.news_events = news_events
+        self.workdir = Path(workdir).resolve()
+        self.spread = float(spread)
+        self.slippage_points = float(slippage_points)
+        self.step_seconds = max(60, int(step_seconds))
+        self.parameter_overrides = dict(parameter_overrides or {})
+        self.prop_engine_factory = prop_engine_factory
+        self.feed = feed if feed is not None else ReplayMarketFeed(self.sources)
+        self.prop_profile = profile_for(account_key)
+
+    def run(self, start=None, end=None, quiet=True):
+        timeline = self.feed.timeline(start=start, end=end)
+        if not timeline:
+            return {"ok": False, "reason": "No replay bars in range"}
+
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        (self.workdir / "logs").mkdir(exist_ok=True)
+        (self.workdir / "data").mkdir(exist_ok=True)
+        sim_clock = clock.SimulatedClock(timeline[0])
+        previous_clock = clock.set_clock(sim_clock)
+        previous_cwd = os.getcwd()
+        statuses = Counter()
+        reasons = Counter()
+        closed_pnl = []
+        equity_curve = []
+        day_lows = {}
+        day_opens = {}
+        decisions = 0
+        steps = 0
+        wall_started = time.perf_counter()
+        try:
+            os.chdir(self.workdir)
+            with open(os.devnull, "w") as sink, (contextlib.redirect_stdout(sink) if quiet else contextlib.nullcontext()):
+                prop_engine = self.prop_engine_factory() if callable(self.prop_engine_factory) else None
+                runner = ReplayRunner(
+                    self.symbols,
+                    self.feed,
+                    news_events=self.news_events,
+                    prop_engine=prop_engine,
+                    spread=self.spread,
+                    slippage_points=self.slippage_points,
+                    parameter_overrides=self.parameter_overrides,
+                )
+                next_step = None
+                for bar_time in timeline:
+                    if next_step is not None and bar_time < next_step:
+                        continue
+                    next_step = bar_time + self.step_seconds
+                    sim_clock.set(bar_time + 60)
+                    steps += 1
+                    for symbol in self.symbols:
+                        result = runner.process_symbol(symbol) or {}
+                        decisions += 1
+                        status = str(result.get("status") or "UNKNOWN")
+                        statuses[status] += 1
+                        if result.get("reason"):
+                            reasons[str(result["reason"])[:80]] += 1
+                        if status == "Closed":
+                            closed_pnl.append(float(result.get("pnl") or 0.0))
+                    balance = float(runner.state.balance)
+                    equity_curve.append(balance)
+                    day = bar_time // 86400
+                    day_opens.setdefault(day, equity_curve[-2] if len(equity_curve) > 1 else balance)
+                    day_lows[day] = min(day_lows.get(day, balance), balance)
+        finally:
+            os.chdir(previous_cwd)
+            clock.set_clock(previous_clock)
+        wall_seconds = time.perf_counter() - wall_started
+
+        peak = None
+        max_drawdown = 0.0
+        for equity in equity_curve:
+            peak = equity if peak is None else max(peak, equity)
+            max_drawdown = max(max_drawdown, peak - equity)
+
+        daily_losses = [max(0.0, day_opens[day] - low) for day, low in day_lows.items()]
+        daily_limit = float(self.prop_profile["daily_max_loss"])
+        loss_floor = float(self.prop_profile["account_size"]) - float(self.prop_profile["total_max_loss"])
+        start_balance = equity_curve[0] if equity_curve else float(runner.state.balance)
+        target = start_balance + float(self.prop_profile["phase1_target"])
+
+        return {
+            "ok": True,
+            "symbols": self.symbols,
+            "start": datetime.fromtimestamp(timeline[0], timezone.utc).isoformat(),
+            "end": datetime.fromtimestamp(timeline[-1] + 60, timezone.utc).isoformat(),
+            "steps": steps,
+            "decisions": decisions,
+            "wall_seconds": round(wall_seconds, 3),
+            "decisions_per_second": round(decisions / wall_seconds, 1) if wall_seconds > 0 else None,
+            "status_counts": dict(statuses),
+            "top_reasons": dict(reasons.most_common(10)),
+            "fills": len(runner.execution.fills),
+            "closed_trades": len(closed_pnl),
+            "wins": sum(1 for pnl in closed_pnl if pnl > 0),
+            "net_pnl": round(sum(closed_pnl), 2),
+            "final_balance": round(float(runner.state.balance), 2),
+            "max_drawdown": round(max_drawdown, 2),
+            "max_daily_loss": round(max(daily_losses, default=0.0), 2),
+            "daily_limit_breaches": sum(1 for loss in daily_losses if loss >= daily_limit),
+            "max_loss_breached": bool(equity_curve and min(equity_curve) <= loss_floor),
+            "target_reached": bool(equity_curve and max(equity_curve) >= target),
+            "prop_account": self.prop_profile["account_key"],
+            "audit_events": len(runner.audit_events),
+            "parameter_overrides": self.parameter_overrides,
+            "workdir": str(self.workdir),
+        }
+
+
+def _parse_when(value):
+    if not value:
+        return None
+    return int(_parse_event_time(value).timestamp())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded DBN/Parquet bars through MultiSymbolRunner")
+    parser.add_argument("--source", action="append", default=[], metavar="SYMBOL=PATH",
+                        help="Recorded ohlcv-1m or trades file for a runner symbol (repeatable)")
+    parser.add_argument("--news", type=str, default="", help="JSON list of {title, currency, impact, time}")
+    parser.add_argument("--start", type=str, default="")
+    parser.add_argument("--end", type=str, default="")
+    parser.add_argument("--workdir", type=str, default="data/replay/run")
+    parser.add_argument("--spread", type=float, default=0.3)
+    parser.add_argument("--slippage", type=float, default=0.0)
+    parser.add_argument("--step-seconds", type=int, default=60)
+    parser.add_argument("--prop", action="store_true", help="Run with PropGovernance enabled")
+    parser.add_argument("--profile", action="store_true", help="Write cProfile stats to <workdir>/replay.prof")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    sources = {}
+    for item in args.source:
+        symbol, _, path = str(item).partition("=")
+        if not symbol or not path:
+            parser.error(f"--source expects SYMBOL=PATH, got {item!r}")
+        sources.setdefault(symbol.strip().upper(), []).append(path.strip())
+    if not sources:
+        parser.error("at least one --source is required")
+
+    prop_engine_factory = None
+    if args.prop:
+        from astroquant.backend.governance.prop_governance import PropConfig, PropGovernance
+
+        prop_engine_factory = lambda: PropGovernance(PropConfig())
+
+    engine = ReplayEngine(
+        symbols=list(sources),
+        sources=sources,
+        news_events=args.news or None,
+        workdir=args.workdir,
+        spread=args.spread,
+        slippage_points=args.slippage,
+        step_seconds=args.step_seconds,
+        prop_engine_factory=prop_engine_factory,
+    )
+    start, end = _parse_when(args.start), _parse_when(args.end)
+    if args.profile:
+        profiler = cProfile.Profile()
+        summary = profiler.runcall(engine.run, start=start, end=end, quiet=not args.verbose)
+        profiler.dump_stats(str(engine.workdir / "replay.prof"))
+    else:
+        summary = engine.run(start=start, end=end, quiet=not args.verbose)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
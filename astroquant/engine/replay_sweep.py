@@ -0,0 +1,204 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from astroquant.engine.replay_feed import ReplayMarketFeed
+from astroquant.engine.replay_runner import ReplayEngine, _parse_when
+
+DEFAULT_SPACE = {
+    "min_confidence_threshold": [50.0, 55.0, 60.0, 65.0, 70.0],
+    "confluence_threshold": [0.4, 0.5, 0.6],
+    "trade_cooldown_seconds": [120, 300, 600],
+    "offset_halt_points": [2.0, 3.0, 4.0],
+}
+
+TABLE_COLUMNS = [
+    ("rank", 4), ("net_pnl", 10), ("max_drawdown", 12), ("max_daily_loss", 14),
+    ("daily_limit_breaches", 8), ("max_loss_breached", 9), ("closed_trades", 7), ("wins", 5),
+]
+
+
+def grid_configs(space):
+    keys = list(space)
+    return [dict(zip(keys, values)) for values in itertools.product(*(space[key] for key in keys))]
+
+
+def random_configs(space, samples, seed=None):
+    """Draw configurations: lists are sampled as choices, ``{"min", "max"}`` dicts uniformly."""
+    rng = random.Random(seed)
+    configs = []
+    for _ in range(max(1, int(samples))):
+        config = {}
+        for key, values in space.items():
+            if isinstance(values, dict):
+                lo, hi = float(values["min"]), float(values["max"])
+                config[key] = round(rng.uniform(lo, hi), 4)
+            else:
+                config[key] = rng.choice(list(values))
+        configs.append(config)
+    return configs
+
+
+def _run_one(index, overrides, cache_dir, symbols, news_events, workdir, start, end, engine_kwargs):
+    feed = ReplayMarketFeed.from_arrays(cache_dir)
+    engine = ReplayEngine(
+        symbols,
+        sources=None,
+        news_events=news_events,
+        workdir=str(Path(workdir) / f"config_{index:04d}"),
+        parameter_overrides=overrides,
+        feed=feed,
+        **engine_kwargs,
+    )
+    try:
+        summary = engine.run(start=start, end=end, quiet=True)
+    except Exception as exc:
+        summary = {"ok": False, "reason": f"{type(exc).__name__}: {exc}"}
+    summary["config_index"] = index
+    summary["parameter_overrides"] = overrides
+    return summary
+
+
+def _rank_key(rank_by):
+    def key(row):
+        if not row.get("ok"):
+            return (2, 0.0, row.get("config_index", 0))
+        breached = bool(row.get("max_loss_breached")) or int(row.get("daily_limit_breaches") or 0) > 0
+        pnl = float(row.get("net_pnl") or 0.0)
+        if rank_by == "return_over_drawdown":
+            score = pnl / max(1.0, float(row.get("max_drawdown") or 0.0))
+        else:
+            score = pnl
+        return (1 if breached else 0, -score, row.get("config_index", 0))
+    return key
+
+
+class ParameterSweep:
+    """Fan replay runs for many runner configurations across a process pool.
+
+    Recorded data is parsed once in the parent and written as memory-mapped
+    arrays; each worker maps the same files read-only and runs an isolated
+    ``ReplayEngine`` in its own workdir. Configurations that breach a prop
+    rule always rank below clean ones.
+    """
+
+    def __init__(self, symbols, sources=None, feed=None, news_events=None, workdir="data/replay/sweep",
+                 workers=None, rank_by="net_pnl", **engine_kwargs):
+        self.symbols = list(symbols)
+        self.workdir = Path(workdir).resolve()
+        self.cache_dir = self.workdir / "market_cache"
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.rank_by = rank_by
+        if isinstance(news_events, (str, Path)):
+            news_events = json.loads(Path(news_events).read_text(encoding="utf-8"))
+        self.news_events = news_events
+        self.engine_kwargs = engine_kwargs
+        (feed if feed is not None else ReplayMarketFeed(sources)).save_arrays(self.cache_dir)
+
+    def run(self, configs, start=None, end=None):
+        started = time.perf_counter()
+        rows = []
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(_run_one, index, dict(config), str(self.cache_dir), self.symbols,
+                            self.news_events, str(self.workdir), start, end, self.engine_kwargs)
+                for index, config in enumerate(configs)
+            ]
+            for future in as_completed(futures):
+                rows.append(future.result())
+        rows.sort(key=_rank_key(self.rank_by))
+        for rank, row in enumerate(rows, start=1):
+            row["rank"] = rank
+        return {
+            "configs": len(rows),
+            "workers": self.workers,
+            "rank_by": self.rank_by,
+            "wall_seconds": round(time.perf_counter() - started, 3),
+            "results": rows,
+        }
+
+
+def format_table(rows, parameter_keys, limit=20):
+    columns = TABLE_COLUMNS + [(key, max(len(key), 8)) for key in parameter_keys]
+    lines = [" ".join(name[:width].rjust(width) for name, width in columns)]
+    for row in rows[:limit]:
+        overrides = row.get("parameter_overrides") or {}
+        cells = []
+        for name, width in columns:
+            value = overrides.get(name) if name in parameter_keys else row.get(name)
+            if not row.get("ok") and name == "net_pnl":
+                value = "ERROR"
+            cells.append(str("" if value is None else value)[:width].rjust(width))
+        lines.append(" ".join(cells))
+    return "\n".join(lines)
+
+
+def write_csv(path, rows, parameter_keys):
+    fields = [name for name, _ in TABLE_COLUMNS] + ["target_reached", "fills", "decisions", "reason"] + list(parameter_keys)
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({**row, **(row.get("parameter_overrides") or {})})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grid or random sweep of runner thresholds over recorded data")
+    parser.add_argument("--source", action="append", default=[], metavar="SYMBOL=PATH")
+    parser.add_argument("--news", type=str, default="")
+    parser.add_argument("--start", type=str, default="")
+    parser.add_argument("--end", type=str, default="")
+    parser.add_argument("--space", type=str, default="", help="JSON file mapping parameter -> list or {min, max}")
+    parser.add_argument("--random", type=int, default=0, help="Sample N random configurations instead of the full grid")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--workdir", type=str, default="data/replay/sweep")
+    parser.add_argument("--spread", type=float, default=0.3)
+    parser.add_argument("--slippage", type=float, default=0.0)
+    parser.add_argument("--step-seconds", type=int, default=60)
+    parser.add_argument("--account", type=str, default="50K", help="Prop profile used for breach metrics")
+    parser.add_argument("--rank-by", choices=["net_pnl", "return_over_drawdown"], default="net_pnl")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--csv", type=str, default="", help="Also write the ranked table to this CSV file")
+    args = parser.parse_args()
+
+    sources = {}
+    for item in args.source:
+        symbol, _, path = str(item).partition("=")
+        if not symbol or not path:
+            parser.error(f"--source expects SYMBOL=PATH, got {item!r}")
+        sources.setdefault(symbol.strip().upper(), []).append(path.strip())
+    if not sources:
+        parser.error("at least one --source is required")
+
+    space = json.loads(Path(args.space).read_text(encoding="utf-8")) if args.space else DEFAULT_SPACE
+    configs = random_configs(space, args.random, seed=args.seed) if args.random else grid_configs(space)
+
+    sweep = ParameterSweep(
+        list(sources),
+        sources=sources,
+        news_events=args.news or None,
+        workdir=args.workdir,
+        workers=args.workers or None,
+        rank_by=args.rank_by,
+        spread=args.spread,
+        slippage_points=args.slippage,
+        step_seconds=args.step_seconds,
+        account_key=args.account,
+    )
+    report = sweep.run(configs, start=_parse_when(args.start), end=_parse_when(args.end))
+    (sweep.workdir / "sweep_results.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.csv:
+        write_csv(args.csv, report["results"], list(space))
+    print(format_table(report["results"], list(space), limit=args.top))
+    print(f"\n{report['configs']} configs on {report['workers']} workers in {report['wall_seconds']}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class RunnerScheduler:
+    """Timer heap plus a symbol trigger queue for the runner's main loop.
+
+    Periodic jobs (equity verification, reconciliation, bar-close ticks) sit
+    on a heap keyed by their next due time; market events (price moves,
+    fills) call :meth:`trigger` from feed/broker threads. The loop blocks on
+    a condition until the earliest timer or the next trigger, so it neither
+    spins between events nor waits a fixed poll interval to react to one.
+    """
+
+    def __init__(self, time_fn=time.monotonic, min_symbol_interval=1.0):
+        self.time_fn = time_fn
+        self.min_symbol_interval = max(0.0, float(min_symbol_interval))
+        self._cond = threading.Condition()
+        self._heap = []
+        self._jobs = {}
+        self._generation = {}
+        self._seq = itertools.count()
+        self._pending = {}
+        self._last_evaluated = {}
+        self._running = False
+        self.stats = {"wakeups": 0, "jobs_run": 0, "triggers": 0, "evaluations": 0, "coalesced": 0}
+
+    def _push(self, name, due):
+        generation = self._generation.get(name, 0) + 1
+        self._generation[name] = generation
+        heapq.heappush(self._heap, (due, next(self._seq), name, generation))
+        self._cond.notify()
+
+    def every(self, name, interval_seconds, fn, first_delay=0.0):
+        """Run ``fn`` every ``interval_seconds``; a numeric return overrides the next delay."""
+        with self._cond:
+            self._jobs[name] = (max(0.05, float(interval_seconds)), fn)
+            self._push(name, self.time_fn() + max(0.0, float(first_delay)))
+
+    def reschedule(self, name, delay_seconds):
+        with self._cond:
+            if name in self._jobs:
+                self._push(name, self.time_fn() + max(0.0, float(delay_seconds)))
+
+    def cancel(self, name):
+        with self._cond:
+            self._jobs.pop(name, None)
+            self._generation.pop(name, None)
+
+    def trigger(self, symbol, reason):
+        """Queue ``symbol`` for evaluation; repeated triggers before the loop wakes coalesce."""
+        with self._cond:
+            self.stats["triggers"] += 1
+            if symbol in self._pending:
+                self.stats["coalesced"] += 1
+            self._pending.setdefault(symbol, reason)
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    def next_due_in(self):
+        with self._cond:
+            self._drop_stale()
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - self.time_fn())
+
+    def _drop_stale(self):
+        while self._heap and self._generation.get(self._heap[0][2]) != self._heap[0][3]:
+            heapq.heappop(self._heap)
+
+    def _ready_symbols(self, now):
+        # Throttle per symbol so a burst of ticks cannot re-run the full
+        # pipeline faster than min_symbol_interval; deferred symbols stay queued.
+        ready, deferred = {}, {}
+        wait = None
+        for symbol, reason in self._pending.items():
+            elapsed = now - self._last_evaluated.get(symbol, float("-inf"))
+            if elapsed >= self.min_symbol_interval:
+                ready[symbol] = reason
+                self._last_evaluated[symbol] = now
+            else:
+                deferred[symbol] = reason
+                remaining = self.min_symbol_interval - elapsed
+                wait = remaining if wait is None else min(wait, remaining)
+        self._pending = deferred
+        return ready, wait
+
+    def run(self, evaluate):
+        """Block and dispatch until :meth:`stop`; ``evaluate({symbol: reason})`` handles triggers."""
+        with self._cond:
+            self._running = True
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                now = self.time_fn()
+                self._drop_stale()
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, name, generation = heapq.heappop(self._heap)
+                    # Entries superseded by reschedule()/cancel() can sit
+                    # anywhere in the due run, not only at the head.
+                    if name not in self._jobs or self._generation.get(name) != generation:
+                        continue
+                    due.append(name)
+                    self._generation[name] = generation + 1
+                ready, throttle_wait = self._ready_symbols(now) if self._pending else ({}, None)
+                if not due and not ready:
+                    self._drop_stale()
+                    timeout = self._heap[0][0] - now if self._heap else None
+                    if throttle_wait is not None:
+                        timeout = throttle_wait if timeout is None else min(timeout, throttle_wait)
+                    self._cond.wait(timeout)
+                    self.stats["wakeups"] += 1
+                    continue
+                jobs = [(name, self._jobs[name]) for name in due]
+
+            for name, (interval, fn) in jobs:
+                delay = interval
+                try:
+                    result = fn()
+                    if isinstance(result, (int, float)) and not isinstance(result, bool):
+                        delay = max(0.05, float(result))
+                except Exception as exc:
+                    print(f"Scheduler job {name} failed:", exc)
+                self.stats["jobs_run"] += 1
+                with self._cond:
+                    if name in self._jobs:
+                        self._push(name, self.time_fn() + delay)
+
+            if ready:
+                self.stats["evaluations"] += len(ready)
+                try:
+                    evaluate(ready)
+                except Exception as exc:
+                    print("Scheduler evaluation failed:", exc)
+
+    def snapshot(self):
+        with self._cond:
+            return {
+                "running": self._running,
+                "jobs": sorted(self._jobs),
+                "pending": dict(self._pending),
+                "stats": dict(self.stats),
+            }
@@ -1,18 +1,11 @@
-import datetime
+from astroquant.engine import session_timeline
 
 
 class SessionBias:
 
 	def get_session(self):
-		hour = datetime.datetime.utcnow().hour
-
-		if 7 <= hour <= 12:
-			return "LONDON"
-
-		if 13 <= hour <= 18:
-			return "NY"
-
-		return "ASIA"
+		# London 7-12 UTC, NY 13-18 UTC, otherwise Asia.
+		return session_timeline.shared().session()
 
 	def get_session_weight(self):
 		session = self.get_session()
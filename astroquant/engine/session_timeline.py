@@ -0,0 +1,225 @@
+import bisect
+import calendar
+import datetime
+import threading
+
+from astroquant.engine import clock
+
+DAY_SECONDS = 86400
+
+# (start hour UTC, label) — SessionBias and PropGovernance disagree on the
+# NY/Asia split, so both views are kept.
+BIAS_SESSIONS = [(0, "ASIA"), (7, "LONDON"), (13, "NY"), (19, "ASIA")]
+PROP_SESSIONS = [(0, "ASIA"), (7, "LONDON"), (13, "NEWYORK")]
+TRADING_WINDOW = (7 * 3600, 16 * 3600)
+DAILY_ROLLOVER = (21 * 3600 + 55 * 60, 22 * 3600 + 11 * 60)
+OUTSIDE_WINDOW_REASON = "Outside London/NY-first-half window"
+
+ROLL_CYCLES = {
+    "GC": [2, 4, 6, 8, 10, 12],
+    "NQ": [3, 6, 9, 12],
+    "YM": [3, 6, 9, 12],
+    "6E": [3, 6, 9, 12],
+    "BTC": [3, 6, 9, 12],
+}
+# Metals roll ahead of first notice (last business day of the prior month);
+# index/FX/crypto roll on the second Thursday of the contract month.
+PRIOR_MONTH_END_ROOTS = {"GC"}
+
+
+def _label(table, seconds_into_day):
+    hour = int(seconds_into_day // 3600)
+    label = table[0][1]
+    for start_hour, name in table:
+        if hour >= start_hour:
+            label = name
+    return label
+
+
+def _roll_anchor(root, year, month):
+    if root in PRIOR_MONTH_END_ROOTS:
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+        day = datetime.date(year, month, calendar.monthrange(year, month)[1])
+        while day.weekday() >= 5:
+            day -= datetime.timedelta(days=1)
+        return day
+    first = datetime.date(year, month, 1)
+    first_thursday = first + datetime.timedelta(days=(3 - first.weekday()) % 7)
+    return first_thursday + datetime.timedelta(days=7)
+
+
+def roll_week_roots(day, cycles=ROLL_CYCLES):
+    """Roots whose contract roll anchor falls in the Monday-Sunday week of ``day``."""
+    week_start = day - datetime.timedelta(days=day.weekday())
+    week_end = week_start + datetime.timedelta(days=6)
+    roots = []
+    for root, months in cycles.items():
+        for year in (day.year, day.year + 1):
+            for month in months:
+                if week_start <= _roll_anchor(root, year, month) <= week_end:
+                    roots.append(root)
+                    break
+            else:
+                continue
+            break
+    return sorted(roots)
+
+
+class SessionTimeline:
+    """Per-day table of session, trading-window, news and roll state.
+
+    A day is cut into segments at every boundary (session hours, trading
+    window, daily rollover, news freeze/reduce/post-news edges) and each
+    segment's state is computed once, so lookups are a single bisect.
+    Days are rebuilt at UTC midnight and whenever the attached news
+    calendar changes.
+    """
+
+    def __init__(self, news=None):
+        self.news = None
+        self._days = {}
+        self._lock = threading.Lock()
+        if news is not None:
+            self.attach_news(news)
+
+    def attach_news(self, news):
+        if news is self.news:
+            return
+        self.news = news
+        calendar_obj = getattr(news, "calendar", None)
+        if calendar_obj is not None and hasattr(calendar_obj, "on_change"):
+            calendar_obj.on_change(lambda _calendar: self.invalidate())
+        self.invalidate()
+
+    def invalidate(self):
+        with self._lock:
+            self._days = {}
+
+    def _news_windows(self, day_start, day_end):
+        if self.news is None:
+            return []
+        pre = int(getattr(self.news, "freeze_pre_minutes", 20)) * 60
+        post = int(getattr(self.news, "freeze_post_minutes", 20)) * 60
+        start = datetime.datetime.fromtimestamp(day_start - 1800, datetime.UTC)
+        end = datetime.datetime.fromtimestamp(day_end + pre + 600, datetime.UTC)
+        calendar_obj = getattr(self.news, "calendar", None)
+        if calendar_obj is not None:
+            events = calendar_obj.between(start, end)
+        else:
+            events = [event for event in list(getattr(self.news, "events", []) or []) if start <= event["time"] <= end]
+        windows = []
+        for event in events:
+            t = event["time"].timestamp()
+            base = {"title": event.get("title"), "currency": event.get("currency")}
+            windows.append({**base, "mode": "REDUCE_RISK", "start": t - pre - 600, "end": t - pre})
+            windows.append({**base, "mode": "HALT", "start": t - pre, "end": t + post + 1})
+            if event.get("impact") == "High":
+                windows.append({**base, "mode": "POST_NEWS", "start": t + 601, "end": t + 1801})
+        return windows
+
+    def _build(self, day):
+        day_start = calendar.timegm(day.timetuple())
+        day_end = day_start + DAY_SECONDS
+        windows = self._news_windows(day_start, day_end)
+        rolls = roll_week_roots(day)
+
+        cuts = {day_start}
+        for hour, _ in BIAS_SESSIONS + PROP_SESSIONS:
+            cuts.add(day_start + hour * 3600)
+        for edge in TRADING_WINDOW + DAILY_ROLLOVER:
+            cuts.add(day_start + edge)
+        for window in windows:
+            for edge in (window["start"], window["end"]):
+                if day_start < edge < day_end:
+                    cuts.add(int(edge))
+        starts = sorted(cuts)
+
+        segments = []
+        for index, start in enumerate(starts):
+            end = starts[index + 1] if index + 1 < len(starts) else day_end
+            offset = start - day_start
+            in_window = TRADING_WINDOW[0] <= offset < TRADING_WINDOW[1]
+            news = {}
+            for window in windows:
+                if window["start"] <= start < window["end"]:
+                    current = news.get(window["currency"])
+                    # HALT outranks REDUCE_RISK outranks POST_NEWS.
+                    rank = {"HALT": 0, "REDUCE_RISK": 1, "POST_NEWS": 2}
+                    if current is None or rank[window["mode"]] < rank[current["mode"]]:
+                        news[window["currency"]] = {"mode": window["mode"], "title": window["title"]}
+            segments.append({
+                "start": int(start),
+                "end": int(end),
+                "session": _label(BIAS_SESSIONS, offset),
+                "prop_session": _label(PROP_SESSIONS, offset),
+                "trading_window": in_window,
+                "trading_reason": "OK" if in_window else OUTSIDE_WINDOW_REASON,
+                "daily_rollover": DAILY_ROLLOVER[0] <= offset < DAILY_ROLLOVER[1],
+                "news": news,
+                "roll_week": rolls,
+            })
+        return {"day": day, "starts": starts, "segments": segments}
+
+    def _table(self, day):
+        with self._lock:
+            table = self._days.get(day)
+        if table is None:
+            table = self._build(day)
+            with self._lock:
+                if len(self._days) > 3:
+                    self._days = {}
+                self._days[day] = table
+        return table
+
+    def at(self, ts=None):
+        ts = clock.now_ts() if ts is None else float(ts)
+        day = datetime.datetime.fromtimestamp(ts, datetime.UTC).date()
+        table = self._table(day)
+        return table["segments"][bisect.bisect_right(table["starts"], ts) - 1]
+
+    def session(self, ts=None):
+        return self.at(ts)["session"]
+
+    def prop_session(self, ts=None):
+        return self.at(ts)["prop_session"]
+
+    def trading_window(self, ts=None):
+        segment = self.at(ts)
+        return segment["trading_window"], segment["trading_reason"]
+
+    def seconds_until_tradeable(self, ts=None, horizon_days=3):
+        """Seconds until the next segment inside the trading window (0 when open now)."""
+        ts = clock.now_ts() if ts is None else float(ts)
+        segment = self.at(ts)
+        if segment["trading_window"]:
+            return 0.0
+        cursor = segment["end"]
+        limit = ts + horizon_days * DAY_SECONDS
+        while cursor < limit:
+            segment = self.at(cursor)
+            if segment["trading_window"]:
+                return max(0.0, segment["start"] - ts)
+            cursor = segment["end"]
+        return float(horizon_days * DAY_SECONDS)
+
+    def snapshot(self, day=None):
+        day = day or clock.utcnow().date()
+        table = self._table(day)
+        return {
+            "day": day.isoformat(),
+            "segments": [dict(segment) for segment in table["segments"]],
+            "current": dict(self.at()) if day == clock.utcnow().date() else None,
+        }
+
+
+_shared = None
+_shared_lock = threading.Lock()
+
+
+def shared():
+    """Process-wide timeline used by the runner, session helpers and dashboard."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = SessionTimeline()
+        return _shared
@@ -11,8 +11,10 @@ from astroquant.backend.config import SYMBOLS
 
 class SignalManager:
 
-    def __init__(self, api_key):
-        self.orderflow_engine = OrderflowEngine(api_key) if api_key else None
+    def __init__(self, api_key, orderflow_engine=None):
+        self.orderflow_engine = orderflow_engine
+        if self.orderflow_engine is None and api_key:
+            self.orderflow_engine = OrderflowEngine(api_key)
 
         self.models = [
             ICTModel(),
@@ -0,0 +1,88 @@
+import bisect
+from collections import deque
+
+
+class RollingMedian:
+    """Fixed-size FIFO window with incremental median and MAD.
+
+    Values are kept in arrival order (for eviction) and in a sorted list.
+    Each push is a bisect insert plus a bisect delete, the median is an
+    index lookup, and the MAD is a k-th-smallest selection over the two
+    already-sorted runs of deviations either side of the median, so no
+    call copies or re-sorts the window.
+    """
+
+    def __init__(self, maxlen):
+        self.maxlen = max(1, int(maxlen))
+        self._fifo = deque()
+        self._sorted = []
+
+    def __len__(self):
+        return len(self._fifo)
+
+    def __iter__(self):
+        return iter(self._fifo)
+
+    def push(self, value):
+        value = float(value)
+        if len(self._fifo) >= self.maxlen:
+            evicted = self._fifo.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, evicted)]
+        self._fifo.append(value)
+        bisect.insort(self._sorted, value)
+
+    def clear(self):
+        self._fifo.clear()
+        self._sorted.clear()
+
+    def median(self):
+        values = self._sorted
+        n = len(values)
+        if n == 0:
+            return None
+        mid = n // 2
+        if n % 2:
+            return values[mid]
+        return (values[mid - 1] + values[mid]) / 2.0
+
+    def _kth_deviation(self, k, center, split):
+        # Deviations left of ``split`` grow as we walk left, right of it as we
+        # walk right; select the k-th smallest (0-based) across both runs.
+        values = self._sorted
+        left_count = split
+        right_count = len(values) - split
+
+        def left(j):
+            return center - values[split - 1 - j]
+
+        def right(j):
+            return values[split + j] - center
+
+        lo = max(0, k + 1 - right_count)
+        hi = min(k + 1, left_count)
+        while lo < hi:
+            taken = (lo + hi) // 2
+            rest = k + 1 - taken
+            if rest > 0 and right(rest - 1) > left(taken):
+                lo = taken + 1
+            else:
+                hi = taken
+        rest = k + 1 - lo
+        candidates = []
+        if lo > 0:
+            candidates.append(left(lo - 1))
+        if rest > 0:
+            candidates.append(right(rest - 1))
+        return max(candidates)
+
+    def mad(self, center=None):
+        """Median absolute deviation around ``center`` (default: the window median)."""
+        n = len(self._sorted)
+        if n == 0:
+            return None
+        center = self.median() if center is None else float(center)
+        split = bisect.bisect_left(self._sorted, center)
+        mid = n // 2
+        if n % 2:
+            return self._kth_deviation(mid, center, split)
+        return (self._kth_deviation(mid - 1, center, split) + self._kth_deviation(mid, center, split)) / 2.0
@@ -0,0 +1,1025 @@
+import asyncio
+import concurrent.futures
+import json
+import os
+import re
+import time
+from collections import Counter
+from pathlib import Path
+
+from astroquant.execution.playwright_engine import PlaywrightExecutionEngine
+
+
+class AsyncPlaywrightExecutionEngine(PlaywrightExecutionEngine):
+    """asyncio-native variant of PlaywrightExecutionEngine.
+
+    Uses the async Playwright API on the server's event loop instead of a
+    sync API pinned to one thread behind a dispatcher. ``execute``,
+    ``broker_quote_snapshot``, ``broker_equity_snapshot``,
+    ``broker_positions_snapshot`` and ``close_position_fraction`` are
+    coroutines, as are login, selector calibration, symbol discovery and
+    recovery; independent page reads inside them run concurrently. Symbol
+    handling, selector aliases and the execution guard are inherited from
+    the sync engine so both variants can be A/B tested on equal terms.
+    ``start`` binds the engine to the loop it is awaited on (the server
+    loop); sync callers on other threads (the runner) go through
+    ``run_sync``.
+    """
+
+    ASYNC_SELECTOR_DEFAULTS = {
+        "sell": [
+            "[data-testid='mw-order-panel'] [data-testid='order-panel-sell-button']",
+            "[data-testid='order-panel-sell-button']",
+            "button:has-text('Sell')",
+        ],
+        "buy_price": [
+            "[data-testid='mw-order-panel'] [data-testid='order-panel-buy-button'] .ui-order-button__price",
+            "[data-testid='order-panel-buy-button'] .ui-order-button__price",
+        ],
+        "sell_price": [
+            "[data-testid='mw-order-panel'] [data-testid='order-panel-sell-button'] .ui-order-button__price",
+            "[data-testid='order-panel-sell-button'] .ui-order-button__price",
+        ],
+        "confirm": [
+            "[data-testid='order-panel-confirm-button']",
+        ],
+        "stop_loss_input": [
+            "[data-testid='order-stop-loss'] input",
+            "[data-testid='order-stop-loss']",
+        ],
+        "take_profit_input": [
+            "[data-testid='order-take-profit'] input",
+            "[data-testid='order-take-profit']",
+        ],
+        "close_partial_volume": [
+            "[data-testid='close-position-volume'] input",
+            "[data-testid='close-position-volume']",
+        ],
+        "close_partial_confirm": [
+            "[data-testid='close-position-confirm-button']",
+            "[data-testid='order-panel-confirm-button']",
+        ],
+    }
+
+    SYMBOL_SELECTORS = [
+        "[data-testid='header-symbol']",
+        "[data-testid='quotation-symbol']",
+        "[data-testid='instrument-symbol']",
+        "[data-testid='symbol-name']",
+        "[data-testid='instrument-symbol-name-wrapper']",
+    ]
+    BID_SELECTORS = ["[data-testid='quotation-bid']", "[data-testid='bid-price']"]
+    ASK_SELECTORS = ["[data-testid='quotation-ask']", "[data-testid='ask-price']"]
+    LAST_SELECTORS = [
+        "[data-testid='quotation']",
+        "[data-testid='quotation-last']",
+        "[data-testid='last-price']",
+    ]
+    POSITION_ROW_SELECTORS = [
+        "[data-testid='open-positions-desktop-list-row']",
+        "[data-testid*='open-positions'][data-testid*='row']",
+        "[data-testid*='open-position'][data-testid*='row']",
+        "[data-testid='position-row']",
+    ]
+    CLOSE_BUTTON_SELECTORS = [
+        "[data-testid='close-position-button']",
+        "[data-testid*='close-position']",
+        "button:has-text('Close')",
+    ]
+
+    _POSITIONS_SCRIPT = r"""
+    (rowSelectors) => {
+      const pick = (scope, selectors) => {
+        for (const s of selectors) {
+          const el = scope.querySelector(s);
+          if (el && String(el.textContent || '').trim()) return String(el.textContent).trim();
+        }
+        return null;
+      };
+      for (const rowSel of rowSelectors) {
+        const rows = Array.from(document.querySelectorAll(rowSel));
+        if (!rows.length) continue;
+        return rows.slice(0, 50).map((row) => ({
+          symbol: pick(row, ["[data-testid='instrument-symbol-name-wrapper']", "[data-testid*='position-symbol']"]),
+          volume: pick(row, ["[data-testid='open-position-volume']", "[data-testid*='position-volume']"]),
+          entry_price: pick(row, ["[data-testid='open-position-entry-price']", "[data-testid*='entry-price']", "[data-testid*='open-price']"]),
+          sl: pick(row, ["[data-testid*='position-sl']", "[data-testid*='stop-loss']"]),
+          tp: pick(row, ["[data-testid*='position-tp']", "[data-testid*='take-profit']"]),
+          profit: pick(row, ["[data-testid*='profit']", "[data-testid*='pnl']"]),
+        }));
+      }
+      return [];
+    }
+    """
+
+    def __init__(
+            self,
+            headless=None,
+            timeout_ms=None,
+            user_data_dir=None,
+            cdp_url=None,
+            url=None,
+            selector_profile_file="data/matchtrader_selectors.json"):
+        super().__init__(
+            headless=headless,
+            timeout_ms=timeout_ms,
+            user_data_dir=user_data_dir,
+            cdp_url=cdp_url)
+        for key, values in self.ASYNC_SELECTOR_DEFAULTS.items():
+            self.selector_aliases.setdefault(key, list(values))
+        self.selector_profile_path = Path(selector_profile_file)
+        self._load_selector_profile()
+
+        self.url = url if url is not None else os.environ.get("EXECUTION_BROWSER_URL", "")
+        self.require_protection_controls = True
+        self.order_in_progress = False
+        self.last_trade_time = None
+        self.loop = None
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._order_lock = None
+        self.metrics = {
+            "execute_calls": 0,
+            "execute_retries": 0,
+            "last_execute_ms": None,
+            "last_quote_ms": None,
+        }
+
+    def _load_selector_profile(self):
+        try:
+            payload = json.loads(self.selector_profile_path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        selectors = payload.get("selectors", {}) if isinstance(payload, dict) else {}
+        if not isinstance(selectors, dict):
+            return
+        for key, values in selectors.items():
+            if not isinstance(values, list):
+                continue
+            merged = []
+            for selector in [*values, *self.selector_aliases.get(key, [])]:
+                value = str(selector or "").strip()
+                if value and value not in merged:
+                    merged.append(value)
+            self.selector_aliases[key] = merged
+        self.selector_profile_loaded = True
+        self.selector_profile_updated_at = payload.get("updated_at")
+
+    def _should_dispatch(self):
+        # Everything runs on the event loop; there is no thread to hop to.
+        return False
+
+    def start_symbol_catalogue_refresh(self, interval_seconds=900.0):
+        def _refresh():
+            if self.page is None:
+                return {"ok": False, "reason": "page_unavailable"}
+            if self.loop is None or not self.loop.is_running():
+                return {"ok": False, "reason": "loop_unavailable"}
+            return self.run_sync(self.discover_broker_symbols(self.page)) or {
+                "ok": False, "reason": "loop_stopped"}
+
+        return self.symbol_catalogue.start_background_refresh(
+            _refresh, interval_seconds=interval_seconds)
+
+    async def start(self):
+        """Attach to the broker browser and bind to the running event loop."""
+        from playwright.async_api import async_playwright
+
+        self.loop = asyncio.get_running_loop()
+        self._order_lock = asyncio.Lock()
+        if self.page is not None:
+            return self.page
+
+        self._playwright = await async_playwright().start()
+        chromium = self._playwright.chromium
+        if self.cdp_url:
+            self._browser = await chromium.connect_over_cdp(self.cdp_url, timeout=self.timeout_ms)
+            contexts = list(self._browser.contexts or [])
+            self._context = contexts[0] if contexts else await self._browser.new_context()
+        elif self.user_data_dir:
+            self._context = await chromium.launch_persistent_context(
+                self.user_data_dir, headless=bool(self.headless))
+        else:
+            self._browser = await chromium.launch(headless=bool(self.headless))
+            self._context = await self._browser.new_context()
+
+        page = None
+        for candidate in list(self._context.pages or []):
+            if "/app/trade" in str(candidate.url or ""):
+                page = candidate
+                break
+        if page is None:
+            page = await self._context.new_page()
+            if self.url:
+                await page.goto(self.url, wait_until="domcontentloaded", timeout=self.timeout_ms)
+        page.set_default_timeout(self.timeout_ms)
+        self.set_page(page)
+        self.last_browser_heartbeat = int(time.time())
+        return page
+
+    async def close(self):
+        for closer in (
+            lambda: self._browser.close() if self._browser is not None else None,
+            lambda: self._context.close() if self._context is not None and self._browser is None else None,
+            lambda: self._playwright.stop() if self._playwright is not None else None,
+        ):
+            try:
+                pending = closer()
+                if pending is not None:
+                    await pending
+            except Exception:
+                pass
+        self._browser = None
+        self._context = None
+        self._playwright = None
+        self.set_page(None)
+
+    def run_sync(self, coro, stopped=None):
+        """Run ``coro`` on the engine loop from a non-loop thread and wait for it.
+
+        The coroutine is never cancelled from here, so an order already sent
+        to the broker runs to its own fill/timeout handling. ``stopped`` is
+        returned if the loop stops before the coroutine finishes.
+        """
+        loop = self.loop
+        if loop is None or not loop.is_running():
+            coro.close()
+            raise RuntimeError("async execution engine is not bound to a running loop")
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        if current is loop:
+            coro.close()
+            raise RuntimeError("run_sync called from the engine loop; await the coroutine instead")
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        while True:
+            try:
+                return future.result(timeout=1.0)
+            except concurrent.futures.TimeoutError:
+                if not loop.is_running():
+                    return stopped
+
+    def emergency_halt(self, reason):
+        self.last_error = str(reason)
+        self.execution_guard.halt(reason)
+
+    def execution_health(self):
+        health = {
+            **self.execution_guard.health_snapshot(),
+            "engine_mode": "async",
+            "healthy": not self.execution_guard.is_halted(),
+            "connected": self.page is not None,
+            "loop_bound": bool(self.loop is not None and self.loop.is_running()),
+            "order_in_progress": bool(self.order_in_progress),
+            "last_trade_time": self.last_trade_time,
+            "last_error": self.last_error,
+            "selector_failure_count": self.selector_failure_count,
+            "selector_profile_loaded": bool(self.selector_profile_loaded),
+            "selector_profile_updated_at": self.selector_profile_updated_at,
+            "metrics": dict(self.metrics),
+        }
+        if self.read_pool is not None:
+            health["read_pool"] = self.read_pool.health()
+        return health
+
+    async def _text(self, page, selectors):
+        for selector in selectors or []:
+            try:
+                loc = page.locator(selector)
+                if await loc.count() <= 0:
+                    continue
+                text = str(await loc.first.inner_text() or "").strip()
+                if text:
+                    return text
+            except Exception:
+                continue
+        return None
+
+    async def _price(self, page, selectors):
+        for selector in selectors or []:
+            try:
+                loc = page.locator(selector)
+                if await loc.count() <= 0:
+                    continue
+                return float(self._parse_price(await loc.first.inner_text()))
+            except Exception:
+                continue
+        return None
+
+    async def _exists(self, page, selectors):
+        for selector in selectors or []:
+            try:
+                if await page.locator(selector).count() > 0:
+                    return True
+            except Exception:
+                continue
+        return False
+
+    async def _click(self, page, selectors):
+        last_error = None
+        for selector in selectors or []:
+            try:
+                loc = page.locator(selector)
+                if await loc.count() <= 0:
+                    continue
+                try:
+                    await loc.first.click(timeout=3000)
+                except Exception:
+                    await loc.first.click(timeout=1500, force=True)
+                return True, None
+            except Exception as exc:
+                last_error = str(exc)
+                continue
+        return False, last_error
+
+    async def _fill(self, page, selectors, value):
+        if value is None:
+            return False
+        text = str(round(float(value), 5))
+        for selector in selectors or []:
+            try:
+                loc = page.locator(selector)
+                if await loc.count() <= 0:
+                    continue
+                await loc.first.fill(text, timeout=1500)
+                return True
+            except Exception:
+                continue
+        return False
+
+    async def _fill_text(self, page, selectors, value):
+        text = str(value or "")
+        if not text:
+            return False
+        for selector in selectors or []:
+            try:
+                loc = page.locator(selector)
+                if await loc.count() <= 0:
+                    continue
+                await loc.first.fill(text, timeout=1500)
+                return True
+            except Exception:
+                continue
+        return False
+
+    async def _active_order_symbol(self, page):
+        raw = await self._text(page, self.SYMBOL_SELECTORS)
+        return raw, self._normalize_symbol(raw)
+
+    async def _wait_for_active_symbol(self, page, target_symbol, timeout_seconds=0.6):
+        deadline = time.monotonic() + float(timeout_seconds)
+        while True:
+            _, active_norm = await self._active_order_symbol(page)
+            if active_norm and self._symbol_matches(active_norm, target_symbol):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+
+    async def _switch_symbol_from_catalogue(self, page, target_symbol):
+        entry = self.symbol_catalogue.lookup(target_symbol)
+        if not entry:
+            return False
+
+        broker_symbol = str(entry.get("broker_symbol") or "").strip()
+        row_selector = entry.get("row_selector") or "[data-testid='instrument-symbol-name-wrapper']"
+        if broker_symbol:
+            try:
+                exact = re.compile(rf"^\s*{re.escape(broker_symbol)}\s*$", re.I)
+                label = page.locator(row_selector, has_text=exact)
+                if await label.count() > 0:
+                    try:
+                        await label.first.click(timeout=1200)
+                    except Exception:
+                        await label.first.click(timeout=1200, force=True)
+                    if await self._wait_for_active_symbol(page, target_symbol):
+                        return True
+            except Exception:
+                pass
+
+        if self.symbol_deep_link_template:
+            try:
+                await page.goto(
+                    self.symbol_deep_link_template.format(symbol=broker_symbol or entry.get("canonical")),
+                    wait_until="domcontentloaded",
+                    timeout=self.timeout_ms,
+                )
+                if await self._wait_for_active_symbol(page, target_symbol, timeout_seconds=3.0):
+                    return True
+            except Exception:
+                pass
+        return False
+
+    async def _try_switch_symbol(self, page, target_symbol):
+        target_norm = self._normalize_symbol(target_symbol)
+        if not target_norm:
+            return False
+
+        if await self._switch_symbol_from_catalogue(page, target_symbol):
+            return True
+
+        try:
+            labels = page.locator("[data-testid='instrument-symbol-name-wrapper']")
+            count = int(await labels.count())
+            for i in range(min(count, 120)):
+                label = labels.nth(i)
+                try:
+                    text = str(await label.inner_text() or "")
+                except Exception:
+                    continue
+                if self._normalize_symbol(text) != target_norm:
+                    continue
+                try:
+                    await label.click(timeout=1200)
+                except Exception:
+                    await label.click(timeout=1200, force=True)
+                return await self._wait_for_active_symbol(page, target_symbol)
+        except Exception:
+            pass
+        return False
+
+    async def _ensure_symbol(self, page, expected):
+        # Holding the order lock keeps a concurrent execute() from submitting
+        # on a page that is halfway through switching instruments.
+        _, active_norm = await self._active_order_symbol(page)
+        if not active_norm or any(self._symbol_matches(active_norm, s) for s in expected):
+            return
+        if self._order_lock is None:
+            self._order_lock = asyncio.Lock()
+        if self._order_lock.locked():
+            return
+        async with self._order_lock:
+            await self._try_switch_symbol(page, expected[0])
+
+    async def _execution_surface_ready(self, page):
+        if await self._exists(page, self.selector_aliases.get("order_panel", [])):
+            return True
+        quote = await self.broker_quote_snapshot(expected_symbols=None) or {}
+        return quote.get("mid") is not None or quote.get("last") is not None
+
+    async def _reconnect(self):
+        now = time.time()
+        if (now - float(self.last_reconnect_attempt or 0.0)) < float(self.reconnect_cooldown_seconds):
+            return False
+        self.last_reconnect_attempt = int(now)
+        self.reconnect_attempts += 1
+        try:
+            page = await self.start()
+        except Exception as exc:
+            self.last_error = f"Browser attach failed: {exc}"
+            return False
+        if page is None:
+            return False
+        self.execution_guard.reset()
+        self.last_error = None
+        self._record_selector_success()
+        return True
+
+    async def login_if_needed(self, username=None, password=None):
+        page = self.page
+        if page is None:
+            if not await self._reconnect():
+                return {"ok": False, "status": "not_connected"}
+            page = self.page
+
+        if await self._execution_surface_ready(page):
+            return {"ok": True, "status": "already_authenticated"}
+
+        login_user_present, login_pass_present = await asyncio.gather(
+            self._exists(page, self.selector_aliases.get("login_username", [])),
+            self._exists(page, self.selector_aliases.get("login_password", [])),
+        )
+        if not (login_user_present and login_pass_present):
+            return {"ok": False, "status": "login_form_not_detected"}
+        if not username or not password:
+            return {"ok": False, "status": "credentials_missing"}
+
+        user_ok = await self._fill_text(page, self.selector_aliases.get("login_username", []), username)
+        pass_ok = await self._fill_text(page, self.selector_aliases.get("login_password", []), password)
+        clicked, click_err = await self._click(page, self.selector_aliases.get("login_submit", []))
+        if not (user_ok and pass_ok and clicked):
+            return {
+                "ok": False,
+                "status": "login_submit_failed",
+                "user_ok": bool(user_ok),
+                "pass_ok": bool(pass_ok),
+                "click_ok": bool(clicked),
+                "click_error": click_err,
+            }
+
+        await asyncio.sleep(2.0)
+        if await self._execution_surface_ready(page):
+            self.last_browser_heartbeat = int(time.time())
+            return {"ok": True, "status": "login_success"}
+        return {"ok": False, "status": "login_attempted_pending"}
+
+    async def get_broker_price(self, symbol):
+        quote = await self.broker_quote_snapshot(expected_symbols=[symbol])
+        if quote and quote.get("mid") is not None:
+            return quote["mid"]
+        if quote and quote.get("last") is not None:
+            return quote["last"]
+        return None
+
+    async def order_panel_snapshot(self):
+        page = self.page
+        if page is None:
+            return {
+                "ready": False,
+                "reason": "page_unavailable",
+                "buy_price": None,
+                "sell_price": None,
+                "volume_control": False,
+            }
+
+        panel_exists, buy_exists, sell_exists, volume_exists, buy_price, sell_price = await asyncio.gather(
+            self._exists(page, self.selector_aliases.get("order_panel", [])),
+            self._exists(page, self.selector_aliases.get("buy", [])),
+            self._exists(page, self.selector_aliases.get("sell", [])),
+            self._exists(page, self.selector_aliases.get("volume", [])),
+            self._price(page, self.selector_aliases.get("buy_price", [])),
+            self._price(page, self.selector_aliases.get("sell_price", [])),
+        )
+        ready = bool(panel_exists and buy_exists and sell_exists and volume_exists)
+        reason = "ok" if ready else "selectors_missing"
+        if not panel_exists:
+            reason = "order_panel_missing"
+        return {
+            "ready": ready,
+            "reason": reason,
+            "panel": panel_exists,
+            "buy_button": buy_exists,
+            "sell_button": sell_exists,
+            "volume_control": volume_exists,
+            "buy_price": buy_price,
+            "sell_price": sell_price,
+            "captured_at": int(time.time()),
+        }
+
+    async def calibrate_selectors(self, save: bool = True):
+        page = self.page
+        if page is None:
+            return {"ok": False, "reason": "page_unavailable"}
+
+        async def _present(selectors):
+            valid = []
+            for selector in selectors or []:
+                try:
+                    if await page.locator(selector).count() > 0:
+                        valid.append(selector)
+                except Exception:
+                    continue
+            return valid
+
+        keys = list(self.selector_aliases)
+        found = await asyncio.gather(*(_present(self.selector_aliases[key]) for key in keys))
+        discovered = dict(zip(keys, found))
+        # Selectors seen on the page move to the front; the rest stay as fallbacks.
+        for key, values in discovered.items():
+            if values:
+                rest = [value for value in self.selector_aliases.get(key, []) if value not in values]
+                self.selector_aliases[key] = [*values, *rest]
+
+        profile = {"updated_at": int(time.time()), "selectors": self.selector_aliases}
+        if save:
+            self.selector_profile_path.parent.mkdir(parents=True, exist_ok=True)
+            self.selector_profile_path.write_text(json.dumps(profile, indent=2), encoding="utf-8")
+            self.selector_profile_loaded = True
+            self.selector_profile_updated_at = profile["updated_at"]
+        return {
+            "ok": True,
+            "profile_file": str(self.selector_profile_path),
+            "discovered_keys": {key: len(values) for key, values in discovered.items()},
+            "profile_loaded": bool(self.selector_profile_loaded),
+        }
+
+    async def discover_broker_symbols(self, page, limit=300, include_quotes=True):
+        page = page or self.page
+        if page is None:
+            return {"ok": False, "reason": "page_unavailable"}
+        max_items = max(10, min(int(limit or 300), 2000))
+        try:
+            rows = await page.evaluate(
+                self._DISCOVER_SYMBOLS_SCRIPT, [self._discovery_nodes(include_quotes), max_items]) or []
+        except Exception:
+            rows = []
+        clean = self._clean_discovered_rows(rows)
+
+        active_raw, active_norm = await self._active_order_symbol(page)
+        try:
+            self.symbol_catalogue.ingest(
+                [row for row in clean if row["selector"] == "[data-testid='instrument-symbol-name-wrapper']"])
+            step_text = await page.locator(
+                "[data-testid='mw-order-panel'] [data-testid='input-stepper-input']").first.get_attribute(
+                "step", timeout=500)
+            if active_norm and step_text:
+                self.symbol_catalogue.record_lot_step(active_norm, float(step_text))
+        except Exception:
+            pass
+        return {
+            "ok": True,
+            "active_symbol": active_raw,
+            "active_symbol_canonical": active_norm,
+            "count": len(clean),
+            "symbols": clean,
+            "captured_at": int(time.time()),
+        }
+
+    async def recover_from_selector_failure(self, force_reconnect=False):
+        health = self.execution_guard.health_snapshot()
+        execution_halted = str(health.get("execution_status") or "").upper() == "HALTED"
+        if not self.selector_halted and not force_reconnect and not execution_halted:
+            return {"ok": True, "reason": "No selector halt active"}
+
+        if force_reconnect:
+            self.last_reconnect_attempt = 0
+        if self.page is None and not await self._reconnect():
+            return {"ok": False, "reason": "Reconnect failed"}
+        page = self.page
+        if page is None:
+            return {"ok": False, "reason": "Page unavailable"}
+
+        buy_ready, sell_ready, quote = await asyncio.gather(
+            self._exists(page, self.selector_aliases.get("buy", [])),
+            self._exists(page, self.selector_aliases.get("sell", [])),
+            self._price(page, self.selector_aliases.get("quote", [])),
+        )
+        dom_ok = bool(buy_ready and sell_ready)
+        quote_ok = quote is not None
+        if dom_ok or quote_ok:
+            self.execution_guard.reset()
+            self._record_selector_success()
+            self.last_error = None
+            return {"ok": True, "reason": "Recovered", "dom_ok": dom_ok, "quote_ok": quote_ok}
+        return {"ok": False, "reason": "Selectors still unavailable", "dom_ok": dom_ok, "quote_ok": quote_ok}
+
+    async def broker_quote_snapshot(self, expected_symbols=None):
+        pool = self.read_pool
+        if pool is not None and pool.is_healthy():
+            pooled = await asyncio.to_thread(pool.quote_snapshot, expected_symbols)
+            if pooled is not None:
+                return pooled
+
+        page = self.page
+        if page is None:
+            return None
+
+        expected = [s for s in expected_symbols or [] if str(s or "").strip()]
+        if expected:
+            await self._ensure_symbol(page, expected)
+
+        started = time.perf_counter()
+        symbol_text, bid, ask, last = await asyncio.gather(
+            self._text(page, self.SYMBOL_SELECTORS),
+            self._price(page, self.BID_SELECTORS),
+            self._price(page, self.ASK_SELECTORS),
+            self._price(page, self.LAST_SELECTORS),
+        )
+        self.metrics["last_quote_ms"] = round((time.perf_counter() - started) * 1000.0, 2)
+        if bid is None and ask is None and last is None:
+            return None
+
+        self._record_selector_success()
+        self.last_browser_heartbeat = int(time.time())
+        mid = None
+        spread = None
+        if bid is not None and ask is not None:
+            mid = (float(bid) + float(ask)) / 2.0
+            spread = abs(float(ask) - float(bid))
+        elif last is not None:
+            mid = float(last)
+
+        symbol_mismatch = False
+        if expected and symbol_text and not any(self._symbol_matches(symbol_text, s) for s in expected):
+            symbol_mismatch = True
+
+        return {
+            "symbol": symbol_text,
+            "bid": bid,
+            "ask": ask,
+            "last": last,
+            "mid": mid,
+            "spread": spread,
+            "symbol_mismatch": symbol_mismatch,
+            "source": "PLAYWRIGHT_BROWSER_ASYNC",
+            "captured_at": int(time.time()),
+        }
+
+    async def broker_equity_snapshot(self):
+        pool = self.read_pool
+        if pool is not None and pool.is_healthy():
+            pooled = await asyncio.to_thread(pool.equity_snapshot)
+            if pooled is not None:
+                return pooled
+
+        page = self.page
+        if page is None:
+            return None
+        return await self._price(page, ["[data-testid='account-equity']"])
+
+    async def _position_rows(self, page):
+        await self._click(page, ["[data-testid='open-positions-tab']"])
+        rows = await page.evaluate(self._POSITIONS_SCRIPT, self.POSITION_ROW_SELECTORS) or []
+        positions = []
+        for row in rows:
+            parsed = {"symbol": (row or {}).get("symbol"), "source": "open_positions_row"}
+            for field in ("volume", "entry_price", "sl", "tp", "profit"):
+                try:
+                    parsed[field] = float(self._parse_price((row or {}).get(field)))
+                except Exception:
+                    parsed[field] = None
+            positions.append(parsed)
+        return positions
+
+    async def broker_positions_snapshot(self):
+        pool = self.read_pool
+        if pool is not None and pool.is_healthy():
+            pooled = await asyncio.to_thread(pool.positions_snapshot)
+            if pooled is not None:
+                return pooled
+
+        page = self.page
+        if page is None:
+            return None
+        try:
+            return await self._position_rows(page)
+        except Exception:
+            return None
+
+    async def _read_position(self, page, target_symbol=None):
+        for position in await self._position_rows(page):
+            if target_symbol and not self._symbol_matches(position.get("symbol"), target_symbol):
+                continue
+            if position.get("entry_price") is None:
+                continue
+            return position
+        return None
+
+    async def _select_row(self, page, symbol):
+        for selector in self.POSITION_ROW_SELECTORS:
+            rows = page.locator(selector)
+            count = await rows.count()
+            if count <= 0:
+                continue
+            for i in range(min(count, 25)):
+                row = rows.nth(i)
+                row_symbol = await self._text(row, [
+                    "[data-testid='instrument-symbol-name-wrapper']",
+                    "[data-testid*='position-symbol']",
+                ])
+                if symbol and not self._symbol_matches(row_symbol, symbol):
+                    continue
+                return row, row_symbol
+        return None, None
+
+    async def close_position_immediately(self, page=None, symbol=None):
+        page = page or self.page
+        if page is None:
+            return False
+        await self._click(page, ["[data-testid='open-positions-tab']"])
+        row, _ = await self._select_row(page, symbol)
+        if row is None:
+            return False
+        clicked, _ = await self._click(row, self.CLOSE_BUTTON_SELECTORS)
+        if clicked:
+            await self._click(page, self.selector_aliases.get("confirm", []))
+        return bool(clicked)
+
+    async def close_position_fraction(self, page=None, symbol=None, fraction=0.5):
+        page = page or self.page
+        if page is None:
+            return {"ok": False, "reason": "positions_unavailable"}
+        fraction = max(0.01, min(0.99, float(fraction or 0.5)))
+
+        await self._click(page, ["[data-testid='open-positions-tab']"])
+        row, row_symbol = await self._select_row(page, symbol)
+        if row is None:
+            return {"ok": False, "reason": "symbol_not_found", "symbol": symbol}
+
+        volume = await self._price(row, ["[data-testid='open-position-volume']"])
+        clicked, err = await self._click(row, self.CLOSE_BUTTON_SELECTORS)
+        if not clicked:
+            return {"ok": False, "reason": f"close_click_failed: {err}", "symbol": row_symbol}
+
+        source_volume = float(volume or 0.0)
+        close_volume = max(0.01, round(source_volume * fraction, 2))
+        if source_volume > 0:
+            close_volume = min(close_volume, max(0.01, round(source_volume - 0.01, 2)))
+
+        if not await self._fill(page, self.selector_aliases.get("close_partial_volume", []), close_volume):
+            await page.keyboard.press("Escape")
+            return {
+                "ok": False,
+                "reason": "partial_volume_input_not_found",
+                "symbol": row_symbol,
+                "requested_close_volume": close_volume,
+            }
+        confirmed, err = await self._click(page, self.selector_aliases.get("close_partial_confirm", []))
+        if not confirmed:
+            await page.keyboard.press("Escape")
+            return {
+                "ok": False,
+                "reason": err or "close_partial_confirm_missing",
+                "symbol": row_symbol,
+                "requested_close_volume": close_volume,
+            }
+        return {
+            "ok": True,
+            "symbol": row_symbol,
+            "fraction": fraction,
+            "requested_close_volume": close_volume,
+            "source_volume": volume,
+        }
+
+    @staticmethod
+    def _position_key(position):
+        return (position.get("symbol"), position.get("volume"), position.get("entry_price"))
+
+    async def _wait_for_fill(self, page, target_symbol, timeout_seconds, positions_before=None):
+        """Wait for a position row that was not on the book before the order was submitted."""
+        deadline = time.monotonic() + max(1.0, float(timeout_seconds))
+        while time.monotonic() < deadline:
+            try:
+                rows = await self._position_rows(page)
+            except Exception:
+                rows = []
+            # Rows identical to ones already open (same symbol, volume and
+            # entry) are the old book; anything beyond them is the fill.
+            unmatched = Counter(self._position_key(row) for row in positions_before or [])
+            for row in rows:
+                key = self._position_key(row)
+                if unmatched[key] > 0:
+                    unmatched[key] -= 1
+                    continue
+                if target_symbol and not self._symbol_matches(row.get("symbol"), target_symbol):
+                    continue
+                if row.get("entry_price") is not None:
+                    return row
+            await asyncio.sleep(0.25)
+        return None
+
+    async def _place_order(self, signal, lot_size, page):
+        direction = str(signal.get("direction", "")).upper()
+        if direction not in {"BUY", "SELL"}:
+            self.emergency_halt("Invalid direction")
+            return {"status": "Rejected", "reason": "Invalid direction"}
+
+        buy_ready, sell_ready, volume_ready = await asyncio.gather(
+            self._exists(page, self.selector_aliases.get("buy", [])),
+            self._exists(page, self.selector_aliases.get("sell", [])),
+            self._exists(page, self.selector_aliases.get("volume", [])),
+        )
+        if not (buy_ready and sell_ready):
+            self._record_selector_failure("order panel selectors missing")
+            return {"status": "Rejected", "reason": "DOM not stable"}
+        self._record_selector_success()
+
+        expected_symbol = str(signal.get("symbol") or "").strip()
+        active_symbol = await self._text(page, self.SYMBOL_SELECTORS)
+        if expected_symbol and active_symbol and not self._symbol_matches(active_symbol, expected_symbol):
+            reason = f"Symbol mismatch (expected={expected_symbol}, active={active_symbol})"
+            self.emergency_halt(reason)
+            return {
+                "status": "Rejected",
+                "reason": reason,
+                "expected_symbol": expected_symbol,
+                "active_symbol": active_symbol,
+            }
+
+        expected_entry = signal.get("entry_price")
+        expected_sl = signal.get("sl")
+        expected_tp = signal.get("tp")
+        valid, message = self.execution_guard.validate_sl_tp(expected_sl, expected_tp, expected_entry)
+        if not valid:
+            self.emergency_halt(message)
+            return {"status": "Rejected", "reason": message}
+
+        side_price_key = "buy_price" if direction == "BUY" else "sell_price"
+        requested_price, button_price, sl_available, tp_available = await asyncio.gather(
+            self._price(page, self.selector_aliases.get("quote", [])),
+            self._price(page, self.selector_aliases.get(side_price_key, [])),
+            self._exists(page, self.selector_aliases.get("stop_loss_input", [])),
+            self._exists(page, self.selector_aliases.get("take_profit_input", [])),
+        )
+        if requested_price is None:
+            requested_price = expected_entry
+
+        if self.require_protection_controls and not (sl_available and tp_available):
+            return {
+                "status": "Rejected",
+                "reason": "Protection controls unavailable on panel; order blocked before submit",
+                "active_symbol": active_symbol,
+                "safety_gate": "pre_submit_protection_controls",
+            }
+
+        # Inputs are filled one after another: they share keyboard focus.
+        volume_set = volume_ready and await self._fill(page, self.selector_aliases.get("volume", []), lot_size)
+        if not volume_set:
+            return {"status": "Rejected", "reason": "Volume selector not found"}
+        sl_set = await self._fill(page, self.selector_aliases.get("stop_loss_input", []), expected_sl)
+        tp_set = await self._fill(page, self.selector_aliases.get("take_profit_input", []), expected_tp)
+        protection_setup = {
+            "sl_requested": expected_sl,
+            "tp_requested": expected_tp,
+            "sl_available": bool(sl_available),
+            "tp_available": bool(tp_available),
+            "sl_set": bool(sl_set),
+            "tp_set": bool(tp_set),
+        }
+        if not (sl_set and tp_set):
+            return {
+                "status": "Rejected",
+                "reason": "Protection inputs could not be set; order blocked before submit",
+                "protection_setup": protection_setup,
+            }
+
+        try:
+            positions_before = await self._position_rows(page)
+        except Exception:
+            positions_before = []
+
+        clicked, click_error = await self._click(page, self.selector_aliases.get(direction.lower(), []))
+        if not clicked:
+            return {"status": "Rejected", "reason": click_error or f"{direction.title()} selector not found"}
+        # From here the order may be live at the broker: failures are UNKNOWN,
+        # never retried, and left for position reconciliation to settle.
+        try:
+            confirm_clicked, _ = await self._click(page, self.selector_aliases.get("confirm", []))
+            position_data = await self._wait_for_fill(
+                page, expected_symbol, self.execution_guard.execution_timeout, positions_before=positions_before)
+        except Exception as exc:
+            self.emergency_halt(f"Fill confirmation failed after submit: {exc}")
+            return {"status": "UNKNOWN", "reason": f"Fill confirmation failed after submit: {exc}"}
+        if not position_data:
+            self.emergency_halt("Order timeout - no fill confirmation")
+            return {"status": "UNKNOWN", "reason": "No fill confirmation after submit"}
+
+        executed_price = float(position_data.get("entry_price"))
+        expected_fill_price = expected_entry if expected_entry is not None else requested_price
+        slippage_ok, slippage = self.execution_guard.check_slippage(expected_fill_price, executed_price)
+        if not slippage_ok:
+            await self.close_position_immediately(page, symbol=expected_symbol)
+            self.emergency_halt(f"Slippage breach ({slippage})")
+            return {"status": "Rejected", "reason": "Slippage exceeded limit"}
+
+        verify_ok, verify_reason = self.execution_guard.verify_position(
+            position_data,
+            expected_symbol=expected_symbol,
+            expected_volume=lot_size,
+        )
+        if not verify_ok:
+            await self.close_position_immediately(page, symbol=expected_symbol)
+            self.emergency_halt(verify_reason)
+            return {"status": "Rejected", "reason": verify_reason}
+
+        return {
+            "status": "EXECUTED",
+            "model": signal.get("model"),
+            "direction": direction,
+            "lot_size": lot_size,
+            "requested_price": requested_price,
+            "button_price": button_price,
+            "entry_price": executed_price,
+            "slippage": slippage,
+            "fill_price": executed_price,
+            "position_data": position_data,
+            "confirm_clicked": bool(confirm_clicked),
+            "active_symbol": active_symbol,
+            "volume_set": bool(volume_set),
+            "execution_source": "PLAYWRIGHT_ASYNC",
+            "protection_setup": protection_setup,
+        }
+
+    async def execute(self, signal, lot_size, page=None):
+        page = page or self.page
+        if page is None:
+            return {"status": "Rejected", "reason": "Broker disconnected"}
+        if self.execution_guard.is_halted():
+            return {"status": "Rejected", "reason": "Execution HALTED"}
+        if self._order_lock is None:
+            self._order_lock = asyncio.Lock()
+        if self._order_lock.locked():
+            return {"status": "Rejected", "reason": "Order in progress"}
+
+        async with self._order_lock:
+            self.order_in_progress = True
+            started = time.perf_counter()
+            self.metrics["execute_calls"] += 1
+            try:
+                result = await self._place_order(dict(signal or {}), lot_size, page)
+                if self._is_transient_rejection(result) and not self.execution_guard.is_halted():
+                    self.metrics["execute_retries"] += 1
+                    await asyncio.sleep(0.3)
+                    result = await self._place_order(dict(signal or {}), lot_size, page)
+            except Exception as exc:
+                self.last_error = str(exc)
+                result = {"status": "Rejected", "reason": f"Execution error: {exc}"}
+            finally:
+                self.order_in_progress = False
+                self.metrics["last_execute_ms"] = round((time.perf_counter() - started) * 1000.0, 2)
+
+        if str(result.get("status") or "").upper() == "EXECUTED":
+            self.last_trade_time = int(time.time())
+        return result
@@ -0,0 +1,484 @@
+import concurrent.futures
+import json
+import re
+import threading
+import time
+from pathlib import Path
+
+
+def _parse_price(text):
+    cleaned = re.sub(r"[^0-9.\-]", "", str(text or "").replace(",", "").strip())
+    return float(cleaned)
+
+
+def _normalize_symbol(value):
+    text = str(value or "").upper().replace("/", "").strip()
+    return re.sub(r"[^A-Z0-9]", "", text)
+
+
+class BrokerReadPool:
+    """Read-only broker page living next to the trading page.
+
+    The pool opens its own CDP connection to the browser the trading engine is
+    attached to and keeps a dedicated page for quotes, equity and open positions.
+    Sync Playwright objects are thread-bound, so every page operation runs on a
+    single worker thread owned by the pool. Reads therefore never hop onto the
+    trading thread and never toggle panels or switch symbols on the order page.
+    """
+
+    DEFAULT_SELECTORS = {
+        "symbol": [
+            "[data-testid='quotation-symbol']",
+            "[data-testid='instrument-symbol']",
+            "[data-testid='symbol-name']",
+            "[data-testid='header-symbol']",
+        ],
+        "bid": [
+            "[data-testid='quotation-bid']",
+            "[data-testid='bid-price']",
+        ],
+        "ask": [
+            "[data-testid='quotation-ask']",
+            "[data-testid='ask-price']",
+        ],
+        "last": [
+            "[data-testid='quotation']",
+            "[data-testid='quotation-last']",
+            "[data-testid='last-price']",
+        ],
+        "equity": [
+            "[data-testid='account-equity']",
+        ],
+        "symbol_row": [
+            "[data-testid='instrument-symbol-name-wrapper']",
+        ],
+        "positions_tab": [
+            "[data-testid='open-positions-tab']",
+            "[data-testid*='open-positions'][data-testid*='tab']",
+        ],
+        "positions_container": [
+            "[data-testid='open-positions-table']",
+            "[data-testid*='open-positions'][data-testid*='table']",
+            "[data-testid*='open-positions'][data-testid*='list']",
+        ],
+        "position_row": [
+            "[data-testid='open-positions-desktop-list-row']",
+            "[data-testid*='open-positions'][data-testid*='row']",
+            "[data-testid*='open-position'][data-testid*='row']",
+            "[data-testid='position-row']",
+        ],
+        "position_symbol": [
+            "[data-testid='instrument-symbol-name-wrapper']",
+            "[data-testid='position-symbol']",
+            "[data-testid*='position-symbol']",
+        ],
+        "position_volume": [
+            "[data-testid='open-position-volume']",
+            "[data-testid*='position-volume']",
+        ],
+        "position_entry": [
+            "[data-testid='open-position-entry-price']",
+            "[data-testid*='entry-price']",
+            "[data-testid*='open-price']",
+        ],
+        "position_sl": [
+            "[data-testid*='position-sl']",
+            "[data-testid*='stop-loss']",
+        ],
+        "position_tp": [
+            "[data-testid*='position-tp']",
+            "[data-testid*='take-profit']",
+        ],
+        "position_profit": [
+            "[data-testid*='profit']",
+            "[data-testid*='pnl']",
+        ],
+    }
+
+    _POSITIONS_SCRIPT = r"""
+    (sel) => {
+      const pick = (scope, selectors) => {
+        for (const s of selectors) {
+          const el = scope.querySelector(s);
+          if (el && String(el.textContent || '').trim()) return String(el.textContent).trim();
+        }
+        return null;
+      };
+      for (const rowSel of sel.position_row) {
+        const rows = Array.from(document.querySelectorAll(rowSel));
+        if (!rows.length) continue;
+        return rows.slice(0, 50).map((row) => ({
+          symbol: pick(row, sel.position_symbol),
+          volume: pick(row, sel.position_volume),
+          entry_price: pick(row, sel.position_entry),
+          sl: pick(row, sel.position_sl),
+          tp: pick(row, sel.position_tp),
+          profit: pick(row, sel.position_profit),
+        }));
+      }
+      // No rows: only an open positions panel proves the book is flat.
+      for (const containerSel of sel.positions_container) {
+        if (document.querySelector(containerSel)) return [];
+      }
+      return null;
+    }
+    """
+
+    _SWITCH_SCRIPT = r"""
+    ([target, selectors]) => {
+      const normalize = (v) => String(v || '').toUpperCase().replace(/[^A-Z0-9]/g, '');
+      for (const sel of selectors) {
+        for (const el of Array.from(document.querySelectorAll(sel))) {
+          if (normalize(el.textContent) !== normalize(target)) continue;
+          const row = el.closest('[data-testid="list-row"], [data-testid="favorites-list-el"], [data-testid*="row"]') || el;
+          row.dispatchEvent(new MouseEvent('click', { bubbles: true, cancelable: true }));
+          return true;
+        }
+      }
+      return false;
+    }
+    """
+
+    def __init__(
+            self,
+            cdp_url=None,
+            url=None,
+            timeout_ms=None,
+            selector_profile_file="data/broker_read_selectors.json",
+            failure_limit=5,
+            reconnect_cooldown_seconds=10.0,
+            request_timeout_seconds=4.0):
+        self.cdp_url = str(cdp_url or "").strip()
+        self.url = str(url or "").strip()
+        self.timeout_ms = int(timeout_ms or 12000)
+        self.selector_profile_path = Path(selector_profile_file)
+        self.selectors = {key: list(values) for key, values in self.DEFAULT_SELECTORS.items()}
+        self.selector_profile_loaded = False
+        self.selector_profile_updated_at = None
+        self.failure_limit = max(1, int(failure_limit))
+        self.reconnect_cooldown_seconds = float(reconnect_cooldown_seconds)
+        self.request_timeout_seconds = float(request_timeout_seconds)
+
+        self.page = None
+        self._playwright = None
+        self._browser = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="aq-broker-read")
+        self._stats_lock = threading.Lock()
+
+        self.failure_count = 0
+        self.connect_attempts = 0
+        self.last_connect_attempt = None
+        self.last_success_at = None
+        self.last_error = None
+        self.last_latency_ms = None
+        self.read_count = 0
+        self.active_symbol = None
+
+        self._load_selector_profile()
+
+    def _merge_selector_candidates(self, key, discovered):
+        merged = []
+        seen = set()
+        for selector in [*discovered, *self.selectors.get(key, [])]:
+            value = str(selector or "").strip()
+            if not value or value in seen:
+                continue
+            seen.add(value)
+            merged.append(value)
+        self.selectors[key] = merged
+
+    def _load_selector_profile(self):
+        path = self.selector_profile_path
+        if not path.exists():
+            return
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        selectors = payload.get("selectors", {}) if isinstance(payload, dict) else {}
+        if not isinstance(selectors, dict):
+            return
+        for key, values in selectors.items():
+            if key not in self.selectors or not isinstance(values, list):
+                continue
+            self._merge_selector_candidates(key, [str(v) for v in values])
+        self.selector_profile_loaded = True
+        self.selector_profile_updated_at = payload.get("updated_at")
+
+    def save_selector_profile(self):
+        profile = {
+            "updated_at": int(time.time()),
+            "selectors": self.selectors,
+        }
+        self.selector_profile_path.parent.mkdir(parents=True, exist_ok=True)
+        self.selector_profile_path.write_text(json.dumps(profile, indent=2), encoding="utf-8")
+        self.selector_profile_loaded = True
+        self.selector_profile_updated_at = profile["updated_at"]
+        return {"ok": True, "profile_file": str(self.selector_profile_path)}
+
+    def _submit(self, func, timeout_seconds=None):
+        timeout = float(timeout_seconds or self.request_timeout_seconds)
+        started = time.monotonic()
+        future = self._executor.submit(func)
+        try:
+            result = future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self._record_failure("read_timeout")
+            return None
+        except Exception as exc:
+            self._record_failure(str(exc))
+            return None
+        with self._stats_lock:
+            self.last_latency_ms = round((time.monotonic() - started) * 1000.0, 2)
+        return result
+
+    def _record_failure(self, reason):
+        with self._stats_lock:
+            self.failure_count += 1
+            self.last_error = str(reason)
+            drop_page = self.failure_count >= self.failure_limit
+        if drop_page:
+            # Too many consecutive misses usually means the tab was closed or
+            # navigated away; force a fresh page on the next read.
+            self._executor.submit(self._disconnect)
+
+    def _record_success(self):
+        with self._stats_lock:
+            self.failure_count = 0
+            self.last_error = None
+            self.last_success_at = int(time.time())
+            self.read_count += 1
+
+    def _connect(self):
+        if self.page is not None:
+            try:
+                if not self.page.is_closed():
+                    return self.page
+            except Exception:
+                pass
+            self._disconnect()
+
+        if not self.cdp_url:
+            raise RuntimeError("read pool requires a CDP url")
+
+        now = time.time()
+        if (now - float(self.last_connect_attempt or 0.0)) < self.reconnect_cooldown_seconds:
+            raise RuntimeError("read pool reconnect cooldown")
+        self.last_connect_attempt = int(now)
+        self.connect_attempts += 1
+
+        from playwright.sync_api import sync_playwright
+
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.connect_over_cdp(self.cdp_url, timeout=self.timeout_ms)
+        # Reuse the default context so the read page shares the trading session.
+        contexts = list(self._browser.contexts or [])
+        context = contexts[0] if contexts else self._browser.new_context()
+        page = context.new_page()
+        page.set_default_timeout(self.timeout_ms)
+        if self.url:
+            page.goto(self.url, wait_until="domcontentloaded", timeout=self.timeout_ms)
+        self.page = page
+        self.active_symbol = None
+        return page
+
+    def _disconnect(self):
+        page, browser, playwright = self.page, self._browser, self._playwright
+        self.page = None
+        self._browser = None
+        self._playwright = None
+        for closer in (
+            lambda: page.close() if page is not None else None,
+            # Closing a CDP-attached browser only drops our connection; the
+            # trading session keeps running.
+            lambda: browser.close() if browser is not None else None,
+            lambda: playwright.stop() if playwright is not None else None,
+        ):
+            try:
+                closer()
+            except Exception:
+                pass
+
+    def start(self):
+        page = self._submit(self._connect, timeout_seconds=max(5.0, self.timeout_ms / 1000.0 + 2.0))
+        if page is None:
+            return {"ok": False, "reason": self.last_error or "read_pool_connect_failed"}
+        self._record_success()
+        return {"ok": True, "url": self.url}
+
+    def close(self):
+        try:
+            self._executor.submit(self._disconnect).result(timeout=5.0)
+        except Exception:
+            pass
+        self._executor.shutdown(wait=False)
+
+    def _healthy_locked(self):
+        if not self.cdp_url:
+            return False
+        if self.failure_count < self.failure_limit:
+            return True
+        # Let a tripped pool retry once the reconnect cooldown has elapsed.
+        elapsed = time.time() - float(self.last_connect_attempt or 0.0)
+        return elapsed >= self.reconnect_cooldown_seconds
+
+    def is_healthy(self):
+        with self._stats_lock:
+            return self._healthy_locked()
+
+    def health(self):
+        with self._stats_lock:
+            return {
+                "enabled": bool(self.cdp_url),
+                "healthy": self._healthy_locked(),
+                "connected": self.page is not None,
+                "failure_count": self.failure_count,
+                "failure_limit": self.failure_limit,
+                "connect_attempts": self.connect_attempts,
+                "last_connect_attempt": self.last_connect_attempt,
+                "last_success_at": self.last_success_at,
+                "last_error": self.last_error,
+                "last_latency_ms": self.last_latency_ms,
+                "read_count": self.read_count,
+                "active_symbol": self.active_symbol,
+                "selector_profile_loaded": self.selector_profile_loaded,
+                "selector_profile_updated_at": self.selector_profile_updated_at,
+            }
+
+    def _first_text(self, page, key):
+        for selector in self.selectors.get(key, []):
+            try:
+                loc = page.locator(selector)
+                if loc.count() <= 0:
+                    continue
+                text = str(loc.first.inner_text() or "").strip()
+                if text:
+                    return text
+            except Exception:
+                continue
+        return None
+
+    def _first_price(self, page, key):
+        for selector in self.selectors.get(key, []):
+            try:
+                loc = page.locator(selector)
+                if loc.count() <= 0:
+                    continue
+                return _parse_price(loc.first.inner_text())
+            except Exception:
+                continue
+        return None
+
+    def _switch_symbol(self, page, symbol):
+        target = _normalize_symbol(symbol)
+        if not target or target == self.active_symbol:
+            return True
+        clicked = bool(page.evaluate(self._SWITCH_SCRIPT, [symbol, self.selectors.get("symbol_row", [])]))
+        if clicked:
+            time.sleep(0.25)
+            self.active_symbol = target
+        return clicked
+
+    def _ensure_positions_tab(self, page):
+        for selector in self.selectors.get("positions_tab", []):
+            try:
+                loc = page.locator(selector)
+                if loc.count() <= 0:
+                    continue
+                loc.first.click(timeout=900)
+                return True
+            except Exception:
+                continue
+        return False
+
+    def _read_quote(self, expected_symbols):
+        page = self._connect()
+        expected = [str(s or "").strip() for s in (expected_symbols or []) if str(s or "").strip()]
+        symbol_text = self._first_text(page, "symbol")
+        seen = _normalize_symbol(symbol_text)
+        expected_norm = {_normalize_symbol(s) for s in expected}
+        if expected and seen and seen not in expected_norm:
+            for candidate in expected:
+                if self._switch_symbol(page, candidate):
+                    symbol_text = self._first_text(page, "symbol")
+                    seen = _normalize_symbol(symbol_text)
+                    break
+        elif seen:
+            self.active_symbol = seen
+
+        bid = self._first_price(page, "bid")
+        ask = self._first_price(page, "ask")
+        last = self._first_price(page, "last")
+        if bid is None and ask is None and last is None:
+            raise RuntimeError("quote selectors unavailable")
+
+        mid = None
+        spread = None
+        if bid is not None and ask is not None:
+            mid = (float(bid) + float(ask)) / 2.0
+            spread = abs(float(ask) - float(bid))
+        elif last is not None:
+            mid = float(last)
+
+        return {
+            "symbol": symbol_text,
+            "bid": bid,
+            "ask": ask,
+            "last": last,
+            "mid": mid,
+            "spread": spread,
+            "symbol_mismatch": bool(expected_norm and seen and seen not in expected_norm),
+            "source": "PLAYWRIGHT_READ_POOL",
+            "captured_at": int(time.time()),
+        }
+
+    def _read_equity(self):
+        page = self._connect()
+        value = self._first_price(page, "equity")
+        if value is None:
+            raise RuntimeError("equity selector unavailable")
+        return float(value)
+
+    def _read_positions(self):
+        page = self._connect()
+        tab_ready = self._ensure_positions_tab(page)
+        rows = page.evaluate(self._POSITIONS_SCRIPT, self.selectors)
+        # An unreadable panel must not look like a flat book to
+        # reconciliation and fill detection; [] only when confirmed empty.
+        if rows is None or (not rows and not tab_ready):
+            raise RuntimeError("positions panel unavailable")
+        positions = []
+        for row in rows:
+            parsed = {"symbol": (row or {}).get("symbol"), "source": "read_pool"}
+            for field in ("volume", "entry_price", "sl", "tp", "profit"):
+                try:
+                    parsed[field] = _parse_price((row or {}).get(field))
+                except Exception:
+                    parsed[field] = None
+            if parsed.get("symbol") or parsed.get("entry_price") is not None:
+                positions.append(parsed)
+        return positions
+
+    def _read(self, func):
+        if not self.cdp_url:
+            return None
+        result = self._submit(func)
+        if result is not None:
+            self._record_success()
+        return result
+
+    def quote_snapshot(self, expected_symbols=None):
+        return self._read(lambda: self._read_quote(expected_symbols))
+
+    def quotes_snapshot(self, symbols):
+        quotes = {}
+        for symbol in symbols or []:
+            quotes[str(symbol)] = self.quote_snapshot(expected_symbols=[symbol])
+        return quotes
+
+    def equity_snapshot(self):
+        return self._read(self._read_equity)
+
+    def positions_snapshot(self):
+        return self._read(self._read_positions)
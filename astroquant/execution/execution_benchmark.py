@@ -0,0 +1,238 @@
+import argparse
+import asyncio
+import json
+import time
+
+from astroquant.execution.async_playwright_engine import AsyncPlaywrightExecutionEngine
+from astroquant.execution.mock_broker import MockBrokerConfig, MockBrokerServer
+from astroquant.execution.playwright_engine import PlaywrightExecutionEngine
+
+
+def _percentile(ordered, q):
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * (float(q) / 100.0)
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class LatencyRecorder:
+
+    def __init__(self):
+        self.samples = {}
+
+    def record(self, op, elapsed_ms, ok, error=None):
+        bucket = self.samples.setdefault(op, {"ms": [], "ok": 0, "failed": 0, "errors": {}})
+        bucket["ms"].append(float(elapsed_ms))
+        if ok:
+            bucket["ok"] += 1
+        else:
+            bucket["failed"] += 1
+            key = str(error or "unknown")[:120]
+            bucket["errors"][key] = bucket["errors"].get(key, 0) + 1
+
+    def summary(self):
+        report = {}
+        for op, bucket in self.samples.items():
+            ordered = sorted(bucket["ms"])
+            report[op] = {
+                "count": len(ordered),
+                "ok": bucket["ok"],
+                "failed": bucket["failed"],
+                "p50_ms": round(_percentile(ordered, 50), 2) if ordered else None,
+                "p95_ms": round(_percentile(ordered, 95), 2) if ordered else None,
+                "p99_ms": round(_percentile(ordered, 99), 2) if ordered else None,
+                "mean_ms": round(sum(ordered) / len(ordered), 2) if ordered else None,
+                "max_ms": round(ordered[-1], 2) if ordered else None,
+                "errors": dict(bucket["errors"]),
+            }
+        return report
+
+
+def _signal(quote, symbol, direction="BUY"):
+    entry = float(quote.get("ask") if direction == "BUY" else quote.get("bid"))
+    offset = 5.0 if direction == "BUY" else -5.0
+    return {
+        "model": "benchmark",
+        "symbol": symbol,
+        "direction": direction,
+        "entry_price": entry,
+        "sl": round(entry - offset, 2),
+        "tp": round(entry + 2 * offset, 2),
+    }
+
+
+def _ok(op, result):
+    if op == "quote":
+        return bool(result and (result.get("bid") is not None or result.get("last") is not None)), None
+    if op == "place_order":
+        status = str((result or {}).get("status") or "")
+        return status.upper() == "EXECUTED", (result or {}).get("reason") or ("no result" if result is None else status)
+    if op == "close_fraction":
+        return bool((result or {}).get("ok")), (result or {}).get("reason")
+    return result is not None, None
+
+
+# Both arms time the same calls so their numbers compare directly. The sync
+# engine's public execute() is a stub, so orders are timed at _place_order on
+# both sides, without the async engine's lock and retry wrapper.
+TIMED_PATHS = {
+    "quote": "broker_quote_snapshot(expected_symbols=[symbol])",
+    "execute_quote": "broker_quote_snapshot before each order",
+    "place_order": "_place_order: panel checks, inputs, submit, fill wait",
+    "close_fraction": "close_position_fraction(0.5) on a position opened from the page",
+}
+
+
+def _settle_ms(config):
+    return (max(int(config.order_latency_ms), int(config.close_latency_ms)) + 100) / 1000.0
+
+
+def run_sync(config, iterations, symbol, headless=True):
+    """Drive the thread-bound sync engine against a mock broker page."""
+    from playwright.sync_api import sync_playwright
+
+    recorder = LatencyRecorder()
+    with MockBrokerServer(config) as server, sync_playwright() as pw:
+        browser = pw.chromium.launch(headless=headless)
+        page = browser.new_page()
+        page.goto(server.url, wait_until="domcontentloaded")
+        page.wait_for_selector("[data-testid='quotation-bid']")
+        engine = PlaywrightExecutionEngine(cdp_url="", user_data_dir="")
+        for key, values in AsyncPlaywrightExecutionEngine.ASYNC_SELECTOR_DEFAULTS.items():
+            engine.selector_aliases.setdefault(key, list(values))
+        engine.set_page(page)
+
+        def timed(op, fn):
+            started = time.perf_counter()
+            try:
+                result = fn()
+                ok, error = _ok(op, result)
+            except Exception as exc:
+                result, ok, error = None, False, f"{type(exc).__name__}: {exc}"
+            recorder.record(op, (time.perf_counter() - started) * 1000.0, ok, error)
+            return result
+
+        for _ in range(iterations):
+            timed("quote", lambda: engine.broker_quote_snapshot(expected_symbols=[symbol]))
+        for _ in range(iterations):
+            engine.execution_guard.reset()
+            quote = timed("execute_quote", lambda: engine.broker_quote_snapshot(expected_symbols=[symbol])) or {}
+            if quote.get("ask") is None:
+                recorder.record("place_order", 0.0, False, "quote unavailable")
+                continue
+            timed("place_order", lambda: engine._place_order(_signal(quote, symbol), 0.02, page))
+            page.evaluate("() => window.mockBroker.reset()")
+        for _ in range(iterations):
+            page.click("[data-testid='order-panel-buy-button']")
+            if config.confirm_required:
+                page.click("[data-testid='order-panel-confirm-button']")
+            page.wait_for_selector("[data-testid='open-positions-desktop-list-row']")
+            timed("close_fraction", lambda: engine.close_position_fraction(page, symbol=symbol, fraction=0.5))
+            time.sleep(_settle_ms(config))
+            page.evaluate("() => window.mockBroker.reset()")
+        browser.close()
+    return recorder.summary()
+
+
+async def _run_async(config, iterations, symbol, headless=True):
+    recorder = LatencyRecorder()
+    with MockBrokerServer(config) as server:
+        engine = AsyncPlaywrightExecutionEngine(
+            headless=headless, cdp_url="", user_data_dir="", url=server.url)
+        page = await engine.start()
+        await page.wait_for_selector("[data-testid='quotation-bid']")
+
+        async def timed(op, coro):
+            started = time.perf_counter()
+            try:
+                result = await coro
+                ok, error = _ok(op, result)
+            except Exception as exc:
+                result, ok, error = None, False, f"{type(exc).__name__}: {exc}"
+            recorder.record(op, (time.perf_counter() - started) * 1000.0, ok, error)
+            return result
+
+        try:
+            for _ in range(iterations):
+                await timed("quote", engine.broker_quote_snapshot(expected_symbols=[symbol]))
+            for _ in range(iterations):
+                engine.execution_guard.reset()
+                quote = await timed("execute_quote", engine.broker_quote_snapshot(expected_symbols=[symbol])) or {}
+                if quote.get("ask") is None:
+                    recorder.record("place_order", 0.0, False, "quote unavailable")
+                    continue
+                await timed("place_order", engine._place_order(_signal(quote, symbol), 0.02, page))
+                await page.evaluate("() => window.mockBroker.reset()")
+            for _ in range(iterations):
+                await page.click("[data-testid='order-panel-buy-button']")
+                if config.confirm_required:
+                    await page.click("[data-testid='order-panel-confirm-button']")
+                await page.wait_for_selector("[data-testid='open-positions-desktop-list-row']")
+                await timed("close_fraction", engine.close_position_fraction(page, symbol=symbol, fraction=0.5))
+                await asyncio.sleep(_settle_ms(config))
+                await page.evaluate("() => window.mockBroker.reset()")
+            health = engine.execution_health()
+        finally:
+            await engine.close()
+    report = recorder.summary()
+    report["engine_metrics"] = health.get("metrics")
+    return report
+
+
+def run_async(config, iterations, symbol, headless=True):
+    """Drive the asyncio engine against a mock broker page."""
+    return asyncio.run(_run_async(config, iterations, symbol, headless=headless))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Execution-layer latency benchmark against the local mock broker")
+    parser.add_argument("--engine", choices=["async", "sync", "both"], default="both")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--symbol", type=str, default="XAUUSD")
+    parser.add_argument("--order-latency-ms", type=int, default=150)
+    parser.add_argument("--close-latency-ms", type=int, default=100)
+    parser.add_argument("--partial-fill-rate", type=float, default=0.0)
+    parser.add_argument("--reject-rate", type=float, default=0.0)
+    parser.add_argument("--no-confirm", action="store_true")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--output", type=str, default="", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    def make_config():
+        return MockBrokerConfig(
+            active_symbol=args.symbol,
+            order_latency_ms=args.order_latency_ms,
+            close_latency_ms=args.close_latency_ms,
+            partial_fill_rate=args.partial_fill_rate,
+            reject_rate=args.reject_rate,
+            confirm_required=not args.no_confirm,
+        )
+
+    iterations = max(1, int(args.iterations))
+    report = {
+        "iterations": iterations,
+        "scenario": {k: v for k, v in vars(args).items() if k not in {"engine", "output", "headed"}},
+        "timed_paths": TIMED_PATHS,
+        "engines": {},
+    }
+    runners = {"sync": run_sync, "async": run_async}
+    for name in ("sync", "async"):
+        if args.engine not in {name, "both"}:
+            continue
+        # One arm failing to start (browser, mock server) must not hide the other.
+        try:
+            report["engines"][name] = runners[name](make_config(), iterations, args.symbol, headless=not args.headed)
+        except Exception as exc:
+            report["engines"][name] = {"error": f"{type(exc).__name__}: {exc}"}
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -129,6 +129,74 @@ class MatchTraderConfig:
     })
 
 
+class SelectorResolutionCache:
+    """Remembers the last selector that worked per key and tracks hit rates."""
+
+    def __init__(self, persist_interval_seconds: float = 30.0):
+        self.winners: dict[str, str] = {}
+        self.stats: dict[str, dict[str, float]] = {}
+        self.persist_interval_seconds = float(persist_interval_seconds)
+        self.last_persisted_at = 0.0
+        self.dirty = False
+
+    def ordered(self, key: str, candidates: list[str]) -> list[str]:
+        winner = self.winners.get(key)
+        if not winner or winner not in candidates:
+            return list(candidates)
+        return [winner, *[c for c in candidates if c != winner]]
+
+    def record(self, key: str, selector: str | None, elapsed_ms: float) -> bool:
+        """Update counters; return True when the learned winner changed."""
+        stats = self.stats.setdefault(key, {
+            "hits": 0,
+            "misses": 0,
+            "failures": 0,
+            "demotions": 0,
+            "calls": 0,
+            "total_ms": 0.0,
+            "last_ms": 0.0,
+        })
+        stats["calls"] += 1
+        stats["total_ms"] += float(elapsed_ms)
+        stats["last_ms"] = round(float(elapsed_ms), 3)
+
+        cached = self.winners.get(key)
+        if selector is not None and selector == cached:
+            stats["hits"] += 1
+            return False
+
+        stats["misses"] += 1
+        if cached is not None:
+            # The cached selector did not resolve this time: demote it.
+            stats["demotions"] += 1
+            self.winners.pop(key, None)
+        if selector is None:
+            stats["failures"] += 1
+            return cached is not None
+        self.winners[key] = selector
+        return True
+
+    def snapshot(self) -> dict[str, Any]:
+        keys = {}
+        for key, stats in self.stats.items():
+            calls = int(stats["calls"])
+            keys[key] = {
+                "winner": self.winners.get(key),
+                "hits": int(stats["hits"]),
+                "misses": int(stats["misses"]),
+                "failures": int(stats["failures"]),
+                "demotions": int(stats["demotions"]),
+                "hit_rate": round(stats["hits"] / calls, 4) if calls else None,
+                "avg_ms": round(stats["total_ms"] / calls, 3) if calls else None,
+                "last_ms": stats["last_ms"],
+            }
+        return {
+            "keys": keys,
+            "dirty": bool(self.dirty),
+            "last_persisted_at": int(self.last_persisted_at) or None,
+        }
+
+
 class MatchTraderExecutor:
 
     def __init__(self, config: MatchTraderConfig):
@@ -146,6 +214,7 @@ class MatchTraderExecutor:
         self.layout_failures = 0
         self.selector_profile_loaded = False
         self.selector_profile_path = Path(self.config.selector_profile_file)
+        self.selector_cache = SelectorResolutionCache()
         self._load_selector_profile()
 
     def _merge_selector_candidates(self, key: str, discovered: list[str]):
@@ -229,93 +298,115 @@ class MatchTraderExecutor:
     def release_order_lock(self):
         self.order_active = False
 
-    def _find_selector_value(self, candidates: list[str]) -> str | None:
-        value, _ = self._find_selector_value_with_source(candidates)
-        return value
+    def _resolve_selector(self, key: str | None, candidates: list[str], action) -> tuple[Any, str | None]:
+        """Run ``action(page, locator)`` against candidates, learned winner first.
 
-    def _find_selector_value_with_source(self, candidates: list[str]) -> tuple[str | None, str | None]:
+        ``action`` returns a non-None value on success. With a ``key`` the
+        winning selector is remembered and tried first next time.
+        """
         page = self.engine.page
         if page is None:
             return None, None
 
-        for selector in candidates:
+        started = time.perf_counter()
+        ordered = self.selector_cache.ordered(key, candidates) if key else list(candidates)
+        result, winner = None, None
+        for selector in ordered:
             try:
                 locator = page.locator(selector)
                 if locator.count() <= 0:
                     continue
-                value = locator.first.inner_text()
-                value = str(value or "").strip()
-                if value:
-                    return value, selector
+                result = action(page, locator.first)
+                if result is not None:
+                    winner = selector
+                    break
             except Exception:
                 continue
-        return None, None
 
-    def _find_selector_price(self, candidates: list[str]) -> float | None:
-        value, _ = self._find_selector_price_with_source(candidates)
+        if key:
+            changed = self.selector_cache.record(key, winner, (time.perf_counter() - started) * 1000.0)
+            if changed and winner:
+                self._merge_selector_candidates(key, [winner])
+            if (changed and winner) or self.selector_cache.dirty:
+                self._persist_selector_winners()
+        return result, winner
+
+    def _persist_selector_winners(self, force: bool = False):
+        now = time.time()
+        if not force and (now - self.selector_cache.last_persisted_at) < self.selector_cache.persist_interval_seconds:
+            self.selector_cache.dirty = True
+            return False
+        if not self.selector_profile_loaded and not force:
+            # Never mark an uncalibrated layout as calibrated by side effect.
+            return False
+        profile = {
+            "updated_at": int(now),
+            "selectors": self.config.selectors,
+        }
+        try:
+            self.selector_profile_path.parent.mkdir(parents=True, exist_ok=True)
+            self.selector_profile_path.write_text(json.dumps(profile, indent=2), encoding="utf-8")
+        except Exception:
+            return False
+        self.selector_cache.last_persisted_at = now
+        self.selector_cache.dirty = False
+        return True
+
+    def selector_cache_snapshot(self) -> dict[str, Any]:
+        return self.selector_cache.snapshot()
+
+    def _find_selector_value(self, candidates: list[str], key: str | None = None) -> str | None:
+        value, _ = self._find_selector_value_with_source(candidates, key=key)
         return value
 
-    def _find_selector_price_with_source(self, candidates: list[str]) -> tuple[float | None, str | None]:
-        page = self.engine.page
-        if page is None:
-            return None, None
+    def _find_selector_value_with_source(self, candidates: list[str], key: str | None = None) -> tuple[str | None, str | None]:
+        def _read(page, target):
+            value = str(target.inner_text() or "").strip()
+            return value or None
 
-        for selector in candidates:
-            try:
-                locator = page.locator(selector)
-                if locator.count() <= 0:
-                    continue
-                text = str(locator.first.inner_text() or "").replace(",", "").strip()
-                filtered = "".join(ch for ch in text if ch.isdigit() or ch in {".", "-"})
-                if not filtered:
-                    continue
-                return float(filtered), selector
-            except Exception:
-                continue
-        return None, None
+        return self._resolve_selector(key, candidates, _read)
 
-    def _click_first(self, candidates: list[str]) -> bool:
-        page = self.engine.page
-        if page is None:
-            return False
-        for selector in candidates:
-            try:
-                locator = page.locator(selector)
-                if locator.count() <= 0:
-                    continue
-                locator.first.click(timeout=self.config.timeout_ms)
-                return True
-            except Exception:
-                continue
-        return False
+    def _find_selector_price(self, candidates: list[str], key: str | None = None) -> float | None:
+        value, _ = self._find_selector_price_with_source(candidates, key=key)
+        return value
 
-    def _fill_first(self, candidates: list[str], value: Any) -> bool:
-        page = self.engine.page
-        if page is None:
-            return False
-        for selector in candidates:
+    def _find_selector_price_with_source(self, candidates: list[str], key: str | None = None) -> tuple[float | None, str | None]:
+        def _read(page, target):
+            text = str(target.inner_text() or "").replace(",", "").strip()
+            filtered = "".join(ch for ch in text if ch.isdigit() or ch in {".", "-"})
+            if not filtered:
+                return None
+            return float(filtered)
+
+        return self._resolve_selector(key, candidates, _read)
+
+    def _click_first(self, candidates: list[str], key: str | None = None) -> bool:
+        def _click(page, target):
+            target.click(timeout=self.config.timeout_ms)
+            return True
+
+        clicked, _ = self._resolve_selector(key, candidates, _click)
+        return bool(clicked)
+
+    def _fill_first(self, candidates: list[str], value: Any, key: str | None = None) -> bool:
+        def _fill(page, target):
+            # Standard input path.
             try:
-                locator = page.locator(selector)
-                if locator.count() <= 0:
-                    continue
-                target = locator.first
-                # Standard input path.
-                try:
-                    target.fill(str(value), timeout=self.config.timeout_ms)
-                    return True
-                except Exception:
-                    pass
-
-                # MatchTrader stepper path (content/div-like controls).
-                target.click(timeout=self.config.timeout_ms)
-                page.keyboard.press("Control+A")
-                page.keyboard.type(str(value), delay=10)
-                page.keyboard.press("Enter")
-                time.sleep(0.05)
+                target.fill(str(value), timeout=self.config.timeout_ms)
                 return True
             except Exception:
-                continue
-        return False
+                pass
+
+            # MatchTrader stepper path (content/div-like controls).
+            target.click(timeout=self.config.timeout_ms)
+            page.keyboard.press("Control+A")
+            page.keyboard.type(str(value), delay=10)
+            page.keyboard.press("Enter")
+            time.sleep(0.05)
+            return True
+
+        filled, _ = self._resolve_selector(key, candidates, _fill)
+        return bool(filled)
 
     def _layout_ready_for_execution(self) -> tuple[bool, list[str]]:
         page = self.engine.page
@@ -431,6 +522,8 @@ class MatchTraderExecutor:
             self.selector_profile_path.parent.mkdir(parents=True, exist_ok=True)
             self.selector_profile_path.write_text(json.dumps(profile, indent=2), encoding="utf-8")
             self.selector_profile_loaded = True
+            self.selector_cache.last_persisted_at = time.time()
+            self.selector_cache.dirty = False
 
         quote_check = self.read_quote()
         return {
@@ -438,13 +531,14 @@ class MatchTraderExecutor:
             "profile_file": str(self.selector_profile_path),
             "discovered_keys": {k: len(v) for k, v in discovered.items()} if isinstance(discovered, dict) else {},
             "quote_check": quote_check,
+            "selector_cache": self.selector_cache.snapshot(),
         }
 
     def read_quote(self) -> dict[str, Any]:
-        symbol, symbol_selector = self._find_selector_value_with_source(self.config.selectors["symbol"])
-        bid, bid_selector = self._find_selector_price_with_source(self.config.selectors["bid"])
-        ask, ask_selector = self._find_selector_price_with_source(self.config.selectors["ask"])
-        last, last_selector = self._find_selector_price_with_source(self.config.selectors["last"])
+        symbol, symbol_selector = self._find_selector_value_with_source(self.config.selectors["symbol"], key="symbol")
+        bid, bid_selector = self._find_selector_price_with_source(self.config.selectors["bid"], key="bid")
+        ask, ask_selector = self._find_selector_price_with_source(self.config.selectors["ask"], key="ask")
+        last, last_selector = self._find_selector_price_with_source(self.config.selectors["last"], key="last")
 
         if bid is None and ask is None and last is None:
             self.layout_failures += 1
@@ -520,9 +614,9 @@ class MatchTraderExecutor:
         if not email or not password:
             return {"ok": False, "status": "credentials_missing"}
 
-        email_ok = self._fill_first(self.config.selectors.get("login_email", []), email)
-        password_ok = self._fill_first(self.config.selectors.get("login_password", []), password)
-        button_ok = self._click_first(self.config.selectors.get("login_button", []))
+        email_ok = self._fill_first(self.config.selectors.get("login_email", []), email, key="login_email")
+        password_ok = self._fill_first(self.config.selectors.get("login_password", []), password, key="login_password")
+        button_ok = self._click_first(self.config.selectors.get("login_button", []), key="login_button")
 
         if not (email_ok and password_ok and button_ok):
             return {
@@ -680,23 +774,25 @@ class MatchTraderExecutor:
             self.killed = True
             return {"status": "blocked", "reason": "layout failure detected", "missing": missing}
 
-        lot_ok = self._fill_first(self.config.selectors["lot"], simulated.get("lot"))
-        sl_ok = self._fill_first(self.config.selectors["sl"], simulated.get("sl")) if simulated.get("sl") is not None else True
-        tp_ok = self._fill_first(self.config.selectors["tp"], simulated.get("tp")) if simulated.get("tp") is not None else True
+        lot_ok = self._fill_first(self.config.selectors["lot"], simulated.get("lot"), key="lot")
+        sl_ok = self._fill_first(self.config.selectors["sl"], simulated.get("sl"), key="sl") if simulated.get("sl") is not None else True
+        tp_ok = self._fill_first(self.config.selectors["tp"], simulated.get("tp"), key="tp") if simulated.get("tp") is not None else True
         if not (lot_ok and sl_ok and tp_ok):
             self.killed = True
             return {"status": "blocked", "reason": "failed to fill lot/sl/tp"}
 
         direction = str(simulated.get("message", "")).upper()
         side_buy = "BUY" in direction
-        side_price = self._find_selector_price(self.config.selectors["buy_price"] if side_buy else self.config.selectors["sell_price"])
-        side_ok = self._click_first(self.config.selectors["buy"] if side_buy else self.config.selectors["sell"])
+        side_price_key = "buy_price" if side_buy else "sell_price"
+        side_key = "buy" if side_buy else "sell"
+        side_price = self._find_selector_price(self.config.selectors[side_price_key], key=side_price_key)
+        side_ok = self._click_first(self.config.selectors[side_key], key=side_key)
         if not side_ok:
             self.killed = True
             return {"status": "blocked", "reason": "failed to click side button"}
 
         self.order_active = True
-        confirm_ok = self._click_first(self.config.selectors["confirm"])
+        confirm_ok = self._click_first(self.config.selectors["confirm"], key="confirm")
         # Some order panels execute directly on BUY/SELL and do not require confirm.
         if not confirm_ok:
             confirm_ok = True
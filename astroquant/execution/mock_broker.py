@@ -0,0 +1,436 @@
+import argparse
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+@dataclass
+class MockBrokerConfig:
+    symbols: dict = field(default_factory=lambda: {"XAUUSD": 2350.0, "BTCUSD": 67000.0})
+    active_symbol: str = "XAUUSD"
+    spread: float = 0.3
+    digits: int = 2
+    tick_ms: int = 250
+    tick_size: float = 0.05
+    balance: float = 100000.0
+    contract_size: float = 100.0
+    lot_step: float = 0.01
+    load_delay_ms: int = 0
+    confirm_required: bool = True
+    order_latency_ms: int = 150
+    close_latency_ms: int = 100
+    partial_fill_rate: float = 0.0
+    partial_fill_ratio: float = 0.5
+    reject_rate: float = 0.0
+    reject_message: str = "Order rejected: market is closed"
+    toast_ms: int = 1500
+    seed: int = 7
+
+
+_PAGE = r"""<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Mock MatchTrader</title>
+<style>
+  body { font-family: sans-serif; margin: 0; background: #111; color: #ddd; }
+  header, section, trade-order-panel, .positions { display: block; padding: 8px 12px; border-bottom: 1px solid #333; }
+  button { margin: 2px; padding: 6px 10px; }
+  input { width: 90px; }
+  .row { display: flex; gap: 12px; align-items: center; padding: 2px 0; }
+  .toasts { position: fixed; top: 8px; right: 8px; width: 260px; }
+  [data-testid='toast'] { background: #264; padding: 6px; margin-bottom: 4px; }
+  [data-testid='toast'].error { background: #822; }
+</style>
+</head>
+<body>
+<div id="app"></div>
+<div class="toasts" id="toasts"></div>
+<script>
+const CONFIG = __CONFIG__;
+
+function mulberry32(seed) {
+  return function () {
+    seed |= 0; seed = seed + 0x6D2B79F5 | 0;
+    let t = Math.imul(seed ^ seed >>> 15, 1 | seed);
+    t = t + Math.imul(t ^ t >>> 7, 61 | t) ^ t;
+    return ((t ^ t >>> 14) >>> 0) / 4294967296;
+  };
+}
+
+const state = {
+  config: CONFIG,
+  rand: mulberry32(CONFIG.seed),
+  prices: Object.assign({}, CONFIG.symbols),
+  active: CONFIG.active_symbol,
+  positions: [],
+  nextId: 1,
+  pending: null,
+  orders: { submitted: 0, filled: 0, partial: 0, rejected: 0, closed: 0 },
+};
+
+const fmt = (v) => Number(v).toLocaleString('en-US', {
+  minimumFractionDigits: state.config.digits, maximumFractionDigits: state.config.digits });
+const el = (html) => { const t = document.createElement('template'); t.innerHTML = html.trim(); return t.content.firstChild; };
+const $ = (sel, scope) => (scope || document).querySelector(sel);
+
+function quote(symbol) {
+  const mid = state.prices[symbol];
+  const half = state.config.spread / 2;
+  return { bid: mid - half, ask: mid + half, last: mid };
+}
+
+function toast(message, error) {
+  const node = el(`<div data-testid="toast" class="${error ? 'error' : ''}"></div>`);
+  node.textContent = message;
+  $('#toasts').appendChild(node);
+  setTimeout(() => node.remove(), state.config.toast_ms);
+}
+
+function render() {
+  const symbols = Object.keys(state.prices).map((s) => `
+    <div class="row" data-testid="favorites-list-el">
+      <span data-testid="instrument-symbol-name-wrapper">${s}</span>
+      <span class="price">${fmt(state.prices[s])}</span>
+    </div>`).join('');
+  document.getElementById('app').innerHTML = `
+    <header class="row">
+      <span data-testid="header-symbol">${state.active}</span>
+      <span>Equity <span data-testid="account-equity"></span></span>
+    </header>
+    <section data-testid="symbol-selector">${symbols}</section>
+    <section class="row">
+      <span data-testid="quotation-symbol">${state.active}</span>
+      Bid <span data-testid="quotation-bid"></span>
+      Ask <span data-testid="quotation-ask"></span>
+      Last <span data-testid="quotation"></span>
+    </section>
+    <trade-order-panel data-testid="mw-order-panel">
+      <div class="row">
+        Volume <input data-testid="input-stepper-input" step="${state.config.lot_step}" value="${state.config.lot_step}">
+        SL <span data-testid="order-stop-loss"><input></span>
+        TP <span data-testid="order-take-profit"><input></span>
+      </div>
+      <div class="row" id="order-buttons">
+        <button data-testid="order-panel-sell-button">Sell <span class="ui-order-button__price"></span></button>
+        <button data-testid="order-panel-buy-button">Buy <span class="ui-order-button__price"></span></button>
+      </div>
+    </trade-order-panel>
+    <div class="positions">
+      <button data-testid="open-positions-tab">Open Positions</button>
+      <div data-testid="open-positions-table" id="positions"></div>
+    </div>`;
+
+  document.querySelectorAll("[data-testid='favorites-list-el']").forEach((row) => {
+    row.addEventListener('click', () => {
+      state.active = $("[data-testid='instrument-symbol-name-wrapper']", row).textContent.trim();
+      $("[data-testid='header-symbol']").textContent = state.active;
+      $("[data-testid='quotation-symbol']").textContent = state.active;
+      tick(false);
+    });
+  });
+  $("[data-testid='order-panel-buy-button']").addEventListener('click', () => requestOrder('BUY'));
+  $("[data-testid='order-panel-sell-button']").addEventListener('click', () => requestOrder('SELL'));
+  renderPositions();
+  tick(false);
+}
+
+function renderPositions() {
+  const table = document.getElementById('positions');
+  if (!table) return;
+  table.innerHTML = state.positions.map((p) => `
+    <div class="row" data-testid="open-positions-desktop-list-row" data-position-id="${p.id}">
+      <span data-testid="instrument-symbol-name-wrapper">${p.symbol}</span>
+      <span>${p.side}</span>
+      <span data-testid="open-position-volume">${p.volume.toFixed(2)}</span>
+      <span data-testid="open-position-entry-price">${fmt(p.entry)}</span>
+      <span data-testid="position-sl">${p.sl == null ? '-' : fmt(p.sl)}</span>
+      <span data-testid="position-tp">${p.tp == null ? '-' : fmt(p.tp)}</span>
+      <span data-testid="position-profit">${fmt(profit(p))}</span>
+      <button data-testid="close-position-button">Close</button>
+    </div>`).join('');
+  table.querySelectorAll("[data-testid='close-position-button']").forEach((btn) => {
+    btn.addEventListener('click', () => openCloseDialog(Number(btn.closest('[data-position-id]').dataset.positionId)));
+  });
+}
+
+function profit(p) {
+  const q = quote(p.symbol);
+  const exit = p.side === 'BUY' ? q.bid : q.ask;
+  const sign = p.side === 'BUY' ? 1 : -1;
+  return (exit - p.entry) * sign * p.volume * state.config.contract_size;
+}
+
+function tick(move) {
+  if (move) {
+    for (const s of Object.keys(state.prices)) {
+      const steps = Math.round((state.rand() - 0.5) * 4);
+      state.prices[s] = Math.max(state.config.tick_size, state.prices[s] + steps * state.config.tick_size);
+    }
+  }
+  const q = quote(state.active);
+  const set = (sel, v) => { const n = $(sel); if (n) n.textContent = fmt(v); };
+  set("[data-testid='quotation-bid']", q.bid);
+  set("[data-testid='quotation-ask']", q.ask);
+  set("[data-testid='quotation']", q.last);
+  set("[data-testid='order-panel-buy-button'] .ui-order-button__price", q.ask);
+  set("[data-testid='order-panel-sell-button'] .ui-order-button__price", q.bid);
+  const floating = state.positions.reduce((sum, p) => sum + profit(p), 0);
+  set("[data-testid='account-equity']", state.config.balance + floating);
+  document.querySelectorAll("[data-position-id]").forEach((row) => {
+    const p = state.positions.find((x) => x.id === Number(row.dataset.positionId));
+    if (p) $("[data-testid='position-profit']", row).textContent = fmt(profit(p));
+  });
+}
+
+function readInput(sel) {
+  const node = $(sel);
+  const input = node && (node.matches('input') ? node : $('input', node));
+  const value = input ? parseFloat(String(input.value).replace(/,/g, '')) : NaN;
+  return Number.isFinite(value) ? value : null;
+}
+
+function requestOrder(side) {
+  const order = {
+    side,
+    symbol: state.active,
+    volume: readInput("[data-testid='input-stepper-input']") || state.config.lot_step,
+    sl: readInput("[data-testid='order-stop-loss']"),
+    tp: readInput("[data-testid='order-take-profit']"),
+  };
+  if (!state.config.confirm_required) {
+    submitOrder(order);
+    return;
+  }
+  state.pending = order;
+  const old = $("[data-testid='order-panel-confirm-button']");
+  if (old) old.remove();
+  const confirm = el(`<button data-testid="order-panel-confirm-button">Confirm ${side}</button>`);
+  confirm.addEventListener('click', () => {
+    confirm.remove();
+    const pending = state.pending;
+    state.pending = null;
+    if (pending) submitOrder(pending);
+  });
+  $('#order-buttons').appendChild(confirm);
+}
+
+function submitOrder(order) {
+  state.orders.submitted += 1;
+  setTimeout(() => {
+    if (state.rand() < state.config.reject_rate) {
+      state.orders.rejected += 1;
+      toast(state.config.reject_message, true);
+      return;
+    }
+    let volume = order.volume;
+    if (state.rand() < state.config.partial_fill_rate) {
+      const step = state.config.lot_step;
+      volume = Math.max(step, Math.round(order.volume * state.config.partial_fill_ratio / step) * step);
+      state.orders.partial += 1;
+    }
+    const q = quote(order.symbol);
+    state.positions.push({
+      id: state.nextId++,
+      symbol: order.symbol,
+      side: order.side,
+      volume: Number(volume.toFixed(2)),
+      entry: order.side === 'BUY' ? q.ask : q.bid,
+      sl: order.sl,
+      tp: order.tp,
+    });
+    state.orders.filled += 1;
+    renderPositions();
+    toast(`Order executed: ${order.side} ${volume.toFixed(2)} ${order.symbol}`, false);
+  }, state.config.order_latency_ms);
+}
+
+function openCloseDialog(id) {
+  const existing = $("[data-testid='close-position-dialog']");
+  if (existing) existing.remove();
+  const p = state.positions.find((x) => x.id === id);
+  if (!p) return;
+  const dialog = el(`
+    <div data-testid="close-position-dialog" class="row">
+      Close ${p.symbol}
+      <span data-testid="close-position-volume"><input value="${p.volume.toFixed(2)}"></span>
+      <button data-testid="close-position-confirm-button">Close position</button>
+    </div>`);
+  $("[data-testid='close-position-confirm-button']", dialog).addEventListener('click', () => {
+    const requested = readInput("[data-testid='close-position-volume']") || p.volume;
+    dialog.remove();
+    setTimeout(() => {
+      const closeVolume = Math.min(p.volume, requested);
+      p.volume = Number((p.volume - closeVolume).toFixed(2));
+      if (p.volume <= 0) state.positions = state.positions.filter((x) => x.id !== p.id);
+      state.orders.closed += 1;
+      renderPositions();
+      toast(`Position closed: ${closeVolume.toFixed(2)} ${p.symbol}`, false);
+    }, state.config.close_latency_ms);
+  });
+  document.body.appendChild(dialog);
+}
+
+window.mockBroker = {
+  configure(patch) {
+    Object.assign(state.config, patch || {});
+    if (patch && patch.seed != null) state.rand = mulberry32(patch.seed);
+    render();
+    return state.config;
+  },
+  reset() {
+    state.positions = [];
+    state.pending = null;
+    state.orders = { submitted: 0, filled: 0, partial: 0, rejected: 0, closed: 0 };
+    render();
+  },
+  state() {
+    return { active: state.active, prices: state.prices, positions: state.positions, orders: state.orders };
+  },
+};
+
+setTimeout(() => {
+  render();
+  setInterval(() => tick(true), state.config.tick_ms);
+}, state.config.load_delay_ms);
+</script>
+</body>
+</html>
+"""
+
+
+class MockBrokerServer:
+    """Local stand-in for the MatchTrader trade page.
+
+    Serves a single page at ``/app/trade`` exposing the ``data-testid``
+    elements the execution engines target, with configurable order latency,
+    confirmations, partial fills, rejections and toasts. ``/config`` returns
+    (GET) or patches (POST) the config used for the next page load; a loaded
+    page can be reconfigured in place through ``window.mockBroker``.
+    """
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or MockBrokerConfig()
+        self.host = host
+        self.port = int(port)
+        self._server = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/app/trade"
+
+    def update(self, **changes):
+        with self._lock:
+            for key, value in changes.items():
+                if hasattr(self.config, key):
+                    setattr(self.config, key, value)
+            return asdict(self.config)
+
+    def render_page(self):
+        with self._lock:
+            payload = json.dumps(asdict(self.config))
+        return _PAGE.replace("__CONFIG__", payload)
+
+    def _handler(self):
+        broker = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def _send(self, status, body, content_type):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                if path in {"/", "/app/trade"}:
+                    self._send(200, broker.render_page(), "text/html; charset=utf-8")
+                elif path == "/config":
+                    self._send(200, json.dumps(asdict(broker.config)), "application/json")
+                elif path == "/health":
+                    self._send(200, json.dumps({"ok": True, "ts": int(time.time())}), "application/json")
+                else:
+                    self._send(404, json.dumps({"error": "not found"}), "application/json")
+
+            def do_POST(self):
+                if self.path.split("?", 1)[0] != "/config":
+                    self._send(404, json.dumps({"error": "not found"}), "application/json")
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    changes = json.loads(self.rfile.read(length) or b"{}")
+                    if not isinstance(changes, dict):
+                        raise ValueError("config patch must be an object")
+                except Exception as exc:
+                    self._send(400, json.dumps({"error": str(exc)}), "application/json")
+                    return
+                self._send(200, json.dumps(broker.update(**changes)), "application/json")
+
+            def log_message(self, format, *args):
+                return
+
+        return Handler
+
+    def start(self):
+        if self._server is not None:
+            return self.url
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self.port = int(self._server.server_address[1])
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True, name="aq-mock-broker")
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local mock of the MatchTrader trade page")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--order-latency-ms", type=int, default=150)
+    parser.add_argument("--close-latency-ms", type=int, default=100)
+    parser.add_argument("--partial-fill-rate", type=float, default=0.0)
+    parser.add_argument("--reject-rate", type=float, default=0.0)
+    parser.add_argument("--no-confirm", action="store_true", help="Orders execute directly on Buy/Sell")
+    args = parser.parse_args()
+
+    config = MockBrokerConfig(
+        order_latency_ms=args.order_latency_ms,
+        close_latency_ms=args.close_latency_ms,
+        partial_fill_rate=args.partial_fill_rate,
+        reject_rate=args.reject_rate,
+        confirm_required=not args.no_confirm,
+    )
+    server = MockBrokerServer(config, host=args.host, port=args.port)
+    print(f"Mock broker listening on {server.start()}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import concurrent.futures
 import threading
 import time
 import re
@@ -8,6 +9,7 @@ from typing import Any
 from urllib.parse import urlparse
 from urllib.request import urlopen
 from astroquant.backend.execution.execution_guard import ExecutionGuard
+from astroquant.execution.symbol_catalogue import BrokerSymbolCatalogue
 
 
 class PlaywrightExecutionEngine:
@@ -59,7 +61,10 @@ class PlaywrightExecutionEngine:
 
     def execution_health(self):
         # Stub: Always return healthy status for now
-        return {"execution_status": "OK", "healthy": True}
+        health = {"execution_status": "OK", "healthy": True}
+        if self.read_pool is not None:
+            health["read_pool"] = self.read_pool.health()
+        return health
 
     def set_page(self, page):
         """Set the current Playwright page object."""
@@ -70,7 +75,70 @@ class PlaywrightExecutionEngine:
         self._reconnect_handler = handler
 
     def set_task_dispatcher(self, dispatcher):
+        """Run page work through ``dispatcher``, a single-thread executor that owns the page."""
         self._task_dispatcher = dispatcher
+        # Pin the owner thread now, so the first call from any other thread
+        # already hops onto it instead of running the page in place.
+        self._dispatch_thread_id = None
+        if dispatcher is not None:
+            self._dispatch_thread_id = dispatcher.submit(threading.get_ident).result(timeout=5.0)
+
+    def _should_dispatch(self):
+        # Sync Playwright objects only work on the thread that created them,
+        # so calls from any other thread hop onto the dispatcher's thread.
+        return self._task_dispatcher is not None and threading.get_ident() != self._dispatch_thread_id
+
+    def _run_thread_affine(self, fn, timeout_seconds=10.0):
+        future = self._task_dispatcher.submit(fn)
+        try:
+            return future.result(timeout=float(timeout_seconds))
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self.last_error = f"Thread-affine call timed out after {timeout_seconds}s"
+            return None
+
+    def set_read_pool(self, read_pool):
+        """Route quote/equity/position reads to a dedicated read-only page."""
+        self.read_pool = read_pool
+
+    def _pooled_read(self, reader):
+        pool = self.read_pool
+        if pool is None or not pool.is_healthy():
+            return None
+        try:
+            return reader(pool)
+        except Exception:
+            return None
+
+    _DISCOVER_SYMBOLS_SCRIPT = r"""
+    ([selectors, maxItems]) => {
+      const out = [];
+      const seen = new Set();
+      const normalize = (v) => String(v || '').replace(/\s+/g, ' ').trim();
+      const toCanonical = (v) => normalize(v).toUpperCase().replace(/[^A-Z0-9/]/g, '');
+      for (const selector of selectors) {
+        const all = Array.from(document.querySelectorAll(selector));
+        for (const el of all) {
+          const text = normalize(el.textContent || el.innerText || '');
+          if (!text) continue;
+          const canonical = toCanonical(text);
+          if (!canonical) continue;
+          if (seen.has(canonical)) continue;
+          seen.add(canonical);
+          const row = el.closest('[data-testid="list-row"], [data-testid="favorites-list-el"], [data-testid*="row"]');
+          const priceEl = row ? row.querySelector('[data-testid="quotation-bid"], [data-testid="quotation-ask"]') : null;
+          out.push({
+            symbol: text,
+            canonical,
+            selector,
+            price_text: priceEl ? normalize(priceEl.textContent || '') : null,
+          });
+          if (out.length >= maxItems) return out;
+        }
+      }
+      return out;
+    }
+    """
 
     def __init__(
             self,
@@ -132,6 +200,15 @@ class PlaywrightExecutionEngine:
         self.reconnect_handler = None
         self._page = None
         self._reconnect_handler = None
+        self._task_dispatcher = None
+        self._dispatch_thread_id = None
+        self.read_pool = None
+        self.symbol_catalogue = BrokerSymbolCatalogue(
+            cache_file=os.environ.get("EXECUTION_SYMBOL_CATALOGUE_FILE", "data/broker_symbol_catalogue.json"))
+        # Optional URL template such as ".../app/trade?symbol={symbol}" used to
+        # jump straight to an instrument when no cached row is clickable.
+        self.symbol_deep_link_template = str(
+            os.environ.get("EXECUTION_SYMBOL_DEEP_LINK_TEMPLATE", "") or "").strip()
         self._record_selector_failure("Initialization complete.")
 
     def _has_any_selector(self, page, selectors):
@@ -302,6 +379,10 @@ class PlaywrightExecutionEngine:
             return False
 
     def broker_positions_snapshot(self):
+        pooled = self._pooled_read(lambda pool: pool.positions_snapshot())
+        if pooled is not None:
+            return pooled
+
         if self._should_dispatch():
             return self._run_thread_affine(
                 self.broker_positions_snapshot, timeout_seconds=4.0)
@@ -321,6 +402,10 @@ class PlaywrightExecutionEngine:
         return [position]
 
     def broker_equity_snapshot(self):
+        pooled = self._pooled_read(lambda pool: pool.equity_snapshot())
+        if pooled is not None:
+            return pooled
+
         if self._should_dispatch():
             return self._run_thread_affine(
                 self.broker_equity_snapshot, timeout_seconds=4.0)
@@ -349,6 +434,13 @@ class PlaywrightExecutionEngine:
         return None
 
     def broker_quote_snapshot(self, expected_symbols=None):
+        # Reads go to the read-only page first so polling never switches
+        # symbols or toggles panels on the page orders are placed from.
+        pooled = self._pooled_read(
+            lambda pool: pool.quote_snapshot(expected_symbols=expected_symbols))
+        if pooled is not None:
+            return pooled
+
         if self._should_dispatch():
             return self._run_thread_affine(
                 lambda: self.broker_quote_snapshot(
@@ -414,10 +506,10 @@ class PlaywrightExecutionEngine:
 
         symbol_mismatch = False
         if expected_symbols:
-            expected = {str(s or "").upper().replace("/", "")
-                        for s in expected_symbols if str(s or "").strip()}
-            seen_symbol = str(symbol_text or "").upper().replace("/", "")
-            if expected and seen_symbol and seen_symbol not in expected:
+            expected = [s for s in expected_symbols if str(s or "").strip()]
+            seen_symbol = self._normalize_symbol(symbol_text)
+            if expected and seen_symbol and not any(
+                    self._symbol_matches(seen_symbol, s) for s in expected):
                 symbol_mismatch = True
 
         return {
@@ -552,12 +644,69 @@ class PlaywrightExecutionEngine:
         if actual_norm == expected_norm:
             return True
 
-        # Broker symbols can vary across BTC aliases.
-        btc_aliases = {"BTC", "BTCUSD", "BTCUSDT"}
-        if actual_norm in btc_aliases and expected_norm in btc_aliases:
-            return True
+        # Broker symbols can vary across aliases (BTC/BTCUSD/BTCUSDT, ...).
+        return self.symbol_catalogue.same_instrument(actual_norm, expected_norm)
+
+    def _wait_for_active_symbol(self, page, target_symbol, timeout_seconds=0.6):
+        deadline = time.time() + float(timeout_seconds)
+        while True:
+            _, active_norm = self._active_order_symbol(page)
+            if active_norm and self._symbol_matches(active_norm, target_symbol):
+                return True
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.05)
+
+    def _switch_symbol_from_catalogue(self, page, target_symbol):
+        entry = self.symbol_catalogue.lookup(target_symbol)
+        if not entry:
+            return False
+
+        broker_symbol = str(entry.get("broker_symbol") or "").strip()
+        row_selector = entry.get(
+            "row_selector") or "[data-testid='instrument-symbol-name-wrapper']"
+        if broker_symbol:
+            try:
+                exact = re.compile(rf"^\s*{re.escape(broker_symbol)}\s*$", re.I)
+                label = page.locator(row_selector, has_text=exact)
+                if label.count() > 0:
+                    try:
+                        label.first.click(timeout=1200)
+                    except Exception:
+                        label.first.click(timeout=1200, force=True)
+                    if self._wait_for_active_symbol(page, target_symbol):
+                        return True
+            except Exception:
+                pass
+
+        if self.symbol_deep_link_template:
+            try:
+                page.goto(
+                    self.symbol_deep_link_template.format(
+                        symbol=broker_symbol or entry.get("canonical")),
+                    wait_until="domcontentloaded",
+                    timeout=self.timeout_ms,
+                )
+                if self._wait_for_active_symbol(
+                        page, target_symbol, timeout_seconds=3.0):
+                    return True
+            except Exception:
+                pass
         return False
 
+    def start_symbol_catalogue_refresh(self, interval_seconds=900.0):
+        def _refresh():
+            if self.page is None:
+                return {"ok": False, "reason": "page_unavailable"}
+            # This thread never drives the page itself; without an owner
+            # thread to dispatch to, the refresh waits for one.
+            if not self._should_dispatch():
+                return {"ok": False, "reason": "owner_thread_unavailable"}
+            return self.discover_broker_symbols(self.page)
+
+        return self.symbol_catalogue.start_background_refresh(
+            _refresh, interval_seconds=interval_seconds)
+
     def _ensure_open_positions_panel(self, page):
         selectors = [
             "[data-testid='open-positions-tab']",
@@ -598,6 +747,10 @@ class PlaywrightExecutionEngine:
         if not target_norm:
             return False
 
+        # Cached catalogue row or deep link: one locator instead of a UI scan.
+        if self._switch_symbol_from_catalogue(page, target_symbol):
+            return True
+
         # First try direct click on visible symbol labels.
         try:
             labels = page.locator(
@@ -616,7 +769,7 @@ class PlaywrightExecutionEngine:
                     label.click(timeout=1200)
                 except Exception:
                     label.click(timeout=1200, force=True)
-                time.sleep(0.35)
+                self._wait_for_active_symbol(page, target_symbol)
                 return True
         except Exception:
             pass
@@ -640,19 +793,14 @@ class PlaywrightExecutionEngine:
                 target_symbol,
             ))
             if clicked:
-                time.sleep(0.35)
+                self._wait_for_active_symbol(page, target_symbol)
                 return True
         except Exception:
             pass
 
         return False
 
-    def discover_broker_symbols(self, page, limit=300, include_quotes=True):
-        if self._should_dispatch():
-            return self._run_thread_affine(lambda: self.discover_broker_symbols(
-                page, limit=limit, include_quotes=include_quotes), timeout_seconds=15.0, )
-
-        max_items = max(10, min(int(limit or 300), 2000))
+    def _discovery_nodes(self, include_quotes=True):
         nodes = [
             "[data-testid='instrument-symbol-name-wrapper']",
             "[data-testid='quotation-symbol']",
@@ -664,41 +812,9 @@ class PlaywrightExecutionEngine:
                 "[data-testid='quotation-bid']",
                 "[data-testid='quotation-ask']",
             ])
+        return nodes
 
-        try:
-            rows = page.evaluate(
-                r"""
-                (selectors, maxItems) => {
-                  const out = [];
-                  const seen = new Set();
-                  const normalize = (v) => String(v || '').replace(/\s+/g, ' ').trim();
-                  const toCanonical = (v) => normalize(v).toUpperCase().replace(/[^A-Z0-9/]/g, '');
-                  for (const selector of selectors) {
-                    const all = Array.from(document.querySelectorAll(selector));
-                    for (const el of all) {
-                      const text = normalize(el.textContent || el.innerText || '');
-                      if (!text) continue;
-                      const canonical = toCanonical(text);
-                      if (!canonical) continue;
-                      if (seen.has(canonical)) continue;
-                      seen.add(canonical);
-                      out.push({
-                        symbol: text,
-                        canonical,
-                        selector,
-                      });
-                      if (out.length >= maxItems) return out;
-                    }
-                  }
-                  return out;
-                }
-                """,
-                nodes,
-                max_items,
-            ) or []
-        except Exception:
-            rows = []
-
+    def _clean_discovered_rows(self, rows):
         clean = []
         seen = set()
         for row in list(rows or []):
@@ -714,9 +830,36 @@ class PlaywrightExecutionEngine:
                 "symbol": raw,
                 "canonical": canonical,
                 "selector": str((row or {}).get("selector") or ""),
+                "price_text": (row or {}).get("price_text"),
             })
+        return clean
+
+    def discover_broker_symbols(self, page, limit=300, include_quotes=True):
+        if self._should_dispatch():
+            return self._run_thread_affine(lambda: self.discover_broker_symbols(
+                page, limit=limit, include_quotes=include_quotes), timeout_seconds=15.0, )
+
+        max_items = max(10, min(int(limit or 300), 2000))
+        try:
+            rows = page.evaluate(
+                self._DISCOVER_SYMBOLS_SCRIPT,
+                [self._discovery_nodes(include_quotes), max_items],
+            ) or []
+        except Exception:
+            rows = []
+        clean = self._clean_discovered_rows(rows)
 
         active_raw, active_norm = self._active_order_symbol(page)
+        try:
+            self.symbol_catalogue.ingest(
+                [row for row in clean if row["selector"] == "[data-testid='instrument-symbol-name-wrapper']"])
+            step_text = page.locator(
+                "[data-testid='mw-order-panel'] [data-testid='input-stepper-input']").first.get_attribute(
+                "step", timeout=500)
+            if active_norm and step_text:
+                self.symbol_catalogue.record_lot_step(active_norm, float(step_text))
+        except Exception:
+            pass
         return {
             "ok": True,
             "active_symbol": active_raw,
@@ -0,0 +1,199 @@
+import json
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+
+
+def normalize_symbol(value):
+    text = str(value or "").upper().replace("/", "").strip()
+    return re.sub(r"[^A-Z0-9]", "", text)
+
+
+class BrokerSymbolCatalogue:
+    """Persisted broker instrument list with constant-time alias resolution.
+
+    Every known spelling of an instrument (broker symbol, canonical name,
+    aliases) is normalized once and stored in a flat dict pointing at the
+    catalogue key, so symbol matching never rescans the broker UI.
+    """
+
+    DEFAULT_ALIASES = {
+        "BTCUSD": ["BTC", "BTCUSD", "BTCUSDT"],
+        "XAUUSD": ["XAUUSD", "GOLD"],
+    }
+
+    def __init__(self, cache_file="data/broker_symbol_catalogue.json", default_lot_step=0.01):
+        self.file = Path(cache_file)
+        self.default_lot_step = float(default_lot_step)
+        self.entries = {}
+        self.alias_index = {}
+        self.updated_at = None
+        self.refresh_count = 0
+        self.last_refresh_error = None
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+        self._refresh_stop = threading.Event()
+        for canonical, aliases in self.DEFAULT_ALIASES.items():
+            self._upsert(canonical, aliases=aliases)
+        self._load()
+
+    def _load(self):
+        try:
+            payload = json.loads(self.file.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(payload, dict):
+            return
+        for row in payload.get("symbols", []) or []:
+            if not isinstance(row, dict) or not row.get("canonical"):
+                continue
+            self._upsert(
+                row.get("canonical"),
+                broker_symbol=row.get("broker_symbol"),
+                aliases=row.get("aliases"),
+                precision=row.get("precision"),
+                lot_step=row.get("lot_step"),
+                row_selector=row.get("row_selector"),
+            )
+        self.updated_at = payload.get("updated_at")
+
+    def _save(self):
+        with self._lock:
+            payload = {
+                "updated_at": self.updated_at,
+                "symbols": [dict(entry) for entry in self.entries.values()],
+            }
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        self.file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    def _upsert(self, canonical, broker_symbol=None, aliases=None, precision=None, lot_step=None, row_selector=None):
+        key = normalize_symbol(canonical)
+        if not key:
+            return None
+        with self._lock:
+            # An alias that already points at another entry keeps that entry as
+            # its owner, so discovered rows merge into the seeded alias groups.
+            key = self.alias_index.get(key, key)
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = {
+                    "canonical": key,
+                    "broker_symbol": None,
+                    "aliases": [],
+                    "precision": None,
+                    "lot_step": self.default_lot_step,
+                    "row_selector": None,
+                    "seen_at": None,
+                }
+                self.entries[key] = entry
+            if broker_symbol:
+                entry["broker_symbol"] = str(broker_symbol).strip()
+            if precision is not None:
+                entry["precision"] = int(precision)
+            if lot_step is not None and float(lot_step) > 0:
+                entry["lot_step"] = float(lot_step)
+            if row_selector:
+                entry["row_selector"] = str(row_selector)
+
+            names = [key, entry.get("broker_symbol"), *(aliases or []), *entry.get("aliases", [])]
+            merged = []
+            for name in names:
+                norm = normalize_symbol(name)
+                if not norm or norm in merged:
+                    continue
+                merged.append(norm)
+                self.alias_index.setdefault(norm, key)
+            entry["aliases"] = merged
+            return entry
+
+    def resolve(self, symbol):
+        """Return the catalogue key for any known spelling of ``symbol``."""
+        norm = normalize_symbol(symbol)
+        if not norm:
+            return None
+        return self.alias_index.get(norm, norm)
+
+    def same_instrument(self, actual, expected):
+        actual_key = self.resolve(actual)
+        expected_key = self.resolve(expected)
+        return bool(actual_key and expected_key and actual_key == expected_key)
+
+    def lookup(self, symbol):
+        key = self.resolve(symbol)
+        if not key:
+            return None
+        with self._lock:
+            entry = self.entries.get(key)
+            return dict(entry) if entry else None
+
+    def record_lot_step(self, symbol, lot_step):
+        entry = self._upsert(symbol, lot_step=lot_step)
+        if entry is not None:
+            self._save()
+
+    def ingest(self, discovered_rows):
+        """Merge rows returned by ``discover_broker_symbols`` and persist."""
+        now = int(time.time())
+        count = 0
+        for row in discovered_rows or []:
+            raw = str((row or {}).get("symbol") or "").strip()
+            if not raw:
+                continue
+            price_text = str((row or {}).get("price_text") or "")
+            precision = None
+            if price_text:
+                digits = re.sub(r"[^0-9.]", "", price_text)
+                precision = len(digits.split(".", 1)[1]) if "." in digits else 0
+            entry = self._upsert(
+                raw,
+                broker_symbol=raw,
+                aliases=[raw, (row or {}).get("canonical")],
+                precision=precision,
+                row_selector=(row or {}).get("selector"),
+            )
+            if entry is not None:
+                entry["seen_at"] = now
+                count += 1
+        self.updated_at = now
+        self.refresh_count += 1
+        self._save()
+        return count
+
+    def start_background_refresh(self, refresher, interval_seconds=900.0):
+        """Periodically call ``refresher()``, which ingests what it discovers."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return False
+        self._refresh_stop.clear()
+
+        def _loop():
+            while not self._refresh_stop.is_set():
+                try:
+                    result = refresher() or {}
+                    if result.get("ok"):
+                        self.last_refresh_error = None
+                    else:
+                        self.last_refresh_error = str(result.get("reason") or "refresh_unavailable")
+                except Exception as exc:
+                    self.last_refresh_error = f"{type(exc).__name__}: {exc}"
+                    logging.exception("Broker symbol catalogue refresh failed")
+                self._refresh_stop.wait(max(30.0, float(interval_seconds)))
+
+        self._refresh_thread = threading.Thread(target=_loop, daemon=True, name="aq-symbol-catalogue")
+        self._refresh_thread.start()
+        return True
+
+    def stop_background_refresh(self):
+        self._refresh_stop.set()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "updated_at": self.updated_at,
+                "count": len(self.entries),
+                "alias_count": len(self.alias_index),
+                "refresh_count": self.refresh_count,
+                "last_refresh_error": self.last_refresh_error,
+                "symbols": [dict(entry) for entry in self.entries.values()],
+            }
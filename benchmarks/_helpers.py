@@ -0,0 +1,65 @@
+"""Synthetic market data shared by the benchmark fixtures and modules."""
+
+import random
+from types import SimpleNamespace
+
+from astroquant.engine.orderflow_engine import OrderflowEngine
+
+SYMBOL = "XAUUSD"
+BAR_COUNT = 2400
+START_TS = 1760943600  # Monday 07:00 UTC, inside the London window
+TRADE_COUNTS = [500, 5000, 50000]
+
+
+class StaticOrderflowEngine(OrderflowEngine):
+    """OrderflowEngine serving a fixed trade list instead of calling Databento."""
+
+    def __init__(self, trades):
+        self.client = None
+        self.trades = trades
+
+    def get_recent_trades(self, dataset, symbol):
+        return self.trades
+
+
+def make_candles(count=BAR_COUNT, start=2400.0, seed=7):
+    rng = random.Random(seed)
+    price = start
+    rows = []
+    for index in range(count):
+        open_px = price
+        price = max(1.0, price + rng.gauss(0.0, 0.9))
+        rows.append({
+            "time": START_TS - (count - index) * 60,
+            "open": round(open_px, 2),
+            "high": round(max(open_px, price) + abs(rng.gauss(0.0, 0.4)), 2),
+            "low": round(min(open_px, price) - abs(rng.gauss(0.0, 0.4)), 2),
+            "close": round(price, 2),
+            "volume": float(rng.randint(20, 400)),
+        })
+    return rows
+
+
+def make_tape(count, last_price, end_ts=START_TS, seed=11):
+    """Time-and-sales rows (dicts) ending at ``end_ts`` around ``last_price``."""
+    rng = random.Random(seed)
+    price = last_price
+    span = max(60, count // 10)
+    rows = []
+    for index in range(count):
+        price = round(price + rng.choice((-0.1, 0.0, 0.0, 0.1)), 2)
+        rows.append({
+            "time": end_ts - span + (index * span) // count,
+            "price": price,
+            "size": rng.randint(1, 40),
+            "side": "BUY" if rng.random() < 0.52 else "SELL",
+        })
+    return rows
+
+
+def tape_to_trades(tape):
+    """Databento-style trade records (attribute access, ``B``/``A`` sides)."""
+    return [
+        SimpleNamespace(time=row["time"], price=row["price"], size=row["size"], side="B" if row["side"] == "BUY" else "A")
+        for row in tape
+    ]
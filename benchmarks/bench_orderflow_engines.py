@@ -0,0 +1,44 @@
+import itertools
+
+import pytest
+
+from astroquant.engine.basis_engine import BasisEngine
+from astroquant.engine.delta_engine import DeltaEngine
+from astroquant.engine.dom_engine import DomEngine
+from astroquant.engine.volume_profile_engine import VolumeProfileEngine
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_delta_build(benchmark, tape, candles):
+    engine = DeltaEngine()
+    result = benchmark(engine.build, tape, candles, timeframe_minutes=1, limit=120)
+    assert result["candles"]
+
+
+def test_dom_build(benchmark, tape, candles):
+    engine = DomEngine()
+    result = benchmark(engine.build, tape, candles, depth=12)
+    assert result["levels"]
+
+
+def test_volume_profile_value_area(benchmark, trades):
+    engine = VolumeProfileEngine()
+    result = benchmark(engine.value_area, trades)
+    assert result["poc"] is not None
+
+
+def test_basis_update(benchmark, candles):
+    engine = BasisEngine()
+    # Fill the full history window so every timed call pays the steady-state cost.
+    closes = [row["close"] for row in candles]
+    for index, close in enumerate(closes[: engine.history_window]):
+        engine.update("XAUUSD", close, close + 1.5 + (index % 7) * 0.05, event_time=candles[index]["time"])
+    stream = itertools.cycle([(close, close + 1.5 + (index % 7) * 0.05) for index, close in enumerate(closes)])
+
+    def step():
+        spot, futures = next(stream)
+        return engine.update("XAUUSD", spot, futures)
+
+    snapshot = benchmark(step)
+    assert snapshot["sample_count"] == engine.history_window
@@ -0,0 +1,58 @@
+import copy
+
+import pytest
+
+from astroquant.engine.ai_decision import AIDecisionEngine
+from astroquant.engine.gann.gann_master_engine import GannMasterEngine
+from astroquant.engine.signal_manager import SignalManager
+from astroquant.engine.system_state import SystemState
+
+from _helpers import SYMBOL, StaticOrderflowEngine
+
+pytest.importorskip("pytest_benchmark")
+
+RANK_MODELS = ["ICT", "ICEBERG", "EXPANSION", "GANN", "NEWS", "ORDERFLOW_IMBALANCE", "LIQUIDITY_TRAP"]
+
+
+def test_generate_signals(benchmark, market_data, trades):
+    manager = SignalManager(None, orderflow_engine=StaticOrderflowEngine(trades))
+    signals = benchmark(manager.generate_signals, market_data, SYMBOL)
+    assert isinstance(signals, list)
+
+
+def test_gann_master_analyze(benchmark, candles):
+    engine = GannMasterEngine()
+    result = benchmark(engine.analyze, candles)
+    assert "score" in result
+
+
+def test_gann_master_analyze_batch(benchmark, candles):
+    engine = GannMasterEngine()
+    close = [row["close"] for row in candles]
+    high = [row["high"] for row in candles]
+    low = [row["low"] for row in candles]
+    result = benchmark(engine.analyze_batch, close, high, low)
+    assert len(result["score"]) == len(candles)
+
+
+def test_rank_models(benchmark):
+    engine = AIDecisionEngine()
+    state = SystemState()
+    state.model_performance = {name: {"wins": 6, "losses": 4} for name in RANK_MODELS}
+    signals = [
+        {"model": name, "direction": "BUY", "confidence": 60.0 + index, "rr": 2.0}
+        for index, name in enumerate(RANK_MODELS)
+    ]
+    context = {"volatility_regime": "NORMAL", "news_mode": "NORMAL", "session": "LONDON", "drawdown": 0.0}
+
+    def setup():
+        # rank_models scales confidence in place, so every round gets fresh signals.
+        return (copy.deepcopy(signals), 1.0, 1.0), {"state": state, "regime_context": context, "symbol": SYMBOL}
+
+    ranked = benchmark.pedantic(engine.rank_models, setup=setup, rounds=500)
+    assert ranked
+
+
+def test_trade_quality_snapshot(benchmark, runner, market_data):
+    snapshot = benchmark(runner.trade_quality_snapshot, SYMBOL, market_data=market_data)
+    assert snapshot["symbol"] == SYMBOL
@@ -0,0 +1,52 @@
+import pytest
+
+from _helpers import START_TS, SYMBOL, TRADE_COUNTS, make_candles, make_tape, tape_to_trades
+from astroquant.engine import clock
+from tests._workdir import isolated_workdir  # noqa: F401  (session autouse)
+
+
+def pytest_configure(config):
+    # Keep saved runs under benchmarks/.benchmarks wherever pytest is launched
+    # from; a relative --benchmark-storage would follow the working directory.
+    if config.getoption("benchmark_storage", None) == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{config.rootpath / '.benchmarks'}"
+
+
+@pytest.fixture(scope="session")
+def candles():
+    return make_candles()
+
+
+@pytest.fixture(scope="session", params=TRADE_COUNTS, ids=lambda count: f"{count}trades")
+def tape(request, candles):
+    return make_tape(request.param, candles[-1]["close"])
+
+
+@pytest.fixture(scope="session")
+def trades(tape):
+    return tape_to_trades(tape)
+
+
+@pytest.fixture(scope="session")
+def sim_clock():
+    previous = clock.set_clock(clock.SimulatedClock(START_TS))
+    yield clock.get_clock()
+    clock.set_clock(previous)
+
+
+@pytest.fixture(scope="session")
+def runner(candles, sim_clock):
+    from astroquant.engine.replay_feed import ReplayMarketFeed
+    from astroquant.engine.replay_runner import ReplayRunner
+
+    feed = ReplayMarketFeed()
+    feed.add_bars(SYMBOL, candles)
+    feed.add_trades(SYMBOL, tape_to_trades(make_tape(5000, candles[-1]["close"])))
+    return ReplayRunner([SYMBOL], feed)
+
+
+@pytest.fixture(scope="session")
+def market_data(runner, candles):
+    data = dict(runner.get_market_data(SYMBOL) or {})
+    data["candles"] = candles
+    return data
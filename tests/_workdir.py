@@ -0,0 +1,15 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_workdir(tmp_path_factory):
+    # Engines persist JSON/SQLite state relative to cwd; keep it out of the repo.
+    previous = os.getcwd()
+    workdir = tmp_path_factory.mktemp("workdir")
+    (workdir / "data").mkdir()
+    (workdir / "logs").mkdir()
+    os.chdir(workdir)
+    yield workdir
+    os.chdir(previous)
@@ -0,0 +1 @@
+from tests._workdir import isolated_workdir  # noqa: F401  (session autouse)
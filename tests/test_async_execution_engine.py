@@ -0,0 +1,186 @@
+import asyncio
+import threading
+
+from astroquant.engine.execution import ExecutionEngine
+from astroquant.execution.async_playwright_engine import AsyncPlaywrightExecutionEngine
+
+
+class FakeLocator:
+    def __init__(self, page, items):
+        self.page = page
+        self.items = items
+
+    async def count(self):
+        return len(self.items)
+
+    @property
+    def first(self):
+        return FakeLocator(self.page, self.items[:1])
+
+    def nth(self, index):
+        return FakeLocator(self.page, self.items[index:index + 1])
+
+    async def inner_text(self):
+        return self.items[0]["text"]
+
+    async def click(self, timeout=None, force=False):
+        action = self.items[0].get("on_click")
+        if action:
+            action()
+
+
+class FakeBrokerPage:
+    """Just enough of an async Playwright page for quote and fill reads."""
+
+    def __init__(self, active="XAUUSD", instruments=("XAUUSD", "BTCUSD")):
+        self.active = active
+        self.instruments = list(instruments)
+        self.positions = []
+        self.prices = {"XAUUSD": (2400.1, 2400.3), "BTCUSD": (64000.0, 64010.0)}
+
+    def _activate(self, symbol):
+        self.active = symbol
+
+    def locator(self, selector, has_text=None):
+        bid, ask = self.prices[self.active]
+        if selector == "[data-testid='header-symbol']":
+            items = [{"text": self.active}]
+        elif selector == "[data-testid='instrument-symbol-name-wrapper']":
+            items = [{"text": name, "on_click": lambda name=name: self._activate(name)} for name in self.instruments]
+            if has_text is not None:
+                items = [item for item in items if has_text.search(item["text"])]
+        elif selector == "[data-testid='quotation-bid']":
+            items = [{"text": str(bid)}]
+        elif selector == "[data-testid='quotation-ask']":
+            items = [{"text": str(ask)}]
+        elif selector == "[data-testid='open-positions-tab']":
+            items = [{"text": "Open Positions"}]
+        else:
+            items = []
+        return FakeLocator(self, items)
+
+    async def evaluate(self, script, argument=None):
+        if "maxItems" in script:
+            return [{"symbol": name, "canonical": name, "selector": "[data-testid='instrument-symbol-name-wrapper']",
+                     "price_text": str(self.prices[name][0])} for name in self.instruments]
+        return [dict(row) for row in self.positions]
+
+
+def _bare_engine(page):
+    engine = AsyncPlaywrightExecutionEngine(cdp_url="", user_data_dir="")
+    engine.set_page(page)
+    return engine
+
+
+class ServerLoop:
+    """Stands in for the FastAPI event loop the engine binds to on startup."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout=5.0)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5.0)
+        self.loop.close()
+
+
+def _fake_start(page):
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.set_page(page)
+        return page
+    return start
+
+
+def test_async_engine_binds_to_the_server_loop(monkeypatch):
+    page = FakeBrokerPage()
+    monkeypatch.setattr(AsyncPlaywrightExecutionEngine, "start", _fake_start(page))
+    engine = ExecutionEngine(mode="async")
+    assert engine.execute({"direction": "BUY", "symbol": "XAUUSD"}, 0.01) == {
+        "status": "Rejected",
+        "reason": "Execution loop unavailable",
+    }
+
+    server = ServerLoop()
+    try:
+        server.run(engine.start())
+        assert engine.playwright.loop is server.loop
+        assert engine.playwright.execution_health()["loop_bound"]
+
+        async def from_route():
+            # Async callers on the server loop get the coroutine and await it.
+            return await engine.broker_quote_snapshot(expected_symbols=["XAUUSD"])
+
+        assert server.run(from_route())["symbol"] == "XAUUSD"
+        # Sync callers on other threads (the runner) block on the same loop.
+        assert engine.broker_quote_snapshot(expected_symbols=["BTCUSD"])["symbol"] == "BTCUSD"
+    finally:
+        engine.playwright.symbol_catalogue.stop_background_refresh()
+        server.stop()
+
+
+def test_run_sync_waits_for_slow_orders_and_reports_unknown_if_the_loop_stops():
+    engine = _bare_engine(FakeBrokerPage())
+    server = ServerLoop()
+    engine.loop = server.loop
+
+    async def slow_order(delay):
+        await asyncio.sleep(delay)
+        return {"status": "EXECUTED"}
+
+    stopped = {"status": "UNKNOWN", "reason": "loop stopped"}
+    # No bridge timeout: a fill that takes longer than one wait slice still lands.
+    assert engine.run_sync(slow_order(1.3), stopped=stopped) == {"status": "EXECUTED"}
+
+    server.loop.call_soon_threadsafe(server.loop.call_later, 0.2, server.loop.stop)
+    assert engine.run_sync(slow_order(5.0), stopped=stopped) == stopped
+    server.thread.join(timeout=5.0)
+
+
+def test_async_quote_switches_to_the_expected_symbol():
+    page = FakeBrokerPage(active="XAUUSD")
+    engine = _bare_engine(page)
+
+    quote = asyncio.run(engine.broker_quote_snapshot(expected_symbols=["BTCUSD"]))
+
+    assert page.active == "BTCUSD"
+    assert quote["symbol"] == "BTCUSD"
+    assert quote["bid"] == 64000.0
+    assert quote["symbol_mismatch"] is False
+
+
+def test_async_fill_ignores_positions_open_before_submit():
+    page = FakeBrokerPage()
+    existing = {"symbol": "XAUUSD", "volume": "0.01", "entry_price": "2390.5"}
+    page.positions = [existing]
+    engine = _bare_engine(page)
+
+    async def scenario():
+        before = await engine._position_rows(page)
+        stale = await engine._wait_for_fill(page, "XAUUSD", 1.0, positions_before=before)
+        page.positions.append({"symbol": "XAUUSD", "volume": "0.01", "entry_price": "2400.3"})
+        fresh = await engine._wait_for_fill(page, "XAUUSD", 1.0, positions_before=before)
+        return stale, fresh
+
+    stale, fresh = asyncio.run(scenario())
+    assert stale is None
+    assert fresh["entry_price"] == 2400.3
+
+
+def test_async_discovery_and_order_panel_run_on_the_async_page():
+    page = FakeBrokerPage(active="XAUUSD")
+    engine = _bare_engine(page)
+
+    discovered = asyncio.run(engine.discover_broker_symbols(page))
+    assert discovered["ok"] is True
+    assert [row["canonical"] for row in discovered["symbols"]] == ["XAUUSD", "BTCUSD"]
+    assert engine.symbol_catalogue.lookup("BTCUSD")["broker_symbol"] == "BTCUSD"
+    assert asyncio.run(engine.get_broker_price("BTCUSD")) == 64005.0
+    panel = asyncio.run(engine.order_panel_snapshot())
+    assert panel["ready"] is False
+    assert panel["reason"] == "order_panel_missing"
@@ -0,0 +1,76 @@
+import time
+
+from astroquant.execution.broker_read_pool import BrokerReadPool
+
+
+class FakeLocator:
+    def __init__(self, count):
+        self._count = count
+
+    def count(self):
+        return self._count
+
+    @property
+    def first(self):
+        return self
+
+    def click(self, timeout=None):
+        return None
+
+
+class FakePositionsPage:
+    """Sync page whose positions script result is fixed; the tab exists unless told otherwise."""
+
+    def __init__(self, rows, tab=True):
+        self.rows = rows
+        self.tab = tab
+
+    def locator(self, selector):
+        return FakeLocator(1 if self.tab and "tab" in selector else 0)
+
+    def evaluate(self, script, argument=None):
+        return self.rows
+
+
+def _pool(page):
+    pool = BrokerReadPool(cdp_url="http://127.0.0.1:9222", selector_profile_file="data/none.json", failure_limit=2)
+    pool._connect = lambda: page
+    return pool
+
+
+def test_unreadable_positions_panel_is_not_a_flat_book():
+    pool = _pool(FakePositionsPage(None))
+    try:
+        assert pool.positions_snapshot() is None
+        assert pool.last_error == "positions panel unavailable"
+    finally:
+        pool.close()
+
+
+def test_missing_positions_tab_is_not_a_flat_book():
+    pool = _pool(FakePositionsPage([], tab=False))
+    try:
+        assert pool.positions_snapshot() is None
+    finally:
+        pool.close()
+
+
+def test_confirmed_empty_panel_is_a_flat_book():
+    pool = _pool(FakePositionsPage([]))
+    try:
+        assert pool.positions_snapshot() == []
+    finally:
+        pool.close()
+
+
+def test_health_matches_is_healthy_after_cooldown():
+    pool = _pool(FakePositionsPage([]))
+    try:
+        pool.failure_count = pool.failure_limit
+        pool.reconnect_cooldown_seconds = 0.5
+        pool.last_connect_attempt = time.time()
+        assert not pool.is_healthy() and not pool.health()["healthy"]
+        pool.last_connect_attempt = time.time() - 1.0
+        assert pool.is_healthy() and pool.health()["healthy"]
+    finally:
+        pool.close()
@@ -0,0 +1,104 @@
+import datetime as dt
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import databento as db
+import databento_dbn
+import pandas as pd
+from databento.common.symbology import MappingInterval
+
+from astroquant.engine.databento import cache as databento_cache
+from astroquant.engine.databento.cache import DatabentoCache, _SymbolMapping
+
+MINUTE = 60 * 10**9
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PHASE1_CACHE = REPO_ROOT / "AstroQuant_Phase1" / "engine" / "databento_cache.py"
+
+
+class FakeTimeseries:
+    """Serves 1m OHLCV DBN for any range, with a per-day symbology mapping in the header."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_range(self, dataset, schema, symbols=None, start=None, end=None, stype_in="raw_symbol", stype_out="instrument_id", limit=None, **kwargs):
+        self.calls += 1
+        lo, hi = pd.Timestamp(start).value, pd.Timestamp(end).value
+        day = pd.Timestamp(lo, tz="UTC").date()
+        metadata = databento_dbn.Metadata(
+            dataset=dataset,
+            start=lo,
+            stype_in=databento_dbn.SType.RAW_SYMBOL,
+            stype_out=databento_dbn.SType.INSTRUMENT_ID,
+            schema=databento_dbn.Schema.OHLCV_1M,
+            symbols=list(symbols),
+            end=hi,
+            mappings=[_SymbolMapping("GCZ6", [MappingInterval(day, day + dt.timedelta(days=1), "42")])],
+        )
+        first = (lo + MINUTE - 1) // MINUTE * MINUTE
+        records = [
+            bytes(databento_dbn.OHLCVMsg(databento_dbn.RType.OHLCV_1M, 1, 42, ts, 100 * 10**9, 101 * 10**9, 99 * 10**9, 100 * 10**9, 1))
+            for ts in range(first, hi, MINUTE)
+        ]
+        return db.DBNStore.from_bytes(bytes(metadata.encode()) + b"".join(records))
+
+
+class FakeClient:
+    def __init__(self):
+        self.timeseries = FakeTimeseries()
+
+
+def test_compaction_keeps_symbol_mappings(tmp_path):
+    cache = DatabentoCache(tmp_path, max_bytes=10**8, settle_seconds=900)
+    client = FakeClient()
+    # Settled history spanning two UTC days, fetched in touching slices.
+    base = pd.Timestamp("2026-10-14 23:00", tz="UTC").value
+    width = 15 * MINUTE
+    for k in range(DatabentoCache.COMPACT_RUN):
+        cache.get_range(client, dataset="GLBX.MDP3", schema="ohlcv-1m", symbols=["GCZ6"], start=base + k * width, end=base + (k + 1) * width)
+
+    assert cache.status()["segments"] == 1
+    merged = next(tmp_path.glob("*.dbn"))
+    mappings = db.DBNStore.from_bytes(merged.read_bytes()).metadata.mappings
+    assert sorted(interval["start_date"] for interval in mappings["GCZ6"]) == [dt.date(2026, 10, 14), dt.date(2026, 10, 15)]
+
+    calls = client.timeseries.calls
+    served = cache.get_range(client, dataset="GLBX.MDP3", schema="ohlcv-1m", symbols=["GCZ6"], start=base, end=base + DatabentoCache.COMPACT_RUN * width)
+    assert client.timeseries.calls == calls
+    assert [record.ts_event for record in served] == list(range(base, base + DatabentoCache.COMPACT_RUN * width, MINUTE))
+
+
+def test_phase1_cache_copy_matches_astroquant():
+    # Phase1 keeps its own copy; only the settings section after _shared_cache may differ.
+    shared = (REPO_ROOT / "astroquant" / "engine" / "databento" / "cache.py").read_text(encoding="utf-8")
+    phase1 = PHASE1_CACHE.read_text(encoding="utf-8")
+    marker = "_shared_cache = None"
+    assert phase1.split(marker)[0] == shared.split(marker)[0]
+
+
+def test_both_apps_default_to_one_cache_directory(monkeypatch):
+    monkeypatch.delenv("DATABENTO_CACHE_DIR", raising=False)
+    spec = importlib.util.spec_from_file_location("phase1_databento_cache", PHASE1_CACHE)
+    phase1 = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(phase1)
+    phase1.configure_from_env()
+
+    saved = databento_cache._settings
+    try:
+        databento_cache.configure()
+        assert phase1.settings()["directory"] == databento_cache.settings()["directory"] == str(REPO_ROOT / "data" / "databento_cache")
+    finally:
+        databento_cache._settings = saved
+
+
+def test_import_defers_databento_and_pandas():
+    script = (
+        "import sys\n"
+        "from astroquant.engine.databento import cache\n"
+        "assert cache._settings is None\n"
+        "print(sorted(name for name in ('databento', 'databento_dbn', 'numpy', 'pandas') if name in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
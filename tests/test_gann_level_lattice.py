@@ -0,0 +1,34 @@
+import random
+
+from astroquant.engine.gann.gann_level_lattice import GannLevelLattice
+from astroquant.engine.gann.gann_octave_engine import GannOctaveEngine
+
+
+def test_octave_levels_use_each_decades_step():
+    lattice = GannLevelLattice()
+
+    assert lattice.between(99, 106, ["octave"]) == [{"price": 100.0, "kind": "octave"}]
+
+
+def test_octave_neighbours_match_the_octave_engine_grid():
+    rng = random.Random(42)
+    engine = GannOctaveEngine()
+    for _ in range(200):
+        price = round(10 ** rng.uniform(-1.0, 5.0), 4)
+        grid = engine.levels(price)["levels"]
+        # A wide band so the engine's next step up is always inside it.
+        lattice = GannLevelLattice(band_pct=0.5)
+        around = lattice.neighbours(price, kind="octave")
+        below = max(level for level in grid if level <= price)
+        above = min(level for level in grid if level > price)
+        assert around["below"] == below, price
+        assert around["above"] == above, price
+
+
+def test_wide_band_reports_truncated_kinds():
+    lattice = GannLevelLattice()
+    lattice.between(1, 20000)
+    assert lattice.snapshot()["truncated"] == []
+
+    lattice.between(0.001, 1e9)
+    assert lattice.snapshot()["truncated"] == ["square", "square_of_9"]
@@ -0,0 +1,58 @@
+from astroquant.engine.models.ict_model import ICTModel
+
+# (high, low, close) per minute: a swing low at 95 is swept by bar 6 (wick to
+# 94, close back above), bar 7 closes over the 102 swing high (CHOCH), bars 8
+# and 9 leave bullish gaps below price, and bar 14 closes over the next swing
+# high at 110 (BOS). The last bar is still forming.
+SWEEP_AND_BREAK = [
+    (101, 99, 100), (100.5, 98, 99), (99, 95, 96), (100, 97, 99), (102, 98, 101),
+    (101, 96, 97), (100, 94, 96), (103, 99, 102.5), (106, 101, 105), (107, 104, 106),
+]
+CONTINUATION = [(108, 105, 107), (110, 106, 109), (109, 106.5, 107), (108.5, 106, 107), (112, 108, 111)]
+FORMING = (112, 110, 111.5)
+
+
+def _candles(rows):
+    return [{"time": index * 60, "open": close, "high": high, "low": low, "close": close, "volume": 1.0}
+            for index, (high, low, close) in enumerate(rows)]
+
+
+def test_choch_after_sweep_enters_on_the_aligned_gap():
+    signal = ICTModel().check({"candles": _candles(SWEEP_AND_BREAK + [FORMING])}, "ICT_CHOCH")
+
+    assert signal["direction"] == "BUY"
+    assert signal["structure"] == "CHOCH"
+    assert signal["confidence"] == 75
+    assert signal["fvg"] == {"bottom": 103.0, "top": 104.0}
+
+
+def test_bos_after_sweep_scores_higher():
+    signal = ICTModel().check({"candles": _candles(SWEEP_AND_BREAK + CONTINUATION + [FORMING])}, "ICT_BOS")
+
+    assert signal["direction"] == "BUY"
+    assert signal["structure"] == "BOS"
+    assert signal["confidence"] == 80
+
+
+def test_break_without_a_sweep_needs_the_feed_flag():
+    rows = list(SWEEP_AND_BREAK + [FORMING])
+    rows[6] = (100, 95.5, 96)  # wick stops short of the 95 pool
+
+    assert ICTModel().check({"candles": _candles(rows)}, "ICT_NO_SWEEP") is None
+    flagged = ICTModel().check({"candles": _candles(rows), "liquidity_sweep": True}, "ICT_FLAGGED")
+    assert flagged["direction"] == "BUY"
+
+
+def test_break_without_an_aligned_gap_is_ignored():
+    # Without bars 8 and 9 there is no bullish gap below price.
+    rows = SWEEP_AND_BREAK[:8] + [FORMING]
+
+    assert ICTModel().check({"candles": _candles(rows)}, "ICT_NO_GAP") is None
+
+
+def test_without_candles_the_trend_rule_still_applies():
+    model = ICTModel()
+
+    assert model.check({"trend": "UP", "liquidity_sweep": True}, "ICT_FALLBACK")["direction"] == "BUY"
+    assert model.check({"trend": "UP", "liquidity_sweep": False}, "ICT_FALLBACK") is None
+    assert model.check({"trend": "DOWN", "liquidity_sweep": True}, "ICT_FALLBACK") is None
@@ -0,0 +1,141 @@
+import random
+import threading
+from pathlib import Path
+
+import pytest
+
+from astroquant.engine.ict_structure import ICTStructureTracker
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def random_bars(seed, count=400, start=100.0):
+    """Random walk with occasional jumps so gaps open, shrink and fill."""
+    rng = random.Random(seed)
+    price = start
+    bars = []
+    for index in range(count):
+        open_px = price
+        jump = rng.choice((0.0, 0.0, 0.0, rng.uniform(-3.0, 3.0)))
+        price = max(1.0, price + jump + rng.gauss(0.0, 0.8))
+        high = max(open_px, price) + abs(rng.gauss(0.0, 0.4))
+        low = min(open_px, price) - abs(rng.gauss(0.0, 0.4))
+        bars.append({"time": index, "open": open_px, "high": round(high, 2), "low": round(low, 2), "close": round(price, 2)})
+    return bars
+
+
+class NaiveFVGBook:
+    """Brute-force reference: scan every open gap on every bar."""
+
+    def __init__(self, max_open):
+        self.max_open = max_open
+        self.gaps = {}
+        self.next_id = 1
+        self.window = []
+
+    def update(self, bar):
+        high, low = bar["high"], bar["low"]
+        for fvg_id, gap in list(self.gaps.items()):
+            if gap["top"] < low or gap["bottom"] > high:
+                continue
+            if gap["type"] == "BULLISH_FVG":
+                gap["top"] = min(gap["top"], low)
+            else:
+                gap["bottom"] = max(gap["bottom"], high)
+            if gap["top"] <= gap["bottom"]:
+                del self.gaps[fvg_id]
+        if len(self.window) >= 2:
+            two_back_high, two_back_low = self.window[-2]
+            if low > two_back_high:
+                self._open("BULLISH_FVG", two_back_high, low)
+            elif high < two_back_low:
+                self._open("BEARISH_FVG", high, two_back_low)
+        self.window.append((high, low))
+
+    def _open(self, kind, bottom, top):
+        fvg_id = self.next_id
+        self.next_id += 1
+        self.gaps[fvg_id] = {"type": kind, "bottom": bottom, "top": top}
+        if len(self.gaps) > self.max_open:
+            del self.gaps[min(self.gaps)]
+
+    def above(self, price):
+        candidates = [gap["bottom"] for gap in self.gaps.values() if gap["bottom"] > price]
+        return min(candidates) if candidates else None
+
+    def below(self, price):
+        candidates = [gap["top"] for gap in self.gaps.values() if gap["top"] <= price]
+        return max(candidates) if candidates else None
+
+
+@pytest.mark.parametrize("seed", [1, 7, 31, 99, 2024])
+@pytest.mark.parametrize("max_open", [3, 300])
+def test_incremental_fvgs_match_brute_force(seed, max_open):
+    tracker = ICTStructureTracker(max_open_fvgs=max_open)
+    reference = NaiveFVGBook(max_open)
+    rng = random.Random(seed + 1)
+    for bar in random_bars(seed):
+        tracker.update(bar)
+        reference.update(bar)
+
+        open_gaps = {record["id"]: (record["bottom"], record["top"]) for record in tracker.open_fvgs()}
+        assert open_gaps == {fvg_id: (gap["bottom"], gap["top"]) for fvg_id, gap in reference.gaps.items()}, bar["time"]
+
+        for price in (bar["close"], bar["close"] + rng.uniform(-8.0, 8.0)):
+            above = tracker.nearest_fvg_above(price)
+            below = tracker.nearest_fvg_below(price)
+            assert (above["bottom"] if above else None) == reference.above(price), (bar["time"], price)
+            assert (below["top"] if below else None) == reference.below(price), (bar["time"], price)
+
+
+def test_shrinking_the_only_gap_keeps_it_visible():
+    tracker = ICTStructureTracker()
+    for time_value, (high, low) in enumerate([(100.0, 99.0), (103.0, 100.5), (105.0, 102.0)]):
+        tracker.update({"time": time_value, "high": high, "low": low, "close": (high + low) / 2})
+    assert [(gap["bottom"], gap["top"]) for gap in tracker.open_fvgs()] == [(100.0, 102.0)]
+
+    # Trade into the gap from above; it shrinks but stays open and findable.
+    tracker.update({"time": 3, "high": 104.0, "low": 101.0, "close": 103.0})
+    tracker.update({"time": 4, "high": 103.5, "low": 101.2, "close": 102.5})
+    assert [(gap["bottom"], gap["top"]) for gap in tracker.open_fvgs()] == [(100.0, 101.0)]
+    assert tracker.nearest_fvg_below(102.0)["top"] == 101.0
+
+    # A later bar that only reaches the shrunken gap must still mitigate it.
+    tracker.update({"time": 5, "high": 102.0, "low": 100.6, "close": 101.5})
+    assert [(gap["bottom"], gap["top"]) for gap in tracker.open_fvgs()] == [(100.0, 100.6)]
+
+
+def test_shared_tracker_fed_concurrently_matches_a_serial_feed():
+    bars = random_bars(5, count=300)
+    serial = ICTStructureTracker()
+    serial.ingest(bars)
+
+    shared = ICTStructureTracker()
+    start = threading.Barrier(6)
+    snapshots = []
+
+    def build():
+        start.wait()
+        for end in range(3, len(bars) + 1):
+            with shared.lock:
+                shared.ingest(bars[:end])
+                state = shared.state(bars[end - 1]["close"])
+            snapshots.append((end, state["bars_seen"]))
+
+    threads = [threading.Thread(target=build) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every caller saw at least the bars it passed in.
+    assert all(seen >= end - 1 for end, seen in snapshots)
+    assert shared.state(bars[-1]["close"]) == serial.state(bars[-1]["close"])
+    assert shared.open_fvgs() == serial.open_fvgs()
+
+
+def test_phase1_tracker_copy_matches_astroquant():
+    # Phase1 runs as its own app and keeps a copy; both must stay identical.
+    shared = (REPO_ROOT / "astroquant" / "engine" / "ict_structure.py").read_text(encoding="utf-8")
+    phase1 = (REPO_ROOT / "AstroQuant_Phase1" / "engine" / "ict_structure.py").read_text(encoding="utf-8")
+    assert phase1 == shared
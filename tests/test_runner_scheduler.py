@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+from astroquant.engine.runner_scheduler import RunnerScheduler
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_rescheduled_job_is_not_run_from_its_stale_entry():
+    clock = FakeClock()
+    scheduler = RunnerScheduler(time_fn=clock)
+    ran = []
+
+    def head():
+        ran.append("head")
+        scheduler.stop()
+
+    scheduler.every("head", 10.0, head, first_delay=0.0)
+    scheduler.every("moved", 10.0, lambda: ran.append("moved"), first_delay=0.1)
+    # The superseded entry for "moved" now sits behind "head" in the due run.
+    scheduler.reschedule("moved", 5.0)
+    clock.now = 1.0
+
+    scheduler.run(lambda ready: None)
+
+    assert ran == ["head"]
+
+
+def test_cancelled_job_is_skipped_inside_the_due_run():
+    clock = FakeClock()
+    scheduler = RunnerScheduler(time_fn=clock)
+    ran = []
+
+    def head():
+        ran.append("head")
+        scheduler.stop()
+
+    scheduler.every("head", 10.0, head, first_delay=0.0)
+    scheduler.every("gone", 10.0, lambda: ran.append("gone"), first_delay=0.1)
+    scheduler.cancel("gone")
+    clock.now = 1.0
+
+    scheduler.run(lambda ready: None)
+
+    assert ran == ["head"]
+
+
+def test_fill_detection_reuses_the_reconciliation_read():
+    from astroquant.engine.multi_symbol_runner import MultiSymbolRunner
+
+    reads = []
+
+    def positions_snapshot():
+        reads.append(1)
+        return [{"symbol": "XAUUSD", "volume": 0.02}]
+
+    triggered = []
+    runner = MultiSymbolRunner.__new__(MultiSymbolRunner)
+    runner.execution = SimpleNamespace(broker_positions_snapshot=positions_snapshot, emergency_halt=lambda reason: None)
+    runner.reconciliation_engine = SimpleNamespace(reconcile=lambda internal_positions, broker_positions: {"ok": True})
+    runner.positions = SimpleNamespace(get_positions=lambda: [])
+    runner.scheduler = SimpleNamespace(trigger=lambda symbol, reason: triggered.append((symbol, reason)))
+    runner.symbols = ["XAUUSD"]
+    runner.broker_position_fingerprint = {}
+    runner._runner_symbol_for_feed = lambda symbol: symbol
+
+    snapshot = runner._reconcile_and_detect_fills()
+
+    assert snapshot == {"ok": True}
+    assert len(reads) == 1
+    assert triggered == [("XAUUSD", "BROKER_FILL")]
@@ -0,0 +1,90 @@
+import concurrent.futures
+import threading
+import time
+
+from astroquant.execution.playwright_engine import PlaywrightExecutionEngine
+
+
+class FakeLocator:
+    def count(self):
+        return 0
+
+    @property
+    def first(self):
+        return self
+
+    def inner_text(self, timeout=None):
+        raise RuntimeError("not rendered")
+
+    def get_attribute(self, name, timeout=None):
+        raise RuntimeError("not rendered")
+
+
+class FakeSymbolsPage:
+    """Sync page that records which thread evaluated it."""
+
+    def __init__(self):
+        self.threads = []
+
+    def locator(self, selector):
+        return FakeLocator()
+
+    def evaluate(self, script, *args):
+        self.threads.append(threading.get_ident())
+        return [{"symbol": "XAU/USD", "canonical": "XAUUSD",
+                 "selector": "[data-testid='instrument-symbol-name-wrapper']", "price_text": "2351.25"}]
+
+
+def _engine():
+    return PlaywrightExecutionEngine(cdp_url="", user_data_dir="")
+
+
+def test_dispatcher_owner_thread_is_known_before_first_call():
+    engine = _engine()
+    owner = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        engine.set_task_dispatcher(owner)
+        owner_id = owner.submit(threading.get_ident).result()
+        assert engine._dispatch_thread_id == owner_id
+        assert engine._should_dispatch()
+        assert owner.submit(engine._should_dispatch).result() is False
+    finally:
+        owner.shutdown()
+
+
+def test_catalogue_refresh_runs_on_owner_thread_and_ingests_once():
+    engine = _engine()
+    page = FakeSymbolsPage()
+    engine.set_page(page)
+    owner = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        engine.set_task_dispatcher(owner)
+        owner_id = owner.submit(threading.get_ident).result()
+        assert engine.start_symbol_catalogue_refresh(interval_seconds=900.0)
+        deadline = time.time() + 5.0
+        while engine.symbol_catalogue.refresh_count == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        catalogue = engine.symbol_catalogue
+        assert catalogue.last_refresh_error is None
+        assert catalogue.refresh_count == 1
+        assert page.threads == [owner_id]
+        assert catalogue.lookup("XAUUSD")["broker_symbol"] == "XAU/USD"
+    finally:
+        engine.symbol_catalogue.stop_background_refresh()
+        owner.shutdown()
+
+
+def test_catalogue_refresh_waits_without_owner_thread():
+    engine = _engine()
+    page = FakeSymbolsPage()
+    engine.set_page(page)
+    engine.start_symbol_catalogue_refresh(interval_seconds=900.0)
+    try:
+        deadline = time.time() + 5.0
+        while engine.symbol_catalogue.last_refresh_error is None and time.time() < deadline:
+            time.sleep(0.01)
+        assert engine.symbol_catalogue.last_refresh_error == "owner_thread_unavailable"
+        assert page.threads == []
+    finally:
+        engine.symbol_catalogue.stop_background_refresh()